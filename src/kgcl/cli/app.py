@@ -11,24 +11,84 @@ Nouns (resources):
   yawl    - YAWL workflow engine operations
   proj    - Projection/template rendering
   codegen - Code generation from RDF ontologies
+
+Noun groups are registered lazily: ``kgcl --help`` lists them from the
+table below without importing them, and a group's module (with its
+engine, store or code generation dependencies) is imported only when that
+noun is invoked.
 """
 
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 import typer
+from typer.core import TyperGroup
+
+# name -> ("module:attribute" of the sub-application, help text)
+SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "engine": ("kgcl.cli.engine:engine", "HybridEngine operations"),
+    "store": ("kgcl.cli.store:store", "Triple store operations"),
+    "task": ("kgcl.cli.task:task", "Task management"),
+    "physics": ("kgcl.cli.physics:physics", "N3 physics rules"),
+    "system": ("kgcl.cli.system:system", "System management"),
+    "yawl": ("kgcl.cli.yawl:yawl", "YAWL workflow engine operations"),
+    "proj": ("kgcl.projection.cli:proj", "Projection/template rendering"),
+    "codegen": ("kgcl.codegen.cli:codegen", "Code generation from RDF"),
+    "health": ("kgcl.observability.cli:health", "Health checks and observability"),
+}
+
+
+class LazySubcommand(TyperGroup):
+    """Placeholder for a noun group that imports it on first invocation.
+
+    It carries only the name and help text shown in the parent's command
+    list. Parsing arguments for it builds the real group, exactly as
+    ``Typer.add_typer`` would have, and hands over to it.
+
+    Parameters
+    ----------
+    name : str
+        Sub-command name.
+    target : str
+        ``"module:attribute"`` of the ``typer.Typer`` sub-application.
+    help : str
+        Help text shown in the parent's command list.
+    """
+
+    def __init__(self, name: str, target: str, help: str) -> None:
+        super().__init__(name=name, help=help)
+        self.target = target
+        self._loaded: Any = None
+
+    def load(self) -> Any:
+        """Import the sub-application and build its command, once."""
+        if self._loaded is None:
+            module_name, attribute = self.target.split(":")
+            sub_app = getattr(importlib.import_module(module_name), attribute)
+            holder = typer.Typer()
+            holder.add_typer(sub_app, name=self.name, help=self.help)
+            self._loaded = typer.main.get_group(holder).commands[self.name]  # type: ignore[index]
+        return self._loaded
+
+    def make_context(self, info_name: str | None, args: list[str], parent: Any = None, **extra: Any) -> Any:
+        """Build the context of the real group, so it parses and runs the arguments."""
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root group registering every entry of ``SUBCOMMANDS`` as a LazySubcommand."""
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        for name, (target, help_text) in SUBCOMMANDS.items():
+            self.add_command(LazySubcommand(name, target, help_text))
 
-from kgcl.cli.engine import engine
-from kgcl.cli.physics import physics
-from kgcl.cli.store import store
-from kgcl.cli.system import system
-from kgcl.cli.task import task
-from kgcl.cli.yawl import yawl
-from kgcl.codegen.cli import codegen
-from kgcl.observability.cli import health
-from kgcl.projection.cli import proj
 
 app = typer.Typer(
     name="kgcl",
+    cls=LazyTyperGroup,
     help="""KGCL - Knowledge Geometry Calculus for Life.
 
     A hybrid RDF engine combining PyOxigraph (Rust storage) with
@@ -66,17 +126,5 @@ def main(
     """KGCL main entry point."""
 
 
-# Register noun groups as sub-applications
-app.add_typer(engine, name="engine", help="HybridEngine operations")
-app.add_typer(store, name="store", help="Triple store operations")
-app.add_typer(task, name="task", help="Task management")
-app.add_typer(physics, name="physics", help="N3 physics rules")
-app.add_typer(system, name="system", help="System management")
-app.add_typer(yawl, name="yawl", help="YAWL workflow engine operations")
-app.add_typer(proj, name="proj", help="Projection/template rendering")
-app.add_typer(codegen, name="codegen", help="Code generation from RDF")
-app.add_typer(health, name="health", help="Health checks and observability")
-
-
 if __name__ == "__main__":
     app()
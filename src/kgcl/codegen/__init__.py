@@ -15,6 +15,7 @@ Key Features
 Modules
 -------
 cache : GraphCache for ultra-fast RDF graph caching
+incremental : DependencyMap and OntologyDelta for delta-driven regeneration
 indexing : SHACLIndex for optimized SHACL pattern queries
 string_pool : StringPool for cached string transformations
 metrics : UltraMetrics for performance tracking
@@ -27,19 +28,49 @@ Examples
 >>> transpiler = UltraOptimizedTTL2DSPyTranspiler(cache_size=200)
 >>> signatures = transpiler.ultra_build_signatures([Path("ontology.ttl")])
 >>> module_code = transpiler.generate_ultra_module(signatures)
+
+Exports are resolved lazily (PEP 562), so importing one submodule does
+not load DSPy and every generator through this package.
 """
 
-from kgcl.codegen.cache import GraphCache
-from kgcl.codegen.dspy_config import configure_dspy, get_configured_lm, is_dspy_configured
-from kgcl.codegen.generators.dspy_generator import DSPySignatureGenerator
-from kgcl.codegen.generators.python_generator import PythonModuleGenerator
-from kgcl.codegen.generators.yawl_generator import YAWLSpecificationGenerator
-from kgcl.codegen.indexing import SHACLIndex
-from kgcl.codegen.metrics import UltraMetrics
-from kgcl.codegen.orchestrator import CodeGenOrchestrator, GenerationConfig, OutputFormat
-from kgcl.codegen.registry import GeneratorRegistry, get_registry, register_generator
-from kgcl.codegen.string_pool import StringPool
-from kgcl.codegen.transpiler import UltraOptimizedTTL2DSPyTranspiler
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kgcl.codegen.cache import GraphCache
+    from kgcl.codegen.dspy_config import configure_dspy, get_configured_lm, is_dspy_configured
+    from kgcl.codegen.generators.dspy_generator import DSPySignatureGenerator
+    from kgcl.codegen.generators.python_generator import PythonModuleGenerator
+    from kgcl.codegen.generators.yawl_generator import YAWLSpecificationGenerator
+    from kgcl.codegen.indexing import SHACLIndex
+    from kgcl.codegen.metrics import UltraMetrics
+    from kgcl.codegen.orchestrator import CodeGenOrchestrator, GenerationConfig, OutputFormat
+    from kgcl.codegen.registry import GeneratorRegistry, get_registry, register_generator
+    from kgcl.codegen.string_pool import StringPool
+    from kgcl.codegen.transpiler import UltraOptimizedTTL2DSPyTranspiler
+
+# Public name -> defining module.
+_EXPORTS: dict[str, str] = {
+    "GraphCache": "kgcl.codegen.cache",
+    "configure_dspy": "kgcl.codegen.dspy_config",
+    "get_configured_lm": "kgcl.codegen.dspy_config",
+    "is_dspy_configured": "kgcl.codegen.dspy_config",
+    "DSPySignatureGenerator": "kgcl.codegen.generators.dspy_generator",
+    "PythonModuleGenerator": "kgcl.codegen.generators.python_generator",
+    "YAWLSpecificationGenerator": "kgcl.codegen.generators.yawl_generator",
+    "SHACLIndex": "kgcl.codegen.indexing",
+    "UltraMetrics": "kgcl.codegen.metrics",
+    "CodeGenOrchestrator": "kgcl.codegen.orchestrator",
+    "GenerationConfig": "kgcl.codegen.orchestrator",
+    "OutputFormat": "kgcl.codegen.orchestrator",
+    "GeneratorRegistry": "kgcl.codegen.registry",
+    "get_registry": "kgcl.codegen.registry",
+    "register_generator": "kgcl.codegen.registry",
+    "StringPool": "kgcl.codegen.string_pool",
+    "UltraOptimizedTTL2DSPyTranspiler": "kgcl.codegen.transpiler",
+}
 
 __all__ = [
     # Core transpiler components
@@ -67,3 +98,17 @@ __all__ = [
 ]
 
 __version__ = "1.0.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its defining module on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not yet imported exports."""
+    return sorted({*globals(), *__all__})
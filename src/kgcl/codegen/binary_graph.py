@@ -0,0 +1,482 @@
+"""Compact binary graph format for the codegen GraphCache.
+
+Pickling an rdflib Graph stores every node object and rebuilds the whole
+in-memory store on load, so a warm disk hit for a large ontology costs
+seconds. This module writes a graph as a versioned binary image that is
+memory-mapped on load and materialized only as far as it is queried:
+
+- a term dictionary of N-Triples-like encoded terms, sorted, so a term's
+  id is its rank and lookups are binary searches
+- three sorted ``uint32`` permutations of the triples (SPO, POS, OSP),
+  so every triple pattern is answered by narrowing a range with bisection
+- the graph's namespace bindings
+
+All integers are little-endian. Layout::
+
+    header     magic, version, term count, triple count, sizes (40 bytes)
+    offsets    uint64 x (terms + 1), start of each term in the term data
+    terms      encoded terms, padded to 8 bytes
+    spo        uint32 x 3 x triples
+    pos        uint32 x 3 x triples
+    osp        uint32 x 3 x triples
+    namespaces "prefix\\tnamespace" lines, UTF-8
+
+Loading checks the magic and version; any other version raises
+ValueError, which the cache treats as a miss.
+
+Examples
+--------
+>>> from rdflib import Graph, Literal, URIRef
+>>> graph = Graph()
+>>> _ = graph.add((URIRef("urn:a"), URIRef("urn:label"), Literal("A", lang="en")))
+>>> loaded = loads_graph(dumps_graph(graph))
+>>> len(loaded), loaded.value(URIRef("urn:a"), URIRef("urn:label"))
+(1, rdflib.term.Literal('A', lang='en'))
+"""
+
+from __future__ import annotations
+
+import itertools
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Generator, Iterator
+from pathlib import Path
+from typing import Any
+
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.graph import ModificationException
+from rdflib.store import Store
+
+__all__ = ["FORMAT_VERSION", "BinaryGraphStore", "dumps_graph", "load_graph", "loads_graph", "write_graph"]
+
+FORMAT_VERSION = 1
+"""Version written to and required in the header."""
+
+_MAGIC = b"KGCLGRPH"
+_HEADER = struct.Struct("<8sIIIIQQ")
+"""magic, version, term count, triple count, reserved, term data size, namespace data size."""
+
+_ORDERS = {"spo": (0, 1, 2), "pos": (1, 2, 0), "osp": (2, 0, 1)}
+"""Position of subject, predicate and object in each permutation's rows."""
+
+_INDEX_FOR_BOUND = {
+    (): "spo",
+    (0,): "spo",
+    (0, 1): "spo",
+    (0, 1, 2): "spo",
+    (1,): "pos",
+    (1, 2): "pos",
+    (2,): "osp",
+    (0, 2): "osp",
+}
+"""Permutation whose key prefix covers each combination of bound positions."""
+
+
+def _encode(term: Any) -> bytes | None:
+    """Encode a node as sortable bytes, or None for nodes the format cannot hold.
+
+    Literals put language and datatype first: neither can contain NUL, so the
+    lexical form that follows may contain anything.
+    """
+    if isinstance(term, URIRef):
+        return b"U" + term.encode("utf-8")
+    if isinstance(term, BNode):
+        return b"B" + term.encode("utf-8")
+    if isinstance(term, Literal):
+        language = term.language or ""
+        datatype = term.datatype or ""
+        return f"L{language}\0{datatype}\0{term}".encode()
+    return None
+
+
+def _decode(data: bytes) -> URIRef | BNode | Literal:
+    """Rebuild the node encoded by ``_encode``."""
+    kind, text = data[:1], data[1:].decode("utf-8")
+    if kind == b"U":
+        return URIRef(text)
+    if kind == b"B":
+        return BNode(text)
+    language, datatype, lexical = text.split("\0", 2)
+    return Literal(lexical, lang=language or None, datatype=URIRef(datatype) if datatype else None)
+
+
+def dumps_graph(graph: Graph) -> bytes:
+    """Serialize a graph's triples and namespaces to the binary format.
+
+    Parameters
+    ----------
+    graph : Graph
+        Graph to serialize; quoted graphs and variables are not supported.
+
+    Returns
+    -------
+    bytes
+        Binary image readable by ``loads_graph``.
+
+    Raises
+    ------
+    ValueError
+        If a triple contains a node that is not an IRI, blank node or literal.
+    """
+    triples = list(graph)
+    encoded: dict[Any, bytes] = {}
+    for triple in triples:
+        for node in triple:
+            if node not in encoded:
+                data = _encode(node)
+                if data is None:
+                    msg = f"Cannot encode node of type {type(node).__name__}"
+                    raise ValueError(msg)
+                encoded[node] = data
+    terms = sorted(set(encoded.values()))
+    rank = {data: index for index, data in enumerate(terms)}
+    ids = {node: rank[data] for node, data in encoded.items()}
+    rows = [(ids[s], ids[p], ids[o]) for s, p, o in triples]
+
+    offsets = array("Q", itertools.accumulate((len(data) for data in terms), initial=0))
+    term_data = b"".join(terms)
+    term_data += b"\0" * (-len(term_data) % 8)
+    namespaces = "".join(f"{prefix}\t{namespace}\n" for prefix, namespace in graph.namespaces()).encode("utf-8")
+
+    parts = [
+        _HEADER.pack(_MAGIC, FORMAT_VERSION, len(terms), len(rows), 0, len(term_data), len(namespaces)),
+        _little_endian(offsets),
+        term_data,
+    ]
+    for order in _ORDERS.values():
+        permuted = sorted(tuple(row[position] for position in order) for row in rows)
+        parts.append(_little_endian(array("I", itertools.chain.from_iterable(permuted))))
+    parts.append(namespaces)
+    return b"".join(parts)
+
+
+def write_graph(graph: Graph, path: Path) -> None:
+    """Atomically write a graph's binary image to a file.
+
+    Parameters
+    ----------
+    graph : Graph
+        Graph to serialize.
+    path : Path
+        Destination file; replaced only once fully written.
+    """
+    data = dumps_graph(graph)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def loads_graph(data: bytes) -> Graph:
+    """Open a binary image held in memory as a read-only graph.
+
+    Parameters
+    ----------
+    data : bytes
+        Image produced by ``dumps_graph``.
+
+    Returns
+    -------
+    Graph
+        Graph backed by a BinaryGraphStore.
+
+    Raises
+    ------
+    ValueError
+        If the data is not a complete image of the current format version.
+    """
+    return Graph(store=BinaryGraphStore(data))
+
+
+def load_graph(path: Path) -> Graph:
+    """Memory-map a binary image file as a read-only graph.
+
+    Only the header is read eagerly; pages of the file are loaded as
+    queries touch them. The mapping is closed when the graph is collected.
+
+    Parameters
+    ----------
+    path : Path
+        File written by ``write_graph``.
+
+    Returns
+    -------
+    Graph
+        Graph backed by a BinaryGraphStore over the mapped file.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be opened or mapped.
+    ValueError
+        If the file is not a complete image of the current format version.
+    """
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size < _HEADER.size:
+            msg = f"{path} is too short to be a graph image"
+            raise ValueError(msg)
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        store = BinaryGraphStore(mapped)
+    except BaseException:
+        mapped.close()
+        raise
+    weakref.finalize(store, _close_mapping, store.views, mapped)
+    return Graph(store=store)
+
+
+def _close_mapping(views: list[memoryview], mapped: mmap.mmap) -> None:
+    """Release the views into a mapping, then the mapping itself."""
+    for view in views:
+        view.release()
+    mapped.close()
+
+
+def _little_endian(values: array[int]) -> bytes:
+    """Return an array's bytes in little-endian order."""
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class _Column:
+    """Sequence view of one column of a flat row-major ``uint32`` array, for bisect."""
+
+    __slots__ = ("_column", "_rows")
+
+    def __init__(self, rows: Any, column: int) -> None:
+        self._rows = rows
+        self._column = column
+
+    def __len__(self) -> int:
+        return len(self._rows) // 3
+
+    def __getitem__(self, index: int) -> int:
+        return int(self._rows[3 * index + self._column])
+
+
+class _Terms:
+    """Sequence of encoded terms, for bisect."""
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, offsets: Any, data: memoryview) -> None:
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:
+        return bytes(self._data[self._offsets[index] : self._offsets[index + 1]])
+
+
+class BinaryGraphStore(Store):
+    """Read-only rdflib store over a binary graph image.
+
+    Nodes are decoded on first use and kept for the life of the store;
+    triples are never copied out of the image. Namespace bindings can be
+    changed in memory, triples cannot.
+
+    Parameters
+    ----------
+    buffer : bytes | mmap.mmap
+        Image produced by ``dumps_graph``.
+
+    Attributes
+    ----------
+    views : list[memoryview]
+        Views into ``buffer``; they must be released before an mmap closes.
+
+    Raises
+    ------
+    ValueError
+        If the buffer is not a complete image of the current format version.
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        """Validate the header and set up views into the buffer."""
+        super().__init__()
+        # Validate before taking views: an mmap cannot be closed while views exist.
+        if len(buffer) < _HEADER.size:
+            msg = "Buffer is too short to be a graph image"
+            raise ValueError(msg)
+        magic, version, term_count, triple_count, _reserved, term_size, namespace_size = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            msg = "Buffer is not a graph image"
+            raise ValueError(msg)
+        if version != FORMAT_VERSION:
+            msg = f"Graph image version {version} is not supported (expected {FORMAT_VERSION})"
+            raise ValueError(msg)
+        offsets_at = _HEADER.size
+        terms_at = offsets_at + 8 * (term_count + 1)
+        triples_at = terms_at + term_size
+        namespaces_at = triples_at + 3 * 12 * triple_count
+        if len(buffer) != namespaces_at + namespace_size:
+            msg = "Graph image is truncated or has trailing data"
+            raise ValueError(msg)
+        self._namespace: dict[str, URIRef] = {}
+        self._prefix: dict[URIRef, str] = {}
+        for line in bytes(buffer[namespaces_at:]).decode("utf-8").splitlines():
+            prefix, namespace = line.split("\t", 1)
+            self._namespace[prefix] = URIRef(namespace)
+            self._prefix[URIRef(namespace)] = prefix
+
+        view = memoryview(buffer)
+        self.views = [view]
+        self._triple_count = triple_count
+        offsets = self._array(view, offsets_at, term_count + 1, "Q")
+        self._terms = _Terms(offsets, self._slice(view, terms_at, term_size))
+        self._indexes: dict[str, Any] = {}
+        for position, name in enumerate(_ORDERS):
+            self._indexes[name] = self._array(view, triples_at + 12 * triple_count * position, 3 * triple_count, "I")
+        self._nodes: dict[int, URIRef | BNode | Literal] = {}
+
+    def _slice(self, view: memoryview, start: int, size: int) -> memoryview:
+        """Return a tracked view of ``size`` bytes at ``start``."""
+        part = view[start : start + size]
+        self.views.append(part)
+        return part
+
+    def _array(self, view: memoryview, start: int, count: int, typecode: str) -> Any:
+        """Return ``count`` little-endian integers at ``start``, zero-copy where possible."""
+        itemsize = array(typecode).itemsize
+        part = self._slice(view, start, count * itemsize)
+        if sys.byteorder == "little":
+            cast = part.cast(typecode)
+            self.views.append(cast)
+            return cast
+        values = array(typecode, part.tobytes())
+        values.byteswap()
+        return values
+
+    def _id(self, node: Any) -> int | None:
+        """Return a node's term id, or None if the image does not contain it."""
+        data = _encode(node)
+        if data is None:
+            return None
+        index = bisect_left(self._terms, data)
+        if index < len(self._terms) and self._terms[index] == data:
+            return index
+        return None
+
+    def _node(self, term_id: int) -> URIRef | BNode | Literal:
+        """Return the node for a term id, decoding it on first use."""
+        node = self._nodes.get(term_id)
+        if node is None:
+            node = self._nodes[term_id] = _decode(self._terms[term_id])
+        return node
+
+    def triples(self, triple_pattern: Any, context: Any = None) -> Iterator[tuple[Any, Iterator[Any]]]:
+        """Yield triples matching a pattern, each with an empty context iterator.
+
+        Parameters
+        ----------
+        triple_pattern : tuple
+            Subject, predicate and object, each a node or None as wildcard.
+        context : Any
+            Ignored; the store holds a single graph.
+
+        Yields
+        ------
+        tuple[tuple[Node, Node, Node], Iterator]
+            Matching triple and its (empty) contexts.
+        """
+        bound: list[int] = []
+        key: list[int] = []
+        for position, node in enumerate(triple_pattern):
+            if node is not None:
+                term_id = self._id(node)
+                if term_id is None:
+                    return
+                bound.append(position)
+                key.append(term_id)
+
+        name = _INDEX_FOR_BOUND[tuple(bound)]
+        order = _ORDERS[name]
+        rows = self._indexes[name]
+        # Bound positions are a prefix of the permutation's key order.
+        key_by_position = dict(zip(bound, key, strict=True))
+        low, high = 0, self._triple_count
+        for column, position in enumerate(order[: len(bound)]):
+            keys = _Column(rows, column)
+            low = bisect_left(keys, key_by_position[position], low, high)
+            high = bisect_right(keys, key_by_position[position], low, high)
+
+        inverse = [order.index(position) for position in range(3)]
+        node = self._node
+        for row in range(low, high):
+            base = 3 * row
+            yield (
+                (node(rows[base + inverse[0]]), node(rows[base + inverse[1]]), node(rows[base + inverse[2]])),
+                iter(()),
+            )
+
+    def __len__(self, context: Any = None) -> int:
+        """Return the number of triples."""
+        return self._triple_count
+
+    def contexts(self, triple: Any = None) -> Generator[Graph, None, None]:
+        """Yield no contexts; the store is not context-aware."""
+        yield from ()
+
+    def add(self, triple: Any, context: Any = None, quoted: bool = False) -> None:
+        """Reject additions; the store is read-only."""
+        raise ModificationException
+
+    def addN(self, quads: Any) -> None:  # noqa: N802
+        """Reject additions; the store is read-only."""
+        raise ModificationException
+
+    def remove(self, triple: Any, context: Any = None) -> None:
+        """Reject removals; the store is read-only."""
+        raise ModificationException
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        """Bind a prefix in memory, with the semantics of rdflib's Memory store."""
+        bound_namespace = self._namespace.get(prefix)
+        bound_prefix = self._prefix.get(namespace)
+        if bound_prefix is None and bound_namespace is not None:
+            bound_prefix = self._prefix.get(bound_namespace)
+        if override:
+            if bound_prefix is not None:
+                del self._namespace[bound_prefix]
+            if bound_namespace is not None:
+                del self._prefix[bound_namespace]
+            self._prefix[namespace] = prefix
+            self._namespace[prefix] = namespace
+        else:
+            self._prefix[bound_namespace if bound_namespace is not None else namespace] = (
+                bound_prefix if bound_prefix is not None else prefix
+            )
+            self._namespace[bound_prefix if bound_prefix is not None else prefix] = (
+                bound_namespace if bound_namespace is not None else namespace
+            )
+
+    def namespace(self, prefix: str) -> URIRef | None:
+        """Return the namespace bound to a prefix."""
+        return self._namespace.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> str | None:
+        """Return the prefix bound to a namespace."""
+        return self._prefix.get(namespace)
+
+    def namespaces(self) -> Iterator[tuple[str, URIRef]]:
+        """Yield all prefix bindings."""
+        yield from list(self._namespace.items())
@@ -1,19 +1,30 @@
 """Ultra-fast graph caching with memory and disk persistence.
 
 Provides LRU-based caching of parsed RDF graphs with optional disk
-persistence and Redis backend support for distributed caching.
+persistence and Redis backend support for distributed caching. Disk and
+Redis entries use the binary image format of ``kgcl.codegen.binary_graph``;
+disk hits are memory-mapped and materialized lazily.
 """
 
 import hashlib
 import os
-import pickle
 import threading
 import time
 from pathlib import Path
-from typing import Dict, Optional
 
 from rdflib import Graph
 
+from kgcl.codegen.binary_graph import dumps_graph, load_graph, loads_graph, write_graph
+
+_DISK_SUFFIX = ".kgraph"
+"""Extension of binary graph images in the cache directory."""
+
+_LEGACY_SUFFIX = ".pkl"
+"""Extension of pickled graphs written by earlier versions; never loaded."""
+
+DEFAULT_CACHE_DIR = Path(".ttl2dspy_cache")
+"""Disk cache directory used when none is given, relative to the working directory."""
+
 
 class GraphCache:
     """Ultra-fast graph caching with memory management.
@@ -24,7 +35,11 @@ class GraphCache:
     3. Optional Redis backend for distributed caching
 
     Cache keys are derived from file content hashes to ensure
-    automatic invalidation when source files change.
+    automatic invalidation when source files change. The hash of a file is
+    reused while its size, inode and modification times are unchanged, so
+    warm hits do not re-read the source.
+
+    Graphs returned from the disk or Redis tier are read-only.
 
     Parameters
     ----------
@@ -32,6 +47,8 @@ class GraphCache:
         Maximum number of graphs to keep in memory cache
     enable_disk_cache : bool, default=True
         Whether to use disk-based persistence
+    cache_dir : Path | None, default=None
+        Directory for disk cache storage (``DEFAULT_CACHE_DIR`` if None)
 
     Attributes
     ----------
@@ -53,19 +70,20 @@ class GraphCache:
     True
     """
 
-    def __init__(self, max_size: int = 100, enable_disk_cache: bool = True) -> None:
+    def __init__(self, max_size: int = 100, enable_disk_cache: bool = True, cache_dir: Path | None = None) -> None:
         """Initialize graph cache with specified configuration."""
         self.memory_cache: dict[str, Graph] = {}
         self.max_size = max_size
         self.enable_disk_cache = enable_disk_cache
-        self.cache_dir = Path(".ttl2dspy_cache")
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
         self.access_times: dict[str, float] = {}
         self._lock = threading.RLock()
         self.redis_url = os.getenv("REDIS_URL")
         self._redis: object | None = None
+        self._key_memo: dict[Path, tuple[tuple[int, int, int, int], str]] = {}
 
         if enable_disk_cache:
-            self.cache_dir.mkdir(exist_ok=True)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
         if self.redis_url:
             try:
@@ -78,6 +96,8 @@ class GraphCache:
     def _get_cache_key(self, file_path: Path) -> str:
         """Generate cache key from file content hash.
 
+        The hash is recomputed only when the file's stat signature changes.
+
         Parameters
         ----------
         file_path : Path
@@ -88,9 +108,18 @@ class GraphCache:
         str
             SHA-256 hash of file contents
         """
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_ctime_ns, stat.st_size, stat.st_ino)
+        path = Path(file_path).resolve()
+        with self._lock:
+            memo = self._key_memo.get(path)
+        if memo is not None and memo[0] == signature:
+            return memo[1]
         with open(file_path, "rb") as f:
-            content = f.read()
-            return hashlib.sha256(content).hexdigest()
+            digest = hashlib.sha256(f.read()).hexdigest()
+        with self._lock:
+            self._key_memo[path] = (signature, digest)
+        return digest
 
     def get(self, file_path: Path) -> Graph | None:
         """Get cached graph with multi-tier lookup.
@@ -115,8 +144,36 @@ class GraphCache:
         >>> result is None
         True
         """
-        cache_key = self._get_cache_key(file_path)
+        return self.get_by_key(self._get_cache_key(file_path))
 
+    def cache_key(self, file_path: Path) -> str:
+        """Return the key a file's graph is cached under.
+
+        Parameters
+        ----------
+        file_path : Path
+            Source file
+
+        Returns
+        -------
+        str
+            SHA-256 hash of the file's current contents
+        """
+        return self._get_cache_key(file_path)
+
+    def get_by_key(self, cache_key: str) -> Graph | None:
+        """Get a cached graph by key, e.g. one of an earlier version of a file.
+
+        Parameters
+        ----------
+        cache_key : str
+            Key returned by ``cache_key``
+
+        Returns
+        -------
+        Optional[Graph]
+            Cached graph if found, None otherwise
+        """
         with self._lock:
             if cache_key in self.memory_cache:
                 self.access_times[cache_key] = time.time()
@@ -126,23 +183,22 @@ class GraphCache:
                 try:
                     raw = self._redis.get(cache_key)  # type: ignore[attr-defined]
                     if raw:
-                        graph: Graph = pickle.loads(raw)  # type: ignore[arg-type]
+                        graph = loads_graph(raw)  # type: ignore[arg-type]
                         self._add_to_memory_cache(cache_key, graph)
                         return graph
                 except Exception:
                     pass
 
             if self.enable_disk_cache:
-                disk_path = self.cache_dir / f"{cache_key}.pkl"
+                disk_path = self.cache_dir / f"{cache_key}{_DISK_SUFFIX}"
                 if disk_path.exists():
                     try:
-                        with open(disk_path, "rb") as f:
-                            graph = pickle.load(f)
-
+                        graph = load_graph(disk_path)
+                    except (OSError, ValueError):
+                        disk_path.unlink(missing_ok=True)
+                    else:
                         self._add_to_memory_cache(cache_key, graph)
                         return graph
-                    except Exception:
-                        disk_path.unlink(missing_ok=True)
 
             return None
 
@@ -174,17 +230,16 @@ class GraphCache:
                 try:
                     ttl = int(os.getenv("CACHE_TTL", "86400"))
                     self._redis.setex(  # type: ignore[attr-defined]
-                        cache_key, ttl, pickle.dumps(graph)
+                        cache_key, ttl, dumps_graph(graph)
                     )
                 except Exception:
                     pass
 
             if self.enable_disk_cache:
-                disk_path = self.cache_dir / f"{cache_key}.pkl"
+                disk_path = self.cache_dir / f"{cache_key}{_DISK_SUFFIX}"
                 try:
-                    with open(disk_path, "wb") as f:
-                        pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
-                except Exception:
+                    write_graph(graph, disk_path)
+                except (OSError, ValueError):
                     pass
 
     def _add_to_memory_cache(self, cache_key: str, graph: Graph) -> None:
@@ -220,8 +275,9 @@ class GraphCache:
             self.access_times.clear()
 
             if self.enable_disk_cache and self.cache_dir.exists():
-                for cache_file in self.cache_dir.glob("*.pkl"):
-                    cache_file.unlink()
+                for suffix in (_DISK_SUFFIX, _LEGACY_SUFFIX):
+                    for cache_file in self.cache_dir.glob(f"*{suffix}"):
+                        cache_file.unlink()
 
             if self._redis is not None:
                 try:
@@ -247,6 +303,6 @@ class GraphCache:
         with self._lock:
             disk_entries = 0
             if self.enable_disk_cache and self.cache_dir.exists():
-                disk_entries = len(list(self.cache_dir.glob("*.pkl")))
+                disk_entries = len(list(self.cache_dir.glob(f"*{_DISK_SUFFIX}")))
 
             return {"memory_entries": len(self.memory_cache), "disk_entries": disk_entries, "max_size": self.max_size}
@@ -2,12 +2,18 @@
 
 Provides centralized DSPy configuration with environment variable support
 for flexible model selection and API endpoint configuration.
+
+DSPy itself is imported on first use, since importing it takes about a
+second and most code generation formats never need it.
 """
 
+from __future__ import annotations
+
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import dspy
+if TYPE_CHECKING:
+    import dspy
 
 
 def configure_dspy(model: str | None = None, api_base: str | None = None, api_key: str = "", **kwargs: Any) -> dspy.LM:
@@ -55,6 +61,8 @@ def configure_dspy(model: str | None = None, api_base: str | None = None, api_ke
     if not api_key:
         api_key = os.getenv("DSPY_API_KEY", "")
 
+    import dspy
+
     lm = dspy.LM(model, api_base=api_base, api_key=api_key, **kwargs)
 
     dspy.configure(lm=lm)
@@ -77,6 +85,8 @@ def get_configured_lm() -> dspy.LM | None:
     >>> lm is not None
     True
     """
+    import dspy
+
     try:
         return dspy.settings.lm
     except AttributeError:
@@ -220,8 +220,15 @@ class DSPySignatureGenerator(BaseGenerator[RDFMetadata]):
         FileNotFoundError
             If input file doesn't exist
         """
-        # 1. Parse RDF file
-        metadata = self.parser.parse(input_path)
+        # 1. Parse RDF file through the transpiler's cache, so an unchanged
+        #    file is not parsed again and the signatures below reuse the graph
+        if not input_path.exists():
+            msg = f"RDF file not found: {input_path}"
+            raise FileNotFoundError(msg)
+        graph, _index, ontology_uri = self.transpiler.parse_ontology(input_path)
+        metadata = RDFMetadata(
+            graph=graph, ontology_uri=ontology_uri or "http://example.org/ontology", file_path=input_path
+        )
 
         # 2. Generate signatures using transpiler
         signatures = self.transpiler.ultra_build_signatures([input_path], allow_multi_output=self.allow_multi_output)
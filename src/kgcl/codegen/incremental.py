@@ -0,0 +1,280 @@
+"""Incremental code generation driven by ontology deltas.
+
+Regenerating every artifact after a one-line ontology edit is wasteful:
+each generated signature is derived from a handful of nodes (its class,
+the node shapes targeting it, their property shapes). A DependencyMap
+records, for every artifact, the nodes it was derived from. Given the
+OntologyDelta between the previous and the current graph, only artifacts
+whose dependencies were touched are regenerated.
+
+A node counts as touched when it is the subject or object of an added or
+removed triple. Blank node labels are not stable across parses, so
+artifacts depending on blank nodes are regenerated whenever the file
+changes.
+
+Examples
+--------
+>>> from rdflib import Literal, URIRef
+>>> a, b, label = URIRef("urn:a"), URIRef("urn:b"), URIRef("urn:label")
+>>> delta = OntologyDelta.between({(a, label, Literal("A"))}, {(a, label, Literal("A2"))})
+>>> dependencies = DependencyMap()
+>>> dependencies.record("urn:a", "ASignature", "class ASignature: ...", {"urn:a"})
+>>> dependencies.record("urn:b", "BSignature", "class BSignature: ...", {"urn:b"})
+>>> dependencies.stale(delta)
+{'urn:a'}
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rdflib import Literal
+
+__all__ = ["ArtifactRecord", "DependencyMap", "GenerationState", "OntologyDelta"]
+
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class OntologyDelta:
+    """Triples added and removed between two versions of a graph.
+
+    Parameters
+    ----------
+    added : frozenset[tuple[Any, Any, Any]]
+        Triples only in the new graph.
+    removed : frozenset[tuple[Any, Any, Any]]
+        Triples only in the old graph.
+    """
+
+    added: frozenset[tuple[Any, Any, Any]] = frozenset()
+    removed: frozenset[tuple[Any, Any, Any]] = frozenset()
+
+    @classmethod
+    def between(cls, old: Iterable[tuple[Any, Any, Any]], new: Iterable[tuple[Any, Any, Any]]) -> OntologyDelta:
+        """Compute the delta from one set of triples to another.
+
+        Parameters
+        ----------
+        old : Iterable[tuple[Any, Any, Any]]
+            Triples of the previous version, e.g. a Graph.
+        new : Iterable[tuple[Any, Any, Any]]
+            Triples of the current version.
+
+        Returns
+        -------
+        OntologyDelta
+            Added and removed triples.
+        """
+        old_triples, new_triples = set(old), set(new)
+        return cls(frozenset(new_triples - old_triples), frozenset(old_triples - new_triples))
+
+    @property
+    def touched(self) -> frozenset[str]:
+        """Subjects and non-literal objects of changed triples, as strings."""
+        nodes: set[str] = set()
+        for subject, _predicate, obj in itertools.chain(self.added, self.removed):
+            nodes.add(str(subject))
+            if not isinstance(obj, Literal):
+                nodes.add(str(obj))
+        return frozenset(nodes)
+
+    def __bool__(self) -> bool:
+        """Return True if any triple changed."""
+        return bool(self.added or self.removed)
+
+
+@dataclass(frozen=True)
+class ArtifactRecord:
+    """One generated artifact and what it was derived from.
+
+    Parameters
+    ----------
+    name : str
+        Artifact name, e.g. the signature class name.
+    code : str
+        Generated source.
+    dependencies : frozenset[str]
+        Nodes (as strings) the artifact was derived from.
+    """
+
+    name: str
+    code: str
+    dependencies: frozenset[str]
+
+
+@dataclass
+class DependencyMap:
+    """Generated artifacts keyed by source node, with a reverse dependency index.
+
+    Parameters
+    ----------
+    records : dict[str, ArtifactRecord]
+        Artifacts by the node they were generated for (e.g. a class URI).
+    """
+
+    records: dict[str, ArtifactRecord] = field(default_factory=dict)
+    _dependents: dict[str, set[str]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index the initial records."""
+        for key, artifact in self.records.items():
+            self._index(key, artifact)
+
+    def record(self, key: str, name: str, code: str, dependencies: Iterable[str]) -> None:
+        """Add or replace the artifact generated for ``key``.
+
+        Parameters
+        ----------
+        key : str
+            Node the artifact was generated for.
+        name : str
+            Artifact name.
+        code : str
+            Generated source.
+        dependencies : Iterable[str]
+            Nodes the artifact was derived from; ``key`` is always included.
+        """
+        self.discard(key)
+        artifact = ArtifactRecord(name, code, frozenset(dependencies) | {key})
+        self.records[key] = artifact
+        self._index(key, artifact)
+
+    def discard(self, key: str) -> None:
+        """Drop the artifact generated for ``key``, if any."""
+        artifact = self.records.pop(key, None)
+        if artifact is None:
+            return
+        for node in artifact.dependencies:
+            dependents = self._dependents.get(node)
+            if dependents is not None:
+                dependents.discard(key)
+                if not dependents:
+                    del self._dependents[node]
+
+    def stale(self, delta: OntologyDelta) -> set[str]:
+        """Return the keys of artifacts depending on a node the delta touched.
+
+        Parameters
+        ----------
+        delta : OntologyDelta
+            Changes since the artifacts were generated.
+
+        Returns
+        -------
+        set[str]
+            Keys to regenerate.
+        """
+        keys: set[str] = set()
+        for node in delta.touched:
+            keys.update(self._dependents.get(node, ()))
+        return keys
+
+    def to_json(self) -> dict[str, Any]:
+        """Return a JSON-serializable form of the records."""
+        return {
+            "version": _FORMAT_VERSION,
+            "records": {
+                key: [artifact.name, artifact.code, sorted(artifact.dependencies)]
+                for key, artifact in sorted(self.records.items())
+            },
+        }
+
+    @classmethod
+    def from_json(cls, document: Any) -> DependencyMap:
+        """Rebuild a map from ``to_json`` output; anything else yields an empty map.
+
+        Parameters
+        ----------
+        document : Any
+            Parsed JSON document.
+
+        Returns
+        -------
+        DependencyMap
+            Map with the decoded records.
+        """
+        if not isinstance(document, dict) or document.get("version") != _FORMAT_VERSION:
+            return cls()
+        records: dict[str, ArtifactRecord] = {}
+        for key, fields in document.get("records", {}).items():
+            try:
+                name, code, dependencies = fields
+            except (TypeError, ValueError):
+                return cls()
+            records[key] = ArtifactRecord(name, code, frozenset(dependencies))
+        return cls(records)
+
+    def _index(self, key: str, artifact: ArtifactRecord) -> None:
+        """Add an artifact's dependencies to the reverse index."""
+        for node in artifact.dependencies:
+            self._dependents.setdefault(node, set()).add(key)
+
+
+@dataclass
+class GenerationState:
+    """What was generated from one source file, for the next incremental run.
+
+    Parameters
+    ----------
+    source_key : str
+        Content hash of the source the artifacts were generated from.
+    options : dict[str, Any]
+        Generation options that affect every artifact; any change forces a
+        full regeneration.
+    dependencies : DependencyMap
+        Generated artifacts and their dependencies.
+    """
+
+    source_key: str
+    options: dict[str, Any]
+    dependencies: DependencyMap = field(default_factory=DependencyMap)
+
+    @classmethod
+    def load(cls, path: Path) -> GenerationState | None:
+        """Read a saved state; a missing or unreadable file yields None.
+
+        Parameters
+        ----------
+        path : Path
+            File written by ``save``.
+
+        Returns
+        -------
+        GenerationState | None
+            The saved state, if any.
+        """
+        try:
+            document = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(document, dict) or not isinstance(document.get("source_key"), str):
+            return None
+        dependencies = DependencyMap.from_json(document.get("dependencies"))
+        return cls(document["source_key"], document.get("options", {}), dependencies)
+
+    def save(self, path: Path) -> None:
+        """Atomically write the state as JSON, creating parent directories.
+
+        Parameters
+        ----------
+        path : Path
+            Destination file.
+        """
+        document = {"source_key": self.source_key, "options": self.options, "dependencies": self.dependencies.to_json()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(document, handle, separators=(",", ":"))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
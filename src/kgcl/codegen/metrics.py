@@ -34,6 +34,8 @@ class UltraMetrics:
         Estimated memory saved through caching in MB
     parallel_workers : int
         Number of parallel workers used for processing
+    signatures_reused : int
+        Signatures kept from the previous run because their inputs did not change
 
     Examples
     --------
@@ -52,6 +54,7 @@ class UltraMetrics:
     graph_size: int = 0
     memory_saved_mb: float = 0.0
     parallel_workers: int = 0
+    signatures_reused: int = 0
 
     @property
     def cache_efficiency(self) -> float:
@@ -115,4 +118,5 @@ class UltraMetrics:
             "graph_size": self.graph_size,
             "parallel_workers": self.parallel_workers,
             "memory_saved_mb": self.memory_saved_mb,
+            "signatures_reused": self.signatures_reused,
         }
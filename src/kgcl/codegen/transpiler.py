@@ -3,8 +3,14 @@
 Main transpiler that coordinates all components to generate DSPy signatures
 from RDF ontologies with SHACL constraints. Includes parallel processing,
 caching, and OpenTelemetry instrumentation.
+
+Signature generation is incremental: each signature is recorded with the
+class, node shapes and property shapes it was derived from, and after a
+source file changes only signatures whose dependencies appear in the
+graph delta are rebuilt (see ``kgcl.codegen.incremental``).
 """
 
+import hashlib
 import mmap
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -17,6 +23,7 @@ from rdflib import Graph, Namespace
 from rdflib.namespace import OWL, RDF, RDFS, SH, XSD
 
 from kgcl.codegen.cache import GraphCache
+from kgcl.codegen.incremental import DependencyMap, GenerationState, OntologyDelta
 from kgcl.codegen.indexing import SHACLIndex
 from kgcl.codegen.metrics import UltraMetrics
 from kgcl.codegen.string_pool import StringPool
@@ -39,6 +46,12 @@ class UltraOptimizedTTL2DSPyTranspiler:
         Whether to enable parallel file processing
     max_workers : int, default=4
         Number of parallel workers for file processing
+    incremental : bool, default=True
+        Whether to rebuild only signatures affected by a source change.
+        State is kept in memory and, with the disk cache enabled, under
+        ``graph_cache.cache_dir / "signatures"``.
+    cache_dir : Path | None, default=None
+        Disk cache directory (the ``GraphCache`` default if None)
 
     Attributes
     ----------
@@ -59,14 +72,23 @@ class UltraOptimizedTTL2DSPyTranspiler:
     True
     """
 
-    def __init__(self, cache_size: int = 100, enable_parallel: bool = True, max_workers: int = 4) -> None:
+    def __init__(
+        self,
+        cache_size: int = 100,
+        enable_parallel: bool = True,
+        max_workers: int = 4,
+        incremental: bool = True,
+        cache_dir: Path | None = None,
+    ) -> None:
         """Initialize ultra-optimized transpiler."""
-        self.graph_cache = GraphCache(max_size=cache_size)
+        self.graph_cache = GraphCache(max_size=cache_size, cache_dir=cache_dir)
         self.string_pool = StringPool()
         self.enable_parallel = enable_parallel
         self.max_workers = max_workers
+        self.incremental = incremental
         self.metrics = UltraMetrics()
         self.seen_field_names: set[str] = set()
+        self._states: dict[Path, GenerationState] = {}
 
     def parse_ontology(self, ttl_file: Path) -> tuple[Graph, SHACLIndex, str]:
         """Ultra-fast ontology parsing with caching.
@@ -237,12 +259,120 @@ class UltraOptimizedTTL2DSPyTranspiler:
         for cls_uri in shacl_index.property_shape_index.keys():
             target_classes.add(rdflib.URIRef(cls_uri))
 
+        if not self.incremental:
+            for cls in target_classes:
+                cls_signatures = self._build_class_signature(cls, graph, shacl_index, allow_multi_output)
+                signatures.update(cls_signatures)
+            return signatures
+
+        source_key = self.graph_cache.cache_key(ttl_file)
+        options = {"allow_multi_output": allow_multi_output}
+        previous = self._load_state(ttl_file)
+        stale = self._stale_classes(previous, source_key, options, graph)
+        dependencies = previous.dependencies if previous is not None and stale is not None else DependencyMap()
+
+        class_keys = {str(cls) for cls in target_classes}
+        for key in [key for key in dependencies.records if key not in class_keys]:
+            dependencies.discard(key)
+
         for cls in target_classes:
+            key = str(cls)
+            if stale is not None and key in dependencies.records and key not in stale:
+                self.metrics.signatures_reused += 1
+                continue
             cls_signatures = self._build_class_signature(cls, graph, shacl_index, allow_multi_output)
-            signatures.update(cls_signatures)
+            if not cls_signatures:
+                dependencies.discard(key)
+                continue
+            ((name, code),) = cls_signatures.items()
+            dependencies.record(key, name, code, self._class_dependencies(cls, graph, shacl_index))
 
+        changed = previous is None or previous.source_key != source_key or stale is None
+        self._save_state(ttl_file, GenerationState(source_key, options, dependencies), persist=changed)
+        for artifact in dependencies.records.values():
+            signatures[artifact.name] = artifact.code
         return signatures
 
+    def _class_dependencies(self, cls: rdflib.URIRef, graph: Graph, shacl_index: SHACLIndex) -> set[str]:
+        """Return the nodes a class signature is derived from.
+
+        These are the class, the node shapes targeting it and its property
+        shapes; ``_build_class_signature`` reads only triples about them.
+
+        Parameters
+        ----------
+        cls : rdflib.URIRef
+            Class URI
+        graph : Graph
+            RDF graph
+        shacl_index : SHACLIndex
+            SHACL index
+
+        Returns
+        -------
+        Set[str]
+            Dependency nodes as strings
+        """
+        nodes = {str(cls)}
+        nodes.update(str(shape) for shape in graph.subjects(SH.targetClass, cls))
+        nodes.update(shacl_index.get_property_shapes_for_class(str(cls)))
+        return nodes
+
+    def _stale_classes(
+        self, previous: GenerationState | None, source_key: str, options: dict[str, Any], graph: Graph
+    ) -> set[str] | None:
+        """Return the classes whose signatures must be rebuilt, or None for all.
+
+        Parameters
+        ----------
+        previous : Optional[GenerationState]
+            State of the last run for this file
+        source_key : str
+            Content hash of the file now
+        options : Dict[str, Any]
+            Options of this run
+        graph : Graph
+            Current graph
+
+        Returns
+        -------
+        Optional[Set[str]]
+            Class URIs to rebuild; None when there is nothing to diff against
+        """
+        if previous is None or previous.options != options:
+            return None
+        if previous.source_key == source_key:
+            return set()
+        old_graph = self.graph_cache.get_by_key(previous.source_key)
+        if old_graph is None:
+            return None
+        return previous.dependencies.stale(OntologyDelta.between(old_graph, graph))
+
+    def _state_path(self, ttl_file: Path) -> Path | None:
+        """Return where a file's generation state is saved, if on disk at all."""
+        if not self.graph_cache.enable_disk_cache:
+            return None
+        name = hashlib.sha256(str(ttl_file.resolve()).encode("utf-8")).hexdigest()
+        return self.graph_cache.cache_dir / "signatures" / f"{name}.json"
+
+    def _load_state(self, ttl_file: Path) -> GenerationState | None:
+        """Return the state of the last run for a file, from memory or disk."""
+        state = self._states.get(ttl_file.resolve())
+        if state is None:
+            path = self._state_path(ttl_file)
+            state = GenerationState.load(path) if path is not None else None
+        return state
+
+    def _save_state(self, ttl_file: Path, state: GenerationState, *, persist: bool) -> None:
+        """Keep a file's state for the next run in memory and, with ``persist``, on disk."""
+        self._states[ttl_file.resolve()] = state
+        path = self._state_path(ttl_file)
+        if persist and path is not None:
+            try:
+                state.save(path)
+            except OSError:
+                pass
+
     def _build_class_signature(
         self, cls: rdflib.URIRef, graph: Graph, shacl_index: SHACLIndex, allow_multi_output: bool
     ) -> dict[str, str]:
@@ -15,14 +15,27 @@ Example
 
 from __future__ import annotations
 
+from kgcl.daemon.binary_log import BinaryEventLog, EventLogCorruptionError
 from kgcl.daemon.event_store import DomainEvent, EventType, RDFEventStore, TemporalVector, compute_state_hash
-from kgcl.daemon.kgcld import DaemonConfig, DaemonState, KGCLDaemon, MutationReceipt, QueryResult
+from kgcl.daemon.kgcld import (
+    BackpressurePolicy,
+    DaemonConfig,
+    DaemonState,
+    KGCLDaemon,
+    MutationReceipt,
+    QueryResult,
+    SubscriberStats,
+    Subscription,
+)
 from kgcl.daemon.service_gateway import ServiceGateway, ServiceInvocation, ServiceReference, ServiceStatus
 
 __all__ = [
+    "BackpressurePolicy",
+    "BinaryEventLog",
     "DaemonConfig",
     "DaemonState",
     "DomainEvent",
+    "EventLogCorruptionError",
     "EventType",
     "KGCLDaemon",
     "MutationReceipt",
@@ -32,6 +45,8 @@ __all__ = [
     "ServiceInvocation",
     "ServiceReference",
     "ServiceStatus",
+    "SubscriberStats",
+    "Subscription",
     "TemporalVector",
     "compute_state_hash",
 ]
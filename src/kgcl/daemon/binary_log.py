@@ -0,0 +1,626 @@
+"""Binary append-only event log for RDFEventStore.
+
+Storing every event as a reified RDF node costs ten or more quads per
+mutation, and replay then goes through SPARQL decoding. This module
+keeps the event log as compact binary records instead:
+
+- ``events.log`` holds length-prefixed records, each with a CRC-32. A
+  term record defines the next id in a string dictionary, and an event
+  record references IRIs, literals, payload keys and event types by
+  those ids.
+- ``events.idx`` holds one 8-byte log offset per sequence number and is
+  read through ``mmap``, so fetching an event by sequence is a single
+  lookup. Events appended since the files were last mapped are read
+  from a bounded in-memory tail, so appends do not force a remap.
+
+The log file is the source of truth. On open it is scanned once to
+rebuild the term dictionary. A torn record at the end (from a crash
+during a write) is truncated, and the index is rebuilt if it does not
+match. A complete record with a bad checksum raises
+``EventLogCorruptionError``.
+
+Example
+-------
+>>> log = BinaryEventLog(tmp_path / "events")
+>>> store = RDFEventStore(event_log=log)
+>>> store.append(event)
+1
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from bisect import bisect_right
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from kgcl.daemon.event_store import DomainEvent, EventType
+
+logger = logging.getLogger(__name__)
+
+LOG_MAGIC = b"KGCLLOG1"
+INDEX_MAGIC = b"KGCLIDX1"
+
+# Record: body length, CRC-32 of kind + body, kind
+_RECORD = struct.Struct("<IIB")
+_KIND_TERM = 1
+_KIND_EVENT = 2
+
+# Event body: sequence, timestamp, event type term, payload field count
+_EVENT = struct.Struct("<QdIH")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_OFFSET = struct.Struct("<Q")
+_TRIPLE = struct.Struct("<III")
+
+# Payload value tags
+_TAG_TERM = 0
+_TAG_INT = 1
+_TAG_FLOAT = 2
+_TAG_TRIPLES = 3
+_TAG_JSON = 4
+
+# Event records kept in memory before the files are mapped again
+_TAIL_LIMIT = 1024
+
+
+class EventLogCorruptionError(ValueError):
+    """Raised when a complete log record fails its checksum.
+
+    Parameters
+    ----------
+    path : Path
+        Log file
+    offset : int
+        Byte offset of the damaged record
+    """
+
+    def __init__(self, path: Path, offset: int) -> None:
+        self.path = path
+        self.offset = offset
+        super().__init__(f"Corrupt event log record at offset {offset} in {path}")
+
+
+class _View(NamedTuple):
+    """Consistent snapshot of the log for one read."""
+
+    log_map: mmap.mmap
+    index_map: mmap.mmap
+    mapped: int
+    tail: list[bytes]
+    count: int
+
+
+def _is_triples(value: Any) -> bool:
+    """Check whether a payload value is a list of (s, p, o) string tuples."""
+    return isinstance(value, list) and all(
+        isinstance(item, tuple) and len(item) == 3 and all(isinstance(term, str) for term in item) for item in value
+    )
+
+
+class BinaryEventLog:
+    """Append-only binary event log with a term dictionary and mmap'd index.
+
+    Sequence numbers are assigned contiguously from 1. Appends and reads
+    are thread-safe; replay iterates over a snapshot of the log taken
+    when it starts.
+
+    Parameters
+    ----------
+    directory : Path | str
+        Directory holding ``events.log`` and ``events.idx`` (created if missing)
+    sync : bool
+        Call ``fsync`` after every append (default: False, flush only)
+
+    Examples
+    --------
+    >>> log = BinaryEventLog(tmp_path)
+    >>> log.append(event)
+    1
+    >>> log.get(1).event_id == event.event_id
+    True
+    """
+
+    def __init__(self, directory: Path | str, *, sync: bool = False) -> None:
+        """Open or create the log, recovering from a torn last write.
+
+        Parameters
+        ----------
+        directory : Path | str
+            Directory holding the log files
+        sync : bool
+            Call ``fsync`` after every append
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._log_path = self._directory / "events.log"
+        self._index_path = self._directory / "events.idx"
+        self._sync = sync
+        self._lock = threading.RLock()
+        self._terms: list[str] = [""]  # id 0 is unused
+        self._term_ids: dict[str, int] = {}
+        self._event_ids: dict[str, int] = {}
+        self._log_map: mmap.mmap | None = None
+        self._index_map: mmap.mmap | None = None
+        self._mapped = 0
+        self._tail: list[bytes] = []
+        self._last_timestamp = float("-inf")
+        self._time_ordered = True
+
+        if not self._log_path.exists() or self._log_path.stat().st_size == 0:
+            self._log_path.write_bytes(LOG_MAGIC)
+        offsets = self._recover()
+
+        if not self._index_matches(offsets):
+            logger.info("Rebuilding event index %s", self._index_path)
+            self._index_path.write_bytes(INDEX_MAGIC + b"".join(_OFFSET.pack(offset) for offset in offsets))
+
+        self._count = len(offsets)
+        self._log_file = self._log_path.open("ab")
+        self._index_file = self._index_path.open("ab")
+
+    def __enter__(self) -> BinaryEventLog:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the log on context exit."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of events in the log."""
+        return self._count
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the last event (0 if empty)."""
+        return self._count
+
+    @property
+    def term_count(self) -> int:
+        """Number of distinct strings in the term dictionary."""
+        return len(self._terms) - 1
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the log files."""
+        return self._directory
+
+    def append(self, event: DomainEvent) -> int:
+        """Append an event and assign it the next sequence number.
+
+        New strings are written as term records ahead of the event, in
+        the same write, so a record never references an undefined term.
+
+        Parameters
+        ----------
+        event : DomainEvent
+            Event to append (its sequence is ignored)
+
+        Returns
+        -------
+        int
+            Assigned sequence number
+        """
+        with self._lock:
+            sequence = self._count + 1
+            new_terms: list[str] = []
+            try:
+                body = self._encode_event(event, sequence, new_terms)
+            except (TypeError, ValueError, struct.error):
+                # Forget terms interned for an event that is not written
+                del self._terms[len(self._terms) - len(new_terms) :]
+                for term in new_terms:
+                    del self._term_ids[term]
+                raise
+
+            chunks = [self._record(_KIND_TERM, term.encode("utf-8")) for term in new_terms]
+            chunks.append(self._record(_KIND_EVENT, body))
+            offset = self._log_file.tell() + sum(len(chunk) for chunk in chunks[:-1])
+
+            self._log_file.write(b"".join(chunks))
+            self._log_file.flush()
+            self._index_file.write(_OFFSET.pack(offset))
+            self._index_file.flush()
+            if self._sync:
+                os.fsync(self._log_file.fileno())
+                os.fsync(self._index_file.fileno())
+
+            self._count = sequence
+            self._event_ids[event.event_id] = sequence
+            self._tail.append(chunks[-1])
+            self._observe_timestamp(event.timestamp)
+            return sequence
+
+    def get(self, sequence: int) -> DomainEvent | None:
+        """Get the event with a sequence number.
+
+        Parameters
+        ----------
+        sequence : int
+            Sequence number
+
+        Returns
+        -------
+        DomainEvent | None
+            Event if present, None otherwise
+        """
+        if sequence < 1 or sequence > self._count:
+            return None
+        return self._decode_event(*self._locate(self._view(), sequence))
+
+    def find(self, event_id: str) -> DomainEvent | None:
+        """Get an event by its identifier.
+
+        Parameters
+        ----------
+        event_id : str
+            Event identifier
+
+        Returns
+        -------
+        DomainEvent | None
+            Event if present, None otherwise
+        """
+        sequence = self._event_ids.get(event_id)
+        return self.get(sequence) if sequence is not None else None
+
+    def replay(
+        self, from_seq: int = 0, to_seq: int | None = None, event_types: list[EventType] | None = None
+    ) -> Iterator[DomainEvent]:
+        """Replay events in sequence order.
+
+        Parameters
+        ----------
+        from_seq : int
+            Start sequence (exclusive, default: 0)
+        to_seq : int | None
+            End sequence (inclusive, default: latest)
+        event_types : list[EventType] | None
+            Filter by event types (default: all)
+
+        Yields
+        ------
+        DomainEvent
+            Events in sequence order
+        """
+        view = self._view()
+        last = view.count if to_seq is None else min(to_seq, view.count)
+        wanted = {self._term_ids.get(event_type.value, -1) for event_type in event_types} if event_types else None
+        for sequence in range(max(from_seq, 0) + 1, last + 1):
+            buffer, offset = self._locate(view, sequence)
+            if wanted is not None and self._event_header(buffer, offset)[2] not in wanted:
+                continue
+            yield self._decode_event(buffer, offset)
+
+    def count(self, from_seq: int = 0, to_seq: int | None = None, event_type: EventType | None = None) -> int:
+        """Count events in a sequence range.
+
+        Parameters
+        ----------
+        from_seq : int
+            Start sequence (exclusive)
+        to_seq : int | None
+            End sequence (inclusive)
+        event_type : EventType | None
+            Filter by type
+
+        Returns
+        -------
+        int
+            Event count
+        """
+        first = max(from_seq, 0) + 1
+        if event_type is None:
+            last = self._count if to_seq is None else min(to_seq, self._count)
+            return max(last - first + 1, 0)
+        view = self._view()
+        last = view.count if to_seq is None else min(to_seq, view.count)
+        type_id = self._term_ids.get(event_type.value, -1)
+        return sum(
+            1 for sequence in range(first, last + 1) if self._event_header(*self._locate(view, sequence))[2] == type_id
+        )
+
+    def sequence_at_time(self, timestamp: float) -> int:
+        """Find the highest sequence whose event timestamp is not after a time.
+
+        Bisects the index while event timestamps are non-decreasing, and
+        falls back to a reverse scan once an event was appended with an
+        earlier timestamp than its predecessor.
+
+        Parameters
+        ----------
+        timestamp : float
+            Unix timestamp
+
+        Returns
+        -------
+        int
+            Sequence number (0 if no events before timestamp)
+        """
+        view = self._view()
+        sequences = range(1, view.count + 1)
+
+        def event_time(sequence: int) -> float:
+            return self._event_header(*self._locate(view, sequence))[1]
+
+        if self._time_ordered:
+            return bisect_right(sequences, timestamp, key=event_time)
+        return next((sequence for sequence in reversed(sequences) if event_time(sequence) <= timestamp), 0)
+
+    def verify(self) -> int:
+        """Check the checksum of every record.
+
+        Returns
+        -------
+        int
+            Number of events verified
+
+        Raises
+        ------
+        EventLogCorruptionError
+            If a record fails its checksum
+        """
+        view = self._view()
+        for sequence in range(1, view.count + 1):
+            self._checked_body(*self._locate(view, sequence))
+        return view.count
+
+    def flush(self) -> None:
+        """Flush and fsync both files."""
+        with self._lock:
+            for handle in (self._log_file, self._index_file):
+                if not handle.closed:
+                    handle.flush()
+                    os.fsync(handle.fileno())
+
+    def close(self) -> None:
+        """Flush and close the log files."""
+        with self._lock:
+            self.flush()
+            self._log_file.close()
+            self._index_file.close()
+            self._log_map = None
+            self._index_map = None
+            self._mapped = 0
+            self._tail = []
+
+    # -------------------------------------------------------------------------
+    # Encoding
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _record(kind: int, body: bytes) -> bytes:
+        """Frame a record body with its length, checksum and kind."""
+        kind_byte = bytes((kind,))
+        return _RECORD.pack(len(body), zlib.crc32(kind_byte + body), kind) + body
+
+    def _intern(self, term: str, new_terms: list[str]) -> int:
+        """Return a term id, defining the term if it is new."""
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = len(self._terms)
+            self._terms.append(term)
+            self._term_ids[term] = term_id
+            new_terms.append(term)
+        return term_id
+
+    def _encode_event(self, event: DomainEvent, sequence: int, new_terms: list[str]) -> bytes:
+        """Encode an event body, collecting terms that must be defined first."""
+        parts = [
+            _EVENT.pack(sequence, event.timestamp, self._intern(event.event_type.value, new_terms), len(event.payload)),
+            self._inline(event.event_id),
+            self._inline(event.state_hash or ""),
+        ]
+        for key, value in event.payload.items():
+            parts.append(_U32.pack(self._intern(key, new_terms)))
+            if isinstance(value, str):
+                parts.append(bytes((_TAG_TERM,)) + _U32.pack(self._intern(value, new_terms)))
+            elif isinstance(value, bool):
+                parts.append(bytes((_TAG_JSON,)) + self._inline_long(json.dumps(value)))
+            elif isinstance(value, int) and -(2**63) <= value < 2**63:
+                parts.append(bytes((_TAG_INT,)) + _I64.pack(value))
+            elif isinstance(value, float):
+                parts.append(bytes((_TAG_FLOAT,)) + _F64.pack(value))
+            elif _is_triples(value):
+                parts.append(bytes((_TAG_TRIPLES,)) + _U32.pack(len(value)))
+                parts.extend(_TRIPLE.pack(*(self._intern(term, new_terms) for term in triple)) for triple in value)
+            else:
+                parts.append(bytes((_TAG_JSON,)) + self._inline_long(json.dumps(value)))
+        return b"".join(parts)
+
+    @staticmethod
+    def _inline(text: str) -> bytes:
+        """Encode a short string with a 2-byte length prefix."""
+        data = text.encode("utf-8")
+        return _U16.pack(len(data)) + data
+
+    @staticmethod
+    def _inline_long(text: str) -> bytes:
+        """Encode a string with a 4-byte length prefix."""
+        data = text.encode("utf-8")
+        return _U32.pack(len(data)) + data
+
+    # -------------------------------------------------------------------------
+    # Decoding
+    # -------------------------------------------------------------------------
+
+    def _view(self) -> _View:
+        """Snapshot of the maps and in-memory tail covering every appended event.
+
+        The files are mapped on the first read and mapped again only once
+        more than ``_TAIL_LIMIT`` events were appended since. Maps and
+        tails are replaced rather than modified, so a snapshot stays
+        valid for replays still using it.
+        """
+        with self._lock:
+            if self._log_file.closed:
+                msg = f"Event log {self._log_path} is closed"
+                raise ValueError(msg)
+            if self._log_map is None or self._index_map is None or len(self._tail) > _TAIL_LIMIT:
+                self._log_map = self._map(self._log_path)
+                self._index_map = self._map(self._index_path)
+                self._mapped = self._count
+                self._tail = []
+            return _View(self._log_map, self._index_map, self._mapped, self._tail, self._count)
+
+    def _locate(self, view: _View, sequence: int) -> tuple[mmap.mmap | bytes, int]:
+        """Buffer holding an event record and the record's offset in it."""
+        if sequence <= view.mapped:
+            return view.log_map, self._offset(view.index_map, sequence)
+        return view.tail[sequence - view.mapped - 1], 0
+
+    def _observe_timestamp(self, timestamp: float) -> None:
+        """Track whether event timestamps are still in sequence order."""
+        if timestamp < self._last_timestamp:
+            self._time_ordered = False
+        self._last_timestamp = timestamp
+
+    @staticmethod
+    def _map(path: Path) -> mmap.mmap:
+        """Map a whole file read-only."""
+        with path.open("rb") as handle:
+            return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def _offset(index_map: mmap.mmap, sequence: int) -> int:
+        """Log offset of an event record."""
+        return _OFFSET.unpack_from(index_map, len(INDEX_MAGIC) + (sequence - 1) * _OFFSET.size)[0]
+
+    @staticmethod
+    def _event_header(buffer: mmap.mmap | bytes, offset: int) -> tuple[int, float, int, int]:
+        """Sequence, timestamp, event type term and field count of a record."""
+        return _EVENT.unpack_from(buffer, offset + _RECORD.size)
+
+    def _checked_body(self, buffer: mmap.mmap | bytes, offset: int) -> bytes:
+        """Return a record's body after verifying its checksum."""
+        length, crc, kind = _RECORD.unpack_from(buffer, offset)
+        start = offset + _RECORD.size
+        body = buffer[start : start + length]
+        if zlib.crc32(bytes((kind,)) + body) != crc:
+            raise EventLogCorruptionError(self._log_path, offset)
+        return body
+
+    def _decode_event(self, buffer: mmap.mmap | bytes, offset: int) -> DomainEvent:
+        """Decode and verify the event record at an offset."""
+        body = self._checked_body(buffer, offset)
+        terms = self._terms
+        sequence, timestamp, type_id, field_count = _EVENT.unpack_from(body, 0)
+        position = _EVENT.size
+        event_id, position = self._read_inline(body, position)
+        state_hash, position = self._read_inline(body, position)
+
+        payload: dict[str, Any] = {}
+        for _ in range(field_count):
+            key = terms[_U32.unpack_from(body, position)[0]]
+            tag = body[position + 4]
+            position += 5
+            if tag == _TAG_TERM:
+                payload[key] = terms[_U32.unpack_from(body, position)[0]]
+                position += _U32.size
+            elif tag == _TAG_INT:
+                payload[key] = _I64.unpack_from(body, position)[0]
+                position += _I64.size
+            elif tag == _TAG_FLOAT:
+                payload[key] = _F64.unpack_from(body, position)[0]
+                position += _F64.size
+            elif tag == _TAG_TRIPLES:
+                count = _U32.unpack_from(body, position)[0]
+                position += _U32.size
+                payload[key] = [
+                    (terms[s], terms[p], terms[o])
+                    for s, p, o in _TRIPLE.iter_unpack(body[position : position + count * _TRIPLE.size])
+                ]
+                position += count * _TRIPLE.size
+            else:
+                length = _U32.unpack_from(body, position)[0]
+                position += _U32.size
+                payload[key] = json.loads(body[position : position + length])
+                position += length
+
+        return DomainEvent(
+            event_id=event_id,
+            event_type=EventType(terms[type_id]),
+            timestamp=timestamp,
+            sequence=sequence,
+            payload=payload,
+            state_hash=state_hash or None,
+        )
+
+    @staticmethod
+    def _read_inline(body: bytes, position: int) -> tuple[str, int]:
+        """Read a 2-byte length-prefixed string."""
+        length = _U16.unpack_from(body, position)[0]
+        start = position + _U16.size
+        return body[start : start + length].decode("utf-8"), start + length
+
+    # -------------------------------------------------------------------------
+    # Recovery
+    # -------------------------------------------------------------------------
+
+    def _recover(self) -> list[int]:
+        """Scan the log, rebuilding terms and event offsets.
+
+        Returns
+        -------
+        list[int]
+            Offset of every event record in sequence order
+
+        Raises
+        ------
+        EventLogCorruptionError
+            If the file is not an event log or a complete record fails its checksum
+        """
+        data = self._log_path.read_bytes()
+        if not data.startswith(LOG_MAGIC):
+            raise EventLogCorruptionError(self._log_path, 0)
+
+        offsets: list[int] = []
+        position = len(LOG_MAGIC)
+        while position < len(data):
+            if position + _RECORD.size > len(data):
+                break
+            length, crc, kind = _RECORD.unpack_from(data, position)
+            end = position + _RECORD.size + length
+            if end > len(data):
+                break
+            body = data[position + _RECORD.size : end]
+            if zlib.crc32(bytes((kind,)) + body) != crc:
+                raise EventLogCorruptionError(self._log_path, position)
+            if kind == _KIND_TERM:
+                term = body.decode("utf-8")
+                self._term_ids[term] = len(self._terms)
+                self._terms.append(term)
+            else:
+                offsets.append(position)
+                event_id, _ = self._read_inline(body, _EVENT.size)
+                self._event_ids[event_id] = len(offsets)
+                self._observe_timestamp(_EVENT.unpack_from(body, 0)[1])
+            position = end
+
+        if position < len(data):
+            logger.warning("Truncating %d bytes of incomplete record from %s", len(data) - position, self._log_path)
+            with self._log_path.open("r+b") as handle:
+                handle.truncate(position)
+        return offsets
+
+    def _index_matches(self, offsets: list[int]) -> bool:
+        """Check whether the index file lists exactly the recovered offsets."""
+        if not self._index_path.exists():
+            return False
+        data = self._index_path.read_bytes()
+        if not data.startswith(INDEX_MAGIC) or len(data) != len(INDEX_MAGIC) + len(offsets) * _OFFSET.size:
+            return False
+        return all(
+            _OFFSET.unpack_from(data, len(INDEX_MAGIC) + i * _OFFSET.size)[0] == offset
+            for i, offset in enumerate(offsets)
+        )
@@ -7,6 +7,8 @@ coordinates. Features:
 - 4D ontology: entities exist across time dimension
 - Time-travel queries via SPARQL temporal filters
 - Named graphs as temporal snapshots
+- Optional binary append-only log (``BinaryEventLog``) in place of the
+  RDF event graph, with the RDF view materialized on demand
 
 Architecture
 ------------
@@ -36,15 +38,19 @@ Example
 from __future__ import annotations
 
 import hashlib
+import json
 import time
 import uuid
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pyoxigraph import BlankNode, Literal, NamedNode, Quad, Store
 
+if TYPE_CHECKING:
+    from kgcl.daemon.binary_log import BinaryEventLog
+
 # =============================================================================
 # Namespace Constants
 # =============================================================================
@@ -65,6 +71,8 @@ PRED_OBJECT = NamedNode(f"{KGCL_VOCAB}object")
 PRED_STATE_HASH = NamedNode(f"{KGCL_VOCAB}stateHash")
 PRED_PAYLOAD_KEY = NamedNode(f"{KGCL_VOCAB}payloadKey")
 PRED_PAYLOAD_VALUE = NamedNode(f"{KGCL_VOCAB}payloadValue")
+PRED_ADDITIONS = NamedNode(f"{KGCL_VOCAB}additions")
+PRED_REMOVALS = NamedNode(f"{KGCL_VOCAB}removals")
 
 # Named graphs (URIs as strings for SPARQL, NamedNodes for API)
 EVENTS_GRAPH_URI = f"{KGCL_NS}events"
@@ -76,6 +84,9 @@ STATE_GRAPH = NamedNode(STATE_GRAPH_URI)
 RDF_TYPE = NamedNode("http://www.w3.org/1999/02/22-rdf-syntax-ns#type")
 EVENT_CLASS = NamedNode(f"{KGCL_VOCAB}Event")
 
+# (subject, predicate, object) as accepted by KGCLDaemon mutations
+Triple = tuple[str, str, str]
+
 
 class EventType(Enum):
     """Domain event types for KGCL operations.
@@ -88,6 +99,7 @@ class EventType(Enum):
 
     TRIPLE_ADDED = "triple.added"
     TRIPLE_REMOVED = "triple.removed"
+    CHANGESET_APPLIED = "changeset.applied"
     GRAPH_LOADED = "graph.loaded"
     TICK_COMPLETED = "tick.completed"
     HOOK_FIRED = "hook.fired"
@@ -164,12 +176,18 @@ class RDFEventStore:
     """RDF-native event store using PyOxigraph with 4D ontology.
 
     Events are stored as reified statements with temporal vectors,
-    enabling time-travel queries via SPARQL.
+    enabling time-travel queries via SPARQL. With an ``event_log``, events
+    go to a compact binary log instead and only the state graph lives in
+    PyOxigraph; ``materialize_events`` provides the RDF view on demand.
 
     Parameters
     ----------
     store : Store | None
         PyOxigraph store instance (creates in-memory if None)
+    max_event_log_size : int | None
+        Maximum events kept in the RDF log (FIFO purge)
+    event_log : BinaryEventLog | None
+        Binary log to record events in instead of the events graph
 
     Attributes
     ----------
@@ -195,7 +213,13 @@ class RDFEventStore:
     1
     """
 
-    def __init__(self, store: Store | None = None, max_event_log_size: int | None = None) -> None:
+    def __init__(
+        self,
+        store: Store | None = None,
+        max_event_log_size: int | None = None,
+        *,
+        event_log: BinaryEventLog | None = None,
+    ) -> None:
         """Initialize RDF event store.
 
         Parameters
@@ -204,12 +228,27 @@ class RDFEventStore:
             PyOxigraph store instance (creates in-memory if None)
         max_event_log_size : int | None
             Maximum number of events to keep in log. Older events are purged
-            via FIFO when exceeded. If None, no limit.
+            via FIFO when exceeded. If None, no limit. Not supported with
+            an append-only ``event_log``.
+        event_log : BinaryEventLog | None
+            Binary log to record events in. If the store has no state yet,
+            the state graph is rebuilt by replaying the log.
+
+        Raises
+        ------
+        ValueError
+            If both ``max_event_log_size`` and ``event_log`` are given
         """
+        if event_log is not None and max_event_log_size is not None:
+            msg = "max_event_log_size cannot be used with an append-only event log"
+            raise ValueError(msg)
         self._store = store if store is not None else Store()
+        self._event_log = event_log
         self._sequence = self._get_max_sequence()
         self._tick = 0
         self._max_event_log_size = max_event_log_size
+        if event_log is not None and self._sequence > 0 and self._state_is_empty():
+            self._restore_state()
 
     @property
     def sequence(self) -> int:
@@ -226,8 +265,24 @@ class RDFEventStore:
         """Underlying PyOxigraph store."""
         return self._store
 
+    @property
+    def event_log(self) -> BinaryEventLog | None:
+        """Binary event log, if events are not stored as RDF."""
+        return self._event_log
+
+    def _state_is_empty(self) -> bool:
+        """Check whether the state graph has no triples."""
+        return next(iter(self._store.quads_for_pattern(None, None, None, STATE_GRAPH)), None) is None
+
+    def _restore_state(self) -> None:
+        """Rebuild the state graph by replaying the binary log."""
+        for event in self.replay():
+            self._apply_to_state(event)
+
     def _get_max_sequence(self) -> int:
         """Get maximum sequence number from store via SPARQL."""
+        if self._event_log is not None:
+            return self._event_log.sequence
         query = f"""
         PREFIX kgcl: <{KGCL_VOCAB}>
         PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
@@ -243,7 +298,10 @@ class RDFEventStore:
         return 0
 
     def append(self, event: DomainEvent) -> int:
-        """Append event to log as reified RDF statement.
+        """Append event to the log and apply it to the state graph.
+
+        The event is recorded as a reified RDF statement, or as a binary
+        record when the store has an event log.
 
         Parameters
         ----------
@@ -268,7 +326,64 @@ class RDFEventStore:
         >>> store.append(event)
         1
         """
-        self._sequence += 1
+        if self._event_log is not None:
+            self._sequence = self._event_log.append(event)
+        else:
+            self._sequence += 1
+            # Atomic insert
+            self._store.extend(self._event_quads(event, self._sequence))
+
+        self._apply_to_state(event)
+
+        # Compact if over limit (FIFO)
+        if self._max_event_log_size is not None:
+            self._compact_log_fifo()
+
+        return self._sequence
+
+    def _apply_to_state(self, event: DomainEvent) -> None:
+        """Apply TRIPLE_ADDED/REMOVED and changeset events to the state graph."""
+        self._apply_event(self._store, STATE_GRAPH, event)
+
+    def _apply_event(self, store: Store, graph: NamedNode | None, event: DomainEvent) -> None:
+        """Apply a state-changing event to a graph; other events are ignored.
+
+        Parameters
+        ----------
+        store : Store
+            Store to modify
+        graph : NamedNode | None
+            Target graph (default graph if None)
+        event : DomainEvent
+            Event to apply
+        """
+        payload = event.payload
+        if event.event_type == EventType.CHANGESET_APPLIED:
+            self._apply_changeset(store, graph, payload)
+        elif event.event_type in (EventType.TRIPLE_ADDED, EventType.TRIPLE_REMOVED) and all(
+            key in payload for key in ("s", "p", "o")
+        ):
+            quad = Quad(self._to_term(payload["s"]), self._to_term(payload["p"]), self._to_term(payload["o"]), graph)
+            if event.event_type == EventType.TRIPLE_ADDED:
+                store.add(quad)
+            else:
+                store.remove(quad)
+
+    def _event_quads(self, event: DomainEvent, sequence: int) -> list[Quad]:
+        """Encode an event as reified quads in the events graph.
+
+        Parameters
+        ----------
+        event : DomainEvent
+            Event to encode
+        sequence : int
+            Sequence number assigned to the event
+
+        Returns
+        -------
+        list[Quad]
+            Quads describing the event
+        """
         event_node = NamedNode(f"{KGCL_EVENT_NS}{event.event_id}")
 
         quads = [
@@ -278,7 +393,7 @@ class RDFEventStore:
             Quad(event_node, PRED_EVENT_TYPE, Literal(event.event_type.value), EVENTS_GRAPH),
             # Temporal vector
             Quad(event_node, PRED_TIMESTAMP, Literal(str(event.timestamp)), EVENTS_GRAPH),
-            Quad(event_node, PRED_SEQUENCE, Literal(str(self._sequence)), EVENTS_GRAPH),
+            Quad(event_node, PRED_SEQUENCE, Literal(str(sequence)), EVENTS_GRAPH),
         ]
 
         # Add state hash if present
@@ -296,9 +411,18 @@ class RDFEventStore:
                 ]
             )
 
+        # Encode changesets compactly: one JSON literal per side
+        if event.event_type == EventType.CHANGESET_APPLIED:
+            quads.extend(
+                [
+                    Quad(event_node, PRED_ADDITIONS, Literal(_encode_triples(payload["additions"])), EVENTS_GRAPH),
+                    Quad(event_node, PRED_REMOVALS, Literal(_encode_triples(payload["removals"])), EVENTS_GRAPH),
+                ]
+            )
+
         # Encode remaining payload as key-value pairs
         for key, value in payload.items():
-            if key not in ("s", "p", "o"):
+            if key not in ("s", "p", "o", "additions", "removals"):
                 payload_node = BlankNode()
                 quads.extend(
                     [
@@ -307,22 +431,45 @@ class RDFEventStore:
                         Quad(payload_node, NamedNode(f"{KGCL_VOCAB}value"), Literal(str(value)), EVENTS_GRAPH),
                     ]
                 )
+        return quads
 
-        # Atomic insert
-        for quad in quads:
-            self._store.add(quad)
+    def materialize_events(self, from_seq: int = 0, to_seq: int | None = None) -> Store:
+        """Build the reified RDF view of a range of events.
 
-        # Apply to state graph for TRIPLE_ADDED/REMOVED
-        if event.event_type == EventType.TRIPLE_ADDED:
-            self._apply_triple_add(payload)
-        elif event.event_type == EventType.TRIPLE_REMOVED:
-            self._apply_triple_remove(payload)
+        Gives provenance SPARQL queries the same events graph whether
+        events are stored as RDF or in a binary log.
 
-        # Compact if over limit (FIFO)
-        if self._max_event_log_size is not None:
-            self._compact_log_fifo()
+        Parameters
+        ----------
+        from_seq : int
+            Start sequence (exclusive, default: 0)
+        to_seq : int | None
+            End sequence (inclusive, default: latest)
 
-        return self._sequence
+        Returns
+        -------
+        Store
+            New store with the events in the ``urn:kgcl:events`` graph
+
+        Examples
+        --------
+        >>> view = store.materialize_events()
+        >>> list(view.query("SELECT ?e WHERE { GRAPH <urn:kgcl:events> { ?e a <urn:kgcl:vocab#Event> } }"))
+        """
+        view = Store()
+        for event in self.replay(from_seq=from_seq, to_seq=to_seq):
+            view.extend(self._event_quads(event, event.sequence))
+        return view
+
+    def flush(self) -> None:
+        """Make appended events durable when a binary log is used."""
+        if self._event_log is not None:
+            self._event_log.flush()
+
+    def close(self) -> None:
+        """Flush and close the binary log, if one is used."""
+        if self._event_log is not None:
+            self._event_log.close()
 
     def _to_term(self, value: str) -> NamedNode | Literal:
         """Convert string to RDF term (NamedNode if URI, else Literal)."""
@@ -330,21 +477,23 @@ class RDFEventStore:
             return NamedNode(value)
         return Literal(value)
 
-    def _apply_triple_add(self, payload: dict[str, Any]) -> None:
-        """Apply triple addition to state graph."""
-        if "s" in payload and "p" in payload and "o" in payload:
-            quad = Quad(
-                self._to_term(payload["s"]), self._to_term(payload["p"]), self._to_term(payload["o"]), STATE_GRAPH
-            )
-            self._store.add(quad)
+    def _apply_changeset(self, store: Store, graph: NamedNode | None, payload: dict[str, Any]) -> None:
+        """Apply a changeset's removals, then its additions, to a graph.
 
-    def _apply_triple_remove(self, payload: dict[str, Any]) -> None:
-        """Apply triple removal from state graph."""
-        if "s" in payload and "p" in payload and "o" in payload:
-            quad = Quad(
-                self._to_term(payload["s"]), self._to_term(payload["p"]), self._to_term(payload["o"]), STATE_GRAPH
-            )
-            self._store.remove(quad)
+        Parameters
+        ----------
+        store : Store
+            Store to modify
+        graph : NamedNode | None
+            Target graph (default graph if None)
+        payload : dict[str, Any]
+            Changeset payload with "additions" and "removals" triples
+        """
+        for s, p, o in payload["removals"]:
+            store.remove(Quad(self._to_term(s), self._to_term(p), self._to_term(o), graph))
+        store.extend(
+            Quad(self._to_term(s), self._to_term(p), self._to_term(o), graph) for s, p, o in payload["additions"]
+        )
 
     def _compact_log_fifo(self) -> int:
         """Compact event log by removing oldest events (FIFO).
@@ -421,6 +570,10 @@ class RDFEventStore:
         >>> for event in store.replay(from_seq=0):
         ...     print(event.event_type)
         """
+        if self._event_log is not None:
+            yield from self._event_log.replay(from_seq, to_seq, event_types)
+            return
+
         # Build SPARQL query with filters
         type_filter = ""
         if event_types:
@@ -435,7 +588,7 @@ class RDFEventStore:
         PREFIX kgcl: <{KGCL_VOCAB}>
         PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
         SELECT ?event ?eventId ?eventType ?timestamp ?seq ?stateHash
-               ?subject ?predicate ?object
+               ?subject ?predicate ?object ?additions ?removals
         WHERE {{
             GRAPH <{EVENTS_GRAPH_URI}> {{
                 ?event a kgcl:Event ;
@@ -447,6 +600,8 @@ class RDFEventStore:
                 OPTIONAL {{ ?event kgcl:subject ?subject }}
                 OPTIONAL {{ ?event kgcl:predicate ?predicate }}
                 OPTIONAL {{ ?event kgcl:object ?object }}
+                OPTIONAL {{ ?event kgcl:additions ?additions }}
+                OPTIONAL {{ ?event kgcl:removals ?removals }}
                 FILTER(xsd:integer(?seq) > {from_seq})
                 {to_seq_filter}
                 {type_filter}
@@ -468,6 +623,7 @@ class RDFEventStore:
             if row["object"] is not None:
                 obj = row["object"]
                 payload["o"] = str(obj.value) if hasattr(obj, "value") else str(obj)
+            _decode_changeset(row, payload)
 
             yield DomainEvent(
                 event_id=str(row["eventId"].value),
@@ -496,9 +652,12 @@ class RDFEventStore:
         >>> store = RDFEventStore()
         >>> store.get_event("nonexistent")
         """
+        if self._event_log is not None:
+            return self._event_log.find(event_id)
+
         query = f"""
         PREFIX kgcl: <{KGCL_VOCAB}>
-        SELECT ?eventType ?timestamp ?seq ?stateHash ?subject ?predicate ?object
+        SELECT ?eventType ?timestamp ?seq ?stateHash ?subject ?predicate ?object ?additions ?removals
         WHERE {{
             GRAPH <{EVENTS_GRAPH_URI}> {{
                 ?event kgcl:eventId "{event_id}" ;
@@ -509,6 +668,8 @@ class RDFEventStore:
                 OPTIONAL {{ ?event kgcl:subject ?subject }}
                 OPTIONAL {{ ?event kgcl:predicate ?predicate }}
                 OPTIONAL {{ ?event kgcl:object ?object }}
+                OPTIONAL {{ ?event kgcl:additions ?additions }}
+                OPTIONAL {{ ?event kgcl:removals ?removals }}
             }}
         }}
         """
@@ -527,6 +688,7 @@ class RDFEventStore:
         if row["object"] is not None:
             obj = row["object"]
             payload["o"] = str(obj.value) if hasattr(obj, "value") else str(obj)
+        _decode_changeset(row, payload)
 
         return DomainEvent(
             event_id=event_id,
@@ -550,9 +712,12 @@ class RDFEventStore:
         DomainEvent | None
             Event if found, None otherwise
         """
+        if self._event_log is not None:
+            return self._event_log.get(sequence)
+
         query = f"""
         PREFIX kgcl: <{KGCL_VOCAB}>
-        SELECT ?eventId ?eventType ?timestamp ?stateHash ?subject ?predicate ?object
+        SELECT ?eventId ?eventType ?timestamp ?stateHash ?subject ?predicate ?object ?additions ?removals
         WHERE {{
             GRAPH <{EVENTS_GRAPH_URI}> {{
                 ?event kgcl:sequence "{sequence}" ;
@@ -563,6 +728,8 @@ class RDFEventStore:
                 OPTIONAL {{ ?event kgcl:subject ?subject }}
                 OPTIONAL {{ ?event kgcl:predicate ?predicate }}
                 OPTIONAL {{ ?event kgcl:object ?object }}
+                OPTIONAL {{ ?event kgcl:additions ?additions }}
+                OPTIONAL {{ ?event kgcl:removals ?removals }}
             }}
         }}
         """
@@ -581,6 +748,7 @@ class RDFEventStore:
         if row["object"] is not None:
             obj = row["object"]
             payload["o"] = str(obj.value) if hasattr(obj, "value") else str(obj)
+        _decode_changeset(row, payload)
 
         return DomainEvent(
             event_id=str(row["eventId"].value),
@@ -614,6 +782,9 @@ class RDFEventStore:
         >>> store.count_events()
         0
         """
+        if self._event_log is not None:
+            return self._event_log.count(from_seq, to_seq, event_type)
+
         type_filter = ""
         if event_type:
             type_filter = f'FILTER(?eventType = "{event_type.value}")'
@@ -662,6 +833,9 @@ class RDFEventStore:
         >>> store.sequence_at_time(time.time())
         0
         """
+        if self._event_log is not None:
+            return self._event_log.sequence_at_time(timestamp)
+
         query = f"""
         PREFIX kgcl: <{KGCL_VOCAB}>
         PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
@@ -757,6 +931,9 @@ class RDFEventStore:
         >>> # ... append events ...
         >>> past_state = store.reconstruct_at(50)
         """
+        # Create new store for reconstruction
+        reconstructed = Store()
+
         # Find nearest snapshot before target
         query = f"""
         PREFIX kgcl: <{KGCL_VOCAB}>
@@ -775,9 +952,6 @@ class RDFEventStore:
 
         results = list(self._store.query(query))
 
-        # Create new store for reconstruction
-        reconstructed = Store()
-
         start_seq = 0
         if results:
             # Load from snapshot
@@ -786,30 +960,9 @@ class RDFEventStore:
             # Find the snapshot graph and copy its contents
             # (simplified - in production would load snapshot graph)
 
-        # Replay events from start_seq to target_seq
+        # Replay events from start_seq to target_seq into the default graph
         for event in self.replay(from_seq=start_seq, to_seq=target_seq):
-            if event.event_type == EventType.TRIPLE_ADDED:
-                payload = event.payload
-                if "s" in payload and "p" in payload and "o" in payload:
-                    reconstructed.add(
-                        Quad(
-                            self._to_term(payload["s"]),
-                            self._to_term(payload["p"]),
-                            self._to_term(payload["o"]),
-                            None,  # default graph
-                        )
-                    )
-            elif event.event_type == EventType.TRIPLE_REMOVED:
-                payload = event.payload
-                if "s" in payload and "p" in payload and "o" in payload:
-                    reconstructed.remove(
-                        Quad(
-                            self._to_term(payload["s"]),
-                            self._to_term(payload["p"]),
-                            self._to_term(payload["o"]),
-                            None,  # default graph
-                        )
-                    )
+            self._apply_event(reconstructed, None, event)
 
         return reconstructed
 
@@ -863,6 +1016,26 @@ class RDFEventStore:
         return results
 
 
+def _encode_triples(triples: Sequence[Triple]) -> str:
+    """Serialize triples to a compact JSON array of [s, p, o] arrays."""
+    return json.dumps([list(triple) for triple in triples], separators=(",", ":"))
+
+
+def _decode_changeset(row: Any, payload: dict[str, Any]) -> None:
+    """Add decoded changeset triples from a query row to an event payload.
+
+    Parameters
+    ----------
+    row : Any
+        Query solution with optional ?additions and ?removals bindings
+    payload : dict[str, Any]
+        Payload to extend in place
+    """
+    for key in ("additions", "removals"):
+        if row[key] is not None:
+            payload[key] = [tuple(triple) for triple in json.loads(row[key].value)]
+
+
 def compute_state_hash(store: Store, graph: NamedNode | None = None) -> str:
     """Compute SHA-256 hash of graph state.
 
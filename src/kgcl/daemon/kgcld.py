@@ -3,9 +3,14 @@
 This module provides the main daemon class combining:
 1. PyOxigraph state management with 4D ontology
 2. Async tick loop for temporal orchestration
-3. Add/query/subscribe operations
+3. Add/query/subscribe operations, single-triple and batched
 4. Hook execution on mutations
 
+Queries run on a bounded worker pool so that SPARQL evaluation (which
+releases the GIL in pyoxigraph) never blocks the event loop. Mutation
+events reach each subscriber through its own bounded queue, drained by
+a dedicated task, so a slow subscriber only delays itself.
+
 Architecture
 ------------
 The daemon maintains a warm PyOxigraph store with event sourcing.
@@ -23,21 +28,29 @@ Example
 from __future__ import annotations
 
 import asyncio
+import inspect
+import logging
 import time
 import uuid
-from collections.abc import AsyncIterator, Callable
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from pyoxigraph import NamedNode, Store
 
+from kgcl.daemon.binary_log import BinaryEventLog
 from kgcl.daemon.event_store import (
     STATE_GRAPH,
     STATE_GRAPH_URI,
     DomainEvent,
     EventType,
     RDFEventStore,
+    Triple,
     compute_state_hash,
 )
 from kgcl.daemon.service_gateway import ServiceGateway, ServiceInvocation, ServiceReference, ServiceStatus
@@ -46,6 +59,11 @@ if TYPE_CHECKING:
     from kgcl.projection.domain.result import ProjectionResult
     from kgcl.projection.ports.template_registry import TemplateRegistry
 
+logger = logging.getLogger(__name__)
+
+# Set inside subscriber delivery tasks, whose mutations must not wait on back-pressure
+_delivering: ContextVar[bool] = ContextVar("kgcl_daemon_delivering", default=False)
+
 
 class DaemonState(Enum):
     """Daemon lifecycle states.
@@ -122,6 +140,24 @@ class DaemonLimits:
     n3_max_memory_mb: int = 512
 
 
+class BackpressurePolicy(Enum):
+    """What to do when a subscriber's queue is full.
+
+    BLOCK makes the mutation wait until the subscriber has room,
+    DROP_OLDEST discards the oldest undelivered event, and DISCONNECT
+    unsubscribes the subscriber.
+
+    Examples
+    --------
+    >>> BackpressurePolicy.DROP_OLDEST.value
+    'drop_oldest'
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+
+
 @dataclass
 class DaemonConfig:
     """Configuration for KGCL daemon.
@@ -138,6 +174,15 @@ class DaemonConfig:
         Enable hook execution on mutations (default: True)
     limits : DaemonLimits | None
         Resource limits for daemon operations (default: DaemonLimits())
+    query_workers : int
+        Worker threads executing SPARQL queries (default: 4)
+    subscriber_queue_size : int
+        Undelivered events buffered per subscriber (default: 1000)
+    backpressure_policy : BackpressurePolicy
+        Default policy when a subscriber queue is full (default: BLOCK)
+    event_log_dir : Path | None
+        Directory for a binary append-only event log; events are kept as
+        RDF in the store if None (default: None)
 
     Examples
     --------
@@ -153,6 +198,10 @@ class DaemonConfig:
     max_batch_size: int = 1000
     enable_hooks: bool = True
     limits: DaemonLimits = field(default_factory=DaemonLimits)
+    query_workers: int = 4
+    subscriber_queue_size: int = 1000
+    backpressure_policy: BackpressurePolicy = BackpressurePolicy.BLOCK
+    event_log_dir: Path | None = None
 
 
 @dataclass
@@ -217,8 +266,221 @@ class QueryResult:
     at_sequence: int
 
 
-# Type alias for mutation callbacks
-MutationCallback = Callable[[DomainEvent], None]
+# Type alias for mutation callbacks; coroutine functions are awaited
+MutationCallback = Callable[[DomainEvent], Awaitable[None] | None]
+
+
+@dataclass(frozen=True)
+class SubscriberStats:
+    """Delivery metrics for one subscriber.
+
+    Parameters
+    ----------
+    subscriber_id : int
+        Identifier assigned at subscription
+    policy : BackpressurePolicy
+        Policy applied when the queue is full
+    lag : int
+        Events queued but not yet delivered
+    max_lag : int
+        Highest lag observed
+    delivered : int
+        Events passed to the callback
+    dropped : int
+        Events discarded by DROP_OLDEST
+    errors : int
+        Callback invocations that raised
+    connected : bool
+        Whether the subscriber still receives events
+
+    Examples
+    --------
+    >>> stats = SubscriberStats(1, BackpressurePolicy.BLOCK, 0, 3, 10, 0, 0, True)
+    >>> stats.max_lag
+    3
+    """
+
+    subscriber_id: int
+    policy: BackpressurePolicy
+    lag: int
+    max_lag: int
+    delivered: int
+    dropped: int
+    errors: int
+    connected: bool
+
+
+@dataclass
+class Subscription:
+    """Handle for a mutation subscriber with its own bounded queue.
+
+    Calling the handle unsubscribes, so it can be used wherever the
+    unsubscribe function returned by ``KGCLDaemon.subscribe`` was.
+
+    Parameters
+    ----------
+    subscriber_id : int
+        Identifier assigned by the daemon
+    callback : MutationCallback
+        Function called with each mutation event, in order
+    policy : BackpressurePolicy
+        Policy applied when the queue is full
+    queue_size : int
+        Maximum undelivered events
+    on_close : Callable[[Subscription], None]
+        Called once when the subscription is closed
+
+    Examples
+    --------
+    >>> subscription = daemon.subscribe(print, policy=BackpressurePolicy.DROP_OLDEST)
+    >>> subscription.stats().lag
+    0
+    >>> subscription()  # unsubscribe
+    """
+
+    subscriber_id: int
+    callback: MutationCallback
+    policy: BackpressurePolicy
+    queue_size: int
+    on_close: Callable[[Subscription], None] = field(repr=False)
+    _queue: asyncio.Queue[DomainEvent] = field(init=False, repr=False)
+    _task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+    _held: deque[tuple[DomainEvent, asyncio.Future[None] | None]] = field(default_factory=deque, init=False, repr=False)
+    _connected: bool = field(default=True, init=False)
+    _delivered: int = field(default=0, init=False, repr=False)
+    _dropped: int = field(default=0, init=False, repr=False)
+    _errors: int = field(default=0, init=False, repr=False)
+    _max_lag: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Create the bounded queue."""
+        if self.queue_size < 1:
+            msg = f"queue_size must be at least 1, got {self.queue_size}"
+            raise ValueError(msg)
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+
+    def __call__(self) -> None:
+        """Unsubscribe."""
+        self.close()
+
+    @property
+    def connected(self) -> bool:
+        """Whether the subscriber still receives events."""
+        return self._connected
+
+    def stats(self) -> SubscriberStats:
+        """Snapshot of the delivery metrics.
+
+        Returns
+        -------
+        SubscriberStats
+            Current lag and delivery counters
+        """
+        return SubscriberStats(
+            subscriber_id=self.subscriber_id,
+            policy=self.policy,
+            lag=self._queue.qsize(),
+            max_lag=self._max_lag,
+            delivered=self._delivered,
+            dropped=self._dropped,
+            errors=self._errors,
+            connected=self._connected,
+        )
+
+    def start(self) -> None:
+        """Start the delivery task on the running event loop."""
+        if self._task is None and self._connected:
+            self._task = asyncio.get_running_loop().create_task(self._deliver())
+
+    def offer(self, event: DomainEvent, *, wait: bool = True) -> asyncio.Future[None] | None:
+        """Queue an event according to the back-pressure policy.
+
+        Never suspends, so the daemon can hand an event to every
+        subscriber in one step. When a BLOCK queue is full the event is
+        held, in order, until the delivery task makes room.
+
+        Parameters
+        ----------
+        event : DomainEvent
+            Mutation event to deliver
+        wait : bool
+            Whether the caller will wait for a held event to be queued
+
+        Returns
+        -------
+        asyncio.Future[None] | None
+            Future resolved once the held event is queued, if the event
+            was held and ``wait`` is set; None otherwise
+        """
+        if not self._connected:
+            return None
+        if self._queue.full() or self._held:
+            if self.policy == BackpressurePolicy.BLOCK:
+                future = asyncio.get_running_loop().create_future() if wait else None
+                self._held.append((event, future))
+                return future
+            if self.policy == BackpressurePolicy.DISCONNECT:
+                logger.warning("Disconnecting subscriber %d: %d events behind", self.subscriber_id, self._queue.qsize())
+                self.close()
+                return None
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self._dropped += 1
+        self._enqueue(event)
+        return None
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been delivered."""
+        if self._task is not None:
+            await self._queue.join()
+
+    def close(self) -> None:
+        """Stop delivery and discard undelivered events."""
+        if not self._connected:
+            return
+        self._connected = False
+        if self._task is not None:
+            self._task.cancel()
+        # Discarding held events releases the producers waiting on them
+        while self._held:
+            _, future = self._held.popleft()
+            if future is not None and not future.done():
+                future.set_result(None)
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+        self.on_close(self)
+
+    def _enqueue(self, event: DomainEvent) -> None:
+        """Put an event on the queue, which must have room."""
+        self._queue.put_nowait(event)
+        self._max_lag = max(self._max_lag, self._queue.qsize())
+
+    def _release_held(self) -> None:
+        """Move held events into the queue while it has room."""
+        while self._held and not self._queue.full():
+            event, future = self._held.popleft()
+            self._enqueue(event)
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    async def _deliver(self) -> None:
+        """Deliver queued events to the callback one at a time."""
+        _delivering.set(True)
+        while True:
+            event = await self._queue.get()
+            # Refill before task_done, so drain() never sees an empty queue while events are held
+            self._release_held()
+            try:
+                result = self.callback(event)
+                if inspect.isawaitable(result):
+                    await result
+                self._delivered += 1
+            except Exception:
+                self._errors += 1
+                logger.exception("Subscriber %d failed on event %s", self.subscriber_id, event.event_id)
+            finally:
+                self._queue.task_done()
 
 
 @dataclass
@@ -255,14 +517,17 @@ class KGCLDaemon:
     _store: RDFEventStore | None = field(default=None, repr=False)
     _state: DaemonState = field(default=DaemonState.CREATED, repr=False)
     _tick_task: asyncio.Task[None] | None = field(default=None, repr=False)
-    _subscribers: list[MutationCallback] = field(default_factory=list, repr=False)
+    _subscribers: list[Subscription] = field(default_factory=list, repr=False)
+    _next_subscriber_id: int = field(default=1, repr=False)
+    _query_executor: ThreadPoolExecutor | None = field(default=None, repr=False)
     _events_since_snapshot: int = field(default=0, repr=False)
     _service_gateway: ServiceGateway = field(default_factory=ServiceGateway, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize event store if not provided."""
         if self._store is None:
-            self._store = RDFEventStore()
+            event_log = BinaryEventLog(self.config.event_log_dir) if self.config.event_log_dir is not None else None
+            self._store = RDFEventStore(event_log=event_log)
 
     @property
     def state(self) -> DaemonState:
@@ -311,15 +576,19 @@ class KGCLDaemon:
 
         self._state = DaemonState.STARTING
 
-        # Start tick loop
+        # Start tick loop and deliveries to early subscribers
         self._tick_task = asyncio.create_task(self._tick_loop())
+        for subscription in self._subscribers:
+            subscription.start()
 
         self._state = DaemonState.RUNNING
 
     async def stop(self) -> None:
         """Stop the daemon gracefully.
 
-        Cancels the tick loop and transitions to STOPPED state.
+        Cancels the tick loop, delivers queued mutation events to
+        subscribers, shuts down the query pool, closes the event store
+        and transitions to STOPPED state.
 
         Examples
         --------
@@ -340,9 +609,17 @@ class KGCLDaemon:
             except asyncio.CancelledError:
                 pass
 
+        await self.flush_subscribers()
+        for subscription in list(self._subscribers):
+            subscription.close()
+        if self._query_executor is not None:
+            self._query_executor.shutdown(wait=False, cancel_futures=True)
+            self._query_executor = None
+
         # Create final snapshot
         if self._events_since_snapshot > 0:
             self.store.create_snapshot(self.sequence)
+        self.store.close()
 
         self._state = DaemonState.STOPPED
 
@@ -372,13 +649,25 @@ class KGCLDaemon:
             self.store.create_snapshot(self.sequence)
             self._events_since_snapshot = 0
 
-    def _notify_subscribers(self, event: DomainEvent) -> None:
-        """Notify all subscribers of a mutation event."""
-        for callback in self._subscribers:
-            try:
-                callback(event)
-            except Exception:  # noqa: BLE001, S110
-                pass  # Don't let subscriber errors crash daemon
+    async def _notify_subscribers(self, event: DomainEvent) -> None:
+        """Queue a mutation event for every subscriber.
+
+        The event is handed to every subscriber without suspending, so
+        each subscriber sees events in sequence order. The mutation then
+        waits, holding no lock, until full BLOCK queues have taken it.
+        Mutations made from a subscriber callback do not wait, as the
+        delivery they would wait for may be their own; their events are
+        held in order instead. Subscriber errors are counted in its stats
+        and never reach the mutation.
+        """
+        wait = not _delivering.get()
+        pending = [
+            future
+            for subscription in list(self._subscribers)
+            if (future := subscription.offer(event, wait=wait)) is not None
+        ]
+        if pending:
+            await asyncio.gather(*pending)
 
     async def add(self, subject: str, predicate: str, obj: str, *, graph: str | None = None) -> MutationReceipt:
         """Add a triple to the graph.
@@ -427,7 +716,7 @@ class KGCLDaemon:
         state_hash = compute_state_hash(self.store.store, STATE_GRAPH)
 
         # Notify subscribers
-        self._notify_subscribers(event)
+        await self._notify_subscribers(event)
 
         return MutationReceipt(
             event_id=event_id,
@@ -480,7 +769,7 @@ class KGCLDaemon:
         self._events_since_snapshot += 1
 
         state_hash = compute_state_hash(self.store.store, STATE_GRAPH)
-        self._notify_subscribers(event)
+        await self._notify_subscribers(event)
 
         return MutationReceipt(
             event_id=event_id,
@@ -491,8 +780,111 @@ class KGCLDaemon:
             state_hash=state_hash,
         )
 
+    async def add_many(self, triples: Iterable[Triple], *, graph: str | None = None) -> MutationReceipt:
+        """Add a batch of triples as a single event.
+
+        Parameters
+        ----------
+        triples : Iterable[Triple]
+            (subject, predicate, object) triples to add
+        graph : str | None
+            Named graph URI (default: state graph)
+
+        Returns
+        -------
+        MutationReceipt
+            One receipt for the whole batch
+
+        Examples
+        --------
+        >>> receipt = await daemon.add_many(
+        ...     [("urn:task:1", "urn:status", "Pending"), ("urn:task:2", "urn:status", "Done")]
+        ... )
+        >>> receipt.triples_added
+        2
+        """
+        return await self.apply_changeset(additions=triples, graph=graph)
+
+    async def apply_changeset(
+        self, additions: Iterable[Triple] = (), removals: Iterable[Triple] = (), *, graph: str | None = None
+    ) -> MutationReceipt:
+        """Apply removals and additions atomically as one event.
+
+        The changeset is recorded as a single CHANGESET_APPLIED event with
+        the triples encoded compactly, applied to the state graph in bulk
+        (removals first, then additions), hashed once and delivered to
+        subscribers once. Replay and time-travel apply the same event, so
+        reconstructed states match applying the triples one by one.
+
+        Parameters
+        ----------
+        additions : Iterable[Triple]
+            (subject, predicate, object) triples to add
+        removals : Iterable[Triple]
+            (subject, predicate, object) triples to remove
+        graph : str | None
+            Named graph URI (default: state graph)
+
+        Returns
+        -------
+        MutationReceipt
+            One receipt for the whole changeset
+
+        Raises
+        ------
+        RuntimeError
+            If the daemon is not running
+        ValueError
+            If the changeset is empty
+
+        Examples
+        --------
+        >>> receipt = await daemon.apply_changeset(
+        ...     additions=[("urn:task:1", "urn:status", "Done")], removals=[("urn:task:1", "urn:status", "Pending")]
+        ... )
+        """
+        if self._state != DaemonState.RUNNING:
+            msg = f"Cannot apply changeset in state {self._state}"
+            raise RuntimeError(msg)
+
+        added = [(s, p, o) for s, p, o in additions]
+        removed = [(s, p, o) for s, p, o in removals]
+        if not added and not removed:
+            msg = "Changeset has no additions or removals"
+            raise ValueError(msg)
+
+        event_id = f"changeset-{uuid.uuid4()}"
+        timestamp = time.time()
+
+        event = DomainEvent(
+            event_id=event_id,
+            event_type=EventType.CHANGESET_APPLIED,
+            timestamp=timestamp,
+            sequence=0,
+            payload={"additions": added, "removals": removed},
+        )
+
+        sequence = self.store.append(event)
+        self._events_since_snapshot += 1
+
+        state_hash = compute_state_hash(self.store.store, STATE_GRAPH)
+        await self._notify_subscribers(event)
+
+        return MutationReceipt(
+            event_id=event_id,
+            sequence=sequence,
+            timestamp=timestamp,
+            triples_added=len(added),
+            triples_removed=len(removed),
+            state_hash=state_hash,
+        )
+
     async def query(self, sparql: str, *, at_sequence: int | None = None) -> QueryResult:
-        """Execute a SPARQL query.
+        """Execute SPARQL query against current or historical state.
+
+        The query is evaluated on the daemon's query pool so the event
+        loop keeps serving mutations and ticks meanwhile. It sees the
+        state as of the moment it starts executing.
 
         Parameters
         ----------
@@ -506,6 +898,12 @@ class KGCLDaemon:
         QueryResult
             Query results with bindings and timing
 
+        Raises
+        ------
+        TimeoutError
+            If the query exceeds ``limits.query_timeout_seconds``. The
+            worker finishes the evaluation in the background.
+
         Examples
         --------
         >>> result = await daemon.query("SELECT * WHERE { ?s ?p ?o } LIMIT 10")
@@ -513,7 +911,16 @@ class KGCLDaemon:
         10
         """
         start_time = time.perf_counter()
+        query_sequence = at_sequence if at_sequence is not None else self.sequence
+
+        bindings = await self._run_in_query_pool(self._execute_query, sparql, at_sequence)
 
+        execution_time = (time.perf_counter() - start_time) * 1000
+
+        return QueryResult(bindings=bindings, execution_time_ms=execution_time, at_sequence=query_sequence)
+
+    def _execute_query(self, sparql: str, at_sequence: int | None) -> list[dict[str, Any]]:
+        """Evaluate a query synchronously; runs on a query worker."""
         if at_sequence is not None:
             # Time-travel query
             reconstructed = self.store.reconstruct_at(at_sequence)
@@ -525,30 +932,49 @@ class KGCLDaemon:
                     if value is not None:
                         binding[var] = str(value.value) if hasattr(value, "value") else str(value)
                 bindings.append(binding)
-            query_sequence = at_sequence
-        else:
-            # Current state query - wrap to query state graph
-            if "GRAPH" not in sparql.upper():
-                # Auto-wrap in state graph context
-                wrapped = f"""
-                SELECT * WHERE {{
-                    GRAPH <{STATE_GRAPH_URI}> {{
-                        {sparql.replace("SELECT", "").replace("WHERE", "").strip().strip("{}")}
-                    }}
+            return bindings
+
+        # Current state query - wrap to query state graph
+        if "GRAPH" not in sparql.upper():
+            # Auto-wrap in state graph context
+            wrapped = f"""
+            SELECT * WHERE {{
+                GRAPH <{STATE_GRAPH_URI}> {{
+                    {sparql.replace("SELECT", "").replace("WHERE", "").strip().strip("{}")}
                 }}
-                """
-                bindings = self.store.query_state(wrapped)
-            else:
-                bindings = self.store.query_state(sparql)
-            query_sequence = self.sequence
+            }}
+            """
+            return self.store.query_state(wrapped)
+        return self.store.query_state(sparql)
 
-        execution_time = (time.perf_counter() - start_time) * 1000
+    async def _run_in_query_pool(self, func: Callable[..., list[dict[str, Any]]], *args: Any) -> list[dict[str, Any]]:
+        """Run a query function on the query pool with the query timeout.
 
-        return QueryResult(bindings=bindings, execution_time_ms=execution_time, at_sequence=query_sequence)
+        Parameters
+        ----------
+        func : Callable[..., list[dict[str, Any]]]
+            Synchronous query function
+        *args : Any
+            Arguments for ``func``
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Query result bindings
+        """
+        if self._query_executor is None:
+            self._query_executor = ThreadPoolExecutor(
+                max_workers=self.config.query_workers, thread_name_prefix="kgcld-query"
+            )
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._query_executor, func, *args)
+        return await asyncio.wait_for(future, timeout=self.config.limits.query_timeout_seconds)
 
     async def query_raw(self, sparql: str) -> list[dict[str, Any]]:
         """Execute raw SPARQL query against entire store.
 
+        Runs on the query pool like ``query``.
+
         Parameters
         ----------
         sparql : str
@@ -559,20 +985,36 @@ class KGCLDaemon:
         list[dict[str, Any]]
             Query result bindings
         """
-        return self.store.query_state(sparql)
+        return await self._run_in_query_pool(self.store.query_state, sparql)
 
-    def subscribe(self, callback: MutationCallback) -> Callable[[], None]:
+    def subscribe(
+        self, callback: MutationCallback, *, policy: BackpressurePolicy | None = None, queue_size: int | None = None
+    ) -> Subscription:
         """Subscribe to mutation events.
 
+        Each subscriber gets its own bounded queue and delivery task, so
+        callbacks run after the mutation returns and a slow subscriber
+        only delays its own events. Coroutine callbacks are awaited;
+        plain callbacks run on the event loop and should be quick.
+
         Parameters
         ----------
         callback : MutationCallback
             Function called with each mutation event
+        policy : BackpressurePolicy | None
+            Policy when the queue is full (default: config.backpressure_policy)
+        queue_size : int | None
+            Maximum undelivered events (default: config.subscriber_queue_size)
 
         Returns
         -------
-        Callable[[], None]
-            Unsubscribe function
+        Subscription
+            Handle with delivery stats; call it to unsubscribe
+
+        Raises
+        ------
+        ValueError
+            If ``queue_size`` is less than 1
 
         Examples
         --------
@@ -582,13 +1024,43 @@ class KGCLDaemon:
         >>> # Later...
         >>> unsubscribe()
         """
-        self._subscribers.append(callback)
+        subscription = Subscription(
+            subscriber_id=self._next_subscriber_id,
+            callback=callback,
+            policy=policy or self.config.backpressure_policy,
+            queue_size=self.config.subscriber_queue_size if queue_size is None else queue_size,
+            on_close=self._remove_subscription,
+        )
+        self._next_subscriber_id += 1
+        self._subscribers.append(subscription)
+        if self._state == DaemonState.RUNNING:
+            subscription.start()
+        return subscription
+
+    def _remove_subscription(self, subscription: Subscription) -> None:
+        """Forget a closed subscription."""
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+
+    def subscriber_stats(self) -> list[SubscriberStats]:
+        """Delivery metrics of every connected subscriber.
+
+        Returns
+        -------
+        list[SubscriberStats]
+            Stats in subscription order
+        """
+        return [subscription.stats() for subscription in self._subscribers]
 
-        def unsubscribe() -> None:
-            if callback in self._subscribers:
-                self._subscribers.remove(callback)
+    async def flush_subscribers(self) -> None:
+        """Wait until every queued mutation event has been delivered.
 
-        return unsubscribe
+        Examples
+        --------
+        >>> await daemon.add("urn:x", "urn:y", "z")
+        >>> await daemon.flush_subscribers()  # callbacks have now run
+        """
+        await asyncio.gather(*(subscription.drain() for subscription in list(self._subscribers)))
 
     async def replay_events(
         self, from_seq: int = 0, to_seq: int | None = None, event_types: list[EventType] | None = None
@@ -746,8 +1218,6 @@ class KGCLDaemon:
         True
         """
         if not hasattr(self, "_projection_registry"):
-            from pathlib import Path
-
             from kgcl.projection.adapters.filesystem_registry import FilesystemTemplateRegistry
             from kgcl.projection.ports.template_registry import InMemoryTemplateRegistry
 
@@ -46,92 +46,65 @@ Examples
 >>> from kgcl.hybrid import LockchainHook, LockchainWriter
 >>> writer = LockchainWriter(repo_path)
 >>> controller.register_hook(LockchainHook(writer))
+
+Exports are resolved lazily (PEP 562): ``import kgcl.hybrid`` is cheap and
+each name imports its defining module on first access, so using one
+component does not load the adapters, SHACL validation and reasoner
+stacks of all the others. The PyOxigraph-based components fall back to
+None (PHYSICS_ONTOLOGY and STANDARD_PREFIXES to "") when pyoxigraph is
+not installed.
 """
 
 from __future__ import annotations
 
-# Adapters Layer - Port implementations
-from kgcl.hybrid.adapters import (
-    EYEAdapter,
-    NoOpValidator,
-    OxigraphAdapter,
-    PyOxigraphTransactionManager,
-    PySHACLValidator,
-    SPARQLMutator,
-    WCP43RulesAdapter,
-    create_mutator,
-    create_transaction_manager,
-    create_validator,
-)
-
-# Application Layer - Use cases
-from kgcl.hybrid.application import (
-    ConvergenceRunner,
-    HybridOrchestrator,
-    OrchestratorConfig,
-    StatusInspector,
-    TickExecutor,
-    TickOutcome,
-    create_orchestrator,
-)
-
-# Domain Layer - Core value objects and exceptions
-from kgcl.hybrid.domain import ConvergenceError, ReasonerError, StoreOperationError, TaskStatus
-from kgcl.hybrid.domain import PhysicsResult as DomainPhysicsResult
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# PyOxigraph + EYE hybrid engine (facade)
-from kgcl.hybrid.hybrid_engine import N3_PHYSICS, HybridEngine, PhysicsResult
+if TYPE_CHECKING:
+    # Adapters Layer - Port implementations
+    from kgcl.hybrid.adapters import (
+        EYEAdapter,
+        NoOpValidator,
+        OxigraphAdapter,
+        PyOxigraphTransactionManager,
+        PySHACLValidator,
+        SPARQLMutator,
+        WCP43RulesAdapter,
+        create_mutator,
+        create_transaction_manager,
+        create_validator,
+    )
 
-# Knowledge Hooks - Pure N3 Logic
-from kgcl.hybrid.knowledge_hooks import (
-    N3_HOOK_PHYSICS,
-    HookAction,
-    HookExecutor,
-    HookPhase,
-    HookReceipt,
-    HookRegistry,
-    KnowledgeHook,
-)
+    # Application Layer - Use cases
+    from kgcl.hybrid.application import (
+        ConvergenceRunner,
+        HybridOrchestrator,
+        OrchestratorConfig,
+        StatusInspector,
+        TickExecutor,
+        TickOutcome,
+        create_orchestrator,
+    )
 
-# Ports Layer - Abstract protocols (for dependency injection)
-from kgcl.hybrid.ports import (
-    MutationResult,
-    RDFStore,
-    Reasoner,
-    ReasoningOutput,
-    RulesProvider,
-    Snapshot,
-    StateMutation,
-    StateMutator,
-    Transaction,
-    TransactionError,
-    TransactionManager,
-    TransactionResult,
-    TransactionState,
-    Triple,
-    ValidationResult,
-    ValidationSeverity,
-    ValidationViolation,
-    WorkflowValidator,
-)
+    # Domain Layer - Core value objects and exceptions
+    from kgcl.hybrid.domain import ConvergenceError, ReasonerError, StoreOperationError, TaskStatus
+    from kgcl.hybrid.domain import PhysicsResult as DomainPhysicsResult
 
-# WCP-43 SPARQL UPDATE Templates (thesis architecture)
-from kgcl.hybrid.wcp43_mutations import WCP43_MUTATIONS, WCPMutation, get_all_mutations, get_mutation
+    # PyOxigraph + EYE hybrid engine (facade)
+    from kgcl.hybrid.hybrid_engine import N3_PHYSICS, HybridEngine, PhysicsResult
 
-# WCP-43 Complete Physics - All 43 YAWL Workflow Control Patterns
-from kgcl.hybrid.wcp43_physics import (
-    WCP43_COMPLETE_PHYSICS,
-    WCP_PATTERN_CATALOG,
-    get_pattern_info,
-    get_pattern_rule,
-    get_patterns_by_category,
-    get_patterns_by_verb,
-)
-from kgcl.hybrid.wcp43_physics import list_all_patterns as list_wcp_patterns
+    # Knowledge Hooks - Pure N3 Logic
+    from kgcl.hybrid.knowledge_hooks import (
+        N3_HOOK_PHYSICS,
+        HookAction,
+        HookExecutor,
+        HookPhase,
+        HookReceipt,
+        HookRegistry,
+        KnowledgeHook,
+    )
 
-# PyOxigraph-based architecture components
-# Wrapped in try/except for graceful degradation if pyoxigraph not installed
-try:
+    # PyOxigraph-based architecture components
     from kgcl.hybrid.lockchain import LockchainHook, LockchainWriter, TickReceipt
     from kgcl.hybrid.oxigraph_store import (
         OxigraphStore,
@@ -150,37 +123,183 @@ try:
         list_all_verbs,
         load_physics_ontology,
     )
+
+    # Ports Layer - Abstract protocols (for dependency injection)
+    from kgcl.hybrid.ports import (
+        MutationResult,
+        RDFStore,
+        Reasoner,
+        ReasoningOutput,
+        RulesProvider,
+        Snapshot,
+        StateMutation,
+        StateMutator,
+        Transaction,
+        TransactionError,
+        TransactionManager,
+        TransactionResult,
+        TransactionState,
+        Triple,
+        ValidationResult,
+        ValidationSeverity,
+        ValidationViolation,
+        WorkflowValidator,
+    )
     from kgcl.hybrid.tick_controller import ProvenanceHook, ProvenanceRecord, TickController, TickHook, TickPhase
     from kgcl.hybrid.tick_controller import TickResult as NewTickResult
 
-    _PYOXIGRAPH_AVAILABLE = True
-    _PYOXIGRAPH_ERROR: str | None = None
-except ImportError as e:
-    _PYOXIGRAPH_AVAILABLE = False
-    _PYOXIGRAPH_ERROR = str(e)
-    # Type stubs for optional pyoxigraph dependency (None when not installed)
-    TickController = None  # type: ignore[assignment, misc]
-    NewTickResult = None  # type: ignore[assignment, misc]
-    TickPhase = None  # type: ignore[assignment, misc]
-    TickHook = None  # type: ignore[assignment, misc]
-    ProvenanceHook = None  # type: ignore[assignment, misc]
-    ProvenanceRecord = None  # type: ignore[assignment, misc]
-    OxigraphStore = None  # type: ignore[assignment, misc]
-    QueryResult = None  # type: ignore[assignment, misc]
-    TransactionContext = None  # type: ignore[assignment, misc]
-    StoreError = None  # type: ignore[assignment, misc]
-    QueryError = None  # type: ignore[assignment, misc]
-    UpdateError = None  # type: ignore[assignment, misc]
-    PHYSICS_ONTOLOGY = ""  # type: ignore[assignment]
-    STANDARD_PREFIXES = ""  # type: ignore[assignment]
-    load_physics_ontology = None  # type: ignore[assignment, misc]
-    get_verb_rule = None  # type: ignore[assignment, misc]
-    get_wcp_rule = None  # type: ignore[assignment, misc]
-    list_all_verbs = None  # type: ignore[assignment, misc]
-    list_all_patterns = None  # type: ignore[assignment, misc]
-    TickReceipt = None  # type: ignore[assignment, misc]
-    LockchainWriter = None  # type: ignore[assignment, misc]
-    LockchainHook = None  # type: ignore[assignment, misc]
+    # WCP-43 SPARQL UPDATE Templates (thesis architecture)
+    from kgcl.hybrid.wcp43_mutations import WCP43_MUTATIONS, WCPMutation, get_all_mutations, get_mutation
+
+    # WCP-43 Complete Physics - All 43 YAWL Workflow Control Patterns
+    from kgcl.hybrid.wcp43_physics import (
+        WCP43_COMPLETE_PHYSICS,
+        WCP_PATTERN_CATALOG,
+        get_pattern_info,
+        get_pattern_rule,
+        get_patterns_by_category,
+        get_patterns_by_verb,
+    )
+    from kgcl.hybrid.wcp43_physics import list_all_patterns as list_wcp_patterns
+
+# Public name -> (defining module, attribute), grouped by module.
+_EXPORTS: dict[str, tuple[str, str]] = {
+    name: (module, name)
+    for module, names in {
+        "kgcl.hybrid.adapters": (
+            "EYEAdapter",
+            "NoOpValidator",
+            "OxigraphAdapter",
+            "PyOxigraphTransactionManager",
+            "PySHACLValidator",
+            "SPARQLMutator",
+            "WCP43RulesAdapter",
+            "create_mutator",
+            "create_transaction_manager",
+            "create_validator",
+        ),
+        "kgcl.hybrid.application": (
+            "ConvergenceRunner",
+            "HybridOrchestrator",
+            "OrchestratorConfig",
+            "StatusInspector",
+            "TickExecutor",
+            "TickOutcome",
+            "create_orchestrator",
+        ),
+        "kgcl.hybrid.domain": ("ConvergenceError", "ReasonerError", "StoreOperationError", "TaskStatus"),
+        "kgcl.hybrid.hybrid_engine": ("N3_PHYSICS", "HybridEngine", "PhysicsResult"),
+        "kgcl.hybrid.knowledge_hooks": (
+            "N3_HOOK_PHYSICS",
+            "HookAction",
+            "HookExecutor",
+            "HookPhase",
+            "HookReceipt",
+            "HookRegistry",
+            "KnowledgeHook",
+        ),
+        "kgcl.hybrid.ports": (
+            "MutationResult",
+            "RDFStore",
+            "Reasoner",
+            "ReasoningOutput",
+            "RulesProvider",
+            "Snapshot",
+            "StateMutation",
+            "StateMutator",
+            "Transaction",
+            "TransactionError",
+            "TransactionManager",
+            "TransactionResult",
+            "TransactionState",
+            "Triple",
+            "ValidationResult",
+            "ValidationSeverity",
+            "ValidationViolation",
+            "WorkflowValidator",
+        ),
+        "kgcl.hybrid.wcp43_mutations": ("WCP43_MUTATIONS", "WCPMutation", "get_all_mutations", "get_mutation"),
+        "kgcl.hybrid.wcp43_physics": (
+            "WCP43_COMPLETE_PHYSICS",
+            "WCP_PATTERN_CATALOG",
+            "get_pattern_info",
+            "get_pattern_rule",
+            "get_patterns_by_category",
+            "get_patterns_by_verb",
+        ),
+    }.items()
+    for name in names
+}
+_EXPORTS["DomainPhysicsResult"] = ("kgcl.hybrid.domain", "PhysicsResult")
+_EXPORTS["list_wcp_patterns"] = ("kgcl.hybrid.wcp43_physics", "list_all_patterns")
+
+# PyOxigraph-based components: public name -> (defining module, attribute, value if pyoxigraph is missing).
+_OPTIONAL_EXPORTS: dict[str, tuple[str, str, Any]] = {
+    name: (module, name, "" if name.isupper() else None)
+    for module, names in {
+        "kgcl.hybrid.lockchain": ("LockchainHook", "LockchainWriter", "TickReceipt"),
+        "kgcl.hybrid.oxigraph_store": (
+            "OxigraphStore",
+            "QueryError",
+            "QueryResult",
+            "StoreError",
+            "TransactionContext",
+            "UpdateError",
+        ),
+        "kgcl.hybrid.physics_ontology": (
+            "PHYSICS_ONTOLOGY",
+            "STANDARD_PREFIXES",
+            "get_verb_rule",
+            "get_wcp_rule",
+            "list_all_patterns",
+            "list_all_verbs",
+            "load_physics_ontology",
+        ),
+        "kgcl.hybrid.tick_controller": (
+            "ProvenanceHook",
+            "ProvenanceRecord",
+            "TickController",
+            "TickHook",
+            "TickPhase",
+        ),
+    }.items()
+    for name in names
+}
+_OPTIONAL_EXPORTS["NewTickResult"] = ("kgcl.hybrid.tick_controller", "TickResult", None)
+
+
+def _pyoxigraph_error() -> str | None:
+    """Import every PyOxigraph-based module; return the ImportError message, if any."""
+    try:
+        for module, _attribute, _fallback in _OPTIONAL_EXPORTS.values():
+            importlib.import_module(module)
+    except ImportError as e:
+        return str(e)
+    return None
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its defining module on first access."""
+    if name in _EXPORTS:
+        module, attribute = _EXPORTS[name]
+        value = getattr(importlib.import_module(module), attribute)
+    elif name in _OPTIONAL_EXPORTS:
+        module, attribute, fallback = _OPTIONAL_EXPORTS[name]
+        value = getattr(importlib.import_module(module), attribute) if _pyoxigraph_error() is None else fallback
+    elif name == "_PYOXIGRAPH_ERROR":
+        value = _pyoxigraph_error()
+    elif name == "_PYOXIGRAPH_AVAILABLE":
+        value = _pyoxigraph_error() is None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not yet imported exports."""
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     # PyOxigraph + EYE hybrid engine (facade)
@@ -34,6 +34,7 @@ from kgcl.hybrid.temporal.adapters.causal_tracker_adapter import InMemoryCausalT
 # Adapters (implementations)
 from kgcl.hybrid.temporal.adapters.in_memory_event_store import InMemoryEventStore
 from kgcl.hybrid.temporal.adapters.ltl_evaluator import LTLEvaluator
+from kgcl.hybrid.temporal.adapters.ltl_monitor import LTLMonitor, MonitorVerdict
 from kgcl.hybrid.temporal.adapters.tiered_event_store import CompactionPolicy, TieredEventStore
 
 # Application services
@@ -98,6 +99,8 @@ __all__ = [
     "TieredEventStore",
     "CachingProjector",
     "LTLEvaluator",
+    "LTLMonitor",
+    "MonitorVerdict",
     "InMemoryCausalTracker",
     "JSONAuditExporter",
     "CSVAuditExporter",
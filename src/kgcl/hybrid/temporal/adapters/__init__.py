@@ -13,6 +13,7 @@ from kgcl.hybrid.temporal.adapters.common_properties import (
 )
 from kgcl.hybrid.temporal.adapters.in_memory_event_store import InMemoryEventStore
 from kgcl.hybrid.temporal.adapters.ltl_evaluator import LTLEvaluator
+from kgcl.hybrid.temporal.adapters.ltl_monitor import LTLMonitor, MonitorVerdict
 
 __all__ = [
     "CacheEntry",
@@ -21,6 +22,8 @@ __all__ = [
     "InMemoryCausalTracker",
     "InMemoryEventStore",
     "LTLEvaluator",
+    "LTLMonitor",
+    "MonitorVerdict",
     "all_events_have_actor",
     "approval_precedes_execution",
     "no_concurrent_active_in_mutex",
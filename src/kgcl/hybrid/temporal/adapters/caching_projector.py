@@ -1,12 +1,28 @@
-"""Caching projector with multi-level cache and event-driven invalidation."""
+"""Caching projector with multi-level cache and event-driven invalidation.
+
+The current projection is maintained incrementally: each read first
+applies only the events appended since the previous read to a live
+state, then publishes a deeply read-only snapshot of it. Snapshots
+share the frozen views of unchanged entities with each other; only
+entities modified since the previous snapshot are frozen again.
+Every ``checkpoint_interval`` events a snapshot is kept as a checkpoint,
+so historical projections restore the nearest checkpoint and replay
+only the events after it. At most ``max_checkpoints`` are kept: when
+the limit is exceeded every other checkpoint is dropped and the
+interval doubles.
+"""
 
 from __future__ import annotations
 
 import copy
+import json
 import time
+from bisect import bisect_right
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from threading import RLock
+from types import MappingProxyType
 from typing import Any
 
 from kgcl.hybrid.temporal.domain.event import EventType, WorkflowEvent
@@ -18,7 +34,7 @@ from kgcl.hybrid.temporal.ports.projector_port import ProjectionResult, Semantic
 class CacheEntry:
     """Single cache entry with metadata."""
 
-    state: dict[str, Any]
+    state: Mapping[str, Any]
     sequence_number: int
     timestamp: datetime
     created_at: float  # time.monotonic()
@@ -36,6 +52,150 @@ class CacheEntry:
         return (time.monotonic() - self.created_at) > self.ttl_seconds
 
 
+@dataclass(frozen=True)
+class _ProjectionCheckpoint:
+    """Projection snapshot after a prefix of the event stream.
+
+    Parameters
+    ----------
+    sequence_number : int
+        Number of events the snapshot reflects
+    timestamp : datetime
+        Timestamp of the last event in the prefix
+    max_timestamp : datetime
+        Latest timestamp of any event in the prefix
+    entries : dict[str, Any]
+        Entity states backing the snapshot, never modified
+    state : Mapping[str, Any]
+        Read-only snapshot
+    """
+
+    sequence_number: int
+    timestamp: datetime
+    max_timestamp: datetime
+    entries: dict[str, Any]
+    state: Mapping[str, Any]
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only deep copy: mappings become MappingProxyType, lists tuples, sets frozensets."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(value)
+    return value
+
+
+def _affected_key(event: WorkflowEvent) -> str | None:
+    """Top-level state key an event modifies, if any."""
+    if event.event_type is EventType.TOKEN_MOVE:
+        return "_tokens"
+    entity = event.payload.get("entity_id")
+    if event.event_type in {EventType.STATUS_CHANGE, EventType.CANCELLATION}:
+        return entity or None
+    return entity or event.payload.get("subject") or None
+
+
+class _CopyOnWriteState:
+    """Mutable projection state that publishes read-only snapshots.
+
+    A snapshot is a ``MappingProxyType`` over deeply frozen copies of the
+    entity states, so neither later events nor callers mutating nested
+    values can change it. Views of entities untouched since the previous
+    snapshot are reused. Entity dicts captured by a checkpoint are shared
+    with it, and the first event touching such an entity copies it
+    before changing it.
+
+    Parameters
+    ----------
+    entries : dict[str, Any] | None
+        Entity states to start from, treated as shared
+    views : Mapping[str, Any] | None
+        Read-only views of ``entries``
+    """
+
+    def __init__(self, entries: dict[str, Any] | None = None, views: Mapping[str, Any] | None = None) -> None:
+        self._entries: dict[str, Any] = dict(entries or {})
+        self._views: dict[str, Any] = dict(views or {})
+        self._shared: set[str] = set(self._entries)
+        self._dirty: set[str] = set()
+        self._snapshot: Mapping[str, Any] | None = None
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: _ProjectionCheckpoint | None) -> _CopyOnWriteState:
+        """Start from a checkpoint, or from empty state if None."""
+        if checkpoint is None:
+            return cls()
+        return cls(checkpoint.entries, checkpoint.state)
+
+    def apply(self, event: WorkflowEvent, apply: Callable[[dict[str, Any], WorkflowEvent], None]) -> None:
+        """Apply an event, copying the entity it modifies if shared.
+
+        Parameters
+        ----------
+        event : WorkflowEvent
+            Event to apply
+        apply : Callable[[dict[str, Any], WorkflowEvent], None]
+            Function mutating the state dict in place
+        """
+        key = _affected_key(event)
+        if key is None:
+            return
+        if key in self._shared:
+            self._entries[key] = dict(self._entries[key])
+            self._shared.discard(key)
+        apply(self._entries, event)
+        self._dirty.add(key)
+        self._snapshot = None
+
+    def snapshot(self) -> Mapping[str, Any]:
+        """Read-only snapshot of the current state.
+
+        Returns
+        -------
+        Mapping[str, Any]
+            Snapshot, reused until the next change
+        """
+        if self._snapshot is None:
+            for key in self._dirty:
+                if key in self._entries:
+                    self._views[key] = _freeze(self._entries[key])
+                else:
+                    self._views.pop(key, None)
+            self._dirty.clear()
+            self._snapshot = MappingProxyType(dict(self._views))
+        return self._snapshot
+
+    def checkpoint(self, sequence_number: int, timestamp: datetime, max_timestamp: datetime) -> _ProjectionCheckpoint:
+        """Capture the current state as a checkpoint.
+
+        Parameters
+        ----------
+        sequence_number : int
+            Number of events applied
+        timestamp : datetime
+            Timestamp of the last applied event
+        max_timestamp : datetime
+            Latest timestamp of any applied event
+
+        Returns
+        -------
+        _ProjectionCheckpoint
+            Checkpoint sharing entity states with this state
+        """
+        state = self.snapshot()
+        self._shared = set(self._entries)
+        return _ProjectionCheckpoint(
+            sequence_number=sequence_number,
+            timestamp=timestamp,
+            max_timestamp=max_timestamp,
+            entries=dict(self._entries),
+            state=state,
+        )
+
+
 @dataclass
 class CachingProjector:
     """Semantic projector with L1/L2/L3 cache hierarchy.
@@ -43,13 +203,16 @@ class CachingProjector:
     Cache Levels:
     - L1 (Query): LRU cache for repeated queries, TTL=5s
     - L2 (Entity): Per-entity state cache, TTL=30s
-    - L3 (Full): Complete state projection, invalidate on event
+    - L3 (Full): Snapshot of the incrementally maintained projection
 
     Invalidation:
-    - L3 invalidated on ANY new event
+    - L3 republished when new events are applied or on invalidate()
     - L2 invalidated when entity's events arrive
     - L1 invalidated by TTL expiry
 
+    Projected states are read-only mappings; use ``dict(...)`` to get a
+    mutable copy of a level.
+
     Attributes
     ----------
     event_store : EventStore
@@ -60,6 +223,11 @@ class CachingProjector:
         L2 cache TTL in seconds
     l3_ttl : float
         L3 cache TTL in seconds
+    checkpoint_interval : int
+        Events between projection checkpoints used by historical queries
+    max_checkpoints : int
+        Checkpoints kept; beyond it every other one is dropped and the
+        spacing doubles
 
     """
 
@@ -67,6 +235,8 @@ class CachingProjector:
     l1_ttl: float = 5.0
     l2_ttl: float = 30.0
     l3_ttl: float = 300.0
+    checkpoint_interval: int = 1000
+    max_checkpoints: int = 64
 
     # Cache state
     _l3_cache: CacheEntry | None = None
@@ -75,34 +245,72 @@ class CachingProjector:
     _last_applied_seq: int = 0
     _is_stale: bool = True
     _lock: RLock = field(default_factory=RLock)
+    _live: _CopyOnWriteState = field(default_factory=_CopyOnWriteState, init=False, repr=False)
+    _last_timestamp: datetime | None = field(default=None, init=False, repr=False)
+    _max_timestamp: datetime | None = field(default=None, init=False, repr=False)
+    _checkpoints: list[_ProjectionCheckpoint] = field(default_factory=list, init=False, repr=False)
+    _checkpoint_spacing: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validate the checkpoint settings.
+
+        Raises
+        ------
+        ValueError
+            If checkpoint_interval or max_checkpoints is not positive
+        """
+        if self.checkpoint_interval < 1:
+            msg = f"checkpoint_interval must be positive, got {self.checkpoint_interval}"
+            raise ValueError(msg)
+        if self.max_checkpoints < 1:
+            msg = f"max_checkpoints must be positive, got {self.max_checkpoints}"
+            raise ValueError(msg)
+        self._checkpoint_spacing = self.checkpoint_interval
 
     def project_current(self) -> ProjectionResult:
         """Get current materialized state (O(1) from cache).
 
+        Only events appended since the previous call are applied.
+
         Returns
         -------
         ProjectionResult
-            Current state with cache metadata
+            Current state with cache metadata, ``events_applied`` counts
+            the events applied by this call
 
         """
         start = time.monotonic()
         with self._lock:
-            if self._l3_cache and not self._l3_cache.is_expired() and not self._is_stale:
-                return ProjectionResult(
-                    state=copy.deepcopy(self._l3_cache.state),
-                    as_of=self._l3_cache.timestamp,
-                    sequence_number=self._l3_cache.sequence_number,
-                    events_applied=0,
-                    cache_hit=True,
-                    duration_ms=(time.monotonic() - start) * 1000,
+            events_applied = self._catch_up()
+            entry = self._l3_cache
+            cache_hit = events_applied == 0 and entry is not None and not entry.is_expired() and not self._is_stale
+            if entry is None or not cache_hit:
+                entry = CacheEntry(
+                    state=self._live.snapshot(),
+                    sequence_number=self._last_applied_seq,
+                    timestamp=self._last_timestamp or datetime.now(),
+                    created_at=time.monotonic(),
+                    ttl_seconds=self.l3_ttl,
                 )
-
-            # Rebuild projection from events
-            return self._rebuild_projection(start)
+                self._l3_cache = entry
+                self._is_stale = False
+
+            return ProjectionResult(
+                state=entry.state,
+                as_of=entry.timestamp,
+                sequence_number=entry.sequence_number,
+                events_applied=events_applied,
+                cache_hit=cache_hit,
+                duration_ms=(time.monotonic() - start) * 1000,
+            )
 
     def project_at_time(self, timestamp: datetime) -> ProjectionResult:
         """Reconstruct state at specific time point.
 
+        Events are applied in sequence order up to the first event after
+        ``timestamp``, starting from the latest checkpoint whose events
+        all precede it.
+
         Parameters
         ----------
         timestamp : datetime
@@ -111,28 +319,33 @@ class CachingProjector:
         Returns
         -------
         ProjectionResult
-            State as of timestamp
+            State as of timestamp, ``events_applied`` counts every event
+            reflected in the state
 
         """
         start = time.monotonic()
-        state: dict[str, Any] = {}
-        events_applied = 0
-        last_seq = 0
-        last_ts = datetime.now()
-
-        for event in self.event_store.replay():
+        with self._lock:
+            self._catch_up()
+            if self._max_timestamp is not None and self._max_timestamp <= timestamp:
+                return self._live_result(start)
+            index = bisect_right(self._checkpoints, timestamp, key=lambda c: c.max_timestamp)
+            base = self._checkpoints[index - 1] if index else None
+
+        state = _CopyOnWriteState.from_checkpoint(base)
+        last_seq = base.sequence_number if base else 0
+        last_ts = base.timestamp if base else datetime.now()
+        for event in self.event_store.replay(from_sequence=last_seq):
             if event.timestamp > timestamp:
                 break
-            self._apply_event_to_state(state, event)
-            events_applied += 1
-            last_seq = event.sequence_number if hasattr(event, "sequence_number") else last_seq + 1
+            state.apply(event, self._apply_event_to_state)
+            last_seq += 1
             last_ts = event.timestamp
 
         return ProjectionResult(
-            state=state,
+            state=state.snapshot(),
             as_of=last_ts,
             sequence_number=last_seq,
-            events_applied=events_applied,
+            events_applied=last_seq,
             cache_hit=False,
             duration_ms=(time.monotonic() - start) * 1000,
         )
@@ -140,40 +353,42 @@ class CachingProjector:
     def project_at_sequence(self, sequence: int) -> ProjectionResult:
         """Reconstruct state at specific sequence number.
 
+        Starts from the latest checkpoint at or before the target.
+
         Parameters
         ----------
         sequence : int
-            Target sequence number (inclusive)
+            Target sequence number (inclusive, 0-indexed)
 
         Returns
         -------
         ProjectionResult
-            State at sequence number
+            State at sequence number, ``events_applied`` counts every
+            event reflected in the state
 
         """
         start = time.monotonic()
-        state: dict[str, Any] = {}
-        events_applied = 0
-        current_seq = 0
-        last_ts = datetime.now()
-
-        for event in self.event_store.replay():
-            # Track current sequence (0-indexed from replay)
-            self._apply_event_to_state(state, event)
-            events_applied += 1
+        with self._lock:
+            self._catch_up()
+            target = min(max(sequence, 0) + 1, self._last_applied_seq)
+            reported = min(max(sequence, 0), self._last_applied_seq)
+            if target == self._last_applied_seq:
+                return self._live_result(start, reported)
+            index = bisect_right(self._checkpoints, target, key=lambda c: c.sequence_number)
+            base = self._checkpoints[index - 1] if index else None
+
+        state = _CopyOnWriteState.from_checkpoint(base)
+        from_seq = base.sequence_number if base else 0
+        last_ts = base.timestamp if base else datetime.now()
+        for event in self.event_store.replay(from_sequence=from_seq, to_sequence=target):
+            state.apply(event, self._apply_event_to_state)
             last_ts = event.timestamp
 
-            # Check if we've reached target sequence
-            # Sequences are 0-indexed in the replay
-            if current_seq >= sequence:
-                break
-            current_seq += 1
-
         return ProjectionResult(
-            state=state,
+            state=state.snapshot(),
             as_of=last_ts,
-            sequence_number=current_seq,
-            events_applied=events_applied,
+            sequence_number=reported,
+            events_applied=target,
             cache_hit=False,
             duration_ms=(time.monotonic() - start) * 1000,
         )
@@ -215,17 +430,15 @@ class CachingProjector:
         state_to = self.project_at_sequence(to_seq).state
 
         # Find additions and modifications
-        # Serialize dict values to JSON for hashability
+        # Serialize values to JSON for hashability (read-only views as dicts)
         additions: list[tuple[str, str]] = []
         modifications: list[tuple[str, str, str]] = []
         for key, new_val in state_to.items():
-            import json
-
-            new_val_str = json.dumps(new_val, sort_keys=True)
+            new_val_str = json.dumps(new_val, sort_keys=True, default=dict)
             if key not in state_from:
                 additions.append((key, new_val_str))
             elif state_from[key] != new_val:
-                old_val_str = json.dumps(state_from[key], sort_keys=True)
+                old_val_str = json.dumps(state_from[key], sort_keys=True, default=dict)
                 modifications.append((key, old_val_str, new_val_str))
 
         # Find removals
@@ -273,46 +486,60 @@ class CachingProjector:
 
         return history
 
-    def _rebuild_projection(self, start_time: float) -> ProjectionResult:
-        """Replay events to build current state.
+    def _catch_up(self) -> int:
+        """Apply events appended since the last call to the live state.
+
+        Must be called with the lock held. Records a checkpoint every
+        ``checkpoint_interval`` events, thinning them out once more than
+        ``max_checkpoints`` exist.
+
+        Returns
+        -------
+        int
+            Number of events applied
+        """
+        latest = self.event_store.get_latest_sequence()
+        if latest <= self._last_applied_seq:
+            return 0
+
+        applied = 0
+        for event in self.event_store.replay(from_sequence=self._last_applied_seq, to_sequence=latest):
+            self._live.apply(event, self._apply_event_to_state)
+            self._last_applied_seq += 1
+            applied += 1
+            self._last_timestamp = event.timestamp
+            if self._max_timestamp is None or event.timestamp > self._max_timestamp:
+                self._max_timestamp = event.timestamp
+            if self._last_applied_seq % self._checkpoint_spacing == 0:
+                self._checkpoints.append(
+                    self._live.checkpoint(self._last_applied_seq, event.timestamp, self._max_timestamp)
+                )
+                if len(self._checkpoints) > self.max_checkpoints:
+                    # Keep the checkpoints at multiples of the doubled spacing
+                    self._checkpoints = self._checkpoints[1::2]
+                    self._checkpoint_spacing *= 2
+        return applied
+
+    def _live_result(self, start_time: float, sequence_number: int | None = None) -> ProjectionResult:
+        """Project the live state as a historical result.
 
         Parameters
         ----------
         start_time : float
             Start time for duration calculation
+        sequence_number : int | None
+            Sequence number to report, defaults to the applied count
 
         Returns
         -------
         ProjectionResult
-            Rebuilt projection result
-
+            Snapshot of the live state
         """
-        state: dict[str, Any] = {}
-        events_applied = 0
-        last_seq = 0
-        last_ts = datetime.now()
-
-        for event in self.event_store.replay(from_sequence=self._last_applied_seq):
-            self._apply_event_to_state(state, event)
-            events_applied += 1
-            last_seq = event.sequence_number if hasattr(event, "sequence_number") else last_seq + 1
-            last_ts = event.timestamp
-
-        self._l3_cache = CacheEntry(
-            state=copy.deepcopy(state),
-            sequence_number=last_seq,
-            timestamp=last_ts,
-            created_at=time.monotonic(),
-            ttl_seconds=self.l3_ttl,
-        )
-        self._last_applied_seq = last_seq
-        self._is_stale = False
-
         return ProjectionResult(
-            state=state,
-            as_of=last_ts,
-            sequence_number=last_seq,
-            events_applied=events_applied,
+            state=self._live.snapshot(),
+            as_of=self._last_timestamp or datetime.now(),
+            sequence_number=self._last_applied_seq if sequence_number is None else sequence_number,
+            events_applied=self._last_applied_seq,
             cache_hit=False,
             duration_ms=(time.monotonic() - start_time) * 1000,
         )
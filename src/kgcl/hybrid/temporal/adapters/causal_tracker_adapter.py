@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass, field
 
+from kgcl.hybrid.temporal.domain.causal_index import CausalReachabilityIndex
 from kgcl.hybrid.temporal.domain.vector_clock import VectorClock
 from kgcl.hybrid.temporal.ports.causal_port import CausalExplanation, CausalGraph, CausalityAnalyzer, CausalTracker
 from kgcl.hybrid.temporal.ports.event_store_port import EventStore
@@ -14,7 +15,8 @@ from kgcl.hybrid.temporal.ports.event_store_port import EventStore
 class InMemoryCausalTracker:
     """In-memory causal tracker with DAG operations.
 
-    Maintains bidirectional mappings for efficient causal queries.
+    Maintains bidirectional mappings for efficient causal queries and a
+    reachability index answering ancestor checks without traversal.
 
     Attributes
     ----------
@@ -27,6 +29,7 @@ class InMemoryCausalTracker:
     # Internal state
     _causes: dict[str, tuple[str, ...]] = field(default_factory=dict)
     _effects: dict[str, list[str]] = field(default_factory=dict)
+    _index: CausalReachabilityIndex = field(default_factory=CausalReachabilityIndex, init=False, repr=False)
 
     def track_causation(self, effect_id: str, cause_ids: tuple[str, ...]) -> None:
         """Record causal relationship.
@@ -38,7 +41,10 @@ class InMemoryCausalTracker:
         cause_ids : tuple[str, ...]
             Events that caused the effect
         """
+        if self._causes.get(effect_id) == cause_ids:
+            return
         self._causes[effect_id] = cause_ids
+        self._index.add(effect_id, cause_ids)
 
         # Update reverse mapping
         for cause_id in cause_ids:
@@ -62,7 +68,7 @@ class InMemoryCausalTracker:
         """
         return self._causes.get(event_id, ())
 
-    def get_transitive_causes(self, event_id: str, max_depth: int = 100) -> tuple[str, ...]:
+    def get_transitive_causes(self, event_id: str, max_depth: int | None = None) -> tuple[str, ...]:
         """Get all causal ancestors up to max_depth.
 
         Uses BFS to traverse causal graph backwards.
@@ -71,8 +77,8 @@ class InMemoryCausalTracker:
         ----------
         event_id : str
             Event to query
-        max_depth : int, default=100
-            Maximum traversal depth
+        max_depth : int | None, default=None
+            Maximum traversal depth, None for all ancestors
 
         Returns
         -------
@@ -86,7 +92,7 @@ class InMemoryCausalTracker:
         while queue:
             current_id, depth = queue.popleft()
 
-            if depth >= max_depth:
+            if max_depth is not None and depth >= max_depth:
                 continue
 
             # Get direct causes
@@ -99,6 +105,28 @@ class InMemoryCausalTracker:
 
         return tuple(result)
 
+    def is_ancestor(self, ancestor_id: str, descendant_id: str) -> bool:
+        """Check whether one event transitively caused another.
+
+        Answered from the reachability index in constant time,
+        independent of the depth of the causal history.
+
+        Parameters
+        ----------
+        ancestor_id : str
+            Candidate cause
+        descendant_id : str
+            Candidate effect
+
+        Returns
+        -------
+        bool
+            True if ``ancestor_id`` is a causal ancestor of ``descendant_id``
+        """
+        if self._index.stale:
+            self._index.rebuild(self._causes)
+        return self._index.is_ancestor(ancestor_id, descendant_id)
+
     def get_root_causes(self, event_id: str) -> tuple[str, ...]:
         """Get events with no causes (roots of causal chain).
 
@@ -285,18 +313,18 @@ class DefaultCausalityAnalyzer:
         if not event_ids:
             return ()
 
-        # Get causes for first event
-        common_set = set(self.tracker.get_transitive_causes(event_ids[0]))
-
-        # Intersect with causes of remaining events
-        for event_id in event_ids[1:]:
-            causes = set(self.tracker.get_transitive_causes(event_id))
-            common_set &= causes
-
-        return tuple(sorted(common_set))
+        # Keep ancestors of the first event that reach every other event
+        common = self.tracker.get_transitive_causes(event_ids[0])
+        return tuple(
+            sorted(
+                cause_id
+                for cause_id in common
+                if all(self.tracker.is_ancestor(cause_id, event_id) for event_id in event_ids[1:])
+            )
+        )
 
     def check_causally_related(self, event_a_id: str, event_b_id: str) -> bool:
-        """Use vector clocks for happens-before check.
+        """Use vector clocks and tracked causation for happens-before check.
 
         Parameters
         ----------
@@ -321,11 +349,13 @@ class DefaultCausalityAnalyzer:
         vc_a = VectorClock(clocks=event_a.vector_clock)
         vc_b = VectorClock(clocks=event_b.vector_clock)
 
-        # Check vector clock happens-before in both directions
-        return vc_a.happens_before(vc_b) or vc_b.happens_before(vc_a)
+        # Check vector clock happens-before, then tracked ancestry, in both directions
+        if vc_a.happens_before(vc_b) or vc_b.happens_before(vc_a):
+            return True
+        return self.tracker.is_ancestor(event_a_id, event_b_id) or self.tracker.is_ancestor(event_b_id, event_a_id)
 
     def check_concurrent(self, event_a_id: str, event_b_id: str) -> bool:
-        """Use vector clocks - concurrent if neither happens-before.
+        """Concurrent if neither event happens before the other.
 
         Parameters
         ----------
@@ -346,12 +376,5 @@ class DefaultCausalityAnalyzer:
         if not event_a or not event_b:
             return False
 
-        # Reconstruct VectorClock objects from tuples
-        vc_a = VectorClock(clocks=event_a.vector_clock)
-        vc_b = VectorClock(clocks=event_b.vector_clock)
-
         # Concurrent if neither happens before the other
-        a_before_b = vc_a.happens_before(vc_b)
-        b_before_a = vc_b.happens_before(vc_a)
-
-        return not a_before_b and not b_before_a
+        return not self.check_causally_related(event_a_id, event_b_id)
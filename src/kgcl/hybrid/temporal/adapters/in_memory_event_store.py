@@ -2,22 +2,133 @@
 
 from __future__ import annotations
 
+import heapq
+import logging
+from bisect import bisect_left, bisect_right
 from collections import deque
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from threading import RLock
 
-from kgcl.hybrid.temporal.domain.event import WorkflowEvent
+from kgcl.hybrid.temporal.domain.chain_verification import ChainCheckpoint, verify_chain_parallel, verify_segment
+from kgcl.hybrid.temporal.domain.event import EventType, WorkflowEvent
 from kgcl.hybrid.temporal.ports.event_store_port import AppendResult, QueryResult
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Window:
+    """Contiguous run of a posting list's sequence numbers.
+
+    Parameters
+    ----------
+    sequences : list[int]
+        Ascending sequence numbers
+    lo : int
+        First index (inclusive)
+    hi : int
+        Last index (exclusive)
+    """
+
+    sequences: list[int]
+    lo: int
+    hi: int
+
+    def __len__(self) -> int:
+        """Number of sequences in the window."""
+        return self.hi - self.lo
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate sequences in ascending order."""
+        sequences = self.sequences
+        for index in range(self.lo, self.hi):
+            yield sequences[index]
+
+    def page(self, offset: int, limit: int) -> list[int]:
+        """Sequences ``offset .. offset + limit`` of the window."""
+        start = min(self.lo + offset, self.hi)
+        return self.sequences[start : min(start + limit, self.hi)]
+
+
+@dataclass
+class _PostingList:
+    """Sequence numbers of indexed events with their timestamps.
+
+    Entries are kept in sequence order. While timestamps arrive in
+    non-decreasing order (the common case) time windows are found by
+    bisecting the timestamp array directly; otherwise a time-sorted
+    copy is built on demand.
+
+    Parameters
+    ----------
+    sequences : list[int]
+        Sequence numbers in ascending order
+    timestamps : list[datetime]
+        Timestamp of each sequence
+    ordered : bool
+        Whether timestamps are non-decreasing in sequence order
+    """
+
+    sequences: list[int] = field(default_factory=list)
+    timestamps: list[datetime] = field(default_factory=list)
+    ordered: bool = True
+    _by_time: tuple[list[datetime], list[int]] | None = field(default=None, repr=False)
+
+    def add(self, sequence: int, timestamp: datetime) -> None:
+        """Append an event's sequence number and timestamp."""
+        if self.ordered and self.timestamps and timestamp < self.timestamps[-1]:
+            self.ordered = False
+        self.sequences.append(sequence)
+        self.timestamps.append(timestamp)
+        self._by_time = None
+
+    def window(self, start: datetime | None, end: datetime | None) -> _Window:
+        """Sequences whose timestamp lies in ``[start, end]``.
+
+        Parameters
+        ----------
+        start : datetime | None
+            Start timestamp (inclusive), None for unbounded
+        end : datetime | None
+            End timestamp (inclusive), None for unbounded
+
+        Returns
+        -------
+        _Window
+            Matching sequences in ascending order
+        """
+        if start is None and end is None:
+            return _Window(self.sequences, 0, len(self.sequences))
+        if self.ordered:
+            times, sequences = self.timestamps, self.sequences
+        else:
+            if self._by_time is None:
+                pairs = sorted(zip(self.timestamps, self.sequences))
+                self._by_time = ([t for t, _ in pairs], [seq for _, seq in pairs])
+            times, sequences = self._by_time
+        lo = 0 if start is None else bisect_left(times, start)
+        hi = len(times) if end is None else bisect_right(times, end)
+        if self.ordered:
+            return _Window(sequences, lo, max(lo, hi))
+        matched = sorted(sequences[lo:hi])
+        return _Window(matched, 0, len(matched))
+
 
 @dataclass
 class InMemoryEventStore:
     """Thread-safe in-memory event store.
 
     Uses ring buffer for hot tier (recent events) with overflow to main store.
-    Supports O(1) append, O(1) lookup by ID/sequence, O(n) range queries.
+    Supports O(1) append, O(1) lookup by ID/sequence, and range queries
+    answered from timestamp-sorted posting lists (all events, per workflow,
+    per event type) in O(log n) plus the size of the smallest matching list.
+    Subscribers are notified of every appended event in sequence order.
+    Hash-chain verification is checkpointed per workflow, so repeated
+    checks only verify events appended since the last successful one.
 
     Parameters
     ----------
@@ -30,15 +141,48 @@ class InMemoryEventStore:
     # Internal state (not frozen - mutable store)
     _events: list[WorkflowEvent] = field(default_factory=list, init=False, repr=False)
     _by_id: dict[str, int] = field(default_factory=dict, init=False, repr=False)
-    _by_workflow: dict[str, list[int]] = field(default_factory=dict, init=False, repr=False)
+    _all: _PostingList = field(default_factory=_PostingList, init=False, repr=False)
+    _by_workflow: dict[str, _PostingList] = field(default_factory=dict, init=False, repr=False)
+    _by_type: dict[EventType, _PostingList] = field(default_factory=dict, init=False, repr=False)
     _hot_buffer: deque[int] = field(init=False, repr=False)
     _lock: RLock = field(default_factory=RLock, init=False, repr=False)
     _sequence: int = field(default=0, init=False, repr=False)
+    _subscribers: list[Callable[[int, WorkflowEvent], None]] = field(default_factory=list, init=False, repr=False)
+    _checkpoints: dict[str, ChainCheckpoint] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize hot buffer with max_hot_events capacity."""
         object.__setattr__(self, "_hot_buffer", deque(maxlen=self.max_hot_events))
 
+    def subscribe(self, listener: Callable[[int, WorkflowEvent], None]) -> None:
+        """Register a listener for appended events.
+
+        Listeners are called with each event's sequence number while the
+        store's lock is held, so they see events in sequence order. They
+        must not take locks held while calling into the store. An
+        exception raised by a listener is logged and does not affect the
+        append or the other listeners.
+
+        Parameters
+        ----------
+        listener : Callable[[int, WorkflowEvent], None]
+            Called with ``(sequence, event)`` after each append
+        """
+        with self._lock:
+            self._subscribers.append(listener)
+
+    def unsubscribe(self, listener: Callable[[int, WorkflowEvent], None]) -> None:
+        """Remove a listener registered with ``subscribe``.
+
+        Parameters
+        ----------
+        listener : Callable[[int, WorkflowEvent], None]
+            Listener to remove
+        """
+        with self._lock:
+            if listener in self._subscribers:
+                self._subscribers.remove(listener)
+
     def append(self, event: WorkflowEvent) -> AppendResult:
         """Append single event to store.
 
@@ -83,10 +227,16 @@ class InMemoryEventStore:
                 self._events.append(event)
                 self._by_id[event.event_id] = seq
 
-                # Index by workflow
-                if event.workflow_id not in self._by_workflow:
-                    self._by_workflow[event.workflow_id] = []
-                self._by_workflow[event.workflow_id].append(seq)
+                # Index by time, workflow and event type
+                self._all.add(seq, event.timestamp)
+                workflow_postings = self._by_workflow.get(event.workflow_id)
+                if workflow_postings is None:
+                    workflow_postings = self._by_workflow[event.workflow_id] = _PostingList()
+                workflow_postings.add(seq, event.timestamp)
+                type_postings = self._by_type.get(event.event_type)
+                if type_postings is None:
+                    type_postings = self._by_type[event.event_type] = _PostingList()
+                type_postings.add(seq, event.timestamp)
 
                 # Add to hot buffer
                 self._hot_buffer.append(seq)
@@ -94,6 +244,14 @@ class InMemoryEventStore:
                 event_ids.append(event.event_id)
                 sequence_numbers.append(seq)
 
+            listeners = tuple(self._subscribers)
+            for seq, event in zip(sequence_numbers, events, strict=True):
+                for listener in listeners:
+                    try:
+                        listener(seq, event)
+                    except Exception:
+                        logger.exception("Event store listener failed for sequence %d", seq)
+
             return AppendResult(event_ids=tuple(event_ids), sequence_numbers=tuple(sequence_numbers), success=True)
 
     def get_by_id(self, event_id: str) -> WorkflowEvent | None:
@@ -165,35 +323,57 @@ class InMemoryEventStore:
             Query results with pagination info
         """
         with self._lock:
-            # Start with candidate events
+            events = self._events
+            workflow_window = None
             if workflow_id is not None:
-                sequences = self._by_workflow.get(workflow_id, [])
-                candidates = [self._events[seq - 1] for seq in sequences]
+                workflow_postings = self._by_workflow.get(workflow_id)
+                if workflow_postings is None:
+                    return QueryResult(events=(), total_count=0, has_more=False)
+                workflow_window = workflow_postings.window(start, end)
+
+            if event_types is None:
+                window = workflow_window if workflow_window is not None else self._all.window(start, end)
+                page = window.page(offset, limit)
+                total_count = len(window)
+                return QueryResult(
+                    events=tuple(events[seq - 1] for seq in page),
+                    total_count=total_count,
+                    has_more=offset + limit < total_count,
+                )
+
+            types = set(event_types)
+            type_windows = [
+                postings.window(start, end) for event_type in types if (postings := self._by_type.get(event_type))
+            ]
+            type_count = sum(len(window) for window in type_windows)
+
+            matches: Iterable[int]
+            if workflow_window is None:
+                # Event types are disjoint, so the union size is known up front
+                if len(type_windows) == 1:
+                    page = type_windows[0].page(offset, limit)
+                else:
+                    page = list(islice(heapq.merge(*type_windows), offset, offset + limit))
+                total_count = type_count
             else:
-                candidates = list(self._events)
-
-            # Apply filters
-            filtered: list[WorkflowEvent] = []
-            for event in candidates:
-                # Time range filter
-                if start is not None and event.timestamp < start:
-                    continue
-                if end is not None and event.timestamp > end:
-                    continue
-
-                # Event type filter (compare EventType enums)
-                if event_types is not None and event.event_type not in event_types:
-                    continue
-
-                filtered.append(event)
-
-            total_count = len(filtered)
-
-            # Apply pagination
-            paginated = filtered[offset : offset + limit]
-            has_more = offset + limit < total_count
-
-            return QueryResult(events=tuple(paginated), total_count=total_count, has_more=has_more)
+                # Intersect by walking the smaller side and probing the other filter
+                if len(workflow_window) <= type_count:
+                    matches = (seq for seq in workflow_window if events[seq - 1].event_type in types)
+                else:
+                    matches = (seq for seq in heapq.merge(*type_windows) if events[seq - 1].workflow_id == workflow_id)
+                page = []
+                total_count = 0
+                stop = offset + limit
+                for seq in matches:
+                    if offset <= total_count < stop:
+                        page.append(seq)
+                    total_count += 1
+
+            return QueryResult(
+                events=tuple(events[seq - 1] for seq in page),
+                total_count=total_count,
+                has_more=offset + limit < total_count,
+            )
 
     def replay(
         self, from_sequence: int = 0, to_sequence: int | None = None, workflow_id: str | None = None
@@ -217,17 +397,17 @@ class InMemoryEventStore:
         with self._lock:
             # Get candidate sequences
             if workflow_id is not None:
-                sequences = [
-                    seq
-                    for seq in self._by_workflow.get(workflow_id, [])
-                    if seq > from_sequence and (to_sequence is None or seq <= to_sequence)
-                ]
+                workflow_postings = self._by_workflow.get(workflow_id)
+                all_sequences = workflow_postings.sequences if workflow_postings is not None else []
+                lo = bisect_right(all_sequences, from_sequence)
+                hi = len(all_sequences) if to_sequence is None else bisect_right(all_sequences, to_sequence)
+                sequences: Iterable[int] = all_sequences[lo:hi]
             else:
                 max_seq = to_sequence if to_sequence is not None else len(self._events)
-                sequences = list(range(from_sequence + 1, max_seq + 1))
+                sequences = range(from_sequence + 1, max_seq + 1)
 
             # Yield events in order
-            for seq in sorted(sequences):
+            for seq in sequences:
                 if seq <= len(self._events):
                     yield self._events[seq - 1]
 
@@ -293,12 +473,16 @@ class InMemoryEventStore:
         with self._lock:
             if workflow_id is None:
                 return len(self._events)
-            return len(self._by_workflow.get(workflow_id, []))
+            workflow_postings = self._by_workflow.get(workflow_id)
+            return len(workflow_postings.sequences) if workflow_postings is not None else 0
 
     def verify_chain_integrity(self, workflow_id: str) -> tuple[bool, str]:
         """Verify hash chain integrity.
 
-        Checks that each event's previous_hash matches the hash of the previous event.
+        Checks that each event's hash matches its content and that its
+        previous_hash matches the hash of the previous event. Only
+        events after the workflow's checkpoint are verified; the
+        checkpoint advances when they are valid.
 
         Parameters
         ----------
@@ -311,25 +495,92 @@ class InMemoryEventStore:
             (valid, error_message) - error_message empty if valid
         """
         with self._lock:
-            sequences = self._by_workflow.get(workflow_id, [])
-            if not sequences:
+            workflow_postings = self._by_workflow.get(workflow_id)
+            if workflow_postings is None:
                 return (True, "")
+            checkpoint = self._checkpoints.get(workflow_id)
+            start = checkpoint.verified_events if checkpoint is not None else 0
+            previous_hash = checkpoint.last_hash if checkpoint is not None else ""
+            sequences = workflow_postings.sequences[start:]
+            events = [self._events[seq - 1] for seq in sequences]
 
-            sorted_seqs = sorted(sequences)
-            prev_hash = ""
+        if not events:
+            return (True, "")
+        valid, error = verify_segment(events, previous_hash)
+        if valid:
+            self._advance_checkpoint(
+                ChainCheckpoint(workflow_id, start + len(events), sequences[-1], events[-1].event_hash)
+            )
+        return (valid, error)
+
+    def audit_chain_integrity(
+        self,
+        workflow_id: str,
+        segment_size: int = 50_000,
+        max_workers: int | None = None,
+        executor: Executor | None = None,
+    ) -> tuple[bool, str]:
+        """Verify a workflow's full hash chain, ignoring checkpoints.
 
-            for seq in sorted_seqs:
-                event = self._events[seq - 1]
+        The chain is split into segments verified in parallel (see
+        ``verify_chain_parallel``). A successful audit checkpoints the
+        whole chain.
 
-                # Check if previous_hash matches expected
-                if event.previous_hash != prev_hash:
-                    return (
-                        False,
-                        f"Hash chain broken at event {event.event_id}: "
-                        f"expected previous_hash={prev_hash}, got {event.previous_hash}",
-                    )
+        Parameters
+        ----------
+        workflow_id : str
+            Workflow to verify
+        segment_size : int
+            Events per segment
+        max_workers : int | None
+            Worker processes for the default pool
+        executor : Executor | None
+            Executor to run segments on instead of a new process pool
 
-                # Use event's own computed hash for next iteration
-                prev_hash = event.event_hash
+        Returns
+        -------
+        tuple[bool, str]
+            (valid, error_message) - error_message empty if valid
+        """
+        with self._lock:
+            workflow_postings = self._by_workflow.get(workflow_id)
+            if workflow_postings is None:
+                return (True, "")
+            sequences = list(workflow_postings.sequences)
+            events = [self._events[seq - 1] for seq in sequences]
 
-            return (True, "")
+        valid, error = verify_chain_parallel(
+            events, segment_size=segment_size, max_workers=max_workers, executor=executor
+        )
+        if valid:
+            self._advance_checkpoint(ChainCheckpoint(workflow_id, len(events), sequences[-1], events[-1].event_hash))
+        return (valid, error)
+
+    def get_chain_checkpoint(self, workflow_id: str) -> ChainCheckpoint | None:
+        """Get the verified prefix of a workflow's hash chain.
+
+        Parameters
+        ----------
+        workflow_id : str
+            Workflow identifier
+
+        Returns
+        -------
+        ChainCheckpoint | None
+            Checkpoint, or None if nothing has been verified yet
+        """
+        with self._lock:
+            return self._checkpoints.get(workflow_id)
+
+    def _advance_checkpoint(self, checkpoint: ChainCheckpoint) -> None:
+        """Record a verified prefix unless a longer one is already known.
+
+        Parameters
+        ----------
+        checkpoint : ChainCheckpoint
+            Newly verified prefix
+        """
+        with self._lock:
+            current = self._checkpoints.get(checkpoint.workflow_id)
+            if current is None or checkpoint.verified_events > current.verified_events:
+                self._checkpoints[checkpoint.workflow_id] = checkpoint
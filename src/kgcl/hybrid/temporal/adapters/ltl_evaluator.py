@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import threading
 import time
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
 
+from kgcl.hybrid.temporal.adapters.ltl_monitor import LTLMonitor
 from kgcl.hybrid.temporal.domain.event import WorkflowEvent
 from kgcl.hybrid.temporal.domain.ltl_formula import LTLFormula, LTLOperator, LTLResult
 from kgcl.hybrid.temporal.ports.event_store_port import EventStore
@@ -20,22 +23,47 @@ from kgcl.hybrid.temporal.ports.temporal_reasoner_port import (
 class LTLEvaluator:
     """LTL formula evaluator over event streams.
 
-    Implements incremental evaluation where possible:
-    - ALWAYS: Early exit on first violation (O(E) worst case)
-    - EVENTUALLY: Early exit on first satisfaction (O(E) worst case)
-    - UNTIL: Track phi until psi found (O(E) worst case)
-    - NEXT: Check single event after position (O(1))
+    Formulas are compiled into streaming monitors (see ``LTLMonitor``)
+    that are kept per formula and workflow and advanced only over events
+    appended since the previous check, so repeated checks cost O(new
+    events) instead of O(history):
+    - ALWAYS: Violated by the first event failing the condition
+    - EVENTUALLY: Satisfied by the first event meeting the condition
+    - UNTIL: Tracks phi until psi is found
+    - NEXT: Checks the single event after a position (O(1))
+
+    Properties registered with ``watch`` are advanced as events are
+    appended (for stores offering ``subscribe``, or by calling
+    ``observe``), so violations are reported the moment they occur.
+
+    ``evaluate`` caches monitors by formula, which compares conditions by
+    identity; ``verify_property`` caches them by property id and
+    workflow, so properties rebuilt with fresh callables reuse the
+    monitor instead of replaying the history.
 
     Parameters
     ----------
     event_store : EventStore
         Event store to query for event history
+    max_monitors : int
+        Maximum number of cached monitors (LRU)
     """
 
     event_store: EventStore
+    max_monitors: int = 256
+    _monitors: OrderedDict[Hashable, LTLMonitor] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _watched: list[LTLMonitor] = field(default_factory=list, init=False, repr=False, compare=False)
+    _subscribed: bool = field(default=False, init=False, repr=False, compare=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False, compare=False)
+    # Serializes subscribe/unsubscribe, which run without ``_lock``: the
+    # store calls ``observe`` under its own lock, so holding ``_lock``
+    # while calling into the store could deadlock.
+    _subscription_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     def evaluate(self, formula: LTLFormula, workflow_id: str | None = None) -> LTLResult:
-        """Evaluate arbitrary LTL formula recursively.
+        """Evaluate an LTL formula over the event history.
 
         Parameters
         ----------
@@ -47,39 +75,35 @@ class LTLEvaluator:
         Returns
         -------
         LTLResult
-            Evaluation result
+            Evaluation result; formulas with missing or non-callable
+            conditions, and NEXT formulas, yield a failing result
+        """
+        try:
+            key: Hashable = (formula, workflow_id)
+            hash(key)
+        except TypeError:
+            monitor = LTLMonitor.from_formula(formula, workflow_id)
+            self._catch_up(monitor)
+            return monitor.result
+        return self._evaluate_cached(key, lambda: LTLMonitor.from_formula(formula, workflow_id))
+
+    def _evaluate_property(self, property: TemporalProperty) -> LTLResult:
+        """Evaluate a property through the monitor cached under its id.
 
-        Raises
-        ------
-        ValueError
-            If formula operator is not supported
+        Parameters
+        ----------
+        property : TemporalProperty
+            Property whose ``property_id`` identifies its formula
+
+        Returns
+        -------
+        LTLResult
+            Result for the current history
         """
-        # Extract callable from inner (can be string SPARQL or callable)
-        if formula.inner is None:
-            return LTLResult(holds=False, explanation=f"{formula.operator.name} formula missing inner condition")
-
-        if not callable(formula.inner):
-            return LTLResult(holds=False, explanation=f"Inner condition must be callable, got {type(formula.inner)}")
-
-        match formula.operator:
-            case LTLOperator.ALWAYS:
-                return self.check_always(formula.inner, workflow_id)
-            case LTLOperator.EVENTUALLY:
-                return self.check_eventually(formula.inner, workflow_id)
-            case LTLOperator.UNTIL:
-                if formula.right is None:
-                    return LTLResult(holds=False, explanation="UNTIL formula missing right-hand condition")
-                if not callable(formula.right):
-                    return LTLResult(
-                        holds=False, explanation=f"Right condition must be callable, got {type(formula.right)}"
-                    )
-                return self.check_until(formula.inner, formula.right, workflow_id)
-            case LTLOperator.NEXT:
-                # For NEXT, we need to handle after_sequence differently
-                # Since LTLFormula doesn't have after_sequence field, this needs special handling
-                return LTLResult(holds=False, explanation="NEXT operator requires special handling via check_next()")
-            case _:
-                return LTLResult(holds=False, explanation=f"Unsupported operator: {formula.operator}")
+        return self._evaluate_cached(
+            ("property", property.property_id, property.workflow_id),
+            lambda: LTLMonitor.from_formula(property.formula, property.workflow_id),
+        )
 
     def check_always(self, condition: Callable[[WorkflowEvent], bool], workflow_id: str | None = None) -> LTLResult:
         """G(phi) - for all events: condition(event) is true.
@@ -98,15 +122,7 @@ class LTLEvaluator:
         LTLResult
             Result with early exit on first violation
         """
-        for event in self._get_events(workflow_id):
-            if not condition(event):
-                return LTLResult(
-                    holds=False,
-                    violated_at=event.timestamp,
-                    violating_event_id=event.event_id,
-                    explanation=f"Condition violated at event {event.event_id}",
-                )
-        return LTLResult(holds=True, explanation="Condition holds for all events")
+        return self.evaluate(LTLFormula(operator=LTLOperator.ALWAYS, inner=condition), workflow_id)
 
     def check_eventually(self, condition: Callable[[WorkflowEvent], bool], workflow_id: str | None = None) -> LTLResult:
         """F(phi) - exists some event where condition is true.
@@ -123,10 +139,7 @@ class LTLEvaluator:
         LTLResult
             Result with early exit on first satisfaction
         """
-        for event in self._get_events(workflow_id):
-            if condition(event):
-                return LTLResult(holds=True, explanation=f"Condition satisfied at event {event.event_id}")
-        return LTLResult(holds=False, explanation="Condition never satisfied")
+        return self.evaluate(LTLFormula(operator=LTLOperator.EVENTUALLY, inner=condition), workflow_id)
 
     def check_until(
         self,
@@ -136,11 +149,10 @@ class LTLEvaluator:
     ) -> LTLResult:
         """phi U psi - phi holds until psi becomes true.
 
-        Algorithm:
-        1. For each event in order:
-           - If psi(event): SATISFIED
-           - If not phi(event): VIOLATED
-        2. If end reached without psi: VIOLATED (psi never occurred)
+        Monitor states:
+        - psi(event): SATISFIED
+        - not phi(event): VIOLATED
+        - end reached without psi: VIOLATED (psi never occurred)
 
         Parameters
         ----------
@@ -156,17 +168,8 @@ class LTLEvaluator:
         LTLResult
             Result indicating if phi held until psi became true
         """
-        for event in self._get_events(workflow_id):
-            if condition_psi(event):
-                return LTLResult(holds=True, explanation="Until condition reached")
-            if not condition_phi(event):
-                return LTLResult(
-                    holds=False,
-                    violated_at=event.timestamp,
-                    violating_event_id=event.event_id,
-                    explanation="Phi violated before psi became true",
-                )
-        return LTLResult(holds=False, explanation="Psi never became true")
+        formula = LTLFormula(operator=LTLOperator.UNTIL, inner=condition_phi, right=condition_psi)
+        return self.evaluate(formula, workflow_id)
 
     def check_next(
         self, condition: Callable[[WorkflowEvent], bool], after_sequence: int, workflow_id: str | None = None
@@ -204,7 +207,8 @@ class LTLEvaluator:
     def check_precedes(self, event_type_a: str, event_type_b: str, workflow_id: str | None = None) -> LTLResult:
         """A precedes B: no B occurs without A having occurred first.
 
-        Track if A has been seen, fail if B seen before A.
+        Monitored as (not B) weak-until A: satisfied for good once A is
+        seen, violated if B is seen first.
 
         Parameters
         ----------
@@ -220,22 +224,17 @@ class LTLEvaluator:
         LTLResult
             Result indicating if A always precedes B
         """
-        a_seen = False
-        for event in self._get_events(workflow_id):
-            if event.event_type.name == event_type_a:
-                a_seen = True
-            elif event.event_type.name == event_type_b and not a_seen:
-                return LTLResult(
-                    holds=False,
-                    violated_at=event.timestamp,
-                    violating_event_id=event.event_id,
-                    explanation=f"{event_type_b} occurred before {event_type_a}",
-                )
-        return LTLResult(holds=True, explanation=f"{event_type_a} always precedes {event_type_b}")
+        return self._evaluate_cached(
+            ("precedes", event_type_a, event_type_b, workflow_id),
+            lambda: LTLMonitor.precedes(event_type_a, event_type_b, workflow_id),
+        )
 
     def verify_property(self, property: TemporalProperty) -> PropertyVerificationResult:
         """Verify named property with timing.
 
+        The streaming monitor is cached by ``property_id`` and workflow,
+        so the id must identify the formula.
+
         Parameters
         ----------
         property : TemporalProperty
@@ -247,7 +246,7 @@ class LTLEvaluator:
             Verification result with timing information
         """
         start = time.monotonic()
-        result = self.evaluate(property.formula, property.workflow_id)
+        result = self._evaluate_property(property)
         duration = (time.monotonic() - start) * 1000
         return PropertyVerificationResult(
             property=property,
@@ -271,17 +270,136 @@ class LTLEvaluator:
         """
         return [self.verify_property(p) for p in properties]
 
-    def _get_events(self, workflow_id: str | None) -> list[WorkflowEvent]:
-        """Get event iterator, optionally filtered by workflow.
+    def watch(self, property: TemporalProperty, on_violation: Callable[[LTLResult], None] | None = None) -> LTLMonitor:
+        """Monitor a property continuously as events are appended.
+
+        The monitor is caught up with the existing history, then advanced
+        on every append if the event store offers ``subscribe``.
+        Otherwise feed appended events with ``observe``.
 
         Parameters
         ----------
-        workflow_id : str | None
-            Optional workflow ID to filter events
+        property : TemporalProperty
+            The property to monitor
+        on_violation : Callable[[LTLResult], None] | None
+            Called as soon as the property is violated
 
         Returns
         -------
-        list[WorkflowEvent]
-            Filtered event list
+        LTLMonitor
+            Live monitor; its ``verdict`` and ``result`` stay current
         """
-        return list(self.event_store.replay(workflow_id=workflow_id))
+        monitor = LTLMonitor.from_formula(property.formula, property.workflow_id, on_violation)
+        with self._subscription_lock:
+            with self._lock:
+                self._watched.append(monitor)
+                subscribe = None if self._subscribed else getattr(self.event_store, "subscribe", None)
+            if subscribe is not None:
+                subscribe(self.observe)
+                with self._lock:
+                    self._subscribed = True
+        self._catch_up(monitor)
+        return monitor
+
+    def unwatch(self, monitor: LTLMonitor) -> None:
+        """Stop advancing a monitor returned by ``watch``.
+
+        The evaluator unsubscribes from the event store when the last
+        watched monitor is removed.
+
+        Parameters
+        ----------
+        monitor : LTLMonitor
+            Monitor to stop
+        """
+        with self._subscription_lock:
+            with self._lock:
+                self._watched = [m for m in self._watched if m is not monitor]
+                release = not self._watched and self._subscribed
+                if release:
+                    self._subscribed = False
+            unsubscribe = getattr(self.event_store, "unsubscribe", None) if release else None
+            if unsubscribe is not None:
+                unsubscribe(self.observe)
+
+    def observe(self, sequence: int, event: WorkflowEvent) -> None:
+        """Advance watched monitors by an appended event.
+
+        Events delivered in sequence order cost O(1) per monitor. A gap
+        or out-of-order delivery makes the monitor catch up from the
+        event store instead.
+
+        Parameters
+        ----------
+        sequence : int
+            Sequence number assigned by the event store
+        event : WorkflowEvent
+            The appended event
+        """
+        lagging: list[LTLMonitor] = []
+        with self._lock:
+            for monitor in self._watched:
+                if sequence == monitor.position + 1:
+                    monitor.position = sequence
+                    monitor.observe(event)
+                elif sequence > monitor.position:
+                    lagging.append(monitor)
+        for monitor in lagging:
+            self._catch_up(monitor)
+
+    def _evaluate_cached(self, key: Hashable, build: Callable[[], LTLMonitor]) -> LTLResult:
+        """Advance the cached monitor for a key and return its result.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key identifying property and workflow
+        build : Callable[[], LTLMonitor]
+            Builds the monitor on a cache miss
+
+        Returns
+        -------
+        LTLResult
+            Result for the current history
+        """
+        with self._lock:
+            monitor = self._monitors.get(key)
+            if monitor is None:
+                monitor = self._monitors[key] = build()
+                if len(self._monitors) > self.max_monitors:
+                    self._monitors.popitem(last=False)
+            else:
+                self._monitors.move_to_end(key)
+        self._catch_up(monitor)
+        return monitor.result
+
+    def _catch_up(self, monitor: LTLMonitor) -> None:
+        """Advance a monitor over events appended since its position.
+
+        Events are read from the store without holding the evaluator's
+        lock, so store listeners calling ``observe`` cannot deadlock
+        with a catch-up in another thread.
+
+        Parameters
+        ----------
+        monitor : LTLMonitor
+            Monitor to advance
+        """
+        while True:
+            position = monitor.position
+            latest = self.event_store.get_latest_sequence()
+            if latest <= position:
+                return
+            events: list[WorkflowEvent] = []
+            if not monitor.verdict.is_final:
+                events = list(
+                    self.event_store.replay(from_sequence=position, to_sequence=latest, workflow_id=monitor.workflow_id)
+                )
+            with self._lock:
+                if monitor.position != position:
+                    continue
+                for event in events:
+                    if monitor.observe(event).is_final:
+                        break
+                monitor.position = latest
+                return
@@ -0,0 +1,340 @@
+"""Streaming runtime monitors for LTL properties.
+
+An ``LTLFormula`` is compiled into a small finite-state automaton that
+is advanced one event at a time, following LTL progression over finite
+traces. Each event costs O(1) predicate calls, and once a verdict can no
+longer change the monitor ignores further events. Verdicts are
+four-valued (RV-LTL): a trace either irrevocably satisfies or violates
+the property, or only presumably does so until more events arrive.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Protocol
+
+from kgcl.hybrid.temporal.domain.event import WorkflowEvent
+from kgcl.hybrid.temporal.domain.ltl_formula import LTLFormula, LTLOperator, LTLResult
+
+EventPredicate = Callable[[WorkflowEvent], bool]
+
+logger = logging.getLogger(__name__)
+
+
+class MonitorVerdict(Enum):
+    """Verdict of a runtime monitor over the trace seen so far.
+
+    Attributes
+    ----------
+    SATISFIED : str
+        Every extension of the trace satisfies the property
+    VIOLATED : str
+        Every extension of the trace violates the property
+    PRESUMABLY_SATISFIED : str
+        The finite trace satisfies the property, later events may not
+    PRESUMABLY_VIOLATED : str
+        The finite trace violates the property, later events may not
+    """
+
+    SATISFIED = "satisfied"
+    VIOLATED = "violated"
+    PRESUMABLY_SATISFIED = "presumably_satisfied"
+    PRESUMABLY_VIOLATED = "presumably_violated"
+
+    @property
+    def is_final(self) -> bool:
+        """Whether further events can no longer change the verdict."""
+        return self in {MonitorVerdict.SATISFIED, MonitorVerdict.VIOLATED}
+
+    @property
+    def holds(self) -> bool:
+        """Whether the property holds on the trace seen so far."""
+        return self in {MonitorVerdict.SATISFIED, MonitorVerdict.PRESUMABLY_SATISFIED}
+
+
+Transition = tuple[MonitorVerdict, LTLResult]
+
+
+class _Automaton(Protocol):
+    """Transition structure of a compiled property."""
+
+    def initial(self) -> Transition:
+        """Verdict and result for the empty trace."""
+        ...
+
+    def step(self, event: WorkflowEvent) -> Transition | None:
+        """Next verdict and result, or None if the state is unchanged."""
+        ...
+
+
+@dataclass(frozen=True)
+class _Always:
+    """G(phi): violated by the first event not satisfying phi."""
+
+    condition: EventPredicate
+
+    def initial(self) -> Transition:
+        return MonitorVerdict.PRESUMABLY_SATISFIED, LTLResult(holds=True, explanation="Condition holds for all events")
+
+    def step(self, event: WorkflowEvent) -> Transition | None:
+        if self.condition(event):
+            return None
+        return MonitorVerdict.VIOLATED, LTLResult(
+            holds=False,
+            violated_at=event.timestamp,
+            violating_event_id=event.event_id,
+            explanation=f"Condition violated at event {event.event_id}",
+        )
+
+
+@dataclass(frozen=True)
+class _Eventually:
+    """F(phi): satisfied by the first event satisfying phi."""
+
+    condition: EventPredicate
+
+    def initial(self) -> Transition:
+        return MonitorVerdict.PRESUMABLY_VIOLATED, LTLResult(holds=False, explanation="Condition never satisfied")
+
+    def step(self, event: WorkflowEvent) -> Transition | None:
+        if not self.condition(event):
+            return None
+        return MonitorVerdict.SATISFIED, LTLResult(
+            holds=True, explanation=f"Condition satisfied at event {event.event_id}"
+        )
+
+
+@dataclass(frozen=True)
+class _Until:
+    """phi U psi: phi holds on every event before the first psi event."""
+
+    phi: EventPredicate
+    psi: EventPredicate
+
+    def initial(self) -> Transition:
+        return MonitorVerdict.PRESUMABLY_VIOLATED, LTLResult(holds=False, explanation="Psi never became true")
+
+    def step(self, event: WorkflowEvent) -> Transition | None:
+        if self.psi(event):
+            return MonitorVerdict.SATISFIED, LTLResult(holds=True, explanation="Until condition reached")
+        if self.phi(event):
+            return None
+        return MonitorVerdict.VIOLATED, LTLResult(
+            holds=False,
+            violated_at=event.timestamp,
+            violating_event_id=event.event_id,
+            explanation="Phi violated before psi became true",
+        )
+
+
+@dataclass(frozen=True)
+class _Precedes:
+    """(not B) W A: no B event before the first A event."""
+
+    event_type_a: str
+    event_type_b: str
+
+    def initial(self) -> Transition:
+        return MonitorVerdict.PRESUMABLY_SATISFIED, self._holds()
+
+    def step(self, event: WorkflowEvent) -> Transition | None:
+        name = event.event_type.name
+        if name == self.event_type_a:
+            return MonitorVerdict.SATISFIED, self._holds()
+        if name != self.event_type_b:
+            return None
+        return MonitorVerdict.VIOLATED, LTLResult(
+            holds=False,
+            violated_at=event.timestamp,
+            violating_event_id=event.event_id,
+            explanation=f"{self.event_type_b} occurred before {self.event_type_a}",
+        )
+
+    def _holds(self) -> LTLResult:
+        return LTLResult(holds=True, explanation=f"{self.event_type_a} always precedes {self.event_type_b}")
+
+
+@dataclass(frozen=True)
+class _Constant:
+    """Fixed result for formulas that cannot be monitored."""
+
+    result: LTLResult
+
+    def initial(self) -> Transition:
+        verdict = MonitorVerdict.SATISFIED if self.result.holds else MonitorVerdict.VIOLATED
+        return verdict, self.result
+
+    def step(self, event: WorkflowEvent) -> Transition | None:
+        return self.initial()
+
+
+def _compile(formula: LTLFormula) -> _Automaton:
+    """Build the automaton for a formula.
+
+    Parameters
+    ----------
+    formula : LTLFormula
+        Formula with callable conditions
+
+    Returns
+    -------
+    _Automaton
+        Automaton, or a constant failure for unsupported formulas
+    """
+    if formula.inner is None:
+        return _Constant(LTLResult(holds=False, explanation=f"{formula.operator.name} formula missing inner condition"))
+    if not callable(formula.inner):
+        return _Constant(
+            LTLResult(holds=False, explanation=f"Inner condition must be callable, got {type(formula.inner)}")
+        )
+
+    match formula.operator:
+        case LTLOperator.ALWAYS:
+            return _Always(formula.inner)
+        case LTLOperator.EVENTUALLY:
+            return _Eventually(formula.inner)
+        case LTLOperator.UNTIL:
+            if formula.right is None:
+                return _Constant(LTLResult(holds=False, explanation="UNTIL formula missing right-hand condition"))
+            if not callable(formula.right):
+                return _Constant(
+                    LTLResult(holds=False, explanation=f"Right condition must be callable, got {type(formula.right)}")
+                )
+            return _Until(formula.inner, formula.right)
+        case LTLOperator.NEXT:
+            return _Constant(
+                LTLResult(holds=False, explanation="NEXT operator requires special handling via check_next()")
+            )
+        case _:
+            return _Constant(LTLResult(holds=False, explanation=f"Unsupported operator: {formula.operator}"))
+
+
+@dataclass
+class LTLMonitor:
+    """Incremental monitor for one temporal property.
+
+    Feed events in sequence order with ``observe``; ``verdict`` and
+    ``result`` always describe the trace observed so far, and
+    ``on_violation`` is called as soon as the property is violated.
+
+    Parameters
+    ----------
+    automaton : _Automaton
+        Compiled property (use ``from_formula`` or ``precedes``)
+    workflow_id : str | None
+        Only events of this workflow are observed, None observes all
+    on_violation : Callable[[LTLResult], None] | None
+        Called once when the verdict becomes VIOLATED
+    verdict : MonitorVerdict
+        Verdict for the trace observed so far
+    result : LTLResult
+        Evaluation result for the trace observed so far
+    position : int
+        Last store sequence number the monitor was advanced to
+    events_seen : int
+        Number of events the automaton has stepped over
+
+    Examples
+    --------
+    >>> monitor = LTLMonitor.from_formula(LTLFormula(LTLOperator.ALWAYS, has_actor))
+    >>> monitor.observe(event)
+    <MonitorVerdict.PRESUMABLY_SATISFIED: 'presumably_satisfied'>
+    """
+
+    automaton: _Automaton
+    workflow_id: str | None = None
+    on_violation: Callable[[LTLResult], None] | None = field(default=None, repr=False)
+    verdict: MonitorVerdict = field(init=False)
+    result: LTLResult = field(init=False)
+    position: int = field(default=0, init=False)
+    events_seen: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        """Start in the automaton's initial state."""
+        self.verdict, self.result = self.automaton.initial()
+
+    @classmethod
+    def from_formula(
+        cls,
+        formula: LTLFormula,
+        workflow_id: str | None = None,
+        on_violation: Callable[[LTLResult], None] | None = None,
+    ) -> LTLMonitor:
+        """Compile an LTL formula into a monitor.
+
+        Formulas ``LTLEvaluator.evaluate`` rejects (missing or
+        non-callable conditions, NEXT) compile to a monitor with the same
+        fixed failing result.
+
+        Parameters
+        ----------
+        formula : LTLFormula
+            Formula with callable conditions
+        workflow_id : str | None
+            Workflow to observe, None observes all
+        on_violation : Callable[[LTLResult], None] | None
+            Violation callback
+
+        Returns
+        -------
+        LTLMonitor
+            Monitor in its initial state
+        """
+        return cls(_compile(formula), workflow_id=workflow_id, on_violation=on_violation)
+
+    @classmethod
+    def precedes(
+        cls,
+        event_type_a: str,
+        event_type_b: str,
+        workflow_id: str | None = None,
+        on_violation: Callable[[LTLResult], None] | None = None,
+    ) -> LTLMonitor:
+        """Monitor that no ``event_type_b`` event occurs before an ``event_type_a`` event.
+
+        Parameters
+        ----------
+        event_type_a : str
+            Event type name that must come first
+        event_type_b : str
+            Event type name that must come after A
+        workflow_id : str | None
+            Workflow to observe, None observes all
+        on_violation : Callable[[LTLResult], None] | None
+            Violation callback
+
+        Returns
+        -------
+        LTLMonitor
+            Monitor in its initial state
+        """
+        return cls(_Precedes(event_type_a, event_type_b), workflow_id=workflow_id, on_violation=on_violation)
+
+    def observe(self, event: WorkflowEvent) -> MonitorVerdict:
+        """Advance the monitor by one event.
+
+        Parameters
+        ----------
+        event : WorkflowEvent
+            Next event of the trace
+
+        Returns
+        -------
+        MonitorVerdict
+            Verdict after the event
+        """
+        if self.verdict.is_final or (self.workflow_id is not None and event.workflow_id != self.workflow_id):
+            return self.verdict
+        self.events_seen += 1
+        transition = self.automaton.step(event)
+        if transition is not None:
+            self.verdict, self.result = transition
+            if self.verdict is MonitorVerdict.VIOLATED and self.on_violation is not None:
+                try:
+                    self.on_violation(self.result)
+                except Exception:
+                    logger.exception("on_violation callback failed")
+        return self.verdict
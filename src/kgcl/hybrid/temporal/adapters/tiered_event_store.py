@@ -6,6 +6,8 @@ Performance-optimized three-tier storage:
 - COLD: Compressed snapshots on disk, O(log N) access via binary search
 
 Automatic promotion and compaction based on configurable policies.
+Vector clocks in snapshots are delta-encoded against the event's causal
+predecessor, since consecutive clocks usually differ in one entry.
 """
 
 from __future__ import annotations
@@ -23,6 +25,7 @@ from typing import Any
 from uuid import uuid4
 
 from kgcl.hybrid.temporal.domain.event import WorkflowEvent
+from kgcl.hybrid.temporal.domain.vector_clock import apply_clock_delta, clock_delta
 from kgcl.hybrid.temporal.ports.event_store_port import AppendResult, QueryResult
 
 
@@ -74,8 +77,10 @@ class Snapshot:
             )
 
         # Serialize events to JSON
-        events_data = [
-            {
+        positions: dict[str, int] = {}
+        events_data = []
+        for position, (e, seq) in enumerate(events):
+            event_data = {
                 "event_id": e.event_id,
                 "workflow_id": e.workflow_id,
                 "event_type": e.event_type.name,
@@ -83,12 +88,12 @@ class Snapshot:
                 "tick_number": e.tick_number,
                 "payload": e.payload,
                 "caused_by": list(e.caused_by),
-                "vector_clock": [list(vc) for vc in e.vector_clock],
                 "previous_hash": e.previous_hash,
                 "sequence_number": seq,
             }
-            for e, seq in events
-        ]
+            event_data.update(_encode_vector_clock(e, position, events, positions))
+            events_data.append(event_data)
+            positions[e.event_id] = position
         json_data = json.dumps(events_data)
         compressed = zlib.compress(json_data.encode("utf-8"), level=compression_level)
 
@@ -115,6 +120,11 @@ class Snapshot:
 
         results: list[tuple[WorkflowEvent, int]] = []
         for e in events_data:
+            if "vector_clock" in e:
+                vector_clock = tuple(tuple(vc) for vc in e["vector_clock"])
+            else:
+                base = results[e["vector_clock_base"]][0].vector_clock
+                vector_clock = apply_clock_delta(base, e["vector_clock_delta"])
             event = WorkflowEvent(
                 event_id=e["event_id"],
                 event_type=EventType[e["event_type"]],
@@ -123,7 +133,7 @@ class Snapshot:
                 workflow_id=e["workflow_id"],
                 payload=e["payload"],
                 caused_by=tuple(e["caused_by"]),
-                vector_clock=tuple(tuple(vc) for vc in e["vector_clock"]),
+                vector_clock=vector_clock,
                 previous_hash=e["previous_hash"],
             )
             seq = e["sequence_number"]
@@ -132,6 +142,40 @@ class Snapshot:
         return results
 
 
+def _encode_vector_clock(
+    event: WorkflowEvent, position: int, events: Sequence[tuple[WorkflowEvent, int]], positions: dict[str, int]
+) -> dict[str, Any]:
+    """Encode an event's vector clock for a snapshot.
+
+    The clock is stored as a delta against its first causal predecessor in
+    the snapshot, or else the preceding event. Clocks that are not in
+    canonical sorted form are stored whole, so the decoded tuple (and
+    therefore the event hash) is unchanged.
+
+    Parameters
+    ----------
+    event : WorkflowEvent
+        Event being encoded
+    position : int
+        Position of the event in the snapshot
+    events : Sequence[tuple[WorkflowEvent, int]]
+        All snapshot events, in order
+    positions : dict[str, int]
+        Positions of the events already encoded
+
+    Returns
+    -------
+    dict[str, Any]
+        ``vector_clock``, or ``vector_clock_base`` and ``vector_clock_delta``
+    """
+    clock = event.vector_clock
+    base_position = next((positions[cause] for cause in event.caused_by if cause in positions), position - 1)
+    if base_position < 0 or clock != tuple(sorted(dict(clock).items())):
+        return {"vector_clock": [list(vc) for vc in clock]}
+    delta = clock_delta(clock, events[base_position][0].vector_clock)
+    return {"vector_clock_base": base_position, "vector_clock_delta": [list(entry) for entry in delta]}
+
+
 @dataclass
 class TieredEventStore:
     """Three-tier event store with automatic promotion and compaction.
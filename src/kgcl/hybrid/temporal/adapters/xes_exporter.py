@@ -1,21 +1,29 @@
 """XES event log exporter for process mining compatibility.
 
 Implements IEEE 1849-2016 XES standard for export to ProM, Disco, Celonis.
+Logs can be built in memory (``convert_log`` / ``to_xml``) or streamed
+straight from an event iterator or store with ``XESStreamWriter``, which
+writes one event element at a time and keeps memory independent of the
+log size.
 """
 
 from __future__ import annotations
 
+import gzip
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
 from xml.dom import minidom
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
+    from types import TracebackType
 
     from kgcl.hybrid.temporal.domain.event import WorkflowEvent
+    from kgcl.hybrid.temporal.ports.event_store_port import EventStore
 
 
 class LifecycleTransition(Enum):
@@ -260,29 +268,7 @@ class XESExporter:
         root = ET.Element("log")
         root.set("xes.version", "1849.2016")
         root.set("xmlns", self._ns)
-
-        # Add extensions
-        for ext_name in log.extensions:
-            ext = ET.SubElement(root, "extension")
-            ext.set("name", ext_name)
-            ext.set("prefix", ext_name.lower())
-            ext.set("uri", f"{self._ns}{ext_name.lower()}.xesext")
-
-        # Add classifiers
-        for clf_name, clf_keys in log.classifiers:
-            clf = ET.SubElement(root, "classifier")
-            clf.set("name", clf_name)
-            clf.set("keys", clf_keys)
-
-        # Add global event attributes
-        global_event = ET.SubElement(root, "global")
-        global_event.set("scope", "event")
-        self._add_attribute(global_event, "string", "concept:name", "UNKNOWN")
-        self._add_attribute(global_event, "string", "lifecycle:transition", "complete")
-
-        # Add log-level attributes
-        for attr in log.attributes:
-            self._add_attribute(root, attr.attr_type, attr.key, attr.value)
+        self._append_header(root, log)
 
         # Add traces
         for trace in log.traces:
@@ -293,15 +279,7 @@ class XESExporter:
                 self._add_attribute(trace_elem, attr.attr_type, attr.key, attr.value)
 
             for event in trace.events:
-                event_elem = ET.SubElement(trace_elem, "event")
-                self._add_attribute(event_elem, "string", "concept:name", event.concept_name)
-                self._add_attribute(event_elem, "date", "time:timestamp", event.timestamp.isoformat())
-                self._add_attribute(event_elem, "string", "lifecycle:transition", event.lifecycle.value)
-                if event.resource:
-                    self._add_attribute(event_elem, "string", "org:resource", event.resource)
-
-                for attr in event.attributes:
-                    self._add_attribute(event_elem, attr.attr_type, attr.key, attr.value)
+                trace_elem.append(self._event_element(event))
 
         xml_str = ET.tostring(root, encoding="unicode")
 
@@ -331,6 +309,197 @@ class XESExporter:
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(xml_content)
 
+    def export_events(
+        self,
+        events: Iterable[WorkflowEvent],
+        filepath: str | Path,
+        *,
+        max_buffered_events: int = 10_000,
+        compress: bool | None = None,
+        header: XESLog | None = None,
+    ) -> int:
+        """Stream events from any iterator, e.g. ``EventStore.replay()``, to an XES file.
+
+        Events are grouped into traces by workflow. At most
+        ``max_buffered_events`` events are held at once: when the buffer
+        fills, the largest workflow buffers are written out until it is
+        half empty. A workflow whose events are spread further apart than
+        the buffer then appears as several consecutive ``<trace>``
+        segments with the same ``concept:name``; use ``export_store`` when
+        each workflow must be exactly one trace.
+
+        Parameters
+        ----------
+        events : Iterable[WorkflowEvent]
+            Events in sequence order
+        filepath : str | Path
+            Output file path
+        max_buffered_events : int, optional
+            Maximum number of events buffered (default: 10000)
+        compress : bool | None, optional
+            Gzip the output, None to compress when the path ends in ".gz"
+        header : XESLog | None, optional
+            Log whose extensions, classifiers and attributes are written,
+            defaults to ``XESLog(traces=())``
+
+        Returns
+        -------
+        int
+            Number of events written
+
+        Raises
+        ------
+        ValueError
+            If max_buffered_events is not positive
+        """
+        if max_buffered_events < 1:
+            msg = f"max_buffered_events must be positive, got {max_buffered_events}"
+            raise ValueError(msg)
+
+        with self._open_output(filepath, compress) as stream, XESStreamWriter(self, stream, header) as writer:
+            buffers: dict[str, list[WorkflowEvent]] = {}
+            buffered = 0
+            for event in events:
+                buffers.setdefault(event.workflow_id, []).append(event)
+                buffered += 1
+                if buffered < max_buffered_events:
+                    continue
+                for case_id in sorted(buffers, key=lambda wf_id: len(buffers[wf_id]), reverse=True):
+                    segment = buffers.pop(case_id)
+                    writer.write_trace(case_id, segment)
+                    buffered -= len(segment)
+                    if buffered <= max_buffered_events // 2:
+                        break
+            for case_id, segment in buffers.items():
+                writer.write_trace(case_id, segment)
+            return writer.events_written
+
+    def export_store(
+        self,
+        store: EventStore,
+        filepath: str | Path,
+        *,
+        workflow_ids: Iterable[str] | None = None,
+        compress: bool | None = None,
+        header: XESLog | None = None,
+    ) -> int:
+        """Stream an event store to an XES file with one trace per workflow.
+
+        Each trace is written from ``store.replay(workflow_id=...)``, so
+        only one event is held at a time. Without ``workflow_ids`` a first
+        replay pass collects the workflow IDs in order of first
+        appearance; only the IDs are kept in memory.
+
+        Parameters
+        ----------
+        store : EventStore
+            Event store to export
+        filepath : str | Path
+            Output file path
+        workflow_ids : Iterable[str] | None, optional
+            Workflows to export, None for every workflow in the store
+        compress : bool | None, optional
+            Gzip the output, None to compress when the path ends in ".gz"
+        header : XESLog | None, optional
+            Log whose extensions, classifiers and attributes are written
+
+        Returns
+        -------
+        int
+            Number of events written
+        """
+        if workflow_ids is None:
+            workflow_ids = dict.fromkeys(event.workflow_id for event in store.replay())
+
+        with self._open_output(filepath, compress) as stream, XESStreamWriter(self, stream, header) as writer:
+            for workflow_id in workflow_ids:
+                writer.write_trace(workflow_id, store.replay(workflow_id=workflow_id))
+            return writer.events_written
+
+    @staticmethod
+    def _open_output(filepath: str | Path, compress: bool | None) -> TextIO:
+        """Open a text stream for writing, gzip-compressed if requested.
+
+        Parameters
+        ----------
+        filepath : str | Path
+            Output file path
+        compress : bool | None
+            Gzip the output, None to infer from a ".gz" suffix
+
+        Returns
+        -------
+        TextIO
+            Writable UTF-8 text stream
+        """
+        path = Path(filepath)
+        if compress is None:
+            compress = path.suffix == ".gz"
+        if compress:
+            return gzip.open(path, "wt", encoding="utf-8")
+        return path.open("w", encoding="utf-8")
+
+    def _append_header(self, root: ET.Element, log: XESLog) -> None:
+        """Add extensions, classifiers, globals and log attributes to a log element.
+
+        Parameters
+        ----------
+        root : ET.Element
+            Log element
+        log : XESLog
+            Log providing the header entries
+
+        Returns
+        -------
+        None
+        """
+        # Add extensions
+        for ext_name in log.extensions:
+            ext = ET.SubElement(root, "extension")
+            ext.set("name", ext_name)
+            ext.set("prefix", ext_name.lower())
+            ext.set("uri", f"{self._ns}{ext_name.lower()}.xesext")
+
+        # Add classifiers
+        for clf_name, clf_keys in log.classifiers:
+            clf = ET.SubElement(root, "classifier")
+            clf.set("name", clf_name)
+            clf.set("keys", clf_keys)
+
+        # Add global event attributes
+        global_event = ET.SubElement(root, "global")
+        global_event.set("scope", "event")
+        self._add_attribute(global_event, "string", "concept:name", "UNKNOWN")
+        self._add_attribute(global_event, "string", "lifecycle:transition", "complete")
+
+        # Add log-level attributes
+        for attr in log.attributes:
+            self._add_attribute(root, attr.attr_type, attr.key, attr.value)
+
+    def _event_element(self, event: XESEvent) -> ET.Element:
+        """Build the ``<event>`` element for an XES event.
+
+        Parameters
+        ----------
+        event : XESEvent
+            Event to serialize
+
+        Returns
+        -------
+        ET.Element
+            Detached event element
+        """
+        event_elem = ET.Element("event")
+        self._add_attribute(event_elem, "string", "concept:name", event.concept_name)
+        self._add_attribute(event_elem, "date", "time:timestamp", event.timestamp.isoformat())
+        self._add_attribute(event_elem, "string", "lifecycle:transition", event.lifecycle.value)
+        if event.resource:
+            self._add_attribute(event_elem, "string", "org:resource", event.resource)
+
+        for attr in event.attributes:
+            self._add_attribute(event_elem, attr.attr_type, attr.key, attr.value)
+        return event_elem
+
     def _add_attribute(self, parent: ET.Element, attr_type: str, key: str, value: Any) -> None:
         """Add XES attribute element to parent.
 
@@ -378,6 +547,117 @@ class XESExporter:
             return "string"
 
 
+class XESStreamWriter:
+    """Writes an XES document to a text stream one trace at a time.
+
+    The log header is written on construction and each event is
+    serialized and written as soon as it is read, so the document is
+    never held in memory. ``close`` (or leaving the ``with`` block
+    without an error) writes the closing ``</log>`` tag, so a failed
+    export leaves a document that does not parse.
+
+    Parameters
+    ----------
+    exporter : XESExporter
+        Exporter converting and serializing events
+    stream : TextIO
+        Writable text stream
+    header : XESLog | None
+        Log whose extensions, classifiers and attributes are written,
+        defaults to ``XESLog(traces=())``
+
+    Attributes
+    ----------
+    traces_written : int
+        Number of ``<trace>`` elements written
+    events_written : int
+        Number of ``<event>`` elements written
+
+    Examples
+    --------
+    >>> with XESStreamWriter(XESExporter(), stream) as writer:
+    ...     writer.write_trace("wf-1", store.replay(workflow_id="wf-1"))
+    """
+
+    def __init__(self, exporter: XESExporter, stream: TextIO, header: XESLog | None = None) -> None:
+        """Write the XML declaration, log element and header."""
+        self._exporter = exporter
+        self._stream = stream
+        self._closed = False
+        self.traces_written = 0
+        self.events_written = 0
+
+        root = ET.Element("log")
+        exporter._append_header(root, header or XESLog(traces=()))
+        stream.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        stream.write(f'<log xes.version="1849.2016" xmlns="{exporter._ns}">\n')
+        for child in root:
+            stream.write(f"  {ET.tostring(child, encoding='unicode')}\n")
+
+    def __enter__(self) -> XESStreamWriter:
+        """Return the writer."""
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Close the log element unless the export failed."""
+        if exc_type is None:
+            self.close()
+
+    def write_trace(
+        self, case_id: str, events: Iterable[WorkflowEvent], attributes: tuple[XESAttribute, ...] = ()
+    ) -> int:
+        """Write one trace, streaming its events.
+
+        Parameters
+        ----------
+        case_id : str
+            Workflow instance identifier
+        events : Iterable[WorkflowEvent]
+            Ordered events of the trace
+        attributes : tuple[XESAttribute, ...], optional
+            Case-level attributes
+
+        Returns
+        -------
+        int
+            Number of events written
+
+        Raises
+        ------
+        ValueError
+            If the writer is closed
+        """
+        if self._closed:
+            msg = "Cannot write a trace to a closed XES stream"
+            raise ValueError(msg)
+        trace_elem = ET.Element("trace")
+        self._exporter._add_attribute(trace_elem, "string", "concept:name", case_id)
+        for attr in attributes:
+            self._exporter._add_attribute(trace_elem, attr.attr_type, attr.key, attr.value)
+
+        self._stream.write("  <trace>\n")
+        for child in trace_elem:
+            self._stream.write(f"    {ET.tostring(child, encoding='unicode')}\n")
+        count = 0
+        for event in events:
+            event_elem = self._exporter._event_element(self._exporter.convert_event(event))
+            self._stream.write(f"    {ET.tostring(event_elem, encoding='unicode')}\n")
+            count += 1
+        self._stream.write("  </trace>\n")
+
+        self.traces_written += 1
+        self.events_written += count
+        return count
+
+    def close(self) -> None:
+        """Write the closing log tag; further calls do nothing."""
+        if not self._closed:
+            self._stream.write("</log>\n")
+            self._closed = True
+
+
 def create_xes_exporter() -> XESExporter:
     """Factory for XES exporter.
 
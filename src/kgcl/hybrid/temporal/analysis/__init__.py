@@ -1,7 +1,9 @@
 """Analysis tools for temporal event sourcing."""
 
 from kgcl.hybrid.temporal.analysis.soundness_verifier import (
+    OMEGA,
     CoverabilityAnalyzer,
+    CoverabilityResult,
     SoundnessResult,
     SoundnessVerifier,
     SoundnessViolation,
@@ -13,5 +15,7 @@ __all__ = [
     "SoundnessResult",
     "SoundnessViolation",
     "CoverabilityAnalyzer",
+    "CoverabilityResult",
+    "OMEGA",
     "create_soundness_verifier",
 ]
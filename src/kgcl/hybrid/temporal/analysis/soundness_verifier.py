@@ -4,18 +4,32 @@ Implements van der Aalst's soundness criteria:
 1. Option to complete - For every marking M reachable from [i], [o] is reachable from M
 2. Proper completion - When [o] is reached, no other places have tokens
 3. No dead transitions - Every transition can fire in some reachable marking
+
+Markings are searched as packed integers (bitsets for safe nets) with
+stubborn-set partial-order reduction, so nets whose concurrency gives
+millions of interleavings are checked without enumerating them.
+Boundedness is decided by a Karp–Miller coverability tree pruned by
+subsumption, which names the unbounded places and a pumping witness.
 """
 
 from __future__ import annotations
 
+import logging
+import math
+import operator
+import sys
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from kgcl.hybrid.temporal.domain.petri_net import FiringSequence, Marking, WorkflowNet
 
+logger = logging.getLogger(__name__)
+
 
 class SoundnessViolation(Enum):
     """Types of soundness violations."""
@@ -47,6 +61,9 @@ class SoundnessResult:
         Transitions that can never fire
     deadlock_markings : tuple[Any, ...]
         Markings where execution gets stuck
+    exhaustive : bool
+        False if the search hit ``max_markings`` or fell back to bitstate
+        hashing, so some reachable markings may not have been checked
     """
 
     is_sound: bool
@@ -55,6 +72,328 @@ class SoundnessResult:
     reachable_markings: int = 0
     dead_transitions: tuple[str, ...] = ()
     deadlock_markings: tuple[Any, ...] = ()
+    exhaustive: bool = True
+
+
+_SET_ENTRY_BYTES = 32
+"""Approximate bytes per entry of a Python set (slot plus load-factor slack)."""
+
+_BITSTATE_HASHES = 3
+_HASH_MASK = (1 << 64) - 1
+
+
+class _TokenOverflow(Exception):
+    """A reachable marking does not fit the current field width."""
+
+
+def _index_net(net: WorkflowNet) -> tuple[tuple[str, ...], tuple[str, ...], list[dict[int, int]], list[dict[int, int]]]:
+    """Number places and transitions and collect arc weights by index.
+
+    Arc endpoints that are not transitions count as places even if they are
+    missing from ``net.places``.
+
+    Returns
+    -------
+    tuple
+        Place ids, transition ids, and per transition the input and output
+        weights keyed by place index
+    """
+    transition_ids = tuple(t.id for t in net.transitions)
+    transition_index = {t_id: i for i, t_id in enumerate(transition_ids)}
+    place_ids = [p.id for p in net.places]
+    for arc in net.arcs:
+        for node in (arc.source, arc.target):
+            if node not in transition_index and node not in place_ids:
+                place_ids.append(node)
+    place_index = {p_id: i for i, p_id in enumerate(place_ids)}
+
+    inputs: list[dict[int, int]] = [{} for _ in transition_ids]
+    outputs: list[dict[int, int]] = [{} for _ in transition_ids]
+    for arc in net.arcs:
+        if arc.target in transition_index and arc.source in place_index:
+            weights = inputs[transition_index[arc.target]]
+            weights[place_index[arc.source]] = weights.get(place_index[arc.source], 0) + arc.weight
+        elif arc.source in transition_index and arc.target in place_index:
+            weights = outputs[transition_index[arc.source]]
+            weights[place_index[arc.target]] = weights.get(place_index[arc.target], 0) + arc.weight
+    return tuple(place_ids), transition_ids, inputs, outputs
+
+
+class _CompiledNet:
+    """Workflow net compiled to integer-packed markings.
+
+    Every place owns a fixed-width bit field of one Python ``int``. With
+    width 1 a marking is the bitset of marked places, so a transition is
+    enabled when ``marking & pre == pre`` and fires as
+    ``(marking ^ pre) | post``. Wider fields hold a token count below a guard
+    bit: setting every guard bit and subtracting the packed preset leaves
+    the guard of a field set exactly when that place holds enough tokens,
+    so enabling is one subtraction for all places.
+
+    Parameters
+    ----------
+    net : WorkflowNet
+        Net to compile
+    width : int
+        Bits per place field; 1 for safe nets, otherwise value bits plus one
+        guard bit
+    """
+
+    def __init__(self, net: WorkflowNet, width: int) -> None:
+        """Index places and transitions and pack presets and postsets."""
+        self.width = width
+        self.place_ids, self.transition_ids, inputs, outputs = _index_net(net)
+        place_ids = self.place_ids
+
+        self.capacity = 1 if width == 1 else (1 << (width - 1)) - 1
+        self.guards = 0 if width == 1 else sum(1 << (i * width + width - 1) for i in range(len(place_ids)))
+        self._ones = sum(1 << (i * width) for i in range(len(place_ids)))
+        self.pre = tuple(self._pack(weights) for weights in inputs)
+        self.post = tuple(self._pack(weights) for weights in outputs)
+        self.pre_guards = tuple(
+            self.pre[t] if width == 1 else sum(1 << (p * width + width - 1) for p in weights)
+            for t, weights in enumerate(inputs)
+        )
+
+        consumers: list[list[int]] = [[] for _ in place_ids]
+        producers: list[list[int]] = [[] for _ in place_ids]
+        for t, weights in enumerate(inputs):
+            for p in weights:
+                consumers[p].append(t)
+        for t, weights in enumerate(outputs):
+            for p in weights:
+                producers[p].append(t)
+        self.consumers = tuple(tuple(ts) for ts in consumers)
+        self._mean_fanout = max(1, sum(map(len, consumers)) // max(1, len(consumers)))
+        self._pre_pairs = tuple(zip(self.pre, self.pre_guards, strict=True))
+        self.producers = tuple(tuple(ts) for ts in producers)
+        self.sourceless = tuple(t for t, weights in enumerate(inputs) if not weights)
+        # Transitions sharing an input place; they can disable each other
+        self.conflicts = tuple(tuple(sorted({u for p in weights for u in consumers[p]})) for weights in inputs)
+        # Scapegoat candidates, cheapest (fewest producers) first
+        self.preset_by_producers = tuple(
+            tuple(sorted(weights.items(), key=lambda item: len(producers[item[0]]))) for weights in inputs
+        )
+
+    def _pack(self, weights: dict[int, int]) -> int:
+        """Pack per-place token counts into one integer."""
+        packed = 0
+        for place, count in weights.items():
+            if count > self.capacity:
+                raise _TokenOverflow
+            packed |= count << (place * self.width)
+        return packed
+
+    def encode(self, marking: Marking) -> int:
+        """Pack a marking."""
+        index = {p_id: i for i, p_id in enumerate(self.place_ids)}
+        return self._pack({index[p_id]: count for p_id, count in marking.tokens if count})
+
+    def decode(self, marking: int) -> Marking:
+        """Unpack a marking."""
+        from kgcl.hybrid.temporal.domain.petri_net import Marking
+
+        return Marking.from_dict({self.place_ids[p]: self.tokens(marking, p) for p in self.marked_places(marking)})
+
+    def tokens(self, marking: int, place: int) -> int:
+        """Token count of one place."""
+        return (marking >> (place * self.width)) & self.capacity
+
+    def _occupied(self, marking: int) -> int:
+        """One set bit per marked place (its lowest bit, or its guard bit)."""
+        return marking if self.width == 1 else ((marking | self.guards) - self._ones) & self.guards
+
+    def marked_places(self, marking: int) -> list[int]:
+        """Indices of places holding at least one token."""
+        occupied = self._occupied(marking)
+        places = []
+        while occupied:
+            low = occupied & -occupied
+            places.append((low.bit_length() - 1) // self.width)
+            occupied ^= low
+        return places
+
+    def is_enabled(self, marking: int, transition: int) -> bool:
+        """Check whether a transition is enabled."""
+        if self.width == 1:
+            pre = self.pre[transition]
+            return marking & pre == pre
+        guard = self.pre_guards[transition]
+        return ((marking | self.guards) - self.pre[transition]) & guard == guard
+
+    def enabled(self, marking: int) -> list[int]:
+        """Transitions enabled at a marking, in net order.
+
+        Sparse markings test only consumers of marked places (and
+        transitions without inputs); dense ones test every preset at once.
+        """
+        # Walking set bits costs several times more than one preset test
+        if 4 * self._occupied(marking).bit_count() * self._mean_fanout >= len(self.pre):
+            if self.width == 1:
+                return [t for t, pre in enumerate(self.pre) if marking & pre == pre]
+            guarded = marking | self.guards
+            return [t for t, (pre, guard) in enumerate(self._pre_pairs) if (guarded - pre) & guard == guard]
+        candidates = set(self.sourceless)
+        for place in self.marked_places(marking):
+            candidates.update(self.consumers[place])
+        return sorted(t for t in candidates if self.is_enabled(marking, t))
+
+    def fire(self, marking: int, transition: int) -> int:
+        """Fire an enabled transition.
+
+        Raises
+        ------
+        _TokenOverflow
+            If a place would exceed the field capacity
+        """
+        if self.width == 1:
+            rest = marking ^ self.pre[transition]
+            if rest & self.post[transition]:
+                raise _TokenOverflow
+            return rest | self.post[transition]
+        following = marking - self.pre[transition] + self.post[transition]
+        if following & self.guards:
+            raise _TokenOverflow
+        return following
+
+    def scapegoat(self, marking: int, transition: int) -> int:
+        """An input place that keeps a disabled transition disabled."""
+        for place, weight in self.preset_by_producers[transition]:
+            if self.tokens(marking, place) < weight:
+                return place
+        msg = f"Transition {self.transition_ids[transition]} is enabled"
+        raise ValueError(msg)
+
+    def stubborn(self, marking: int, enabled: list[int], seeds: Iterable[int]) -> list[int]:
+        """Enabled transitions of a stubborn set containing the seeds.
+
+        The set is closed under two rules: an enabled member brings in every
+        transition consuming from its input places, and a disabled member
+        brings in the producers of one input place lacking tokens. Firing
+        only the enabled members preserves every reachable deadlock and the
+        reachability of any marking that requires firing a seed.
+
+        Parameters
+        ----------
+        marking : int
+            Packed marking
+        enabled : list[int]
+            Transitions enabled at the marking (non-empty unless seeded)
+        seeds : Iterable[int]
+            Transitions that must be in the set
+
+        Returns
+        -------
+        list[int]
+            Enabled members of the stubborn set, in net order
+        """
+        enabled_set = set(enabled)
+        members = set(seeds)
+        if enabled:
+            members.add(min(enabled, key=lambda t: len(self.conflicts[t])))
+        pending = list(members)
+        chosen = []
+        while pending:
+            transition = pending.pop()
+            if transition in enabled_set:
+                chosen.append(transition)
+                closure: tuple[int, ...] = self.conflicts[transition]
+            else:
+                closure = self.producers[self.scapegoat(marking, transition)]
+            for other in closure:
+                if other not in members:
+                    members.add(other)
+                    pending.append(other)
+        return sorted(chosen)
+
+
+class _VisitedSet:
+    """Visited markings under a memory budget.
+
+    Markings are kept in an exact set until it would outgrow the budget,
+    then moved into a bitstate table (a Bloom filter of the same size).
+    From then on memory stays fixed, but a hash collision can make an
+    unseen marking look visited, so the search is no longer exhaustive.
+
+    Parameters
+    ----------
+    memory_bytes : int | None
+        Budget in bytes, or None for an unbounded exact set
+    sample : int
+        A packed marking, used to estimate the size of an entry
+    """
+
+    def __init__(self, memory_bytes: int | None, sample: int) -> None:
+        """Start with an empty exact set."""
+        self.count = 0
+        self._exact: set[int] | None = set()
+        self._bits = bytearray()
+        self._limit = (
+            None if memory_bytes is None else max(1, memory_bytes // (_SET_ENTRY_BYTES + sys.getsizeof(sample)))
+        )
+        self._bit_count = max(8, (memory_bytes or 0) * 8)
+
+    @property
+    def exact(self) -> bool:
+        """True while no marking can have been skipped by a collision."""
+        return self._exact is not None
+
+    def __contains__(self, marking: object) -> bool:
+        """Check whether a marking is (or looks) visited."""
+        if self._exact is not None:
+            return marking in self._exact
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(marking))
+
+    def add(self, marking: int) -> bool:
+        """Record a marking, returning False if it was (or looks) visited."""
+        if self._exact is not None:
+            if marking in self._exact:
+                return False
+            self._exact.add(marking)
+            self.count += 1
+            if self._limit is not None and self.count >= self._limit:
+                self._switch_to_bitstate()
+            return True
+        added = self._set_bits(marking)
+        self.count += added
+        return added
+
+    def _switch_to_bitstate(self) -> None:
+        """Move the exact set into the bitstate table."""
+        exact, self._exact = self._exact or set(), None
+        self._bits = bytearray(self._bit_count // 8)
+        logger.info("Visited set reached %d markings; switching to bitstate hashing", len(exact))
+        for marking in exact:
+            self._set_bits(marking)
+
+    def _positions(self, marking: object) -> list[int]:
+        """Bit positions of a marking (double hashing)."""
+        digest = hash((marking,)) & _HASH_MASK
+        step = (digest >> 32) | 1
+        return [(digest + i * step) % self._bit_count for i in range(_BITSTATE_HASHES)]
+
+    def _set_bits(self, marking: int) -> bool:
+        """Set the marking's bits, returning True if any was clear."""
+        bits = self._bits
+        added = False
+        for position in self._positions(marking):
+            byte, bit = position >> 3, 1 << (position & 7)
+            if not bits[byte] & bit:
+                bits[byte] |= bit
+                added = True
+        return added
+
+
+@dataclass
+class _Exploration:
+    """Outcome of one state-space search."""
+
+    visited: int = 0
+    exhaustive: bool = True
+    reached_final: bool = False
+    fired: set[int] = field(default_factory=set)
+    deadlocks: list[int] = field(default_factory=list)
+    improper: list[int] = field(default_factory=list)
 
 
 class SoundnessVerifier:
@@ -62,17 +401,48 @@ class SoundnessVerifier:
 
     Uses reachability analysis to check van der Aalst's
     three soundness criteria.
+
+    The net is compiled once to packed-integer markings (bitsets while the
+    net stays safe; token-count fields, widened on overflow, otherwise).
+    With partial-order reduction the search fires only the enabled members
+    of a stubborn set at each marking, so independent concurrent branches
+    are interleaved in one order rather than all orders. The stubborn sets
+    preserve every deadlock and, by also containing the sink's producers,
+    every reachable marking that puts a token in the sink, so deadlock,
+    reachability of [o] and proper completion are decided exactly.
+    Transitions the reduced search never fires are then looked for in a
+    second search whose stubborn sets contain them.
+
+    Parameters
+    ----------
+    max_markings : int
+        Maximum markings to explore (prevents infinite loops)
+    partial_order_reduction : bool
+        Explore stubborn sets instead of every enabled transition. Applied
+        only when the sink has no outgoing arcs and every transition has an
+        input place.
+    visited_memory : int | None
+        Memory budget in bytes for visited markings; beyond it the search
+        switches to bitstate hashing and the result is not exhaustive
     """
 
-    def __init__(self, max_markings: int = 10000) -> None:
+    def __init__(
+        self, max_markings: int = 10000, *, partial_order_reduction: bool = True, visited_memory: int | None = None
+    ) -> None:
         """Initialize verifier.
 
         Parameters
         ----------
         max_markings : int
             Maximum markings to explore (prevents infinite loops)
+        partial_order_reduction : bool
+            Explore stubborn sets instead of every enabled transition
+        visited_memory : int | None
+            Memory budget in bytes for the visited set
         """
         self._max_markings = max_markings
+        self._partial_order_reduction = partial_order_reduction
+        self._visited_memory = visited_memory
 
     def verify(self, net: WorkflowNet) -> SoundnessResult:
         """Verify soundness of a workflow net.
@@ -94,75 +464,40 @@ class SoundnessVerifier:
         try:
             source = net.source_place()
         except ValueError:
+            source = None
+        if source is None:
             violations.append(SoundnessViolation.NO_SOURCE)
             messages.append("No unique source place found")
-            source = None
 
         try:
             sink = net.sink_place()
         except ValueError:
+            sink = None
+        if sink is None:
             violations.append(SoundnessViolation.NO_SINK)
             messages.append("No unique sink place found")
-            sink = None
 
-        if violations:
+        if violations or sink is None:
             return SoundnessResult(is_sound=False, violations=tuple(violations), messages=tuple(messages))
 
-        # Explore reachability graph
-        initial = net.initial_marking()
-        final = net.final_marking()
-
-        visited: set[Marking] = set()
-        to_explore: deque[Marking] = deque([initial])
-        transitions_fired: set[str] = set()
-        deadlock_markings: list[Marking] = []
-
-        while to_explore and len(visited) < self._max_markings:
-            marking = to_explore.popleft()
-
-            if marking in visited:
-                continue
-            visited.add(marking)
-
-            # Check if this is final marking
-            if marking == final:
-                continue
-
-            # Check for improper completion
-            if sink is not None and marking.get(sink.id) > 0 and marking != final:
-                violations.append(SoundnessViolation.IMPROPER_COMPLETION)
-                messages.append(f"Improper completion: sink has token but other places too: {marking}")
-
-            # Get enabled transitions
-            enabled = net.enabled_transitions(marking)
-
-            if not enabled:
-                # Deadlock - no enabled transitions and not at final
-                deadlock_markings.append(marking)
-                continue
+        compiled, search, dead = self._explore(net, sink.id)
 
-            # Fire each enabled transition
-            for t_id in enabled:
-                transitions_fired.add(t_id)
-                new_marking = net.fire(t_id, marking)
-                if new_marking not in visited:
-                    to_explore.append(new_marking)
+        for marking in search.improper:
+            violations.append(SoundnessViolation.IMPROPER_COMPLETION)
+            messages.append(f"Improper completion: sink has token but other places too: {compiled.decode(marking)}")
 
         # Check criterion 1: Option to complete (all markings can reach final)
+        deadlock_markings = tuple(compiled.decode(marking) for marking in search.deadlocks)
         for deadlock in deadlock_markings:
-            if deadlock != final:
-                violations.append(SoundnessViolation.DEADLOCK)
-                messages.append(f"Deadlock at marking: {deadlock}")
+            violations.append(SoundnessViolation.DEADLOCK)
+            messages.append(f"Deadlock at marking: {deadlock}")
 
         # Check if final is reachable from initial
-        if final not in visited:
+        if not search.reached_final:
             violations.append(SoundnessViolation.UNREACHABLE_SINK)
             messages.append("Final marking [o] not reachable from initial marking [i]")
 
         # Check criterion 3: No dead transitions
-        all_transitions = {t.id for t in net.transitions}
-        dead = all_transitions - transitions_fired
-
         for t_id in dead:
             violations.append(SoundnessViolation.DEAD_TRANSITION)
             messages.append(f"Dead transition (never enabled): {t_id}")
@@ -171,11 +506,114 @@ class SoundnessVerifier:
             is_sound=len(violations) == 0,
             violations=tuple(violations),
             messages=tuple(messages),
-            reachable_markings=len(visited),
-            dead_transitions=tuple(dead),
-            deadlock_markings=tuple(deadlock_markings),
+            reachable_markings=search.visited,
+            dead_transitions=dead,
+            deadlock_markings=deadlock_markings,
+            exhaustive=search.exhaustive,
         )
 
+    def _explore(self, net: WorkflowNet, sink_id: str) -> tuple[_CompiledNet, _Exploration, tuple[str, ...]]:
+        """Compile the net and search it, widening fields on token overflow.
+
+        Returns
+        -------
+        tuple[_CompiledNet, _Exploration, tuple[str, ...]]
+            Compiled net, main search outcome and dead transition ids
+        """
+        weights = [arc.weight for arc in net.arcs]
+        width = 1 if all(weight == 1 for weight in weights) else max(weights).bit_length() + 1
+        while True:
+            try:
+                compiled = _CompiledNet(net, width)
+                initial = compiled.encode(net.initial_marking())
+                final = compiled.encode(net.final_marking())
+                sink = compiled.place_ids.index(sink_id)
+                reduce = self._partial_order_reduction and not compiled.consumers[sink] and not compiled.sourceless
+                search = self._search(compiled, initial, final, sink, reduce=reduce)
+                unfired = set(range(len(compiled.transition_ids))) - search.fired
+                if reduce and unfired:
+                    unfired = self._search_for_transitions(compiled, initial, unfired)
+            except _TokenOverflow:
+                width = 3 if width == 1 else 2 * width - 1
+                logger.debug("Marking exceeded field capacity; widening to %d bits per place", width)
+                continue
+            return compiled, search, tuple(compiled.transition_ids[t] for t in sorted(unfired))
+
+    def _search(self, compiled: _CompiledNet, initial: int, final: int, sink: int, *, reduce: bool) -> _Exploration:
+        """Depth-first search recording deadlocks, completions and fired transitions."""
+        result = _Exploration()
+        visited = _VisitedSet(self._visited_memory, initial)
+        visited.add(initial)
+        stack = [initial]
+        sink_producers = compiled.producers[sink]
+
+        while stack:
+            marking = stack.pop()
+            if marking == final:
+                result.reached_final = True
+                continue
+
+            sink_marked = compiled.tokens(marking, sink) > 0
+            if sink_marked:
+                result.improper.append(marking)
+
+            enabled = compiled.enabled(marking)
+            if not enabled:
+                # Deadlock - no enabled transitions and not at final
+                result.deadlocks.append(marking)
+                continue
+            if reduce:
+                enabled = compiled.stubborn(marking, enabled, () if sink_marked else sink_producers)
+
+            for transition in enabled:
+                result.fired.add(transition)
+                following = compiled.fire(marking, transition)
+                if following in visited:
+                    continue
+                if visited.count >= self._max_markings:
+                    result.exhaustive = False
+                    stack.clear()
+                    break
+                visited.add(following)
+                stack.append(following)
+
+        result.visited = visited.count
+        result.exhaustive = result.exhaustive and visited.exact
+        return result
+
+    def _search_for_transitions(self, compiled: _CompiledNet, initial: int, targets: set[int]) -> set[int]:
+        """Search for markings enabling any of the target transitions.
+
+        Every stubborn set contains the targets not yet found, so each
+        reachable marking that enables one stays reachable in the reduced
+        search.
+
+        Returns
+        -------
+        set[int]
+            Targets that are never enabled (dead transitions)
+        """
+        remaining = set(targets)
+        visited = _VisitedSet(self._visited_memory, initial)
+        visited.add(initial)
+        stack = [initial]
+
+        while stack and remaining:
+            marking = stack.pop()
+            enabled = compiled.enabled(marking)
+            remaining.difference_update(enabled)
+            if not remaining:
+                break
+            for transition in compiled.stubborn(marking, enabled, remaining):
+                following = compiled.fire(marking, transition)
+                if following in visited:
+                    continue
+                if visited.count >= self._max_markings:
+                    return remaining
+                visited.add(following)
+                stack.append(following)
+        return remaining
+
     def find_firing_sequence_to_final(self, net: WorkflowNet) -> FiringSequence | None:
         """Find a firing sequence from initial to final marking.
 
@@ -237,10 +675,131 @@ class CoverabilityNode:
     transition: str | None = None
 
 
+OMEGA = math.inf
+"""Token count of an unbounded place in a coverability marking."""
+
+OmegaMarking = tuple[tuple[str, int | float], ...]
+"""Sorted ``(place_id, count)`` pairs of marked places; counts may be ``OMEGA``."""
+
+
+@dataclass(frozen=True)
+class CoverabilityResult:
+    """Result of coverability analysis.
+
+    Parameters
+    ----------
+    is_bounded : bool
+        True if the analysis completed and no place is unbounded
+    unbounded_places : tuple[str, ...]
+        Places that can hold arbitrarily many tokens
+    place_bounds : tuple[tuple[str, int], ...]
+        Maximum token count of each bounded place that is ever marked
+    minimal_coverability_set : tuple[OmegaMarking, ...]
+        Maximal markings of the coverability set; every reachable marking is
+        covered by one of them
+    witness : FiringSequence | None
+        Firing sequence from the initial marking that ends by repeating
+        ``pumping_sequence``, so it reaches a marking strictly covering one
+        it passed through
+    pumping_sequence : FiringSequence | None
+        Suffix of ``witness`` that can be fired again and again, adding
+        tokens to unbounded places each time
+    nodes : int
+        Coverability tree nodes created
+    complete : bool
+        False if the analysis stopped at ``max_nodes``
+    """
+
+    is_bounded: bool
+    unbounded_places: tuple[str, ...] = ()
+    place_bounds: tuple[tuple[str, int], ...] = ()
+    minimal_coverability_set: tuple[OmegaMarking, ...] = ()
+    witness: FiringSequence | None = None
+    pumping_sequence: FiringSequence | None = None
+    nodes: int = 0
+    complete: bool = True
+
+
+class _Antichain:
+    """Pairwise incomparable ω-markings in a hash trie.
+
+    Level ``d`` of the trie is a dict keyed by the count in place ``d``. A
+    covering query follows only keys >= the query's count at each level and
+    a covered-members query only keys <= it, so both skip whole subtrees
+    that differ on a single place instead of comparing every member. A
+    set of the members answers the common exact-duplicate query directly.
+    """
+
+    def __init__(self, places: int) -> None:
+        """Create an empty antichain over markings of ``places`` places."""
+        self._places = places
+        self._root: dict[int | float, Any] = {}
+        self._members: set[tuple[int | float, ...]] = set()
+
+    def covers(self, marking: tuple[int | float, ...]) -> bool:
+        """Check whether some member is componentwise >= the marking."""
+        if marking in self._members:
+            return True
+        stack = [(self._root, 0)]
+        while stack:
+            level, depth = stack.pop()
+            if depth == self._places:
+                return True
+            floor = marking[depth]
+            stack.extend((child, depth + 1) for count, child in level.items() if count >= floor)
+        return False
+
+    def add(self, marking: tuple[int | float, ...]) -> None:
+        """Insert a marking that no member covers, dropping members it covers."""
+        for covered in self._covered_by(marking):
+            self._remove(covered)
+        level = self._root
+        for count in marking:
+            level = level.setdefault(count, {})
+        self._members.add(marking)
+
+    def _covered_by(self, marking: tuple[int | float, ...]) -> list[tuple[int | float, ...]]:
+        """Members componentwise <= the marking."""
+        found = []
+        stack: list[tuple[dict[int | float, Any], tuple[int | float, ...]]] = [(self._root, ())]
+        while stack:
+            level, prefix = stack.pop()
+            if len(prefix) == self._places:
+                found.append(prefix)
+                continue
+            ceiling = marking[len(prefix)]
+            stack.extend((child, (*prefix, count)) for count, child in level.items() if count <= ceiling)
+        return found
+
+    def _remove(self, member: tuple[int | float, ...]) -> None:
+        """Delete a member and any levels left empty."""
+        path = []
+        level = self._root
+        for count in member:
+            path.append((level, count))
+            level = level[count]
+        for parent, count in reversed(path):
+            if parent[count]:
+                break
+            del parent[count]
+        self._members.discard(member)
+
+    def __iter__(self) -> Iterator[tuple[int | float, ...]]:
+        """Iterate over the members."""
+        return iter(self._members)
+
+
 class CoverabilityAnalyzer:
     """Analyzes coverability for potentially unbounded nets.
 
     Uses omega (ω) to represent unbounded places.
+
+    Builds a Karp–Miller tree. A new node is accelerated against its
+    ancestors: every place where it strictly exceeds a covered ancestor
+    becomes ω. It is then pruned if an existing node already covers it,
+    which keeps the tree close to the minimal coverability set rather than
+    re-exploring covered behaviour. Existing nodes are never removed, so
+    acceleration always sees the full ancestor path.
     """
 
     def __init__(self, max_nodes: int = 10000) -> None:
@@ -253,56 +812,161 @@ class CoverabilityAnalyzer:
         """
         self._max_nodes = max_nodes
 
-    def is_bounded(self, net: WorkflowNet) -> tuple[bool, int]:
-        """Check if net is bounded.
+    def analyze(self, net: WorkflowNet) -> CoverabilityResult:
+        """Compute the minimal coverability set and unbounded places.
 
         Parameters
         ----------
         net : WorkflowNet
-            Workflow net to check
+            Workflow net to analyze
 
         Returns
         -------
-        tuple[bool, int]
-            (is_bounded, max_tokens_in_any_place)
+        CoverabilityResult
+            Unbounded places, place bounds, the minimal coverability set and a
+            witness for unboundedness
         """
-        initial = net.initial_marking()
-        visited: set[Marking] = set()
-        to_explore: deque[Marking] = deque([initial])
-        max_tokens = 1
+        from kgcl.hybrid.temporal.domain.petri_net import FiringSequence
 
-        while to_explore and len(visited) < self._max_nodes:
-            marking = to_explore.popleft()
+        place_ids, transition_ids, inputs, outputs = _index_net(net)
+        place_index = {p_id: i for i, p_id in enumerate(place_ids)}
+        presets = [tuple(weights.items()) for weights in inputs]
+        effects = []
+        for pre, post in zip(inputs, outputs, strict=True):
+            change = dict.fromkeys(pre.keys() | post.keys(), 0)
+            for place, weight in pre.items():
+                change[place] -= weight
+            for place, weight in post.items():
+                change[place] += weight
+            effects.append(tuple((place, delta) for place, delta in change.items() if delta))
+
+        initial_counts: list[int | float] = [0] * len(place_ids)
+        for p_id, count in net.initial_marking().tokens:
+            initial_counts[place_index[p_id]] = count
+        root = CoverabilityNode(marking=tuple(initial_counts))
+        antichain = _Antichain(len(place_ids))
+        antichain.add(root.marking)
+        pending = [root]
+        nodes = 1
+        witness: tuple[tuple[str, ...], tuple[str, ...]] | None = None
+        complete = True
+
+        while pending:
+            node = pending.pop()
+            marking = node.marking
+            for transition, preset in enumerate(presets):
+                if any(marking[place] < weight for place, weight in preset):
+                    continue
+                successor = list(marking)
+                for place, delta in effects[transition]:
+                    successor[place] += delta
+                child = CoverabilityNode(marking=tuple(successor), parent=node, transition=transition_ids[transition])
+                accelerated, loop_start = self._accelerate(child)
+                if witness is None and loop_start is not None:
+                    path = self._path(child)
+                    witness = (path, path[len(self._path(loop_start)) :])
+                if antichain.covers(accelerated.marking):
+                    continue
+                if nodes >= self._max_nodes:
+                    complete = False
+                    pending.clear()
+                    break
+                antichain.add(accelerated.marking)
+                pending.append(accelerated)
+                nodes += 1
+
+        maximal = sorted(antichain, reverse=True)
+        unbounded = sorted({place_ids[p] for marking in maximal for p, count in enumerate(marking) if count == OMEGA})
+        bounds: dict[str, int] = {}
+        for marking in maximal:
+            for place, count in enumerate(marking):
+                if count and count != OMEGA:
+                    bounds[place_ids[place]] = max(bounds.get(place_ids[place], 0), int(count))
+        return CoverabilityResult(
+            is_bounded=complete and not unbounded,
+            unbounded_places=tuple(unbounded),
+            place_bounds=tuple(sorted((p, n) for p, n in bounds.items() if p not in unbounded)),
+            minimal_coverability_set=tuple(
+                tuple(sorted((place_ids[p], count) for p, count in enumerate(marking) if count)) for marking in maximal
+            ),
+            witness=FiringSequence(witness[0]) if witness else None,
+            pumping_sequence=FiringSequence(witness[1]) if witness else None,
+            nodes=nodes,
+            complete=complete,
+        )
 
-            if marking in visited:
-                continue
-            visited.add(marking)
+    @staticmethod
+    def _accelerate(node: CoverabilityNode) -> tuple[CoverabilityNode, CoverabilityNode | None]:
+        """Set ω wherever the node strictly exceeds an ancestor it covers.
 
-            # Track max tokens
-            for _, count in marking.tokens:
-                max_tokens = max(max_tokens, count)
+        Returns
+        -------
+        tuple[CoverabilityNode, CoverabilityNode | None]
+            The (possibly accelerated) node, and the first ancestor that
+            triggered an acceleration on an ω-free path
+        """
+        marking = list(node.marking)
+        loop_start = None
+        ancestor = node.parent
+        while ancestor is not None:
+            previous = ancestor.marking
+            if all(map(operator.le, previous, marking)):
+                grown = [place for place, count in enumerate(marking) if count > previous[place] != OMEGA]
+                if grown and loop_start is None and OMEGA not in marking:
+                    loop_start = ancestor
+                for place in grown:
+                    marking[place] = OMEGA
+            ancestor = ancestor.parent
+        if tuple(marking) == node.marking:
+            return node, None
+        return CoverabilityNode(marking=tuple(marking), parent=node.parent, transition=node.transition), loop_start
+
+    @staticmethod
+    def _path(node: CoverabilityNode) -> tuple[str, ...]:
+        """Transitions fired from the root to a node."""
+        transitions = []
+        while node.parent is not None:
+            transitions.append(node.transition)
+            node = node.parent
+        return tuple(t for t in reversed(transitions) if t is not None)
 
-            for t_id in net.enabled_transitions(marking):
-                new_marking = net.fire(t_id, marking)
-                if new_marking not in visited:
-                    to_explore.append(new_marking)
+    def is_bounded(self, net: WorkflowNet) -> tuple[bool, int]:
+        """Check if net is bounded.
+
+        Parameters
+        ----------
+        net : WorkflowNet
+            Workflow net to check
 
-        # If we explored all markings, it's bounded
-        is_bounded = len(visited) < self._max_nodes
-        return is_bounded, max_tokens
+        Returns
+        -------
+        tuple[bool, int]
+            (is_bounded, max_tokens_in_any_place), where the maximum is
+            taken over bounded places
+        """
+        result = self.analyze(net)
+        return result.is_bounded, max((bound for _, bound in result.place_bounds), default=1)
 
 
-def create_soundness_verifier(max_markings: int = 10000) -> SoundnessVerifier:
+def create_soundness_verifier(
+    max_markings: int = 10000, *, partial_order_reduction: bool = True, visited_memory: int | None = None
+) -> SoundnessVerifier:
     """Factory for soundness verifier.
 
     Parameters
     ----------
     max_markings : int
         Maximum markings to explore
+    partial_order_reduction : bool
+        Explore stubborn sets instead of every enabled transition
+    visited_memory : int | None
+        Memory budget in bytes for the visited set
 
     Returns
     -------
     SoundnessVerifier
         New verifier instance
     """
-    return SoundnessVerifier(max_markings=max_markings)
+    return SoundnessVerifier(
+        max_markings=max_markings, partial_order_reduction=partial_order_reduction, visited_memory=visited_memory
+    )
@@ -6,6 +6,7 @@ modifying v1 code.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timezone
 from typing import TYPE_CHECKING, Any
@@ -60,7 +61,7 @@ class HistoricalState:
         Hash of reconstructed state
     event_count : int
         Events replayed to reach state
-    state_data : dict[str, Any]
+    state_data : Mapping[str, Any]
         Reconstructed state data
     """
 
@@ -69,7 +70,7 @@ class HistoricalState:
     tick_number: int
     state_hash: str
     event_count: int
-    state_data: dict[str, Any] = field(default_factory=dict)
+    state_data: Mapping[str, Any] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from kgcl.hybrid.temporal.domain.causal_index import CausalReachabilityIndex
+from kgcl.hybrid.temporal.domain.chain_verification import ChainCheckpoint, verify_chain_parallel, verify_segment
 from kgcl.hybrid.temporal.domain.event import EventChain, EventType, WorkflowEvent
 from kgcl.hybrid.temporal.domain.ltl_formula import LTLFormula, LTLOperator, LTLResult
 from kgcl.hybrid.temporal.domain.petri_net import (
@@ -27,6 +29,8 @@ __all__ = [
     # Petri nets
     "Arc",
     "CausalGraph",
+    "CausalReachabilityIndex",
+    "ChainCheckpoint",
     "EventChain",
     "EventType",
     "FiringSequence",
@@ -45,4 +49,6 @@ __all__ = [
     "create_place",
     "create_transition",
     "create_workflow_net",
+    "verify_chain_parallel",
+    "verify_segment",
 ]
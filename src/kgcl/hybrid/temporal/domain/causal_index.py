@@ -0,0 +1,167 @@
+"""Reachability index for causal DAGs.
+
+Events are partitioned into chains: an event extends the chain of one
+of its causes when that cause is still the chain's last event, and
+starts a new chain otherwise. Every event on a chain is therefore an
+ancestor of the events after it. Each event is labelled with, per
+chain, the highest position of any of its ancestors (or itself) on
+that chain - a vector clock whose processes are chains. Event A is an
+ancestor of event B exactly when B's label reaches A's position on A's
+chain, which is a single dict lookup regardless of how deep the
+history is.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CausalReachabilityIndex:
+    """Chain-decomposition labels answering ancestor queries in O(1).
+
+    Events are expected to be added after their causes. Causes not seen
+    before are added as roots. Adding causes to an event that is
+    already indexed can change the ancestry of its descendants, so the
+    index is then marked stale and must be rebuilt from the full
+    cause mapping.
+
+    Attributes
+    ----------
+    stale : bool
+        Whether labels may be out of date until ``rebuild`` is called
+
+    Examples
+    --------
+    >>> index = CausalReachabilityIndex()
+    >>> index.add("e2", ("e1",))
+    >>> index.add("e3", ("e2",))
+    >>> index.is_ancestor("e1", "e3")
+    True
+    """
+
+    stale: bool = field(default=False, init=False)
+    _position: dict[str, tuple[int, int]] = field(default_factory=dict, init=False, repr=False)
+    _labels: dict[str, dict[int, int]] = field(default_factory=dict, init=False, repr=False)
+    _chain_tails: list[str] = field(default_factory=list, init=False, repr=False)
+
+    def __len__(self) -> int:
+        """Number of indexed events."""
+        return len(self._position)
+
+    @property
+    def chain_count(self) -> int:
+        """Number of chains, the maximum label size."""
+        return len(self._chain_tails)
+
+    def add(self, event_id: str, cause_ids: tuple[str, ...]) -> None:
+        """Index an event with its direct causes.
+
+        Parameters
+        ----------
+        event_id : str
+            Event to index
+        cause_ids : tuple[str, ...]
+            Direct causes of the event
+        """
+        if event_id in self._position:
+            if cause_ids:
+                self.stale = True
+            return
+        if event_id in cause_ids:
+            self.stale = True
+            return
+        for cause_id in cause_ids:
+            if cause_id not in self._position:
+                self._insert(cause_id, ())
+        self._insert(event_id, cause_ids)
+
+    def is_ancestor(self, ancestor_id: str, descendant_id: str) -> bool:
+        """Check whether one event transitively caused another.
+
+        Parameters
+        ----------
+        ancestor_id : str
+            Candidate cause
+        descendant_id : str
+            Candidate effect
+
+        Returns
+        -------
+        bool
+            True if ``ancestor_id`` is a proper causal ancestor
+        """
+        if ancestor_id == descendant_id:
+            return False
+        position = self._position.get(ancestor_id)
+        label = self._labels.get(descendant_id)
+        if position is None or label is None:
+            return False
+        chain, index = position
+        return label.get(chain, -1) >= index
+
+    def rebuild(self, causes: Mapping[str, tuple[str, ...]]) -> None:
+        """Recompute all labels from a complete cause mapping.
+
+        Events are inserted in topological order. Edges closing a cycle
+        are ignored, since a causal graph is expected to be acyclic.
+
+        Parameters
+        ----------
+        causes : Mapping[str, tuple[str, ...]]
+            Direct causes of every tracked event
+        """
+        self._position.clear()
+        self._labels.clear()
+        self._chain_tails.clear()
+        self.stale = False
+
+        on_path: set[str] = set()
+        for root in causes:
+            if root in self._position:
+                continue
+            stack: list[tuple[str, int]] = [(root, 0)]
+            on_path.add(root)
+            while stack:
+                event_id, next_cause = stack[-1]
+                event_causes = causes.get(event_id, ())
+                if next_cause < len(event_causes):
+                    stack[-1] = (event_id, next_cause + 1)
+                    cause_id = event_causes[next_cause]
+                    if cause_id not in self._position and cause_id not in on_path:
+                        on_path.add(cause_id)
+                        stack.append((cause_id, 0))
+                    continue
+                stack.pop()
+                on_path.discard(event_id)
+                self._insert(event_id, tuple(c for c in event_causes if c in self._position))
+
+    def _insert(self, event_id: str, cause_ids: tuple[str, ...]) -> None:
+        """Label a new event whose causes are all indexed.
+
+        Parameters
+        ----------
+        event_id : str
+            Event to label
+        cause_ids : tuple[str, ...]
+            Indexed direct causes
+        """
+        label: dict[int, int] = {}
+        chain, index = -1, 0
+        for cause_id in cause_ids:
+            for cause_chain, cause_index in self._labels[cause_id].items():
+                if label.get(cause_chain, -1) < cause_index:
+                    label[cause_chain] = cause_index
+            cause_chain, cause_index = self._position[cause_id]
+            if chain < 0 and self._chain_tails[cause_chain] == cause_id:
+                chain, index = cause_chain, cause_index + 1
+
+        if chain < 0:
+            chain = len(self._chain_tails)
+            self._chain_tails.append(event_id)
+        else:
+            self._chain_tails[chain] = event_id
+        label[chain] = index
+        self._position[event_id] = (chain, index)
+        self._labels[event_id] = label
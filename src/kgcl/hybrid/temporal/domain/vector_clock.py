@@ -1,35 +1,231 @@
-"""Lamport vector clock for distributed causality tracking."""
+"""Lamport vector clock for distributed causality tracking.
+
+Node ids are interned to small integers shared by every clock in the
+process, so a clock is a dense tuple of counters indexed by node. Merge
+and comparison then run element-wise over two tuples (``map`` over
+``max`` and ``operator.le``) instead of going through per-node dict
+lookups. Tuples rather than fixed-width arrays keep clock values
+unbounded, as they were. The sorted ``(node_id, time)`` tuple form
+is still available as ``clocks`` and is built only when requested.
+
+``clock_delta`` and ``apply_clock_delta`` encode a clock relative to a
+causal predecessor's clock, which is usually a handful of entries even
+when hundreds of nodes participate.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import operator
+import threading
+from dataclasses import FrozenInstanceError
+from typing import Any
+
+ClockEntries = tuple[tuple[str, int], ...]
+"""Sorted ``(node_id, time)`` pairs, as stored on ``WorkflowEvent``."""
+
+_NO_ZEROS: frozenset[int] = frozenset()
+
+
+class NodeInterner:
+    """Thread-safe mapping of node ids to dense integer indices.
+
+    Examples
+    --------
+    >>> interner = NodeInterner()
+    >>> interner.intern("node-a"), interner.intern("node-b"), interner.intern("node-a")
+    (0, 1, 0)
+    >>> interner.node_id(1)
+    'node-b'
+    """
+
+    def __init__(self) -> None:
+        """Create an empty interner."""
+        self._indices: dict[str, int] = {}
+        self._node_ids: list[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of interned node ids."""
+        return len(self._node_ids)
+
+    def intern(self, node_id: str) -> int:
+        """Return the index of a node id, assigning the next one if new.
+
+        Parameters
+        ----------
+        node_id : str
+            Node identifier
+
+        Returns
+        -------
+        int
+            Dense index of the node
+        """
+        index = self._indices.get(node_id)
+        if index is None:
+            with self._lock:
+                index = self._indices.get(node_id)
+                if index is None:
+                    index = len(self._node_ids)
+                    self._node_ids.append(node_id)
+                    self._indices[node_id] = index
+        return index
+
+    def index_of(self, node_id: str) -> int | None:
+        """Return the index of a node id without interning it.
+
+        Parameters
+        ----------
+        node_id : str
+            Node identifier
+
+        Returns
+        -------
+        int | None
+            Dense index, or None if the node was never interned
+        """
+        return self._indices.get(node_id)
+
+    def node_id(self, index: int) -> str:
+        """Return the node id interned at an index.
+
+        Parameters
+        ----------
+        index : int
+            Dense index
+
+        Returns
+        -------
+        str
+            Node identifier
+        """
+        return self._node_ids[index]
+
+
+NODES = NodeInterner()
+"""Process-wide interner used by every ``VectorClock``."""
+
+
+def _trimmed(counters: list[int] | tuple[int, ...]) -> tuple[int, ...]:
+    """Drop trailing zero counters so equal clocks have equal tuples."""
+    end = len(counters)
+    while end and not counters[end - 1]:
+        end -= 1
+    return tuple(counters[:end])
 
 
-@dataclass(frozen=True)
 class VectorClock:
     """Lamport vector clock for distributed causality.
 
     Vector clocks track happened-before relationships in distributed systems.
     Each node maintains a logical clock that increments on local events and
-    merges on message receipt.
+    merges on message receipt. A node missing from a clock has time 0.
+
+    Clocks are immutable and compare equal when their ``clocks`` tuples are
+    equal, so a node listed with time 0 is distinct from an absent node for
+    equality but not for ordering.
 
     Parameters
     ----------
     clocks : tuple[tuple[str, int], ...]
-        Mapping of node_id to logical clock value
+        Mapping of node_id to logical clock value; duplicate node ids keep
+        the maximum value and negative values become 0
+
+    Examples
+    --------
+    >>> a = VectorClock.zero("n1").increment("n1")
+    >>> b = a.merge(VectorClock(clocks=(("n2", 2),)))
+    >>> b.clocks
+    (('n1', 1), ('n2', 2))
+    >>> a.happens_before(b)
+    True
     """
 
-    clocks: tuple[tuple[str, int], ...]
+    __slots__ = ("_clocks", "_counters", "_hash", "_zeros")
+
+    _counters: tuple[int, ...]
+    _zeros: frozenset[int]
+    _clocks: ClockEntries | None
+    _hash: int | None
+
+    def __init__(self, clocks: ClockEntries = ()) -> None:
+        """Intern node ids and build the counter tuple."""
+        intern = NODES.intern
+        entries = [(intern(node_id), time) for node_id, time in clocks]
+        counters = [0] * (max((index for index, _ in entries), default=-1) + 1)
+        for index, time in entries:
+            counters[index] = max(counters[index], time)
+        zeros = frozenset(index for index, _ in entries if not counters[index]) or _NO_ZEROS
+        self._init(_trimmed(counters), zeros)
+
+    def _init(self, counters: tuple[int, ...], zeros: frozenset[int]) -> None:
+        """Set the internal state of a newly created clock."""
+        object.__setattr__(self, "_counters", counters)
+        object.__setattr__(self, "_zeros", zeros)
+        object.__setattr__(self, "_clocks", None)
+        object.__setattr__(self, "_hash", None)
+
+    @classmethod
+    def _from_counters(cls, counters: tuple[int, ...], zeros: frozenset[int]) -> VectorClock:
+        """Create a clock from a trimmed counter tuple without re-interning."""
+        clock = cls.__new__(cls)
+        clock._init(counters, zeros)
+        return clock
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject mutation, as for a frozen dataclass."""
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject mutation, as for a frozen dataclass."""
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self) -> tuple[type[VectorClock], tuple[ClockEntries]]:
+        """Pickle by node id, since interned indices are per process."""
+        return (VectorClock, (self.clocks,))
+
+    def __repr__(self) -> str:
+        """Dataclass-style representation."""
+        return f"VectorClock(clocks={self.clocks!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the ``clocks`` tuples."""
+        if not isinstance(other, VectorClock):
+            return NotImplemented
+        return self._counters == other._counters and self._zeros == other._zeros
+
+    def __hash__(self) -> int:
+        """Hash consistent with equality."""
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((self._counters, self._zeros)))
+        return self._hash  # type: ignore[return-value]
+
+    @property
+    def clocks(self) -> ClockEntries:
+        """Sorted ``(node_id, time)`` pairs of the listed nodes."""
+        if self._clocks is None:
+            node_id = NODES.node_id
+            entries = [(node_id(index), time) for index, time in enumerate(self._counters) if time]
+            entries.extend((node_id(index), 0) for index in self._zeros)
+            entries.sort()
+            object.__setattr__(self, "_clocks", tuple(entries))
+        return self._clocks  # type: ignore[return-value]
+
+    def time(self, node_id: str) -> int:
+        """Logical time of a node (0 if absent).
 
-    def __post_init__(self) -> None:
-        """Normalize clocks to remove duplicate node IDs, keeping max value."""
-        clock_dict: dict[str, int] = {}
-        for node_id, time in self.clocks:
-            clock_dict[node_id] = max(clock_dict.get(node_id, 0), time)
+        Parameters
+        ----------
+        node_id : str
+            Node identifier
 
-        normalized = tuple(sorted(clock_dict.items()))
-        if normalized != self.clocks:
-            object.__setattr__(self, "clocks", normalized)
+        Returns
+        -------
+        int
+            Clock value for the node
+        """
+        index = NODES.index_of(node_id)
+        return self._counters[index] if index is not None and index < len(self._counters) else 0
 
     @staticmethod
     def zero(node_id: str) -> VectorClock:
@@ -60,9 +256,13 @@ class VectorClock:
         VectorClock
             New vector clock with incremented value
         """
-        clock_dict = dict(self.clocks)
-        clock_dict[node_id] = clock_dict.get(node_id, 0) + 1
-        return VectorClock(clocks=tuple(sorted(clock_dict.items())))
+        index = NODES.intern(node_id)
+        counters = list(self._counters)
+        if index >= len(counters):
+            counters.extend([0] * (index + 1 - len(counters)))
+        counters[index] += 1
+        zeros = self._zeros - {index} if index in self._zeros else self._zeros
+        return VectorClock._from_counters(_trimmed(counters), zeros)
 
     def merge(self, other: VectorClock) -> VectorClock:
         """Merge this clock with another, taking element-wise maximum.
@@ -77,12 +277,14 @@ class VectorClock:
         VectorClock
             Merged vector clock
         """
-        clock_dict = dict(self.clocks)
-
-        for node_id, time in other.clocks:
-            clock_dict[node_id] = max(clock_dict.get(node_id, 0), time)
-
-        return VectorClock(clocks=tuple(sorted(clock_dict.items())))
+        mine, theirs = self._counters, other._counters
+        if len(mine) < len(theirs):
+            mine, theirs = theirs, mine
+        counters = (*map(max, mine, theirs), *mine[len(theirs) :])
+        zeros = self._zeros | other._zeros
+        if zeros:
+            zeros = frozenset(index for index in zeros if index >= len(counters) or not counters[index])
+        return VectorClock._from_counters(_trimmed(counters), zeros or _NO_ZEROS)
 
     def happens_before(self, other: VectorClock) -> bool:
         """Check if this clock happened before another.
@@ -101,19 +303,11 @@ class VectorClock:
         bool
             True if this clock happened before other
         """
-        this_dict = dict(self.clocks)
-        other_dict = dict(other.clocks)
-
-        # Get all nodes from both clocks
-        all_nodes = set(this_dict.keys()) | set(other_dict.keys())
-
-        # Check if all components are <=
-        all_leq = all(this_dict.get(node, 0) <= other_dict.get(node, 0) for node in all_nodes)
-
-        # Check if at least one component is <
-        any_less = any(this_dict.get(node, 0) < other_dict.get(node, 0) for node in all_nodes)
-
-        return all_leq and any_less
+        mine, theirs = self._counters, other._counters
+        # Counters are trimmed, so a longer tuple has a later nonzero entry
+        if len(mine) > len(theirs):
+            return False
+        return mine != theirs and all(map(operator.le, mine, theirs))
 
     def concurrent_with(self, other: VectorClock) -> bool:
         """Check if this clock is concurrent with another.
@@ -131,3 +325,62 @@ class VectorClock:
             True if clocks are concurrent
         """
         return not self.happens_before(other) and not other.happens_before(self)
+
+
+def clock_delta(clock: ClockEntries, base: ClockEntries) -> tuple[tuple[str, int | None], ...]:
+    """Encode a clock as the entries that differ from a base clock.
+
+    Parameters
+    ----------
+    clock : tuple[tuple[str, int], ...]
+        Clock to encode
+    base : tuple[tuple[str, int], ...]
+        Clock of the causal predecessor
+
+    Returns
+    -------
+    tuple[tuple[str, int | None], ...]
+        Changed or added entries, and ``(node_id, None)`` for entries of
+        ``base`` missing from ``clock``
+
+    Examples
+    --------
+    >>> clock_delta((("a", 3), ("b", 1)), (("a", 2), ("b", 1), ("c", 4)))
+    (('a', 3), ('c', None))
+    """
+    base_times = dict(base)
+    times = dict(clock)
+    changed: list[tuple[str, int | None]] = [
+        (node_id, time) for node_id, time in clock if base_times.get(node_id) != time
+    ]
+    changed.extend((node_id, None) for node_id in base_times if node_id not in times)
+    return tuple(changed)
+
+
+def apply_clock_delta(base: ClockEntries, delta: Any) -> ClockEntries:
+    """Rebuild a clock from its predecessor's clock and a delta.
+
+    Parameters
+    ----------
+    base : tuple[tuple[str, int], ...]
+        Clock of the causal predecessor
+    delta : Iterable[tuple[str, int | None]]
+        Output of ``clock_delta`` (lists are accepted, e.g. from JSON)
+
+    Returns
+    -------
+    tuple[tuple[str, int], ...]
+        The encoded clock, sorted by node id
+
+    Examples
+    --------
+    >>> apply_clock_delta((("a", 2), ("b", 1), ("c", 4)), (("a", 3), ("c", None)))
+    (('a', 3), ('b', 1))
+    """
+    times = dict(base)
+    for node_id, time in delta:
+        if time is None:
+            times.pop(node_id, None)
+        else:
+            times[node_id] = time
+    return tuple(sorted(times.items()))
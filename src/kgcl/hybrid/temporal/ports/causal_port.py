@@ -194,15 +194,15 @@ class CausalTracker(Protocol):
         """
         ...
 
-    def get_transitive_causes(self, event_id: str, max_depth: int = 100) -> tuple[str, ...]:
+    def get_transitive_causes(self, event_id: str, max_depth: int | None = None) -> tuple[str, ...]:
         """Get all causal ancestors up to max_depth.
 
         Parameters
         ----------
         event_id : str
             Event to query
-        max_depth : int, default=100
-            Maximum traversal depth
+        max_depth : int | None, default=None
+            Maximum traversal depth, None for all ancestors
 
         Returns
         -------
@@ -211,6 +211,23 @@ class CausalTracker(Protocol):
         """
         ...
 
+    def is_ancestor(self, ancestor_id: str, descendant_id: str) -> bool:
+        """Check whether one event transitively caused another.
+
+        Parameters
+        ----------
+        ancestor_id : str
+            Candidate cause
+        descendant_id : str
+            Candidate effect
+
+        Returns
+        -------
+        bool
+            True if ``ancestor_id`` is a causal ancestor of ``descendant_id``
+        """
+        ...
+
     def get_root_causes(self, event_id: str) -> tuple[str, ...]:
         """Get events with no causes (roots of causal chain).
 
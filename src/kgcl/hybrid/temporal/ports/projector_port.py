@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Protocol, runtime_checkable
@@ -11,7 +12,7 @@ from typing import Any, Protocol, runtime_checkable
 class ProjectionResult:
     """Result of state projection."""
 
-    state: dict[str, Any]  # Current state as dict
+    state: Mapping[str, Any]  # Current state, read-only
     as_of: datetime
     sequence_number: int
     events_applied: int
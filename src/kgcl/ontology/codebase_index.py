@@ -2,19 +2,59 @@
 
 Provides high-level API for querying the codebase ontology index
 with fast lookups, navigation, and search capabilities.
+
+Parsing the index with rdflib takes seconds, and answering lookups by
+scanning the graph costs a pass over it per call. The index is therefore
+scanned once into hash-map lookup tables (classes by simple and qualified
+name, classes by package, method and field name, hierarchies, references
+and search texts). The tables are persisted as JSON next to the index
+file and shared within the process, both keyed by the index file's size
+and modification time. ``search`` narrows candidates with a trigram
+inverted index before substring matching. The rdflib graph itself is
+parsed only when ``query`` or ``graph`` needs it.
 """
 
 from __future__ import annotations
 
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
-from rdflib import Graph, Literal, Namespace
-from rdflib.namespace import RDF, RDFS
+from rdflib import Graph, Namespace, URIRef
+from rdflib.namespace import RDF
 
 YAWL = Namespace("http://yawlfoundation.org/ontology/")
 INDEX = Namespace("http://yawlfoundation.org/ontology/index#")
 
+_CACHE_VERSION = 1
+_NGRAM = 3
+
+
+@dataclass
+class _IndexTables:
+    """Lookup tables built from one scan of the index graph."""
+
+    classes: dict[str, dict[str, str]] = field(default_factory=dict)
+    by_fully_qualified: dict[str, str] = field(default_factory=dict)
+    by_class_name: dict[str, str] = field(default_factory=dict)
+    packages: dict[str, list[str]] = field(default_factory=dict)
+    methods: dict[str, list[str]] = field(default_factory=dict)
+    fields: dict[str, list[str]] = field(default_factory=dict)
+    hierarchies: dict[str, dict[str, Any]] = field(default_factory=dict)
+    references: dict[str, list[str]] = field(default_factory=dict)
+    search_entries: list[tuple[str, str]] = field(default_factory=list)
+    stats: dict[str, int] = field(default_factory=dict)
+
+
+_LOADED: dict[Path, tuple[tuple[int, int], _IndexTables]] = {}
+"""Tables already loaded in this process, by resolved index path, with their source stat."""
+_LOADED_LOCK = threading.Lock()
+
 
 class CodebaseIndex:
     """Query helper for codebase ontology index.
@@ -26,6 +66,10 @@ class CodebaseIndex:
     ----------
     index_file : Path | str
         Path to the index.ttl file
+    cache_file : Path | str | None
+        Where to persist the lookup tables (default: next to the index file)
+    use_cache : bool
+        Whether to reuse and write persisted lookup tables (default: True)
 
     Examples
     --------
@@ -35,22 +79,42 @@ class CodebaseIndex:
     >>> hierarchy = index.get_inheritance_hierarchy("JMXMemoryStatistics")
     """
 
-    def __init__(self, index_file: Path | str) -> None:
+    def __init__(self, index_file: Path | str, *, cache_file: Path | str | None = None, use_cache: bool = True) -> None:
         """Initialize the index.
 
         Parameters
         ----------
         index_file : Path | str
             Path to the index.ttl file
+        cache_file : Path | str | None
+            Where to persist the lookup tables; defaults to a hidden
+            ``.<name>.cache.json`` next to the index file
+        use_cache : bool
+            Whether to reuse and write persisted lookup tables
         """
         self.index_file = Path(index_file)
         if not self.index_file.exists():
             raise FileNotFoundError(f"Index file not found: {self.index_file}")
 
-        self.graph = Graph()
-        self.graph.parse(str(self.index_file), format="turtle")
-        self.graph.bind("yawl", YAWL)
-        self.graph.bind("index", INDEX)
+        self.cache_file = (
+            Path(cache_file)
+            if cache_file is not None
+            else self.index_file.with_name(f".{self.index_file.name}.cache.json")
+        )
+        self._graph: Graph | None = None
+        self._ngrams: dict[str, set[int]] | None = None
+        self._tables = self._load_tables(use_cache)
+
+    @property
+    def graph(self) -> Graph:
+        """The parsed index graph, loaded on first use (only ``query`` needs it)."""
+        if self._graph is None:
+            graph = Graph()
+            graph.parse(str(self.index_file), format="turtle")
+            graph.bind("yawl", YAWL)
+            graph.bind("index", INDEX)
+            self._graph = graph
+        return self._graph
 
     def find_class(self, class_name: str) -> dict[str, Any] | None:
         """Find class by name (simple or fully qualified).
@@ -72,19 +136,11 @@ class CodebaseIndex:
         >>> info["file_path"]
         'org/yawlfoundation/yawl/controlpanel/YControlPanel.ttl'
         """
-        # Try fully qualified first - match any literal with this value
-        for index_uri in self.graph.subjects(INDEX.fullyQualifiedName, None):
-            fq_name = self.graph.value(index_uri, INDEX.fullyQualifiedName)
-            if fq_name and str(fq_name) == class_name:
-                return self._extract_class_info(index_uri)
-
-        # Try simple name - match any literal with this value
-        for index_uri in self.graph.subjects(INDEX.className, None):
-            cn = self.graph.value(index_uri, INDEX.className)
-            if cn and str(cn) == class_name:
-                return self._extract_class_info(index_uri)
-
-        return None
+        uri = self._tables.by_fully_qualified.get(class_name)
+        if uri is None:
+            uri = self._tables.by_class_name.get(class_name)
+        info = self._tables.classes.get(uri) if uri is not None else None
+        return dict(info) if info is not None else None
 
     def find_classes_in_package(self, package_name: str) -> list[str]:
         """Find all classes in a package.
@@ -106,18 +162,7 @@ class CodebaseIndex:
         >>> "YControlPanel" in [c.split(".")[-1] for c in classes]
         True
         """
-        classes: list[str] = []
-
-        for package_index in self.graph.subjects(INDEX.packageName, None):
-            pkg_name = self.graph.value(package_index, INDEX.packageName)
-            if not pkg_name or str(pkg_name) != package_name:
-                continue
-            for class_index in self.graph.objects(package_index, INDEX.hasClass):
-                fq_name = self.graph.value(class_index, INDEX.fullyQualifiedName)
-                if fq_name:
-                    classes.append(str(fq_name))
-
-        return classes
+        return list(self._tables.packages.get(package_name, ()))
 
     def get_inheritance_hierarchy(self, class_name: str) -> dict[str, Any]:
         """Get inheritance hierarchy for a class.
@@ -140,50 +185,14 @@ class CodebaseIndex:
         'JMXStatistics'
         """
         class_info = self.find_class(class_name)
-        if not class_info:
-            return {"extends": None, "implements": [], "subclasses": []}
-
-        # Find class index URI by fully qualified name
-        class_index_uri = None
-        for index_uri in self.graph.subjects(INDEX.fullyQualifiedName, None):
-            fq_name = self.graph.value(index_uri, INDEX.fullyQualifiedName)
-            if fq_name and str(fq_name) == class_info["fully_qualified"]:
-                class_index_uri = index_uri
-                break
-
-        if not class_index_uri:
+        hierarchy = self._tables.hierarchies.get(class_info["fully_qualified"]) if class_info else None
+        if hierarchy is None:
             return {"extends": None, "implements": [], "subclasses": []}
-
-        # Get extends
-        extends = None
-        extends_uri = self.graph.value(class_index_uri, INDEX.extendsClass)
-        if extends_uri:
-            # Extract class name from URI
-            extends_str = str(extends_uri)
-            # Handle different URI formats: yawl:ClassName, http://.../ClassName
-            if ":" in extends_str and not extends_str.startswith("http"):
-                # Namespace prefix format: yawl:ClassName
-                extends = extends_str.split(":")[-1]
-            elif "/" in extends_str:
-                # Full URI format: http://.../ClassName
-                extends = extends_str.split("/")[-1]
-            else:
-                extends = extends_str
-
-        # Get implements
-        implements: list[str] = []
-        for impl_uri in self.graph.objects(class_index_uri, INDEX.implementsInterface):
-            impl_name = str(impl_uri).split(":")[-1]
-            implements.append(impl_name)
-
-        # Get subclasses
-        subclasses: list[str] = []
-        for subclass_index in self.graph.objects(class_index_uri, INDEX.hasSubclass):
-            subclass_fq = self.graph.value(subclass_index, INDEX.fullyQualifiedName)
-            if subclass_fq:
-                subclasses.append(str(subclass_fq))
-
-        return {"extends": extends, "implements": implements, "subclasses": subclasses}
+        return {
+            "extends": hierarchy["extends"],
+            "implements": list(hierarchy["implements"]),
+            "subclasses": list(hierarchy["subclasses"]),
+        }
 
     def find_classes_with_method(self, method_name: str) -> list[str]:
         """Find all classes that have a method with the given name.
@@ -205,18 +214,7 @@ class CodebaseIndex:
         >>> len(classes) > 0
         True
         """
-        classes: list[str] = []
-
-        for method_index in self.graph.subjects(INDEX.methodName, None):
-            m_name = self.graph.value(method_index, INDEX.methodName)
-            if not m_name or str(m_name) != method_name:
-                continue
-            for class_index in self.graph.objects(method_index, INDEX.hasMethodNamed):
-                fq_name = self.graph.value(class_index, INDEX.fullyQualifiedName)
-                if fq_name:
-                    classes.append(str(fq_name))
-
-        return classes
+        return list(self._tables.methods.get(method_name, ()))
 
     def find_classes_with_field(self, field_name: str) -> list[str]:
         """Find all classes that have a field with the given name.
@@ -238,18 +236,7 @@ class CodebaseIndex:
         >>> len(classes) > 0
         True
         """
-        classes: list[str] = []
-
-        for field_index in self.graph.subjects(INDEX.fieldName, None):
-            f_name = self.graph.value(field_index, INDEX.fieldName)
-            if not f_name or str(f_name) != field_name:
-                continue
-            for class_index in self.graph.objects(field_index, INDEX.hasFieldNamed):
-                fq_name = self.graph.value(class_index, INDEX.fullyQualifiedName)
-                if fq_name:
-                    classes.append(str(fq_name))
-
-        return classes
+        return list(self._tables.fields.get(field_name, ()))
 
     def find_references(self, class_name: str) -> list[str]:
         """Find all classes that reference the given class.
@@ -274,45 +261,7 @@ class CodebaseIndex:
         class_info = self.find_class(class_name)
         if not class_info:
             return []
-
-        # Find class index URI by fully qualified name
-        class_index_uri = None
-        for index_uri in self.graph.subjects(INDEX.fullyQualifiedName, None):
-            fq_name = self.graph.value(index_uri, INDEX.fullyQualifiedName)
-            if fq_name and str(fq_name) == class_info["fully_qualified"]:
-                class_index_uri = index_uri
-                break
-
-        if not class_index_uri:
-            return []
-
-        references: list[str] = []
-
-        # Find all reference entries that reference this class
-        # Can reference by class index URI or by YAWL namespace URI
-        class_uri = self.graph.value(class_index_uri, INDEX.indexedClass)
-        if class_uri:
-            # Find references by class URI (YAWL namespace)
-            for ref_index in self.graph.subjects(INDEX.referencesClass, class_uri):
-                ref_class_index = self.graph.value(ref_index, INDEX.referencedBy)
-                if ref_class_index:
-                    fq_name = self.graph.value(ref_class_index, INDEX.fullyQualifiedName)
-                    if fq_name:
-                        fq_str = str(fq_name)
-                        if fq_str not in references:
-                            references.append(fq_str)
-
-        # Also check references by class index URI
-        for ref_index in self.graph.subjects(INDEX.referencesClass, class_index_uri):
-            ref_class_index = self.graph.value(ref_index, INDEX.referencedBy)
-            if ref_class_index:
-                fq_name = self.graph.value(ref_class_index, INDEX.fullyQualifiedName)
-                if fq_name:
-                    fq_str = str(fq_name)
-                    if fq_str not in references:
-                        references.append(fq_str)
-
-        return references
+        return list(self._tables.references.get(class_info["fully_qualified"], ()))
 
     def search(self, text: str) -> list[dict[str, Any]]:
         """Full-text search across classes, methods, fields, and comments.
@@ -335,17 +284,24 @@ class CodebaseIndex:
         True
         """
         text_lower = text.lower()
-        results: list[dict[str, Any]] = []
-
-        for search_index in self.graph.subjects(RDF.type, INDEX.SearchIndex):
-            searchable_text = self.graph.value(search_index, INDEX.searchableText)
-            if searchable_text and text_lower in str(searchable_text).lower():
-                class_index = self.graph.value(search_index, INDEX.searchableClass)
-                if class_index:
-                    class_info = self._extract_class_info(class_index)
-                    if class_info:
-                        results.append(class_info)
+        entries = self._tables.search_entries
+        if len(text_lower) < _NGRAM:
+            candidates: Iterable[int] = range(len(entries))
+        else:
+            postings = self._ngram_index()
+            matches: set[int] | None = None
+            for gram in _ngrams(text_lower):
+                found = postings.get(gram)
+                if not found:
+                    return []
+                matches = set(found) if matches is None else matches & found
+            candidates = sorted(matches or ())
 
+        results: list[dict[str, Any]] = []
+        for position in candidates:
+            searchable_text, class_uri = entries[position]
+            if text_lower in searchable_text:
+                results.append(dict(self._tables.classes[class_uri]))
         return results
 
     def query(self, sparql: str) -> list[dict[str, Any]]:
@@ -390,34 +346,6 @@ class CodebaseIndex:
 
         return results
 
-    def _extract_class_info(self, index_uri: Any) -> dict[str, Any] | None:
-        """Extract class information from index URI.
-
-        Parameters
-        ----------
-        index_uri : Any
-            Index URI
-
-        Returns
-        -------
-        dict[str, Any] | None
-            Class information dictionary
-        """
-        file_path = self.graph.value(index_uri, INDEX.filePath)
-        package_name = self.graph.value(index_uri, INDEX.packageName)
-        class_name = self.graph.value(index_uri, INDEX.className)
-        fq_name = self.graph.value(index_uri, INDEX.fullyQualifiedName)
-
-        if not fq_name:
-            return None
-
-        return {
-            "class_name": str(class_name) if class_name else "",
-            "package_name": str(package_name) if package_name else "",
-            "fully_qualified": str(fq_name),
-            "file_path": str(file_path) if file_path else "",
-        }
-
     def stats(self) -> dict[str, int]:
         """Get index statistics.
 
@@ -433,15 +361,205 @@ class CodebaseIndex:
         >>> stats["classes"] > 0
         True
         """
-        class_count = len(list(self.graph.subjects(RDF.type, INDEX.ClassIndex)))
-        package_count = len(list(self.graph.subjects(RDF.type, INDEX.PackageIndex)))
-        method_count = len(list(self.graph.subjects(RDF.type, INDEX.MethodIndex)))
-        field_count = len(list(self.graph.subjects(RDF.type, INDEX.FieldIndex)))
+        return dict(self._tables.stats)
 
-        return {
-            "classes": class_count,
-            "packages": package_count,
-            "methods": method_count,
-            "fields": field_count,
-            "triples": len(self.graph),
-        }
+    def _load_tables(self, use_cache: bool) -> _IndexTables:
+        """Return lookup tables from the process memo, the cache file, or the graph.
+
+        Tables are valid for an index file with the same size and
+        modification time as when they were built.
+        """
+        stat = self.index_file.stat()
+        source = (stat.st_size, stat.st_mtime_ns)
+        key = self.index_file.resolve()
+        if use_cache:
+            with _LOADED_LOCK:
+                loaded = _LOADED.get(key)
+            if loaded is not None and loaded[0] == source:
+                return loaded[1]
+            tables = _read_cache(self.cache_file, source)
+            if tables is not None:
+                with _LOADED_LOCK:
+                    _LOADED[key] = (source, tables)
+                return tables
+
+        tables = _build_tables(self.graph)
+        if use_cache:
+            _write_cache(self.cache_file, source, tables)
+            with _LOADED_LOCK:
+                _LOADED[key] = (source, tables)
+        return tables
+
+    def _ngram_index(self) -> dict[str, set[int]]:
+        """Return the trigram postings of the search texts, building them on first use."""
+        if self._ngrams is None:
+            postings: dict[str, set[int]] = {}
+            for position, (searchable_text, _class_uri) in enumerate(self._tables.search_entries):
+                for gram in _ngrams(searchable_text):
+                    postings.setdefault(gram, set()).add(position)
+            self._ngrams = postings
+        return self._ngrams
+
+
+def _ngrams(text: str) -> set[str]:
+    """Return the distinct character trigrams of a string."""
+    return {text[i : i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
+def _class_info(graph: Graph, index_uri: Any) -> dict[str, str] | None:
+    """Extract class information from a class index node, or None without a qualified name."""
+    file_path = graph.value(index_uri, INDEX.filePath)
+    package_name = graph.value(index_uri, INDEX.packageName)
+    class_name = graph.value(index_uri, INDEX.className)
+    fq_name = graph.value(index_uri, INDEX.fullyQualifiedName)
+
+    if not fq_name:
+        return None
+
+    return {
+        "class_name": str(class_name) if class_name else "",
+        "package_name": str(package_name) if package_name else "",
+        "fully_qualified": str(fq_name),
+        "file_path": str(file_path) if file_path else "",
+    }
+
+
+def _members(graph: Graph, name_predicate: URIRef, link_predicate: URIRef) -> dict[str, list[str]]:
+    """Map member names (package, method, field) to the qualified names of classes linked to them."""
+    members: dict[str, list[str]] = {}
+    for member_index in graph.subjects(name_predicate, None):
+        name = graph.value(member_index, name_predicate)
+        if not name:
+            continue
+        classes = members.setdefault(str(name), [])
+        for class_index in graph.objects(member_index, link_predicate):
+            fq_name = graph.value(class_index, INDEX.fullyQualifiedName)
+            if fq_name:
+                classes.append(str(fq_name))
+    return members
+
+
+def _hierarchy(graph: Graph, class_index_uri: Any) -> dict[str, Any]:
+    """Return extends, implements and subclasses of a class index node."""
+    extends = None
+    extends_uri = graph.value(class_index_uri, INDEX.extendsClass)
+    if extends_uri:
+        # Extract class name from URI
+        extends_str = str(extends_uri)
+        # Handle different URI formats: yawl:ClassName, http://.../ClassName
+        if ":" in extends_str and not extends_str.startswith("http"):
+            # Namespace prefix format: yawl:ClassName
+            extends = extends_str.rsplit(":", maxsplit=1)[-1]
+        elif "/" in extends_str:
+            # Full URI format: http://.../ClassName
+            extends = extends_str.rsplit("/", maxsplit=1)[-1]
+        else:
+            extends = extends_str
+
+    implements = [
+        str(impl_uri).split(":")[-1] for impl_uri in graph.objects(class_index_uri, INDEX.implementsInterface)
+    ]
+
+    subclasses: list[str] = []
+    for subclass_index in graph.objects(class_index_uri, INDEX.hasSubclass):
+        subclass_fq = graph.value(subclass_index, INDEX.fullyQualifiedName)
+        if subclass_fq:
+            subclasses.append(str(subclass_fq))
+
+    return {"extends": extends, "implements": implements, "subclasses": subclasses}
+
+
+def _references(graph: Graph, class_index_uri: Any) -> list[str]:
+    """Return qualified names of classes referencing a class, by its YAWL URI or index node."""
+    targets = []
+    # Can reference by class index URI or by YAWL namespace URI
+    class_uri = graph.value(class_index_uri, INDEX.indexedClass)
+    if class_uri:
+        targets.append(class_uri)
+    targets.append(class_index_uri)
+
+    references: list[str] = []
+    for target in targets:
+        for ref_index in graph.subjects(INDEX.referencesClass, target):
+            ref_class_index = graph.value(ref_index, INDEX.referencedBy)
+            if ref_class_index:
+                fq_name = graph.value(ref_class_index, INDEX.fullyQualifiedName)
+                if fq_name and str(fq_name) not in references:
+                    references.append(str(fq_name))
+    return references
+
+
+def _build_tables(graph: Graph) -> _IndexTables:
+    """Scan the index graph once and build every lookup table."""
+    tables = _IndexTables()
+    nodes: dict[str, Any] = {}
+    for index_uri in graph.subjects(INDEX.fullyQualifiedName, None):
+        key = str(index_uri)
+        if key in tables.classes:
+            continue
+        info = _class_info(graph, index_uri)
+        if info is not None:
+            tables.classes[key] = info
+            nodes[key] = index_uri
+            tables.by_fully_qualified.setdefault(info["fully_qualified"], key)
+    for index_uri in graph.subjects(INDEX.className, None):
+        class_name = graph.value(index_uri, INDEX.className)
+        if class_name:
+            tables.by_class_name.setdefault(str(class_name), str(index_uri))
+
+    tables.packages = _members(graph, INDEX.packageName, INDEX.hasClass)
+    tables.methods = _members(graph, INDEX.methodName, INDEX.hasMethodNamed)
+    tables.fields = _members(graph, INDEX.fieldName, INDEX.hasFieldNamed)
+
+    for fq_name, key in tables.by_fully_qualified.items():
+        tables.hierarchies[fq_name] = _hierarchy(graph, nodes[key])
+        tables.references[fq_name] = _references(graph, nodes[key])
+
+    for search_index in graph.subjects(RDF.type, INDEX.SearchIndex):
+        searchable_text = graph.value(search_index, INDEX.searchableText)
+        if searchable_text:
+            class_index = graph.value(search_index, INDEX.searchableClass)
+            if class_index and str(class_index) in tables.classes:
+                tables.search_entries.append((str(searchable_text).lower(), str(class_index)))
+
+    tables.stats = {
+        "classes": len(list(graph.subjects(RDF.type, INDEX.ClassIndex))),
+        "packages": len(list(graph.subjects(RDF.type, INDEX.PackageIndex))),
+        "methods": len(list(graph.subjects(RDF.type, INDEX.MethodIndex))),
+        "fields": len(list(graph.subjects(RDF.type, INDEX.FieldIndex))),
+        "triples": len(graph),
+    }
+    return tables
+
+
+def _read_cache(path: Path, source: tuple[int, int]) -> _IndexTables | None:
+    """Load persisted tables built from a file with the given (size, mtime_ns)."""
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(document, dict) or document.get("version") != _CACHE_VERSION:
+        return None
+    if tuple(document.get("source", ())) != source:
+        return None
+    try:
+        tables = _IndexTables(**document["tables"])
+    except (KeyError, TypeError):
+        return None
+    tables.search_entries = [(text, class_uri) for text, class_uri in tables.search_entries]
+    return tables
+
+
+def _write_cache(path: Path, source: tuple[int, int], tables: _IndexTables) -> None:
+    """Atomically persist tables; an unwritable location is ignored."""
+    document = {"version": _CACHE_VERSION, "source": list(source), "tables": asdict(tables)}
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(document, handle, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
@@ -51,7 +51,7 @@ from kgcl.projection.domain.exceptions import (
 )
 from kgcl.projection.domain.result import BundleFileResult, BundleResult, ProjectionResult
 from kgcl.projection.engine import ProjectionEngine
-from kgcl.projection.ports.graph_client import GraphClient, GraphRegistry
+from kgcl.projection.ports.graph_client import GraphClient, GraphRegistry, VersionedGraphClient
 from kgcl.projection.ports.template_registry import BundleRegistry, InMemoryTemplateRegistry, TemplateRegistry
 
 __all__ = [
@@ -97,4 +97,5 @@ __all__ = [
     "GraphRegistry",
     "InMemoryTemplateRegistry",
     "TemplateRegistry",
+    "VersionedGraphClient",
 ]
@@ -80,6 +80,23 @@ class EventStoreAdapter:
         """
         return self._graph_id
 
+    @property
+    def generation(self) -> int:
+        """Return the store's event sequence, which advances on every change.
+
+        Returns
+        -------
+        int
+            Current event sequence number.
+
+        Examples
+        --------
+        >>> from kgcl.daemon.event_store import RDFEventStore
+        >>> EventStoreAdapter(RDFEventStore()).generation
+        0
+        """
+        return self._store.sequence
+
     def query(self, sparql: str) -> list[dict[str, Any]]:
         """Execute SPARQL SELECT query against state graph.
 
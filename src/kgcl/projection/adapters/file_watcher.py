@@ -0,0 +1,283 @@
+"""File watchers - Report which files under a directory tree changed.
+
+The FilesystemTemplateRegistry uses a watcher to keep its template index
+and descriptor cache current without rescanning the template directory on
+every call. On Linux the InotifyWatcher receives change events from the
+kernel (through ``ctypes``, no extra dependency); elsewhere, or when
+inotify is unavailable, the PollingWatcher compares ``(mtime, size)``
+snapshots at most once per interval.
+
+``poll()`` returns the set of paths created, modified or deleted since the
+previous call, or None when the watcher lost track (event queue overflow,
+a watched directory moved or deleted) and the caller must rescan.
+
+Examples
+--------
+>>> import tempfile
+>>> from pathlib import Path
+>>> with tempfile.TemporaryDirectory() as tmp:
+...     root = Path(tmp)
+...     watcher = create_file_watcher([root], poll_interval=0.0)
+...     _ = (root / "a.j2").write_text("x")
+...     changed = watcher.poll()
+...     watcher.close()
+>>> [path.name for path in changed]
+['a.j2']
+"""
+
+from __future__ import annotations
+
+import ctypes
+import errno
+import os
+import struct
+import sys
+import time
+import weakref
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Protocol
+
+__all__ = ["FileWatcher", "InotifyWatcher", "PollingWatcher", "create_file_watcher"]
+
+# inotify event masks (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_EVENT = struct.Struct("iIII")
+"""``struct inotify_event`` header: wd, mask, cookie, len (name follows)."""
+
+
+class FileWatcher(Protocol):
+    """Source of file change notifications for directory trees."""
+
+    def poll(self) -> set[Path] | None:
+        """Return paths changed since the last poll, or None if a rescan is needed."""
+        ...
+
+    def close(self) -> None:
+        """Release any OS resources held by the watcher."""
+        ...
+
+
+def _load_inotify() -> Any | None:
+    """Return libc with inotify prototypes set, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_init1.restype = ctypes.c_int
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_add_watch.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class InotifyWatcher:
+    """Kernel-notified watcher for Linux.
+
+    Every directory under the roots gets a watch; directories created later
+    are watched as they appear, and their files are reported as changed.
+
+    Parameters
+    ----------
+    roots : Iterable[Path]
+        Directory trees to watch; missing roots are ignored.
+
+    Raises
+    ------
+    OSError
+        If inotify is unavailable or cannot be initialized.
+    """
+
+    def __init__(self, roots: Iterable[Path]) -> None:
+        """Create the inotify instance and watch every directory under the roots."""
+        libc = _load_inotify()
+        if libc is None:
+            msg = "inotify is not available on this platform"
+            raise OSError(msg)
+        self._libc = libc
+        self._roots = tuple(roots)
+        self._fd = -1
+        self._finalizer: weakref.finalize[Any, InotifyWatcher] | None = None
+        self._watches: dict[int, Path] = {}
+        self._open()
+
+    def poll(self) -> set[Path] | None:
+        """Drain pending events.
+
+        Returns
+        -------
+        set[Path] | None
+            Changed file paths, or None after an overflow or a watched
+            directory being moved or deleted (the watches are rebuilt).
+        """
+        changed: set[Path] = set()
+        rescan = False
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    rescan = True
+                elif mask & _IN_IGNORED:
+                    self._watches.pop(wd, None)
+                elif mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                    rescan = True
+                elif wd in self._watches:
+                    path = self._watches[wd] / name
+                    if not mask & _IN_ISDIR:
+                        changed.add(path)
+                    elif mask & (_IN_CREATE | _IN_MOVED_TO):
+                        changed.update(self._watch_tree(path, strict=False))
+                    elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+                        rescan = True
+        if rescan:
+            self.close()
+            self._open()
+            return None
+        return changed
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._watches.clear()
+
+    def _open(self) -> None:
+        """Create a fresh inotify instance watching the roots."""
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+        self._fd = fd
+        self._finalizer = weakref.finalize(self, os.close, fd)
+        try:
+            for root in self._roots:
+                self._watch_tree(root, strict=True)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, root: Path, *, strict: bool) -> list[Path]:
+        """Watch a directory and its subdirectories; return the files found in them.
+
+        With ``strict``, failing to add a watch for an existing directory
+        (typically the per-user watch limit) raises OSError; otherwise that
+        directory goes unwatched.
+        """
+        files: list[Path] = []
+        for dirpath, _dirnames, filenames in os.walk(root):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), _WATCH_MASK)
+            if wd >= 0:
+                self._watches[wd] = Path(dirpath)
+            elif strict and ctypes.get_errno() != errno.ENOENT:
+                code = ctypes.get_errno()
+                raise OSError(code, os.strerror(code), dirpath)
+            files.extend(Path(dirpath) / filename for filename in filenames)
+        return files
+
+
+class PollingWatcher:
+    """Portable watcher comparing ``(mtime_ns, size)`` snapshots.
+
+    Parameters
+    ----------
+    roots : Iterable[Path]
+        Directory trees to watch; missing roots are ignored.
+    interval : float
+        Minimum seconds between rescans; polls in between report nothing.
+    """
+
+    def __init__(self, roots: Iterable[Path], interval: float = 1.0) -> None:
+        """Take the initial snapshot."""
+        self._roots = tuple(roots)
+        self._interval = interval
+        self._snapshot = self._scan()
+        self._scanned_at = time.monotonic()
+
+    def poll(self) -> set[Path] | None:
+        """Rescan if the interval has passed and return paths whose stat differs.
+
+        Returns
+        -------
+        set[Path] | None
+            Changed file paths (never None).
+        """
+        now = time.monotonic()
+        if now - self._scanned_at < self._interval:
+            return set()
+        previous, self._snapshot = self._snapshot, self._scan()
+        self._scanned_at = now
+        return {
+            path for path in previous.keys() | self._snapshot.keys() if previous.get(path) != self._snapshot.get(path)
+        }
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        """Stat every file under the roots."""
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for root in self._roots:
+            for dirpath, _dirnames, filenames in os.walk(root):
+                for filename in filenames:
+                    path = Path(dirpath) / filename
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+def create_file_watcher(roots: Iterable[Path], poll_interval: float = 1.0) -> FileWatcher:
+    """Create an inotify watcher, falling back to polling.
+
+    Parameters
+    ----------
+    roots : Iterable[Path]
+        Directory trees to watch.
+    poll_interval : float
+        Rescan interval of the polling fallback, in seconds.
+
+    Returns
+    -------
+    FileWatcher
+        InotifyWatcher on Linux, PollingWatcher otherwise.
+    """
+    roots = tuple(roots)
+    try:
+        return InotifyWatcher(roots)
+    except OSError:
+        return PollingWatcher(roots, poll_interval)
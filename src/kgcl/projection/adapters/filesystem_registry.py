@@ -3,6 +3,12 @@
 This registry implementation scans a directory for Jinja2 templates (.j2 files)
 and parses their YAML frontmatter to construct TemplateDescriptor instances.
 
+Descriptors are cached with the ``(mtime, size)`` fingerprint of the
+template and of the external query files it loads. A file watcher (inotify,
+or polling where that is unavailable) keeps the directory index and the
+cache current, so an edited template is reparsed on its next lookup while
+every other descriptor stays cached.
+
 Examples
 --------
 >>> from pathlib import Path
@@ -14,11 +20,16 @@ Examples
 from __future__ import annotations
 
 import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any
 
 import yaml
 
+from kgcl.projection.adapters.file_watcher import FileWatcher, create_file_watcher
 from kgcl.projection.domain.descriptors import (
     N3RuleDescriptor,
     OntologyConfig,
@@ -30,6 +41,32 @@ from kgcl.projection.domain.descriptors import (
 )
 from kgcl.projection.domain.exceptions import ResourceLimitExceeded
 
+_Fingerprint = tuple[int, int]
+"""``(mtime_ns, size)`` of a file."""
+
+
+def _fingerprint(path: Path) -> _Fingerprint | None:
+    """Return a file's fingerprint, or None if it is not a regular file."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    if not S_ISREG(stat.st_mode):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass(frozen=True)
+class _CachedTemplate:
+    """A parsed descriptor with the fingerprints of the files it was built from."""
+
+    descriptor: TemplateDescriptor
+    files: tuple[tuple[Path, _Fingerprint | None], ...]
+
+    def is_current(self) -> bool:
+        """Check that no source file changed since parsing."""
+        return all(_fingerprint(path) == fingerprint for path, fingerprint in self.files)
+
 
 class FilesystemTemplateRegistry:
     """Registry that loads templates from filesystem.
@@ -44,6 +81,14 @@ class FilesystemTemplateRegistry:
         Directory containing .j2 template files.
     query_dir : Path | None
         Optional directory for external query files (default: template_dir/queries).
+    max_template_size : int | None
+        Maximum template file size in bytes. If None, no limit.
+    auto_reload : bool
+        Watch the template and query directories and pick up changes on
+        the next call (default: True). If False, descriptors are cached
+        until ``refresh()`` is called.
+    poll_interval : float
+        Rescan interval in seconds when inotify is unavailable (default: 1.0).
 
     Attributes
     ----------
@@ -63,7 +108,15 @@ class FilesystemTemplateRegistry:
     []
     """
 
-    def __init__(self, template_dir: Path, query_dir: Path | None = None, max_template_size: int | None = None) -> None:
+    def __init__(
+        self,
+        template_dir: Path,
+        query_dir: Path | None = None,
+        max_template_size: int | None = None,
+        *,
+        auto_reload: bool = True,
+        poll_interval: float = 1.0,
+    ) -> None:
         """Initialize registry with template directory.
 
         Parameters
@@ -74,11 +127,22 @@ class FilesystemTemplateRegistry:
             Optional directory for external query files.
         max_template_size : int | None
             Maximum template file size in bytes. If None, no limit.
+        auto_reload : bool
+            Pick up file changes automatically.
+        poll_interval : float
+            Rescan interval of the polling fallback, in seconds.
         """
         self._template_dir = template_dir
         self._query_dir = query_dir if query_dir else template_dir / "queries"
         self._max_template_size = max_template_size
-        self._cache: dict[str, TemplateDescriptor] = {}
+        self._auto_reload = auto_reload
+        self._poll_interval = poll_interval
+        self._cache: dict[str, _CachedTemplate] = {}
+        self._dependents: dict[Path, set[str]] = {}
+        self._index: set[str] | None = None
+        self._watcher: FileWatcher | None = None
+        self._listeners: list[Callable[[str], None]] = []
+        self._lock = threading.RLock()
 
     @property
     def template_dir(self) -> Path:
@@ -129,19 +193,29 @@ class FilesystemTemplateRegistry:
         if not name.endswith(".j2"):
             name = f"{name}.j2"
 
-        # Check cache
-        if name in self._cache:
-            return self._cache[name]
-
-        # Resolve path
-        template_path = self._template_dir / name
-        if not template_path.exists():
-            return None
-
-        # Parse and cache
-        descriptor = self._parse_template(template_path)
-        self._cache[name] = descriptor
-        return descriptor
+        with self._lock:
+            if self._auto_reload:
+                self._apply_changes()
+
+            # Check cache
+            cached = self._cache.get(name)
+            if cached is not None:
+                return cached.descriptor
+
+            # Resolve path
+            template_path = self._template_dir / name
+            fingerprint = _fingerprint(template_path)
+            if fingerprint is None:
+                return None
+
+            # Parse and cache, remembering which files the descriptor came from
+            query_files: list[Path] = []
+            descriptor = self._parse_template(template_path, query_files)
+            files = ((template_path, fingerprint), *((path, _fingerprint(path)) for path in query_files))
+            self._cache[name] = _CachedTemplate(descriptor, files)
+            for path in query_files:
+                self._dependents.setdefault(path, set()).add(name)
+            return descriptor
 
     def list_templates(self) -> list[str]:
         """List all available template names.
@@ -162,15 +236,46 @@ class FilesystemTemplateRegistry:
         ...     "test.j2" in registry.list_templates()
         True
         """
-        if not self._template_dir.exists():
-            return []
+        with self._lock:
+            if self._auto_reload:
+                self._apply_changes()
+            if self._index is None or self._watcher is None:
+                self._index = self._scan_index()
+            return sorted(self._index)
+
+    def refresh(self) -> None:
+        """Re-validate every cached descriptor and rebuild the template index.
+
+        Descriptors whose template or query files changed (by mtime or size)
+        are dropped and their listeners notified; unchanged ones stay cached.
+        Useful with ``auto_reload=False`` or after bulk changes.
+        """
+        with self._lock:
+            self._index = self._scan_index()
+            for name in [name for name, cached in self._cache.items() if not cached.is_current()]:
+                self._invalidate(name)
 
-        templates = []
-        for path in self._template_dir.rglob("*.j2"):
-            relative = path.relative_to(self._template_dir)
-            templates.append(str(relative))
+    def subscribe(self, listener: Callable[[str], None]) -> None:
+        """Register a callback for templates that changed or were removed.
 
-        return sorted(templates)
+        The callback receives the template name (relative path with the
+        .j2 extension) after its cached descriptor has been dropped, for
+        example to evict the matching compiled template.
+
+        Parameters
+        ----------
+        listener : Callable[[str], None]
+            Called with each invalidated template name.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def close(self) -> None:
+        """Stop watching the template directories."""
+        with self._lock:
+            if self._watcher is not None:
+                self._watcher.close()
+                self._watcher = None
 
     def exists(self, name: str) -> bool:
         """Check if a template exists.
@@ -199,13 +304,67 @@ class FilesystemTemplateRegistry:
             name = f"{name}.j2"
         return (self._template_dir / name).exists()
 
-    def _parse_template(self, path: Path) -> TemplateDescriptor:
+    def _apply_changes(self) -> None:
+        """Apply file changes reported by the watcher, starting it if needed."""
+        if self._watcher is None:
+            if not self._template_dir.is_dir():
+                return
+            roots = [self._template_dir]
+            if not self._query_dir.is_relative_to(self._template_dir):
+                roots.append(self._query_dir)
+            self._watcher = create_file_watcher(roots, self._poll_interval)
+            # Changes made before the watcher existed are invisible to it
+            self.refresh()
+            return
+
+        changed = self._watcher.poll()
+        if changed is None:
+            self.refresh()
+            return
+        for path in changed:
+            for name in sorted(self._dependents.get(path, ())):
+                self._invalidate(name)
+            if path.suffix != ".j2" or not path.is_relative_to(self._template_dir):
+                continue
+            name = path.relative_to(self._template_dir).as_posix()
+            if self._index is not None:
+                if _fingerprint(path) is None:
+                    self._index.discard(name)
+                else:
+                    self._index.add(name)
+            cached = self._cache.get(name)
+            if cached is not None and not cached.is_current():
+                self._invalidate(name)
+
+    def _invalidate(self, name: str) -> None:
+        """Drop a cached descriptor and notify listeners."""
+        cached = self._cache.pop(name, None)
+        if cached is not None:
+            for path, _ in cached.files[1:]:
+                dependents = self._dependents.get(path)
+                if dependents is not None:
+                    dependents.discard(name)
+                    if not dependents:
+                        del self._dependents[path]
+        for listener in self._listeners:
+            listener(name)
+
+    def _scan_index(self) -> set[str]:
+        """List template names by walking the template directory."""
+        if not self._template_dir.exists():
+            return set()
+        return {path.relative_to(self._template_dir).as_posix() for path in self._template_dir.rglob("*.j2")}
+
+    def _parse_template(self, path: Path, query_files: list[Path] | None = None) -> TemplateDescriptor:
         """Parse template file and extract frontmatter.
 
         Parameters
         ----------
         path : Path
             Path to template file.
+        query_files : list[Path] | None
+            If given, external query files referenced by the frontmatter
+            are appended to it, whether or not they exist.
 
         Returns
         -------
@@ -281,6 +440,8 @@ class FilesystemTemplateRegistry:
                 if "file" in query_dict:
                     file_path = query_dict["file"]
                     full_path = self._query_dir / file_path
+                    if query_files is not None:
+                        query_files.append(full_path)
                     if full_path.exists():
                         query_dict = dict(query_dict)  # Copy to avoid mutation
                         query_dict["inline"] = full_path.read_text(encoding="utf-8")
@@ -15,11 +15,16 @@ Examples
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from rdflib import Graph
 
+# rdflib's SPARQL parser and algebra translation keep module-global state,
+# so queries against any graph must not run concurrently.
+_QUERY_LOCK = threading.Lock()
+
 
 class RDFLibAdapter:
     """Adapter wrapping rdflib.Graph as GraphClient.
@@ -27,6 +32,8 @@ class RDFLibAdapter:
     This adapter exposes an rdflib Graph via the GraphClient protocol,
     allowing templates to execute SPARQL queries against in-memory
     RDF graphs. Useful for testing and working with external data.
+    Queries are serialized across all adapters because rdflib's SPARQL
+    engine is not thread-safe.
 
     Parameters
     ----------
@@ -110,9 +117,11 @@ class RDFLibAdapter:
         'Alice'
         """
         results: list[dict[str, Any]] = []
-        query_results = self._graph.query(sparql)
+        with _QUERY_LOCK:
+            query_results = self._graph.query(sparql)
+            rows = list(query_results)
 
-        for row in query_results:
+        for row in rows:
             binding: dict[str, Any] = {}
             # rdflib returns ResultRow objects with variable bindings
             for var in query_results.vars:
@@ -150,9 +159,10 @@ class RDFLibAdapter:
         >>> adapter.ask("ASK { ?s <urn:missing> ?o }")
         False
         """
-        result = self._graph.query(sparql)
-        # rdflib ASK returns a boolean result
-        return bool(result)
+        with _QUERY_LOCK:
+            result = self._graph.query(sparql)
+            # rdflib ASK returns a boolean result
+            return bool(result)
 
     def construct(self, sparql: str) -> str:
         """Execute SPARQL CONSTRUCT query against rdflib graph.
@@ -180,12 +190,13 @@ class RDFLibAdapter:
         >>> "alice" in result
         True
         """
-        query_result = self._graph.query(sparql)
-        # CONSTRUCT returns a Graph object
-        if hasattr(query_result, "serialize"):
-            # rdflib Graph.serialize() returns bytes
-            serialized = query_result.serialize(format="turtle")
-            if isinstance(serialized, bytes):
-                return serialized.decode("utf-8")
-            return str(serialized)
+        with _QUERY_LOCK:
+            query_result = self._graph.query(sparql)
+            # CONSTRUCT returns a Graph object
+            if hasattr(query_result, "serialize"):
+                # rdflib Graph.serialize() returns bytes
+                serialized = query_result.serialize(format="turtle")
+                if isinstance(serialized, bytes):
+                    return serialized.decode("utf-8")
+                return str(serialized)
         return ""
@@ -139,6 +139,9 @@ class BundleFileResult:
         The projection result for this file.
     iteration_context : dict[str, Any] | None
         Context from iteration (if applicable).
+    unchanged : bool
+        True if the file's inputs matched the bundle manifest, so the
+        result holds the content already on disk instead of a new render.
 
     Examples
     --------
@@ -155,6 +158,7 @@ class BundleFileResult:
     output_path: str
     result: ProjectionResult
     iteration_context: dict[str, Any] | None = None
+    unchanged: bool = False
 
 
 @dataclass(frozen=True)
@@ -171,6 +175,8 @@ class BundleResult:
         Total time to render all files.
     dry_run : bool
         Whether this was a dry run (no files written).
+    written_paths : tuple[str, ...]
+        Output paths whose content was written to disk by this run.
 
     Examples
     --------
@@ -183,6 +189,7 @@ class BundleResult:
     files: tuple[BundleFileResult, ...]
     total_render_time_ms: float
     dry_run: bool = False
+    written_paths: tuple[str, ...] = ()
 
     @property
     def file_count(self) -> int:
@@ -11,12 +11,15 @@ context_builder
     SPARQL query execution and context mapping
 projection_engine
     Main orchestrator coordinating the full pipeline
+template_cache
+    Compiled template cache shared across renders
 
 Examples
 --------
 >>> from kgcl.projection.engine import parse_template_file, ContextBuilder, ProjectionEngine
 """
 
+from kgcl.projection.engine.bundle_manifest import BundleManifest
 from kgcl.projection.engine.bundle_renderer import BundleRenderer
 from kgcl.projection.engine.context_builder import ContextBuilder, QueryContext
 from kgcl.projection.engine.frontmatter_parser import (
@@ -27,6 +30,8 @@ from kgcl.projection.engine.frontmatter_parser import (
     validate_frontmatter,
 )
 from kgcl.projection.engine.projection_engine import ProjectionConfig, ProjectionEngine, TemplateRegistry
+from kgcl.projection.engine.query_cache import QueryCache
+from kgcl.projection.engine.template_cache import TemplateCache
 
 __all__ = [
     # Frontmatter parser
@@ -42,6 +47,10 @@ __all__ = [
     "ProjectionEngine",
     "ProjectionConfig",
     "TemplateRegistry",
+    # Caches
+    "QueryCache",
+    "TemplateCache",
     # Bundle renderer
+    "BundleManifest",
     "BundleRenderer",
 ]
@@ -0,0 +1,239 @@
+"""Bundle manifest - Input fingerprints of written bundle files.
+
+Re-rendering a large bundle after a small graph change should only touch
+the files whose inputs changed. The BundleManifest, stored next to the
+bundle's output, records for every file it wrote:
+
+- ``inputs``: fingerprint of the template, its query results and params
+- ``digest``: SHA-256 of the written content
+- ``size`` and ``mtime_ns``: the file's stat after writing, used to notice
+  files edited or removed outside the renderer
+
+One manifest file serves every bundle rendered into a directory; entries
+are grouped by bundle id.
+
+Examples
+--------
+>>> import tempfile
+>>> from pathlib import Path
+>>> with tempfile.TemporaryDirectory() as tmp:
+...     out = Path(tmp)
+...     atomic_write_bytes(out / "a.txt", b"hello")
+...     manifest = BundleManifest.load(out, "demo")
+...     manifest.record("a.txt", fingerprint("inputs"), b"hello")
+...     manifest.save()
+...     BundleManifest.load(out, "demo").owns("a.txt")
+True
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+__all__ = ["MANIFEST_NAME", "BundleManifest", "ManifestEntry", "atomic_write_bytes", "fingerprint"]
+
+MANIFEST_NAME = ".kgcl-bundle-manifest.json"
+"""File name of the manifest inside a bundle's output directory."""
+
+_FORMAT_VERSION = 1
+
+
+def fingerprint(*parts: Any) -> str:
+    """Hash JSON-serializable parts into a stable hex digest.
+
+    Values JSON cannot encode are hashed by ``str()``; dict keys are sorted.
+
+    Parameters
+    ----------
+    *parts : Any
+        Values the fingerprint depends on.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest.
+
+    Examples
+    --------
+    >>> fingerprint({"b": 1, "a": 2}) == fingerprint({"a": 2, "b": 1})
+    True
+    >>> fingerprint("x") == fingerprint("y")
+    False
+    """
+    encoded = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file so readers see either the old or the new content.
+
+    The data goes to a temporary file in the same directory, which then
+    replaces ``path``. Parent directories are created as needed.
+
+    Parameters
+    ----------
+    path : Path
+        Destination file.
+    data : bytes
+        Complete new content.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Record of one written bundle file.
+
+    Parameters
+    ----------
+    inputs : str
+        Fingerprint of everything the content was rendered from.
+    digest : str
+        SHA-256 hex digest of the written content.
+    size : int
+        File size after writing.
+    mtime_ns : int
+        File modification time after writing.
+    """
+
+    inputs: str
+    digest: str
+    size: int
+    mtime_ns: int
+
+    def matches_file(self, path: Path) -> bool:
+        """Check that the file still has the size and mtime it was written with."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+
+class BundleManifest:
+    """Manifest entries of one bundle in an output directory.
+
+    Parameters
+    ----------
+    output_dir : Path
+        Directory the bundle is written to.
+    bundle_id : str
+        Bundle whose entries this manifest holds.
+    entries : dict[str, ManifestEntry] | None
+        Entries by output path relative to ``output_dir``.
+    """
+
+    def __init__(self, output_dir: Path, bundle_id: str, entries: dict[str, ManifestEntry] | None = None) -> None:
+        """Initialize a manifest with existing entries."""
+        self.output_dir = output_dir
+        self.bundle_id = bundle_id
+        self.entries = entries if entries is not None else {}
+
+    @property
+    def path(self) -> Path:
+        """Location of the manifest file."""
+        return self.output_dir / MANIFEST_NAME
+
+    @classmethod
+    def load(cls, output_dir: Path, bundle_id: str) -> BundleManifest:
+        """Read a bundle's entries; a missing or unreadable manifest yields none.
+
+        Parameters
+        ----------
+        output_dir : Path
+            Directory the bundle is written to.
+        bundle_id : str
+            Bundle to load entries for.
+
+        Returns
+        -------
+        BundleManifest
+            Manifest with the bundle's recorded entries.
+        """
+        bundles = cls._read_bundles(output_dir / MANIFEST_NAME)
+        entries: dict[str, ManifestEntry] = {}
+        for output_path, fields in bundles.get(bundle_id, {}).items():
+            try:
+                entries[output_path] = ManifestEntry(*fields)
+            except TypeError:
+                continue
+        return cls(output_dir, bundle_id, entries)
+
+    def owns(self, output_path: str) -> bool:
+        """Check whether a file is exactly as this manifest last wrote it.
+
+        Parameters
+        ----------
+        output_path : str
+            Path relative to the output directory.
+
+        Returns
+        -------
+        bool
+            True if the file is recorded and its size and mtime match.
+        """
+        entry = self.entries.get(output_path)
+        return entry is not None and entry.matches_file(self.output_dir / output_path)
+
+    def record(self, output_path: str, inputs: str, content: bytes) -> None:
+        """Record a file whose current content is ``content``.
+
+        Parameters
+        ----------
+        output_path : str
+            Path relative to the output directory.
+        inputs : str
+            Fingerprint of the content's inputs.
+        content : bytes
+            Content now on disk.
+        """
+        stat = (self.output_dir / output_path).stat()
+        digest = hashlib.sha256(content).hexdigest()
+        self.entries[output_path] = ManifestEntry(inputs, digest, stat.st_size, stat.st_mtime_ns)
+
+    def forget(self, output_path: str) -> None:
+        """Drop the entry for a file, if any."""
+        self.entries.pop(output_path, None)
+
+    def retain(self, output_paths: set[str]) -> None:
+        """Drop entries for files the bundle no longer produces.
+
+        The files themselves are left on disk.
+        """
+        self.entries = {path: entry for path, entry in self.entries.items() if path in output_paths}
+
+    def save(self) -> None:
+        """Atomically write the manifest, keeping other bundles' entries."""
+        bundles = self._read_bundles(self.path)
+        bundles[self.bundle_id] = {
+            path: [entry.inputs, entry.digest, entry.size, entry.mtime_ns]
+            for path, entry in sorted(self.entries.items())
+        }
+        document = {"version": _FORMAT_VERSION, "bundles": bundles}
+        atomic_write_bytes(self.path, json.dumps(document, indent=1, sort_keys=True).encode("utf-8"))
+
+    @staticmethod
+    def _read_bundles(path: Path) -> dict[str, Any]:
+        """Return the per-bundle entry tables of a manifest file, or none."""
+        try:
+            document = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(document, dict) or document.get("version") != _FORMAT_VERSION:
+            return {}
+        bundles = document.get("bundles")
+        return bundles if isinstance(bundles, dict) else {}
@@ -3,6 +3,11 @@
 This module provides bundle rendering that generates multiple files from
 a single projection run, with support for iterating over query results.
 
+Entries and iterations render in parallel. When writing to disk, a
+BundleManifest of input fingerprints lets unchanged outputs skip
+rendering, and files are replaced atomically and only if their content
+changed.
+
 Examples
 --------
 >>> from kgcl.projection.engine.projection_engine import ProjectionEngine
@@ -15,7 +20,10 @@ Examples
 
 from __future__ import annotations
 
+import hashlib
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -23,15 +31,36 @@ from jinja2 import Environment
 
 from kgcl.projection.domain.bundle import ConflictMode
 from kgcl.projection.domain.exceptions import ResourceLimitExceeded
-from kgcl.projection.domain.result import BundleFileResult, BundleResult
+from kgcl.projection.domain.result import BundleFileResult, BundleResult, ProjectionResult
+from kgcl.projection.engine.bundle_manifest import BundleManifest, atomic_write_bytes, fingerprint
+from kgcl.projection.engine.context_builder import ContextBuilder
+from kgcl.projection.engine.template_cache import TemplateCache
 from kgcl.projection.sandbox import create_projection_environment
 
 if TYPE_CHECKING:
     from kgcl.projection.domain.bundle import BundleDescriptor, BundleTemplateEntry
+    from kgcl.projection.domain.descriptors import TemplateDescriptor
+    from kgcl.projection.engine.query_cache import QueryCache
 
 __all__ = ["BundleRenderer"]
 
 
+@dataclass(frozen=True)
+class _RenderJob:
+    """One output file of a bundle: a template, its params and its path.
+
+    ``inputs`` fingerprints everything the content depends on, or is None
+    when that is unknown and the file must always be rendered.
+    """
+
+    entry: BundleTemplateEntry
+    descriptor: TemplateDescriptor
+    params: dict[str, Any]
+    output_path: str
+    iteration_context: dict[str, Any] | None
+    inputs: str | None
+
+
 class BundleRenderer:
     """Renders multi-file bundles with iteration support.
 
@@ -39,12 +68,25 @@ class BundleRenderer:
     handling file path resolution, iteration over query results,
     and conflict detection.
 
+    A file's inputs are its template, the results of the template's
+    queries and its params. When they match the manifest in the output
+    directory and the file is as last written, the file is neither
+    rendered nor written. Templates with N3 rules are always rendered,
+    because rule files are read at execution time.
+
     Parameters
     ----------
     projection_engine : ProjectionEngine
         Engine for rendering individual templates.
     output_jinja_env : Environment | None
         Jinja environment for output path templates (uses sandboxed if None).
+    max_iteration : int | None
+        Maximum iterations per bundle entry. If None, no limit.
+    max_workers : int | None
+        Threads rendering files in parallel (default: the executor's
+        default; 1 renders sequentially).
+    incremental : bool
+        Skip outputs whose inputs are unchanged (default: True).
 
     Examples
     --------
@@ -62,6 +104,8 @@ class BundleRenderer:
         projection_engine: Any,  # ProjectionEngine from projection_engine module
         output_jinja_env: Environment | None = None,
         max_iteration: int | None = None,
+        max_workers: int | None = None,
+        incremental: bool = True,
     ) -> None:
         """Initialize bundle renderer.
 
@@ -73,11 +117,18 @@ class BundleRenderer:
             Environment for output path templates.
         max_iteration : int | None
             Maximum iterations per bundle entry. If None, no limit.
+        max_workers : int | None
+            Threads rendering files in parallel; 1 renders sequentially.
+        incremental : bool
+            Skip outputs whose inputs match the output directory's manifest.
         """
         self._projection_engine = projection_engine
         self._template_registry: TemplateRegistry = projection_engine.template_registry  # type: ignore[assignment]
         self._output_env = output_jinja_env or create_projection_environment()
+        self._output_templates = TemplateCache(self._output_env)
         self._max_iteration = max_iteration
+        self._max_workers = max_workers
+        self._incremental = incremental
 
     def render_bundle(
         self,
@@ -105,7 +156,8 @@ class BundleRenderer:
         Returns
         -------
         BundleResult
-            Result containing all generated files.
+            Result containing all generated files; ``written_paths`` lists
+            the files whose content changed on disk.
 
         Raises
         ------
@@ -145,59 +197,59 @@ class BundleRenderer:
         """
         start_time = time.perf_counter()
         user_params = params or {}
-        all_files: list[BundleFileResult] = []
+        writing = not dry_run and output_dir is not None
+        manifest = None
+        if writing and self._incremental and output_dir is not None:
+            manifest = BundleManifest.load(output_dir, bundle.id)
+
+        # Identical queries across the bundle's templates execute once
+        query_cache = self._projection_engine.query_cache.scope()
+
+        # One job per output file; fingerprints only matter with a manifest
+        jobs = [
+            job
+            for entry in bundle.templates
+            for job in self._plan_entry(entry, user_params, query_cache, fingerprints=manifest is not None)
+        ]
 
-        # Render each template entry
-        for entry in bundle.templates:
-            file_results = self._render_entry(entry, user_params)
-            all_files.extend(file_results)
+        # Check for conflicts before rendering anything
+        self._check_conflicts([job.output_path for job in jobs], conflict_mode)
 
-        # Check for conflicts
-        self._check_conflicts(all_files, conflict_mode)
+        files = self._render_jobs(jobs, query_cache, manifest)
 
-        # Write files if not dry run
-        if not dry_run and output_dir is not None:
-            self._write_files(all_files, output_dir, conflict_mode)
+        written: tuple[str, ...] = ()
+        if writing and output_dir is not None:
+            written = self._write_files(files, jobs, output_dir, conflict_mode, manifest)
 
         elapsed_ms = (time.perf_counter() - start_time) * 1000.0
         return BundleResult(
-            bundle_id=bundle.id, files=tuple(all_files), total_render_time_ms=elapsed_ms, dry_run=dry_run
+            bundle_id=bundle.id,
+            files=tuple(files),
+            total_render_time_ms=elapsed_ms,
+            dry_run=dry_run,
+            written_paths=written,
         )
 
-    def _render_entry(self, entry: BundleTemplateEntry, params: dict[str, Any]) -> list[BundleFileResult]:
-        """Render a single bundle template entry.
+    def _plan_entry(
+        self, entry: BundleTemplateEntry, params: dict[str, Any], query_cache: QueryCache, *, fingerprints: bool
+    ) -> list[_RenderJob]:
+        """Expand a bundle entry into one job per output file.
 
         Parameters
         ----------
         entry : BundleTemplateEntry
-            Entry to render.
+            Entry to expand.
         params : dict[str, Any]
             User parameters.
+        query_cache : QueryCache
+            Query cache scoped to the bundle render.
+        fingerprints : bool
+            Run the template's queries now to fingerprint each job's inputs.
 
         Returns
         -------
-        list[BundleFileResult]
-            One or more file results (multiple if iteration).
-        """
-        if entry.has_iteration:
-            return self._render_with_iteration(entry, params)
-        else:
-            return self._render_single(entry, params)
-
-    def _render_single(self, entry: BundleTemplateEntry, params: dict[str, Any]) -> list[BundleFileResult]:
-        """Render entry without iteration.
-
-        Parameters
-        ----------
-        entry : BundleTemplateEntry
-            Entry to render.
-        params : dict[str, Any]
-            Parameters.
-
-        Returns
-        -------
-        list[BundleFileResult]
-            Single file result.
+        list[_RenderJob]
+            One job, or one per iteration row.
         """
         # Load template descriptor
         descriptor = self._template_registry.get(entry.template)
@@ -205,68 +257,120 @@ class BundleRenderer:
             msg = f"Template not found: {entry.template}"
             raise ValueError(msg)
 
-        # Render template using descriptor's ontology
-        projection_result = self._projection_engine.render(entry.template, params)
-
-        # Resolve output path
-        output_path = self._resolve_output_path(entry.output, params)
-
-        return [BundleFileResult(output_path=output_path, result=projection_result, iteration_context=None)]
-
-    def _render_with_iteration(self, entry: BundleTemplateEntry, params: dict[str, Any]) -> list[BundleFileResult]:
-        """Render entry with iteration over query results.
-
-        Parameters
-        ----------
-        entry : BundleTemplateEntry
-            Entry with iteration spec.
-        params : dict[str, Any]
-            Parameters.
+        graph_id = descriptor.ontology.graph_id
+        graph_client = self._projection_engine.graph_clients.get(graph_id)
+        template_inputs = None
+        if fingerprints and graph_client is not None and not descriptor.n3_rules:
+            # The render reuses these results through the query cache
+            results = ContextBuilder(graph_client, query_cache=query_cache).execute_queries(descriptor.queries)
+            template_inputs = fingerprint(
+                descriptor.id, descriptor.version, descriptor.language, descriptor.raw_content, results
+            )
 
-        Returns
-        -------
-        list[BundleFileResult]
-            File result per iteration.
-        """
         if entry.iterate is None:
-            return []
-
-        # Load template to get ontology config
-        descriptor = self._template_registry.get(entry.template)
-        if descriptor is None:
-            msg = f"Template not found: {entry.template}"
-            raise ValueError(msg)
+            return [self._job(entry, descriptor, params, None, template_inputs)]
 
         # Execute iteration query against the template's graph
-        graph_id = descriptor.ontology.graph_id
-        graph_client = self._projection_engine.graph_clients.get(graph_id)
         if graph_client is None:
             msg = f"Graph not found: {graph_id}"
             raise ValueError(msg)
 
-        iteration_results = graph_client.query(entry.iterate.query)
+        iteration_results = query_cache.execute(graph_client, entry.iterate.query, graph_client.query)
 
         # Check iteration limit
         if self._max_iteration is not None and len(iteration_results) > self._max_iteration:
             raise ResourceLimitExceeded(f"iterations:{entry.template}", self._max_iteration, len(iteration_results))
 
-        files: list[BundleFileResult] = []
-        for row in iteration_results:
-            # Build context for this iteration
-            iter_context = {entry.iterate.as_var: row}
-            merged_params = {**params, **iter_context}
+        return [
+            self._job(
+                entry, descriptor, {**params, entry.iterate.as_var: row}, {entry.iterate.as_var: row}, template_inputs
+            )
+            for row in iteration_results
+        ]
+
+    def _job(
+        self,
+        entry: BundleTemplateEntry,
+        descriptor: TemplateDescriptor,
+        params: dict[str, Any],
+        iteration_context: dict[str, Any] | None,
+        template_inputs: str | None,
+    ) -> _RenderJob:
+        """Resolve a job's output path and fingerprint its params."""
+        output_path = self._resolve_output_path(entry.output, params)
+        inputs = fingerprint(template_inputs, output_path, params) if template_inputs is not None else None
+        return _RenderJob(entry, descriptor, params, output_path, iteration_context, inputs)
+
+    def _render_jobs(
+        self, jobs: list[_RenderJob], query_cache: QueryCache, manifest: BundleManifest | None
+    ) -> list[BundleFileResult]:
+        """Render jobs in parallel, reusing files whose inputs are unchanged.
+
+        Parameters
+        ----------
+        jobs : list[_RenderJob]
+            Jobs in bundle order.
+        query_cache : QueryCache
+            Query cache scoped to the bundle render.
+        manifest : BundleManifest | None
+            Manifest of the output directory, if rendering incrementally.
 
-            # Render template with iteration context
-            projection_result = self._projection_engine.render(entry.template, merged_params)
+        Returns
+        -------
+        list[BundleFileResult]
+            File results in job order.
+        """
+        reused = [manifest is not None and self._is_unchanged(job, manifest) for job in jobs]
+        pending = [index for index, unchanged in enumerate(reused) if not unchanged]
 
-            # Resolve output path with iteration context
-            output_path = self._resolve_output_path(entry.output, merged_params)
+        def render(index: int) -> ProjectionResult:
+            job = jobs[index]
+            return self._projection_engine.render(job.entry.template, job.params, query_cache=query_cache)
 
-            files.append(
-                BundleFileResult(output_path=output_path, result=projection_result, iteration_context=iter_context)
+        if self._max_workers == 1 or len(pending) < 2:
+            rendered = [render(index) for index in pending]
+        else:
+            # A dedicated pool: renders block on queries running in the shared query pool
+            with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="kgcl-bundle") as pool:
+                rendered = list(pool.map(render, pending))
+        results = dict(zip(pending, rendered, strict=True))
+
+        return [
+            BundleFileResult(
+                output_path=job.output_path,
+                result=self._reuse_output(job, manifest.output_dir) if manifest and reused[index] else results[index],
+                iteration_context=job.iteration_context,
+                unchanged=reused[index],
             )
+            for index, job in enumerate(jobs)
+        ]
+
+    @staticmethod
+    def _is_unchanged(job: _RenderJob, manifest: BundleManifest) -> bool:
+        """Check whether a job's file was written from the same inputs and not modified since."""
+        entry = manifest.entries.get(job.output_path)
+        return (
+            job.inputs is not None
+            and entry is not None
+            and entry.inputs == job.inputs
+            and manifest.owns(job.output_path)
+        )
 
-        return files
+    def _reuse_output(self, job: _RenderJob, output_dir: Path) -> ProjectionResult:
+        """Build a job's result from the file already on disk."""
+        descriptor = job.descriptor
+        return ProjectionResult(
+            template_id=descriptor.id,
+            version=descriptor.version,
+            content=(output_dir / job.output_path).read_text(encoding="utf-8"),
+            media_type=self._projection_engine._infer_media_type(descriptor.language),
+            context_info={
+                "query_count": len(descriptor.queries),
+                "n3_rule_count": 0,
+                "render_time_ms": 0.0,
+                "graph_id": descriptor.ontology.graph_id,
+            },
+        )
 
     def _resolve_output_path(self, output_template: str, context: dict[str, Any]) -> str:
         """Resolve output path from template.
@@ -297,19 +401,19 @@ class BundleRenderer:
             # Dynamic path - render with Jinja
             # Wrap context in params to match projection engine pattern
             render_context = {"params": context}
-            template = self._output_env.from_string(output_template)
+            template = self._output_templates.get(output_template, output_template)
             return template.render(**render_context)
         else:
             # Static path
             return output_template
 
-    def _check_conflicts(self, files: list[BundleFileResult], conflict_mode: ConflictMode) -> None:
+    def _check_conflicts(self, output_paths: list[str], conflict_mode: ConflictMode) -> None:
         """Check for output path conflicts.
 
         Parameters
         ----------
-        files : list[BundleFileResult]
-            Files to check.
+        output_paths : list[str]
+            Output paths of all files in the bundle.
         conflict_mode : ConflictMode
             How to handle conflicts.
 
@@ -320,38 +424,82 @@ class BundleRenderer:
         """
         if conflict_mode == ConflictMode.ERROR:
             paths_seen: set[str] = set()
-            for file_result in files:
-                if file_result.output_path in paths_seen:
-                    msg = f"Output path conflict: {file_result.output_path}"
+            for output_path in output_paths:
+                if output_path in paths_seen:
+                    msg = f"Output path conflict: {output_path}"
                     raise ValueError(msg)
-                paths_seen.add(file_result.output_path)
+                paths_seen.add(output_path)
 
-    def _write_files(self, files: list[BundleFileResult], output_dir: Path, conflict_mode: ConflictMode) -> None:
-        """Write files to disk.
+    def _write_files(
+        self,
+        files: list[BundleFileResult],
+        jobs: list[_RenderJob],
+        output_dir: Path,
+        conflict_mode: ConflictMode,
+        manifest: BundleManifest | None,
+    ) -> tuple[str, ...]:
+        """Write changed files to disk and update the manifest.
+
+        Files the manifest owns (unmodified since this renderer wrote them)
+        are updated regardless of ``conflict_mode``; other existing files
+        follow it. Each file is replaced atomically, and only if its
+        content differs.
 
         Parameters
         ----------
         files : list[BundleFileResult]
-            Files to write.
+            Files to write, in job order.
+        jobs : list[_RenderJob]
+            The jobs that produced ``files``.
         output_dir : Path
             Base output directory.
         conflict_mode : ConflictMode
             How to handle existing files.
-        """
-        for file_result in files:
-            output_path = output_dir / file_result.output_path
+        manifest : BundleManifest | None
+            Manifest to update, if rendering incrementally.
 
-            # Check if file exists
-            if output_path.exists():
-                if conflict_mode == ConflictMode.SKIP:
+        Returns
+        -------
+        tuple[str, ...]
+            Output paths whose content was written.
+        """
+        written: list[str] = []
+        try:
+            for file_result, job in zip(files, jobs, strict=True):
+                if file_result.unchanged:
                     continue
-                elif conflict_mode == ConflictMode.ERROR:
-                    msg = f"File already exists: {output_path}"
-                    raise ValueError(msg)
-                # OVERWRITE mode - continue to write
-
-            # Ensure parent directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write content
-            output_path.write_text(file_result.result.content, encoding="utf-8")
+                relative = file_result.output_path
+                output_path = output_dir / relative
+                content = file_result.result.content.encode("utf-8")
+                owned = manifest is not None and manifest.owns(relative)
+
+                # Check if file exists
+                if not owned and output_path.exists():
+                    if conflict_mode == ConflictMode.SKIP:
+                        continue
+                    elif conflict_mode == ConflictMode.ERROR:
+                        msg = f"File already exists: {output_path}"
+                        raise ValueError(msg)
+                    # OVERWRITE mode - continue to write
+
+                if not self._same_content(output_path, content, manifest.entries[relative].digest if owned else None):
+                    atomic_write_bytes(output_path, content)
+                    written.append(relative)
+                if manifest is not None:
+                    # Files without a fingerprint are recorded as owned but never match
+                    manifest.record(relative, job.inputs or "", content)
+        finally:
+            if manifest is not None:
+                manifest.retain({job.output_path for job in jobs})
+                manifest.save()
+        return tuple(written)
+
+    @staticmethod
+    def _same_content(path: Path, content: bytes, recorded_digest: str | None) -> bool:
+        """Check whether a file already holds ``content``, trusting a recorded digest if given."""
+        if recorded_digest is not None:
+            return hashlib.sha256(content).hexdigest() == recorded_digest
+        try:
+            return path.read_bytes() == content
+        except OSError:
+            return False
@@ -31,12 +31,17 @@ Examples
 
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from kgcl.projection.domain.descriptors import QueryDescriptor
 from kgcl.projection.domain.exceptions import QueryExecutionError, QueryTimeoutError, ResourceLimitExceeded
-from kgcl.projection.engine.timeout_executor import execute_with_timeout
+from kgcl.projection.engine.query_cache import QueryCache
+from kgcl.projection.engine.timeout_executor import execute_with_timeout, get_timeout_executor, on_timeout_executor
 from kgcl.projection.ports.graph_client import GraphClient
 
 __all__ = ["QueryContext", "ContextBuilder"]
@@ -69,7 +74,9 @@ class ContextBuilder:
 
     The ContextBuilder executes QueryDescriptor instances against a
     GraphClient and constructs the context dictionary used for
-    template rendering.
+    template rendering. Independent queries of one batch can run
+    concurrently, and a QueryCache lets identical queries share a
+    single execution.
 
     Parameters
     ----------
@@ -101,6 +108,8 @@ class ContextBuilder:
         graph_client: GraphClient,
         max_query_results: int | None = None,
         query_timeout_seconds: float | None = None,
+        query_cache: QueryCache | None = None,
+        concurrent: bool = False,
     ) -> None:
         """Initialize context builder with graph client.
 
@@ -112,10 +121,19 @@ class ContextBuilder:
             Maximum number of results per query. If None, no limit.
         query_timeout_seconds : float | None
             Maximum query execution time in seconds. If None, no timeout.
+        query_cache : QueryCache | None
+            Cache consulted before executing a query. If None, every query
+            runs against the client.
+        concurrent : bool
+            Run a batch's queries in parallel on the shared query pool
+            (default: False). The client must then be safe to call from
+            several threads.
         """
         self.graph_client = graph_client
         self._max_query_results = max_query_results
         self._query_timeout_seconds = query_timeout_seconds
+        self._query_cache = query_cache
+        self._concurrent = concurrent
 
     def execute_queries(self, queries: tuple[QueryDescriptor, ...]) -> dict[str, list[dict[str, Any]]]:
         """Execute all queries and return results mapping.
@@ -134,6 +152,10 @@ class ContextBuilder:
         ------
         QueryExecutionError
             If any query execution fails.
+        QueryTimeoutError
+            If a query exceeds the timeout.
+        ResourceLimitExceeded
+            If a query returns more than ``max_query_results`` bindings.
 
         Examples
         --------
@@ -164,36 +186,69 @@ class ContextBuilder:
         >>> len(results["entities"])
         2
         """
-        results: dict[str, list[dict[str, Any]]] = {}
+        nested = on_timeout_executor()
+        if self._concurrent and len(queries) > 1 and not nested:
+            return self._execute_concurrently(queries)
 
+        results: dict[str, list[dict[str, Any]]] = {}
         for query in queries:
-            try:
-                # Execute query with optional timeout
-                if self._query_timeout_seconds is not None:
-                    bindings = execute_with_timeout(
-                        lambda q=query.content: self.graph_client.query(q), self._query_timeout_seconds, query.name
-                    )
-                else:
-                    bindings = self.graph_client.query(query.content)
-
-                # Convert to list of dicts with Any values
-                result_list = [dict(binding) for binding in bindings]
-
-                # Check result limit
-                if self._max_query_results is not None and len(result_list) > self._max_query_results:
-                    raise ResourceLimitExceeded(
-                        f"query_results:{query.name}", self._max_query_results, len(result_list)
-                    )
-
-                results[query.name] = result_list
-            except (ResourceLimitExceeded, QueryTimeoutError):
-                raise
-            except Exception as e:
-                msg = str(e)
-                raise QueryExecutionError(query.name, query.content, msg) from e
+            # Already on a pool thread: submitting nested work to the same
+            # pool could starve it, so run the query inline.
+            if self._query_timeout_seconds is not None and not nested:
+                timeout = self._query_timeout_seconds
+                obtain = partial(execute_with_timeout, partial(self._fetch, query.content), timeout, query.name)
+            else:
+                obtain = partial(self._fetch, query.content)
+            results[query.name] = self._collect(query, obtain)
+        return results
+
+    def _execute_concurrently(self, queries: tuple[QueryDescriptor, ...]) -> dict[str, list[dict[str, Any]]]:
+        """Run all queries on the shared pool and gather them in declaration order.
 
+        Each query's timeout is measured from submission, so the whole
+        batch takes at most ``query_timeout_seconds`` of wall time. Errors
+        are raised for the first failing query in declaration order.
+        """
+        executor = get_timeout_executor()
+        timeout = self._query_timeout_seconds
+        deadline = None if timeout is None else time.monotonic() + timeout
+        futures = [executor.submit(self._fetch, query.content) for query in queries]
+        results: dict[str, list[dict[str, Any]]] = {}
+        try:
+            for query, future in zip(queries, futures, strict=True):
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                results[query.name] = self._collect(query, partial(future.result, remaining))
+        finally:
+            for future in futures:
+                future.cancel()
         return results
 
+    def _collect(self, query: QueryDescriptor, obtain: Callable[[], list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Obtain one query's bindings, translating failures and checking the result limit."""
+        try:
+            bindings = obtain()
+        except QueryTimeoutError:
+            raise
+        except Exception as e:
+            if isinstance(e, FuturesTimeoutError) and self._query_timeout_seconds is not None:
+                raise QueryTimeoutError(query.name, self._query_timeout_seconds) from e
+            msg = str(e)
+            raise QueryExecutionError(query.name, query.content, msg) from e
+
+        if self._max_query_results is not None and len(bindings) > self._max_query_results:
+            raise ResourceLimitExceeded(f"query_results:{query.name}", self._max_query_results, len(bindings))
+        return bindings
+
+    def _fetch(self, sparql: str) -> list[dict[str, Any]]:
+        """Return a query's bindings, from the query cache when one is configured."""
+        if self._query_cache is None:
+            return self._select(sparql)
+        return self._query_cache.execute(self.graph_client, sparql, self._select)
+
+    def _select(self, sparql: str) -> list[dict[str, Any]]:
+        """Execute a SELECT query and copy its bindings into plain dicts."""
+        return [dict(binding) for binding in self.graph_client.query(sparql)]
+
     def build_context(self, queries: tuple[QueryDescriptor, ...], params: dict[str, Any] | None = None) -> QueryContext:
         """Build complete Jinja context from queries and params.
 
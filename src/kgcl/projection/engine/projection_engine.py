@@ -54,7 +54,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Protocol
 
-from jinja2 import Environment, Template
+from jinja2 import Environment, FileSystemBytecodeCache, Template
 
 from kgcl.projection.domain.descriptors import N3Role, N3RuleDescriptor
 from kgcl.projection.domain.exceptions import (
@@ -66,6 +66,8 @@ from kgcl.projection.domain.exceptions import (
 from kgcl.projection.domain.result import ProjectionResult
 from kgcl.projection.engine.context_builder import ContextBuilder
 from kgcl.projection.engine.n3_executor import N3Executor, N3ExecutorConfig
+from kgcl.projection.engine.query_cache import QueryCache
+from kgcl.projection.engine.template_cache import TemplateCache
 from kgcl.projection.ports.graph_client import GraphClient
 from kgcl.projection.sandbox import create_projection_environment
 
@@ -111,6 +113,16 @@ class ProjectionConfig:
         N3 subprocess memory limit in MB (default: None, no limit).
     n3_enabled : bool
         Whether to execute N3 rules (default: True).
+    template_cache_size : int
+        Maximum number of compiled templates kept in memory (default: 256).
+    bytecode_cache_dir : Path | None
+        Directory for Jinja's bytecode cache, which persists compiled
+        templates across processes (default: None, memory only).
+    query_cache_size : int
+        Maximum number of query results kept in memory (default: 1024).
+    concurrent_queries : bool
+        Run a template's queries in parallel (default: False). Enable only
+        when every graph client is safe to call from several threads.
 
     Examples
     --------
@@ -124,6 +136,24 @@ class ProjectionConfig:
     n3_timeout_seconds: float = 30.0
     n3_max_memory_mb: int | None = None
     n3_enabled: bool = True
+    template_cache_size: int = 256
+    bytecode_cache_dir: Path | None = None
+    query_cache_size: int = 1024
+    concurrent_queries: bool = False
+
+
+_MEDIA_TYPES: dict[str, str] = {
+    "python": "text/x-python",
+    "typescript": "text/typescript",
+    "javascript": "text/javascript",
+    "java": "text/x-java",
+    "rust": "text/x-rust",
+    "yaml": "text/yaml",
+    "json": "application/json",
+    "markdown": "text/markdown",
+    "html": "text/html",
+    "css": "text/css",
+}
 
 
 class ProjectionEngine:
@@ -137,6 +167,12 @@ class ProjectionEngine:
     5. Render template in sandboxed environment
     6. Return ProjectionResult with metadata
 
+    Compiled templates are cached by name and content digest in
+    ``template_cache``, so repeated renders only execute the template.
+    SELECT results of clients that report a store generation are memoized
+    in ``query_cache`` until the generation changes or ``cache_ttl``
+    expires.
+
     Implements μ_proj in A = μ_proj(O).
 
     Parameters
@@ -217,7 +253,21 @@ class ProjectionEngine:
         else:
             self._n3_executor = None
 
-    def render(self, template_name: str, params: dict[str, Any] | None = None) -> ProjectionResult:
+        bytecode_cache = None
+        if self.config.bytecode_cache_dir is not None:
+            self.config.bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(self.config.bytecode_cache_dir))
+        self.template_cache = TemplateCache(self.jinja_env, self.config.template_cache_size, bytecode_cache)
+        self.query_cache = QueryCache(self.config.cache_ttl, self.config.query_cache_size)
+
+        # Registries that reload templates report changes; drop stale compiled code
+        subscribe = getattr(template_registry, "subscribe", None)
+        if callable(subscribe):
+            subscribe(self._on_template_changed)
+
+    def render(
+        self, template_name: str, params: dict[str, Any] | None = None, *, query_cache: QueryCache | None = None
+    ) -> ProjectionResult:
         """Render template with given parameters.
 
         Parameters
@@ -226,6 +276,9 @@ class ProjectionEngine:
             Name or identifier of template to render.
         params : dict[str, Any] | None
             User-provided parameters for template context.
+        query_cache : QueryCache | None
+            Cache for this render's queries, such as a bundle's
+            ``query_cache.scope()`` (default: the engine's ``query_cache``).
 
         Returns
         -------
@@ -301,16 +354,20 @@ class ProjectionEngine:
         n3_results.update(precondition_results)
 
         # Build context from queries
-        builder = ContextBuilder(client)
+        builder = ContextBuilder(
+            client,
+            query_cache=query_cache if query_cache is not None else self.query_cache,
+            concurrent=self.config.concurrent_queries,
+        )
         query_context = builder.build_context(descriptor.queries, params)
 
         # Execute INFERENCE N3 rules (after queries, with query context)
         inference_results = self._execute_n3_rules(descriptor.n3_rules, N3Role.INFERENCE, state_ttl)
         n3_results.update(inference_results)
 
-        # Create Jinja template
+        # Get compiled Jinja template (compiled once per name and content)
         try:
-            template: Template = self.jinja_env.from_string(descriptor.raw_content)
+            template: Template = self.template_cache.get(template_name, descriptor.raw_content)
         except Exception as e:
             msg = f"Failed to parse template: {e}"
             raise TemplateRenderError(template_name, msg) from e
@@ -434,6 +491,15 @@ class ProjectionEngine:
 
         return result
 
+    def _on_template_changed(self, name: str) -> None:
+        """Evict the compiled template for a name the registry invalidated.
+
+        Templates may be rendered by name with or without the ``.j2``
+        extension, so both spellings are evicted.
+        """
+        self.template_cache.invalidate(name)
+        self.template_cache.invalidate(name.removesuffix(".j2"))
+
     def _infer_media_type(self, language: str) -> str | None:
         """Infer MIME type from language field.
 
@@ -453,19 +519,7 @@ class ProjectionEngine:
         >>> engine._infer_media_type("python")
         'text/x-python'
         """
-        mapping: dict[str, str] = {
-            "python": "text/x-python",
-            "typescript": "text/typescript",
-            "javascript": "text/javascript",
-            "java": "text/x-java",
-            "rust": "text/x-rust",
-            "yaml": "text/yaml",
-            "json": "application/json",
-            "markdown": "text/markdown",
-            "html": "text/html",
-            "css": "text/css",
-        }
-        return mapping.get(language.lower())
+        return _MEDIA_TYPES.get(language.lower())
 
     def _get_state_ttl(self, client: GraphClient) -> str:
         """Get graph state as Turtle for N3 reasoning.
@@ -0,0 +1,176 @@
+"""Query cache - SELECT results shared between renders.
+
+Templates in a bundle often declare the same queries, and re-rendering a
+projection repeats every query even when the graph has not changed. The
+QueryCache memoizes SELECT bindings keyed by graph, store generation and
+query text:
+
+- Clients that expose a ``generation`` (see ``VersionedGraphClient``) are
+  memoized until the generation changes or the TTL expires.
+- Clients without one give no way to notice writes, so their results are
+  only shared inside a ``scope()``, which lives for one bundle render.
+
+Concurrent requests for the same key run the query once; the other callers
+wait for its result (single flight).
+
+Examples
+--------
+>>> class Client:
+...     graph_id = "main"
+...     generation = 1
+...     calls = 0
+...
+...     def query(self, sparql: str) -> list[dict[str, object]]:
+...         Client.calls += 1
+...         return [{"n": Client.calls}]
+>>> cache = QueryCache()
+>>> client = Client()
+>>> cache.execute(client, "SELECT ?n", client.query)
+[{'n': 1}]
+>>> cache.execute(client, "SELECT ?n", client.query)
+[{'n': 1}]
+>>> client.generation = 2
+>>> cache.execute(client, "SELECT ?n", client.query)
+[{'n': 2}]
+>>> cache.hits, cache.misses
+(1, 2)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+__all__ = ["QueryCache"]
+
+_Key = tuple[str, Hashable, str]
+
+
+class QueryCache:
+    """Thread-safe, single-flight LRU cache of SELECT bindings.
+
+    Parameters
+    ----------
+    ttl_seconds : float | None
+        Maximum age of an entry. If None, entries live until evicted or
+        their generation changes.
+    max_entries : int
+        Maximum number of cached results (least recently used are evicted).
+
+    Notes
+    -----
+    Cached binding lists are shared between callers and must be treated as
+    read-only. Writes that bypass a client's generation counter (for example
+    updating a store directly) are not seen until the TTL expires.
+    """
+
+    def __init__(self, ttl_seconds: float | None = 300.0, max_entries: int = 1024) -> None:
+        """Initialize an empty cache."""
+        if max_entries < 1:
+            msg = f"max_entries must be positive, got {max_entries}"
+            raise ValueError(msg)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._parent: QueryCache | None = None
+        self._entries: OrderedDict[_Key, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self._inflight: dict[_Key, Future[list[dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return len(self._entries)
+
+    def scope(self) -> QueryCache:
+        """Create a short-lived cache that also memoizes unversioned clients.
+
+        Versioned clients still go through this cache, so their results
+        outlive the scope. Discard the scope when the unit of work (one
+        bundle render) ends.
+
+        Returns
+        -------
+        QueryCache
+            Child cache without a TTL.
+        """
+        child = QueryCache(ttl_seconds=None, max_entries=self.max_entries)
+        child._parent = self
+        return child
+
+    def execute(self, client: Any, sparql: str, run: Callable[[str], list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Return the bindings of a query, running it only on a miss.
+
+        Parameters
+        ----------
+        client : GraphClient
+            Client the query targets; supplies ``graph_id`` and, optionally,
+            ``generation``.
+        sparql : str
+            SELECT query text.
+        run : Callable[[str], list[dict[str, Any]]]
+            Executes the query; called with ``sparql`` on a miss.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Result bindings, possibly shared with other callers.
+
+        Raises
+        ------
+        Exception
+            Whatever ``run`` raises; failures are not cached.
+        """
+        generation = getattr(client, "generation", None)
+        if generation is not None and self._parent is not None:
+            return self._parent.execute(client, sparql, run)
+        if generation is None and self._parent is None:
+            return run(sparql)
+
+        key: _Key = (client.graph_id, generation, sparql)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not self._expired(entry[0]):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            future = self._inflight.get(key)
+            owner = future is None
+            if future is None:
+                future = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not owner:
+            return future.result()
+
+        try:
+            bindings = run(sparql)
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._inflight[key]
+            self._entries[key] = (time.monotonic(), bindings)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        future.set_result(bindings)
+        return bindings
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _expired(self, stored_at: float) -> bool:
+        """Check whether an entry stored at a monotonic time is past its TTL."""
+        return self.ttl_seconds is not None and time.monotonic() - stored_at >= self.ttl_seconds
@@ -0,0 +1,148 @@
+"""Template cache - Compiled Jinja templates reused across renders.
+
+Compiling a template (lexing, parsing and generating Python code) costs far
+more than executing it. The TemplateCache keeps compiled ``Template``
+objects keyed by template name and a digest of the source, so re-rendering
+the same projection only executes the template. Editing a template changes
+its digest and replaces the entry. An optional Jinja ``BytecodeCache``
+persists the generated code across processes.
+
+Examples
+--------
+>>> from kgcl.projection.sandbox import create_projection_environment
+>>> cache = TemplateCache(create_projection_environment())
+>>> first = cache.get("greeting", "Hello {{ name }}")
+>>> first.render(name="Ada")
+'Hello Ada'
+>>> cache.get("greeting", "Hello {{ name }}") is first
+True
+>>> cache.get("greeting", "Hi {{ name }}").render(name="Ada")
+'Hi Ada'
+>>> len(cache), cache.hits, cache.misses
+(1, 1, 2)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from jinja2 import Environment, Template
+
+if TYPE_CHECKING:
+    from jinja2.bccache import BytecodeCache
+
+__all__ = ["TemplateCache"]
+
+
+class TemplateCache:
+    """Thread-safe LRU cache of compiled templates.
+
+    Parameters
+    ----------
+    environment : Environment
+        Jinja environment templates are compiled in.
+    max_size : int
+        Maximum number of cached templates (least recently used are evicted).
+    bytecode_cache : BytecodeCache | None
+        Optional Jinja bytecode cache consulted before compiling; a
+        ``FileSystemBytecodeCache`` shares compiled code between processes.
+
+    Notes
+    -----
+    Entries do not track later changes to the environment's configuration
+    (filters, globals, undefined class); call ``clear`` after reconfiguring.
+    """
+
+    def __init__(
+        self, environment: Environment, max_size: int = 256, bytecode_cache: BytecodeCache | None = None
+    ) -> None:
+        """Initialize an empty cache."""
+        if max_size < 1:
+            msg = f"max_size must be positive, got {max_size}"
+            raise ValueError(msg)
+        self.environment = environment
+        self.max_size = max_size
+        self.bytecode_cache = bytecode_cache
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[str, Template]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Number of cached templates."""
+        return len(self._entries)
+
+    def get(self, name: str, source: str) -> Template:
+        """Return the compiled template for a name and source.
+
+        Parameters
+        ----------
+        name : str
+            Template name; one entry is kept per name.
+        source : str
+            Template source; a different source for the same name recompiles
+            and replaces the entry.
+
+        Returns
+        -------
+        Template
+            Compiled template.
+
+        Raises
+        ------
+        jinja2.TemplateSyntaxError
+            If the source does not compile (nothing is cached).
+        """
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == digest:
+                self._entries.move_to_end(name)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent miss compiles twice at worst
+        template = self._compile(name, source)
+        with self._lock:
+            self._entries[name] = (digest, template)
+            self._entries.move_to_end(name)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return template
+
+    def invalidate(self, name: str) -> None:
+        """Drop the entry for a template name, if any.
+
+        Parameters
+        ----------
+        name : str
+            Template name.
+        """
+        with self._lock:
+            self._entries.pop(name, None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _compile(self, name: str, source: str) -> Template:
+        """Compile a template, going through the bytecode cache if configured."""
+        env = self.environment
+        if self.bytecode_cache is None:
+            return env.from_string(source)
+        # Keyed by environment class too: sandboxed and unsandboxed code differ
+        key = f"{type(env).__module__}.{type(env).__qualname__}:{name}"
+        bucket = self.bytecode_cache.get_bucket(env, key, None, source)
+        code = bucket.code
+        if code is None:
+            code = env.compile(source, name)
+            bucket.code = code
+            self.bytecode_cache.set_bucket(bucket)
+        return env.template_class.from_code(env, code, env.make_globals(None))
@@ -4,6 +4,12 @@ This module provides a thread-based executor for running SPARQL queries
 with configurable timeouts. When a query exceeds the timeout, a
 QueryTimeoutError is raised.
 
+Queries run on one long-lived, process-wide thread pool instead of a pool
+per call, so a timed query costs a task submission rather than a thread
+start and join. A timed-out query cannot be interrupted; it keeps its
+worker until it returns, while the caller gets the error immediately.
+The ContextBuilder also fans a render's queries out over this pool.
+
 Examples
 --------
 >>> from kgcl.projection.engine.timeout_executor import execute_with_timeout
@@ -19,13 +25,117 @@ Examples
 
 from __future__ import annotations
 
+import os
+import threading
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 from kgcl.projection.domain.exceptions import QueryTimeoutError
 
-__all__ = ["execute_with_timeout"]
+__all__ = [
+    "DEFAULT_MAX_WORKERS",
+    "execute_with_timeout",
+    "get_timeout_executor",
+    "on_timeout_executor",
+    "shutdown_timeout_executor",
+]
+
+DEFAULT_MAX_WORKERS = 8
+"""Worker threads of the shared pool created on first use."""
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_worker = threading.local()
+
+
+def _mark_worker() -> None:
+    """Pool initializer: flag the thread as a worker of the shared pool."""
+    _worker.active = True
+
+
+def on_timeout_executor() -> bool:
+    """Check whether the calling thread is a worker of the shared pool.
+
+    Code running on the pool must not block on further tasks submitted to
+    it: with every worker waiting, nothing is left to run them.
+
+    Returns
+    -------
+    bool
+        True inside a pool task.
+
+    Examples
+    --------
+    >>> on_timeout_executor()
+    False
+    >>> get_timeout_executor().submit(on_timeout_executor).result()
+    True
+    """
+    return getattr(_worker, "active", False)
+
+
+def get_timeout_executor(max_workers: int = DEFAULT_MAX_WORKERS) -> ThreadPoolExecutor:
+    """Return the shared executor for timed queries, creating it if needed.
+
+    Parameters
+    ----------
+    max_workers : int
+        Pool size used if the pool has to be created; ignored otherwise.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        Process-wide executor.
+
+    Examples
+    --------
+    >>> get_timeout_executor() is get_timeout_executor()
+    True
+    """
+    global _executor
+    executor = _executor
+    if executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="kgcl-query-timeout", initializer=_mark_worker
+                )
+            executor = _executor
+    return executor
+
+
+def shutdown_timeout_executor(wait: bool = True) -> None:
+    """Shut down the shared executor; the next timed query creates a new one.
+
+    Parameters
+    ----------
+    wait : bool
+        Wait for running queries to finish.
+
+    Examples
+    --------
+    >>> first = get_timeout_executor()
+    >>> shutdown_timeout_executor()
+    >>> get_timeout_executor() is first
+    False
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def _reset_after_fork() -> None:
+    """Forget the parent's pool in a forked child; its threads do not exist there."""
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 def execute_with_timeout[T](func: Callable[[], T], timeout_seconds: float, query_name: str = "unnamed") -> T:
@@ -66,11 +176,10 @@ def execute_with_timeout[T](func: Callable[[], T], timeout_seconds: float, query
         ...
     kgcl.projection.domain.exceptions.QueryTimeoutError: ...
     """
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(func)
-        try:
-            return future.result(timeout=timeout_seconds)
-        except FuturesTimeoutError as e:
-            # Cancel the future (though Python can't truly interrupt threads)
-            future.cancel()
-            raise QueryTimeoutError(query_name, timeout_seconds) from e
+    future = get_timeout_executor().submit(func)
+    try:
+        return future.result(timeout=timeout_seconds)
+    except FuturesTimeoutError as e:
+        # Cancel the future (though Python can't truly interrupt threads)
+        future.cancel()
+        raise QueryTimeoutError(query_name, timeout_seconds) from e
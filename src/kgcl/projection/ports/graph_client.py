@@ -223,6 +223,38 @@ class GraphClient(Protocol):
         ...
 
 
+@runtime_checkable
+class VersionedGraphClient(GraphClient, Protocol):
+    """GraphClient that reports a generation counter for its store.
+
+    The generation must change whenever the data visible to queries changes.
+    The projection engine's query cache keys SELECT results on it, so
+    unchanged stores answer repeated queries from memory.
+
+    Examples
+    --------
+    >>> class C:
+    ...     graph_id = "x"
+    ...     generation = 7
+    ...
+    ...     def query(self, s: str) -> list[dict[str, Any]]:
+    ...         return []
+    ...
+    ...     def ask(self, s: str) -> bool:
+    ...         return False
+    ...
+    ...     def construct(self, s: str) -> str:
+    ...         return ""
+    >>> isinstance(C(), VersionedGraphClient)
+    True
+    """
+
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever the queryable data changes."""
+        ...
+
+
 class GraphRegistry:
     """Registry for managing multiple GraphClient instances.
 
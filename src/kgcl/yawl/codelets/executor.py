@@ -2,11 +2,24 @@
 
 Executes codelets with configurable timeouts to prevent
 runaway automated tasks from blocking workflow execution.
+
+All executions share one long-lived worker pool (bounded by
+``max_workers``), with an optional per-codelet concurrency limit.
+Jobs over the limit wait in a per-codelet lane instead of occupying
+a worker, and a timed-out job that has not started yet is cancelled
+rather than left to run.
 """
 
 from __future__ import annotations
 
 import concurrent.futures
+import heapq
+import itertools
+import multiprocessing
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -15,6 +28,94 @@ from kgcl.yawl.codelets.base import Codelet, CodeletContext, CodeletResult, Code
 from kgcl.yawl.codelets.registry import CodeletRegistry
 
 
+@dataclass(eq=False)
+class _CodeletJob:
+    """A single codelet submission tracked by the executor.
+
+    Parameters
+    ----------
+    key : str
+        Concurrency lane key (codelet name)
+    codelet : Codelet
+        Codelet to execute
+    context : CodeletContext
+        Execution context
+    timeout : float
+        Timeout in seconds
+    use_process : bool
+        Whether to run on the process pool
+    """
+
+    key: str
+    codelet: Codelet
+    context: CodeletContext
+    timeout: float
+    use_process: bool = False
+    outcome: concurrent.futures.Future[CodeletResult] = field(default_factory=concurrent.futures.Future)
+    started: datetime = field(default_factory=datetime.now)
+    inner: concurrent.futures.Future[Any] | None = None
+    running: bool = False
+
+
+class _DeadlineWatcher:
+    """Single background thread firing callbacks at deadlines.
+
+    Used to enforce timeouts of asynchronous executions without
+    spawning a timer thread per call.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, Callable[[], None]]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def watch(self, deadline: float, callback: Callable[[], None]) -> None:
+        """Schedule a callback at a monotonic deadline.
+
+        Parameters
+        ----------
+        deadline : float
+            ``time.monotonic()`` value at which to fire
+        callback : Callable[[], None]
+            Callback to run
+        """
+        with self._condition:
+            if self._closed:
+                return
+            heapq.heappush(self._heap, (deadline, next(self._sequence), callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="codelet-deadlines", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Stop the watcher thread and drop scheduled callbacks."""
+        with self._condition:
+            self._closed = True
+            self._heap.clear()
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    delay = self._heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if self._closed:
+                    return
+                _, _, callback = heapq.heappop(self._heap)
+            callback()
+
+
 @dataclass
 class CodeletExecutor:
     """Executor for codelets with timeout support.
@@ -26,12 +127,76 @@ class CodeletExecutor:
     default_timeout : float
         Default timeout in seconds
     max_workers : int
-        Maximum concurrent executions
+        Maximum concurrent executions (size of the shared pool)
+    max_concurrent_per_codelet : int
+        Maximum concurrent executions of one codelet (0 for no limit)
+    process_codelets : set[str]
+        Names of CPU-bound codelets to run on a process pool; their
+        codelet and context must be picklable
+
+    Examples
+    --------
+    >>> with CodeletExecutor(max_workers=8, max_concurrent_per_codelet=2) as executor:
+    ...     executor.register("echo", EchoCodelet())
+    ...     result = executor.execute("echo", context)
     """
 
     registry: CodeletRegistry = field(default_factory=CodeletRegistry)
     default_timeout: float = 30.0
     max_workers: int = 4
+    max_concurrent_per_codelet: int = 0
+    process_codelets: set[str] = field(default_factory=set)
+
+    _thread_pool: concurrent.futures.ThreadPoolExecutor | None = field(default=None, init=False, repr=False)
+    _process_pool: concurrent.futures.ProcessPoolExecutor | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _lanes: dict[str, deque[_CodeletJob]] = field(default_factory=dict, init=False, repr=False)
+    _lane_running: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _queued: int = field(default=0, init=False, repr=False)
+    _active: int = field(default=0, init=False, repr=False)
+    _watcher: _DeadlineWatcher = field(default_factory=_DeadlineWatcher, init=False, repr=False)
+    _shutdown: bool = field(default=False, init=False, repr=False)
+
+    def __enter__(self) -> CodeletExecutor:
+        """Enter context manager.
+
+        Returns
+        -------
+        CodeletExecutor
+            This executor
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Shut down the executor on context exit."""
+        self.shutdown()
+
+    @property
+    def queue_depth(self) -> int:
+        """Get number of accepted executions not yet running.
+
+        Counts jobs waiting for a per-codelet slot and jobs waiting for
+        a pool worker.
+
+        Returns
+        -------
+        int
+            Queued executions
+        """
+        with self._lock:
+            return self._queued
+
+    @property
+    def active_count(self) -> int:
+        """Get number of executions currently running.
+
+        Returns
+        -------
+        int
+            Running executions
+        """
+        with self._lock:
+            return self._active
 
     def execute(self, codelet_name: str, context: CodeletContext, timeout: float | None = None) -> CodeletResult:
         """Execute a codelet by name with timeout.
@@ -58,7 +223,7 @@ class CodeletExecutor:
             return CodeletResult.failure_result(f"Codelet not found: {codelet_name}")
 
         # Execute with timeout
-        return self._execute_with_timeout(codelet, context, timeout)
+        return self._execute_with_timeout(codelet, context, timeout, key=codelet_name)
 
     def execute_codelet(self, codelet: Codelet, context: CodeletContext, timeout: float | None = None) -> CodeletResult:
         """Execute a codelet instance with timeout.
@@ -80,7 +245,9 @@ class CodeletExecutor:
         timeout = timeout if timeout is not None else self.default_timeout
         return self._execute_with_timeout(codelet, context, timeout)
 
-    def _execute_with_timeout(self, codelet: Codelet, context: CodeletContext, timeout: float) -> CodeletResult:
+    def _execute_with_timeout(
+        self, codelet: Codelet, context: CodeletContext, timeout: float, key: str | None = None
+    ) -> CodeletResult:
         """Execute codelet with timeout.
 
         Parameters
@@ -91,37 +258,29 @@ class CodeletExecutor:
             Execution context
         timeout : float
             Timeout in seconds
+        key : str | None
+            Concurrency lane key (derived from the codelet if None)
 
         Returns
         -------
         CodeletResult
             Execution result
         """
-        started = datetime.now()
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(codelet.execute, context)
-
-            try:
-                result = future.result(timeout=timeout)
-                return result
-
-            except concurrent.futures.TimeoutError:
-                future.cancel()
-                result = CodeletResult.timeout_result(timeout)
-                result.started = started
-                return result
-
-            except Exception as e:
-                result = CodeletResult.error_result(e)
-                result.started = started
-                return result
+        job = self._submit(codelet, context, timeout, key)
+        try:
+            return job.outcome.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            self._expire(job)
+            return job.outcome.result()
 
     def execute_async(
         self, codelet_name: str, context: CodeletContext, callback: Any | None = None
     ) -> concurrent.futures.Future[CodeletResult]:
         """Execute a codelet asynchronously.
 
+        The returned future resolves with a TIMEOUT result once
+        ``default_timeout`` elapses.
+
         Parameters
         ----------
         codelet_name : str
@@ -136,16 +295,253 @@ class CodeletExecutor:
         Future[CodeletResult]
             Future for the result
         """
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        codelet = self.registry.get(codelet_name)
+        if codelet is None:
+            job_outcome: concurrent.futures.Future[CodeletResult] = concurrent.futures.Future()
+            job_outcome.set_result(CodeletResult.failure_result(f"Codelet not found: {codelet_name}"))
+            outcome = job_outcome
+        else:
+            job = self._submit(codelet, context, self.default_timeout, codelet_name)
+            if not job.outcome.done():
+                self._watcher.watch(time.monotonic() + self.default_timeout, lambda: self._expire(job))
+            outcome = job.outcome
+
+        if callback:
+            outcome.add_done_callback(lambda f: callback(f.result()))
+        return outcome
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the shared pools.
+
+        Queued executions are resolved with a failure result and pending
+        pool work is cancelled. Running codelets are allowed to finish
+        when ``wait`` is True.
+
+        Parameters
+        ----------
+        wait : bool
+            Wait for running codelets to finish
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            waiting = [job for lane in self._lanes.values() for job in lane]
+            self._lanes.clear()
+            self._queued -= len(waiting)
+            thread_pool, process_pool = self._thread_pool, self._process_pool
+
+        for job in waiting:
+            self._resolve(job, CodeletResult.failure_result("Codelet executor shut down"))
+
+        self._watcher.close()
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=wait, cancel_futures=True)
+        if process_pool is not None:
+            process_pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _submit(self, codelet: Codelet, context: CodeletContext, timeout: float, key: str | None) -> _CodeletJob:
+        """Accept a job into its lane, starting it if a slot is free.
+
+        Parameters
+        ----------
+        codelet : Codelet
+            Codelet to execute
+        context : CodeletContext
+            Execution context
+        timeout : float
+            Timeout in seconds
+        key : str | None
+            Concurrency lane key
+
+        Returns
+        -------
+        _CodeletJob
+            Tracked job
+        """
+        key = key or getattr(codelet, "name", "") or type(codelet).__name__
+        job = _CodeletJob(
+            key=key, codelet=codelet, context=context, timeout=timeout, use_process=key in self.process_codelets
+        )
+        with self._lock:
+            rejected = self._shutdown
+            start = False
+            if not rejected:
+                self._queued += 1
+                running = self._lane_running.get(key, 0)
+                start = not self.max_concurrent_per_codelet or running < self.max_concurrent_per_codelet
+                if start:
+                    self._lane_running[key] = running + 1
+                else:
+                    self._lanes.setdefault(key, deque()).append(job)
+
+        if rejected:
+            self._resolve(job, CodeletResult.failure_result("Codelet executor shut down"))
+        elif start:
+            self._start(job)
+        return job
+
+    def _start(self, job: _CodeletJob) -> None:
+        """Hand a job to the thread or process pool.
+
+        Parameters
+        ----------
+        job : _CodeletJob
+            Job holding a lane slot
+        """
+        try:
+            if job.use_process:
+                with self._lock:
+                    # The process pool has no start notification; the job
+                    # counts as running once handed over.
+                    self._queued -= 1
+                    self._active += 1
+                    job.running = True
+                job.inner = self._get_process_pool().submit(job.codelet.execute, job.context)
+            else:
+                job.inner = self._get_thread_pool().submit(self._run, job)
+        except RuntimeError as e:
+            # Pool already shut down
+            with self._lock:
+                if job.running:
+                    self._active -= 1
+                else:
+                    self._queued -= 1
+            result = CodeletResult.error_result(e)
+            result.started = job.started
+            self._resolve(job, result)
+            self._release(job)
+            return
+        job.inner.add_done_callback(lambda inner: self._finished(job, inner))
+
+    def _run(self, job: _CodeletJob) -> CodeletResult | None:
+        """Execute a job on a pool thread.
+
+        Parameters
+        ----------
+        job : _CodeletJob
+            Job to run
+
+        Returns
+        -------
+        CodeletResult | None
+            Result, or None if the job expired while queued
+        """
+        with self._lock:
+            self._queued -= 1
+            if job.outcome.done():
+                return None
+            self._active += 1
+            job.running = True
+        return job.codelet.execute(job.context)
+
+    def _finished(self, job: _CodeletJob, inner: concurrent.futures.Future[Any]) -> None:
+        """Record completion of a pool future and start the next waiter.
+
+        Parameters
+        ----------
+        job : _CodeletJob
+            Completed job
+        inner : Future[Any]
+            Pool future
+        """
+        with self._lock:
+            if job.running:
+                self._active -= 1
+            elif inner.cancelled():
+                self._queued -= 1
+
+        if inner.cancelled():
+            self._resolve(job, CodeletResult.failure_result("Codelet execution cancelled"))
+        elif inner.exception() is not None:
+            result = CodeletResult.error_result(inner.exception())
+            result.started = job.started
+            self._resolve(job, result)
+        elif inner.result() is not None:
+            self._resolve(job, inner.result())
+        self._release(job)
+
+    def _release(self, job: _CodeletJob) -> None:
+        """Free a lane slot and start the next waiting job.
+
+        Parameters
+        ----------
+        job : _CodeletJob
+            Job releasing its slot
+        """
+        with self._lock:
+            lane = self._lanes.get(job.key)
+            next_job = lane.popleft() if lane else None
+            if lane is not None and not lane:
+                del self._lanes[job.key]
+            if next_job is None:
+                remaining = self._lane_running.get(job.key, 1) - 1
+                if remaining > 0:
+                    self._lane_running[job.key] = remaining
+                else:
+                    self._lane_running.pop(job.key, None)
+        if next_job is not None:
+            self._start(next_job)
+
+    def _expire(self, job: _CodeletJob) -> None:
+        """Resolve a job as timed out and cancel it if not yet running.
+
+        Parameters
+        ----------
+        job : _CodeletJob
+            Job whose deadline passed
+        """
+        if job.outcome.done():
+            return
 
-        def execute_and_callback() -> CodeletResult:
-            result = self.execute(codelet_name, context)
-            if callback:
-                callback(result)
-            return result
+        with self._lock:
+            lane = self._lanes.get(job.key)
+            dequeued = lane is not None and job in lane
+            if dequeued:
+                lane.remove(job)
+                self._queued -= 1
 
-        future = executor.submit(execute_and_callback)
-        return future
+        result = CodeletResult.timeout_result(job.timeout)
+        result.started = job.started
+        self._resolve(job, result)
+        if job.inner is not None:
+            job.inner.cancel()
+
+    def _resolve(self, job: _CodeletJob, result: CodeletResult) -> None:
+        """Set a job's result unless already resolved.
+
+        Parameters
+        ----------
+        job : _CodeletJob
+            Job to resolve
+        result : CodeletResult
+            Result to publish
+        """
+        try:
+            job.outcome.set_result(result)
+        except concurrent.futures.InvalidStateError:
+            return
+
+    def _get_thread_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Codelet executor shut down")
+            if self._thread_pool is None:
+                self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="codelet"
+                )
+            return self._thread_pool
+
+    def _get_process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Codelet executor shut down")
+            if self._process_pool is None:
+                # Spawn rather than fork: the parent is multi-threaded
+                self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._process_pool
 
     def register(self, name: str, codelet: Codelet) -> None:
         """Register a codelet.
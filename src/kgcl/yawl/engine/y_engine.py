@@ -7,7 +7,7 @@ managing specifications, cases, work items, and resources.
 from __future__ import annotations
 
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum, auto
@@ -46,7 +46,7 @@ from kgcl.yawl.engine.y_case import CaseFactory, CaseStatus, YCase
 from kgcl.yawl.engine.y_net_runner import ExecutionStatus, FireResult, YNetRunner
 from kgcl.yawl.engine.y_timer import TimerAction, TimerTrigger, YTimer, YTimerService
 from kgcl.yawl.engine.y_work_item import WorkItemEvent, WorkItemStatus, YWorkItem
-from kgcl.yawl.resources.y_distribution import DistributionContext, ParticipantMetrics
+from kgcl.yawl.resources.y_distribution import DistributionContext, ParticipantMetrics, ParticipantMetricsMap
 from kgcl.yawl.resources.y_filters import FilterContext, WorkItemHistoryEntry
 from kgcl.yawl.resources.y_resource import YParticipant, YResourceManager
 from kgcl.yawl.state.y_marking import YMarking
@@ -127,13 +127,14 @@ class YEngine:
     distribution_context: DistributionContext = field(
         default_factory=lambda: DistributionContext(task_id="", case_id="")
     )
-    participant_metrics: dict[str, ParticipantMetrics] = field(default_factory=dict)
+    participant_metrics: dict[str, ParticipantMetrics] = field(default_factory=ParticipantMetricsMap)
 
     # Counters
     work_item_counter: int = 0
 
     # Event handling
     event_listeners: list[Callable[[EngineEvent], None]] = field(default_factory=list)
+    _event_buffer: list[EngineEvent] | None = field(default=None, init=False, repr=False)
 
     # Timestamps
     started: datetime | None = None
@@ -389,6 +390,34 @@ class YEngine:
         ValueError
             If specification not found or not active
         """
+        root_net = self._get_launchable_root_net(spec_id)
+        case = self.case_factory.create_case(specification_id=spec_id, root_net_id=root_net.id, case_id=case_id)
+
+        if input_data:
+            case.data.merge_input(input_data)
+
+        self.cases[case.id] = case
+        self._emit_event("CASE_CREATED", case_id=case.id)
+        return case
+
+    def _get_launchable_root_net(self, spec_id: str) -> YNet:
+        """Get the root net of a specification that can launch cases.
+
+        Parameters
+        ----------
+        spec_id : str
+            Specification ID
+
+        Returns
+        -------
+        YNet
+            Root net
+
+        Raises
+        ------
+        ValueError
+            If specification not found, not active or has no root net
+        """
         spec = self.specifications.get(spec_id)
         if spec is None:
             raise ValueError(f"Specification not found: {spec_id}")
@@ -399,15 +428,7 @@ class YEngine:
         root_net = spec.get_root_net()
         if root_net is None:
             raise ValueError(f"No root net in specification: {spec_id}")
-
-        case = self.case_factory.create_case(specification_id=spec_id, root_net_id=root_net.id, case_id=case_id)
-
-        if input_data:
-            case.data.merge_input(input_data)
-
-        self.cases[case.id] = case
-        self._emit_event("CASE_CREATED", case_id=case.id)
-        return case
+        return root_net
 
     def start_case(self, case_id: str, input_data: dict[str, Any] | None = None) -> YCase:
         """Start a case.
@@ -1455,11 +1476,25 @@ class YEngine:
             participant_id=participant_id,
             data=data or {},
         )
-        for listener in self.event_listeners:
-            try:
-                listener(event)
-            except Exception:
-                pass  # Don't let listener errors break the engine
+        if self._event_buffer is not None:
+            self._event_buffer.append(event)
+            return
+        self._dispatch_events([event])
+
+    def _dispatch_events(self, events: list[EngineEvent]) -> None:
+        """Deliver events to all listeners.
+
+        Parameters
+        ----------
+        events : list[EngineEvent]
+            Events in emission order
+        """
+        for event in events:
+            for listener in self.event_listeners:
+                try:
+                    listener(event)
+                except Exception:
+                    pass  # Don't let listener errors break the engine
 
     # --- External client management (Gap 8) ---
 
@@ -2353,6 +2388,90 @@ class YEngine:
                 )
             return case.id
 
+    def launch_cases(
+        self, spec_id: str | YSpecificationID | YSpecification, data_list: Iterable[dict[str, Any] | None]
+    ) -> list[str]:
+        """Launch many cases of one specification.
+
+        Validates the specification and evaluates the root net's initial
+        enablement once, then starts every case from that shared state.
+        Engine events are delivered to listeners after the whole batch,
+        and persisted objects are stored in one transaction.
+
+        If launching a case fails, the cases created so far stay in the
+        engine, as after a loop of ``create_case``/``start_case``: their
+        events are delivered and they are persisted before the exception
+        propagates.
+
+        Parameters
+        ----------
+        spec_id : str | YSpecificationID | YSpecification
+            Specification ID or specification
+        data_list : Iterable[dict[str, Any] | None]
+            Input data for each case to launch
+
+        Returns
+        -------
+        list[str]
+            IDs of the launched cases, in input order
+
+        Raises
+        ------
+        ValueError
+            If specification not found, not active or has no root net
+        """
+        if isinstance(spec_id, YSpecification):
+            spec_key = spec_id.id
+        elif isinstance(spec_id, YSpecificationID):
+            spec_key = spec_id.identifier
+        else:
+            spec_key = spec_id
+        root_net = self._get_launchable_root_net(spec_key)
+
+        prototype = YNetRunner(net=root_net, case_id=f"{spec_key}:prototype")
+        prototype.start()
+        initial_tasks = [(task_id, root_net.tasks[task_id]) for task_id in prototype.get_enabled_tasks()]
+
+        case_ids: list[str] = []
+        stored: list[object] = []
+        events: list[EngineEvent] = []
+        outer_buffer = self._event_buffer
+        self._event_buffer = events
+        try:
+            for input_data in data_list:
+                case = self.case_factory.create_case(specification_id=spec_key, root_net_id=root_net.id)
+                self.cases[case.id] = case
+                stored.append(case)
+                self._emit_event("CASE_CREATED", case_id=case.id)
+
+                runner = YNetRunner(net=root_net, case_id=case.id)
+                self.net_runners[f"{case.id}:{root_net.id}"] = runner
+                case.net_runners[root_net.id] = runner
+                case.start(input_data)
+                runner.start_like(prototype)
+                self._emit_event("CASE_STARTED", case_id=case.id)
+
+                for _, task in initial_tasks:
+                    work_item = self._create_work_item(case, task, root_net.id)
+                    stored.append(work_item)
+                    self._resource_work_item(work_item, task)
+                case_ids.append(case.id)
+        finally:
+            self._event_buffer = outer_buffer
+            if outer_buffer is not None:
+                outer_buffer.extend(events)
+            else:
+                self._dispatch_events(events)
+
+            if self.persisting and stored:
+                owns_transaction = self.startTransaction()
+                for obj in stored:
+                    self.storeObject(obj)
+                if owns_transaction:
+                    self.commitTransaction()
+
+        return case_ids
+
     def logCaseStarted_spec(
         self, spec: YSpecification, runner: YNetRunner, case_params: str, log_data: YLogDataItemList
     ) -> None:
@@ -222,6 +222,40 @@ class YNetRunner:
 
         return token
 
+    def start_like(self, prototype: YNetRunner) -> YIdentifier:
+        """Start case by copying the initial state of a started runner.
+
+        Every case of a net starts from the same marking, so bulk
+        launches evaluate task enablement once on a prototype runner
+        and copy the result instead of re-checking every join.
+
+        Parameters
+        ----------
+        prototype : YNetRunner
+            Runner for the same net, started and not yet fired
+
+        Returns
+        -------
+        YIdentifier
+            The initial token placed at input condition
+
+        Raises
+        ------
+        ValueError
+            If the prototype runs a different net or has advanced past start
+        """
+        if prototype.net is not self.net or prototype._token_counter != 1:
+            raise ValueError("Prototype must be a freshly started runner for the same net")
+
+        input_id = self.net.input_condition.id  # type: ignore[union-attr]
+        token = YIdentifier(id=f"{self.case_id}-{self._token_counter}")
+        token.location = input_id
+        self.tokens[token.id] = token
+        self.marking.add_token(input_id, token.id)
+        self._token_counter += 1
+        self.enabled_tasks.update(prototype.enabled_tasks)
+        return token
+
     def get_enabled_tasks(self) -> list[str]:
         """Get IDs of all enabled tasks.
 
@@ -190,6 +190,47 @@ class WorkItemLog:
     data: dict[str, Any] = field(default_factory=dict)
 
 
+# Valid state transitions, shared by all work items
+_WORK_ITEM_TRANSITIONS: dict[tuple[WorkItemStatus, WorkItemEvent], WorkItemStatus] = {
+    # From ENABLED
+    (WorkItemStatus.ENABLED, WorkItemEvent.FIRE): WorkItemStatus.FIRED,
+    (WorkItemStatus.ENABLED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
+    (WorkItemStatus.ENABLED, WorkItemEvent.SKIP): WorkItemStatus.COMPLETED,
+    # From FIRED
+    (WorkItemStatus.FIRED, WorkItemEvent.OFFER): WorkItemStatus.OFFERED,
+    (WorkItemStatus.FIRED, WorkItemEvent.ALLOCATE): WorkItemStatus.ALLOCATED,
+    (WorkItemStatus.FIRED, WorkItemEvent.START): WorkItemStatus.STARTED,
+    (WorkItemStatus.FIRED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
+    # From OFFERED
+    (WorkItemStatus.OFFERED, WorkItemEvent.ALLOCATE): WorkItemStatus.ALLOCATED,
+    (WorkItemStatus.OFFERED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
+    (WorkItemStatus.OFFERED, WorkItemEvent.TIMEOUT): WorkItemStatus.FAILED,
+    # From ALLOCATED
+    (WorkItemStatus.ALLOCATED, WorkItemEvent.START): WorkItemStatus.STARTED,
+    (WorkItemStatus.ALLOCATED, WorkItemEvent.REALLOCATE): WorkItemStatus.ALLOCATED,
+    (WorkItemStatus.ALLOCATED, WorkItemEvent.DELEGATE): WorkItemStatus.OFFERED,
+    (WorkItemStatus.ALLOCATED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
+    (WorkItemStatus.ALLOCATED, WorkItemEvent.TIMEOUT): WorkItemStatus.FAILED,
+    # From STARTED
+    (WorkItemStatus.STARTED, WorkItemEvent.COMPLETE): WorkItemStatus.COMPLETED,
+    (WorkItemStatus.STARTED, WorkItemEvent.FAIL): WorkItemStatus.FAILED,
+    (WorkItemStatus.STARTED, WorkItemEvent.SUSPEND): WorkItemStatus.SUSPENDED,
+    (WorkItemStatus.STARTED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
+    (WorkItemStatus.STARTED, WorkItemEvent.TIMEOUT): WorkItemStatus.FAILED,
+    (WorkItemStatus.STARTED, WorkItemEvent.FORCE_COMPLETE): WorkItemStatus.FORCE_COMPLETED,
+    # From SUSPENDED
+    (WorkItemStatus.SUSPENDED, WorkItemEvent.RESUME): WorkItemStatus.STARTED,
+    (WorkItemStatus.SUSPENDED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
+    (WorkItemStatus.SUSPENDED, WorkItemEvent.FORCE_COMPLETE): WorkItemStatus.FORCE_COMPLETED,
+    # From EXECUTING (system task)
+    (WorkItemStatus.EXECUTING, WorkItemEvent.COMPLETE): WorkItemStatus.COMPLETED,
+    (WorkItemStatus.EXECUTING, WorkItemEvent.FAIL): WorkItemStatus.FAILED,
+    (WorkItemStatus.EXECUTING, WorkItemEvent.SUSPEND): WorkItemStatus.SUSPENDED,
+    (WorkItemStatus.EXECUTING, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
+    (WorkItemStatus.EXECUTING, WorkItemEvent.TIMEOUT): WorkItemStatus.FAILED,
+}
+
+
 @dataclass
 class YWorkItem:
     """Work item representing a unit of work (mirrors Java YWorkItem).
@@ -307,44 +348,7 @@ class YWorkItem:
 
     def _init_transitions(self) -> None:
         """Initialize valid state transitions."""
-        self._transitions = {
-            # From ENABLED
-            (WorkItemStatus.ENABLED, WorkItemEvent.FIRE): WorkItemStatus.FIRED,
-            (WorkItemStatus.ENABLED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
-            (WorkItemStatus.ENABLED, WorkItemEvent.SKIP): WorkItemStatus.COMPLETED,
-            # From FIRED
-            (WorkItemStatus.FIRED, WorkItemEvent.OFFER): WorkItemStatus.OFFERED,
-            (WorkItemStatus.FIRED, WorkItemEvent.ALLOCATE): WorkItemStatus.ALLOCATED,
-            (WorkItemStatus.FIRED, WorkItemEvent.START): WorkItemStatus.STARTED,
-            (WorkItemStatus.FIRED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
-            # From OFFERED
-            (WorkItemStatus.OFFERED, WorkItemEvent.ALLOCATE): WorkItemStatus.ALLOCATED,
-            (WorkItemStatus.OFFERED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
-            (WorkItemStatus.OFFERED, WorkItemEvent.TIMEOUT): WorkItemStatus.FAILED,
-            # From ALLOCATED
-            (WorkItemStatus.ALLOCATED, WorkItemEvent.START): WorkItemStatus.STARTED,
-            (WorkItemStatus.ALLOCATED, WorkItemEvent.REALLOCATE): WorkItemStatus.ALLOCATED,
-            (WorkItemStatus.ALLOCATED, WorkItemEvent.DELEGATE): WorkItemStatus.OFFERED,
-            (WorkItemStatus.ALLOCATED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
-            (WorkItemStatus.ALLOCATED, WorkItemEvent.TIMEOUT): WorkItemStatus.FAILED,
-            # From STARTED
-            (WorkItemStatus.STARTED, WorkItemEvent.COMPLETE): WorkItemStatus.COMPLETED,
-            (WorkItemStatus.STARTED, WorkItemEvent.FAIL): WorkItemStatus.FAILED,
-            (WorkItemStatus.STARTED, WorkItemEvent.SUSPEND): WorkItemStatus.SUSPENDED,
-            (WorkItemStatus.STARTED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
-            (WorkItemStatus.STARTED, WorkItemEvent.TIMEOUT): WorkItemStatus.FAILED,
-            (WorkItemStatus.STARTED, WorkItemEvent.FORCE_COMPLETE): WorkItemStatus.FORCE_COMPLETED,
-            # From SUSPENDED
-            (WorkItemStatus.SUSPENDED, WorkItemEvent.RESUME): WorkItemStatus.STARTED,
-            (WorkItemStatus.SUSPENDED, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
-            (WorkItemStatus.SUSPENDED, WorkItemEvent.FORCE_COMPLETE): WorkItemStatus.FORCE_COMPLETED,
-            # From EXECUTING (system task)
-            (WorkItemStatus.EXECUTING, WorkItemEvent.COMPLETE): WorkItemStatus.COMPLETED,
-            (WorkItemStatus.EXECUTING, WorkItemEvent.FAIL): WorkItemStatus.FAILED,
-            (WorkItemStatus.EXECUTING, WorkItemEvent.SUSPEND): WorkItemStatus.SUSPENDED,
-            (WorkItemStatus.EXECUTING, WorkItemEvent.CANCEL): WorkItemStatus.CANCELLED,
-            (WorkItemStatus.EXECUTING, WorkItemEvent.TIMEOUT): WorkItemStatus.FAILED,
-        }
+        self._transitions = _WORK_ITEM_TRANSITIONS
 
     def can_transition(self, event: WorkItemEvent) -> bool:
         """Check if transition is valid.
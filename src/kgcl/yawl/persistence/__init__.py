@@ -5,12 +5,15 @@ cases, and related data including:
 - In-memory repositories for development/testing
 - XML parsing and writing for specification files
 - PostgreSQL persistence for runtime state
+- Write-behind batching and a SQLite backend
 - Checkpoint and restore functionality
 """
 
 from kgcl.yawl.persistence.checkpoint import Checkpoint, CheckpointManager, CheckpointStatus, CheckpointType
 from kgcl.yawl.persistence.db_repository import DatabaseRepository
 from kgcl.yawl.persistence.db_schema import DatabaseSchema
+from kgcl.yawl.persistence.sqlite_backend import SQLiteConnection, sqlite_connection_factory
+from kgcl.yawl.persistence.write_behind import RepositoryPersistenceManager, WriteBehindRepository
 from kgcl.yawl.persistence.xml_parser import ParseResult, XMLParser
 from kgcl.yawl.persistence.xml_writer import XMLWriter
 from kgcl.yawl.persistence.y_repository import (
@@ -37,6 +40,10 @@ __all__ = [
     # Database
     "DatabaseRepository",
     "DatabaseSchema",
+    "WriteBehindRepository",
+    "RepositoryPersistenceManager",
+    "SQLiteConnection",
+    "sqlite_connection_factory",
     # Checkpoints
     "Checkpoint",
     "CheckpointType",
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
@@ -161,11 +162,15 @@ class CheckpointManager:
         Maximum checkpoints to retain
     auto_checkpoint : bool
         Whether to auto-checkpoint on major events
+    flush_hooks : list[Callable[[], None]]
+        Called before each checkpoint is stored, e.g. to flush
+        buffered repository writes so the database matches it
     """
 
     checkpoints: dict[str, Checkpoint] = field(default_factory=dict)
     max_checkpoints: int = 100
     auto_checkpoint: bool = True
+    flush_hooks: list[Callable[[], None]] = field(default_factory=list)
 
     def create_case_checkpoint(self, case: Any, description: str = "") -> Checkpoint:
         """Create checkpoint for a case.
@@ -329,6 +334,8 @@ class CheckpointManager:
         checkpoint : Checkpoint
             Checkpoint to store
         """
+        for hook in self.flush_hooks:
+            hook()
         self.checkpoints[checkpoint.id] = checkpoint
 
         # Cleanup if needed
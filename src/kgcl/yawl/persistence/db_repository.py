@@ -7,13 +7,150 @@ other runtime entities using PostgreSQL.
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import Any, Protocol
 
-if TYPE_CHECKING:
-    pass
+
+@dataclass(frozen=True)
+class WriteStatement:
+    """A write statement issued by the repository.
+
+    Describes how rows for the statement may be batched: keyed rows
+    are coalesced per entity, unkeyed rows are appended in order.
+
+    Parameters
+    ----------
+    table : str
+        Target table
+    sql : str
+        Parameterised SQL
+    order : int
+        Flush order (parents before children)
+    keyed : bool
+        Whether the first parameter identifies the entity
+    keep_first : tuple[int, ...]
+        Parameter positions the upsert never overwrites
+    coalesce : tuple[int, ...]
+        Parameter positions the upsert only overwrites when not NULL
+    is_delete : bool
+        Whether the statement removes rows
+    """
+
+    table: str
+    sql: str
+    order: int
+    keyed: bool = True
+    keep_first: tuple[int, ...] = ()
+    coalesce: tuple[int, ...] = ()
+    is_delete: bool = False
+
+    def merge(self, previous: tuple[Any, ...], current: tuple[Any, ...]) -> tuple[Any, ...]:
+        """Merge two upserts of the same entity into one.
+
+        The result has the same effect as executing ``previous``
+        followed by ``current``.
+
+        Parameters
+        ----------
+        previous : tuple[Any, ...]
+            Earlier parameters
+        current : tuple[Any, ...]
+            Later parameters
+
+        Returns
+        -------
+        tuple[Any, ...]
+            Merged parameters
+        """
+        merged = list(current)
+        for index in self.keep_first:
+            merged[index] = previous[index]
+        for index in self.coalesce:
+            if merged[index] is None:
+                merged[index] = previous[index]
+        return tuple(merged)
+
+
+SPECIFICATION_UPSERT = WriteStatement(
+    table="yawl_specifications",
+    order=0,
+    sql="""
+            INSERT INTO yawl_specifications
+            (id, uri, name, version, status, xml_content, documentation)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (id) DO UPDATE SET
+            uri = EXCLUDED.uri,
+            name = EXCLUDED.name,
+            version = EXCLUDED.version,
+            status = EXCLUDED.status,
+            xml_content = EXCLUDED.xml_content,
+            documentation = EXCLUDED.documentation,
+            updated_at = CURRENT_TIMESTAMP
+        """,
+)
+
+CASE_UPSERT = WriteStatement(
+    table="yawl_cases",
+    order=1,
+    keep_first=(1, 3, 4, 5),
+    coalesce=(6,),
+    sql="""
+            INSERT INTO yawl_cases
+            (id, specification_id, status, root_net_id, parent_case_id,
+             parent_work_item_id, started_at, completed_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (id) DO UPDATE SET
+            status = EXCLUDED.status,
+            started_at = COALESCE(EXCLUDED.started_at, yawl_cases.started_at),
+            completed_at = EXCLUDED.completed_at
+        """,
+)
+
+WORK_ITEM_UPSERT = WriteStatement(
+    table="yawl_work_items",
+    order=2,
+    keep_first=(1, 2, 3, 8),
+    coalesce=(11, 12, 13),
+    sql="""
+            INSERT INTO yawl_work_items
+            (id, case_id, task_id, net_id, status, allocated_to, started_by,
+             completed_by, instance_number, data_in, data_out, fired_at,
+             allocated_at, started_at, completed_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (id) DO UPDATE SET
+            status = EXCLUDED.status,
+            allocated_to = EXCLUDED.allocated_to,
+            started_by = EXCLUDED.started_by,
+            completed_by = EXCLUDED.completed_by,
+            data_in = EXCLUDED.data_in,
+            data_out = EXCLUDED.data_out,
+            fired_at = COALESCE(EXCLUDED.fired_at, yawl_work_items.fired_at),
+            allocated_at = COALESCE(EXCLUDED.allocated_at, yawl_work_items.allocated_at),
+            started_at = COALESCE(EXCLUDED.started_at, yawl_work_items.started_at),
+            completed_at = EXCLUDED.completed_at
+        """,
+)
+
+EVENT_INSERT = WriteStatement(
+    table="yawl_events",
+    order=3,
+    keyed=False,
+    sql="""
+            INSERT INTO yawl_events
+            (event_type, case_id, work_item_id, task_id, participant_id, data_json)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """,
+)
+
+SPECIFICATION_DELETE = WriteStatement(
+    table="yawl_specifications", order=0, is_delete=True, sql="DELETE FROM yawl_specifications WHERE id = %s"
+)
+CASE_DELETE = WriteStatement(table="yawl_cases", order=1, is_delete=True, sql="DELETE FROM yawl_cases WHERE id = %s")
+WORK_ITEM_DELETE = WriteStatement(
+    table="yawl_work_items", order=2, is_delete=True, sql="DELETE FROM yawl_work_items WHERE id = %s"
+)
 
 
 class DatabaseConnection(Protocol):
@@ -40,6 +177,14 @@ class DatabaseConnection(Protocol):
         ...
 
 
+class BatchDatabaseConnection(DatabaseConnection, Protocol):
+    """Protocol for connections that execute parameter batches."""
+
+    def executemany(self, sql: str, params_seq: Iterable[tuple[Any, ...]]) -> Any:
+        """Execute SQL statement once per parameter tuple."""
+        ...
+
+
 @dataclass
 class DatabaseRepository:
     """Repository for YAWL runtime state persistence.
@@ -116,23 +261,7 @@ class DatabaseRepository:
         bool
             True if saved
         """
-        conn = self.get_connection()
-        sql = """
-            INSERT INTO yawl_specifications
-            (id, uri, name, version, status, xml_content, documentation)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
-            uri = EXCLUDED.uri,
-            name = EXCLUDED.name,
-            version = EXCLUDED.version,
-            status = EXCLUDED.status,
-            xml_content = EXCLUDED.xml_content,
-            documentation = EXCLUDED.documentation,
-            updated_at = CURRENT_TIMESTAMP
-        """
-        conn.execute(sql, (spec_id, uri, name, version, status, xml_content, documentation))
-        if self.auto_commit:
-            conn.commit()
+        self._write(SPECIFICATION_UPSERT, (spec_id, uri, name, version, status, xml_content, documentation))
         return True
 
     def get_specification(self, spec_id: str) -> dict[str, Any] | None:
@@ -172,11 +301,7 @@ class DatabaseRepository:
         bool
             True if deleted
         """
-        conn = self.get_connection()
-        sql = "DELETE FROM yawl_specifications WHERE id = %s"
-        conn.execute(sql, (spec_id,))
-        if self.auto_commit:
-            conn.commit()
+        self._write(SPECIFICATION_DELETE, (spec_id,))
         return True
 
     # --- Case operations ---
@@ -218,19 +343,8 @@ class DatabaseRepository:
         bool
             True if saved
         """
-        conn = self.get_connection()
-        sql = """
-            INSERT INTO yawl_cases
-            (id, specification_id, status, root_net_id, parent_case_id,
-             parent_work_item_id, started_at, completed_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
-            status = EXCLUDED.status,
-            started_at = COALESCE(EXCLUDED.started_at, yawl_cases.started_at),
-            completed_at = EXCLUDED.completed_at
-        """
-        conn.execute(
-            sql,
+        self._write(
+            CASE_UPSERT,
             (
                 case_id,
                 specification_id,
@@ -242,8 +356,6 @@ class DatabaseRepository:
                 completed_at,
             ),
         )
-        if self.auto_commit:
-            conn.commit()
         return True
 
     def get_case(self, case_id: str) -> dict[str, Any] | None:
@@ -328,11 +440,7 @@ class DatabaseRepository:
         bool
             True if deleted
         """
-        conn = self.get_connection()
-        sql = "DELETE FROM yawl_cases WHERE id = %s"
-        conn.execute(sql, (case_id,))
-        if self.auto_commit:
-            conn.commit()
+        self._write(CASE_DELETE, (case_id,))
         return True
 
     # --- Work item operations ---
@@ -395,27 +503,8 @@ class DatabaseRepository:
         bool
             True if saved
         """
-        conn = self.get_connection()
-        sql = """
-            INSERT INTO yawl_work_items
-            (id, case_id, task_id, net_id, status, allocated_to, started_by,
-             completed_by, instance_number, data_in, data_out, fired_at,
-             allocated_at, started_at, completed_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
-            status = EXCLUDED.status,
-            allocated_to = EXCLUDED.allocated_to,
-            started_by = EXCLUDED.started_by,
-            completed_by = EXCLUDED.completed_by,
-            data_in = EXCLUDED.data_in,
-            data_out = EXCLUDED.data_out,
-            fired_at = COALESCE(EXCLUDED.fired_at, yawl_work_items.fired_at),
-            allocated_at = COALESCE(EXCLUDED.allocated_at, yawl_work_items.allocated_at),
-            started_at = COALESCE(EXCLUDED.started_at, yawl_work_items.started_at),
-            completed_at = EXCLUDED.completed_at
-        """
-        conn.execute(
-            sql,
+        self._write(
+            WORK_ITEM_UPSERT,
             (
                 work_item_id,
                 case_id,
@@ -434,8 +523,6 @@ class DatabaseRepository:
                 completed_at,
             ),
         )
-        if self.auto_commit:
-            conn.commit()
         return True
 
     def get_work_item(self, work_item_id: str) -> dict[str, Any] | None:
@@ -527,6 +614,22 @@ class DatabaseRepository:
             for row in rows
         ]
 
+    def delete_work_item(self, work_item_id: str) -> bool:
+        """Delete work item.
+
+        Parameters
+        ----------
+        work_item_id : str
+            Work item ID
+
+        Returns
+        -------
+        bool
+            True if deleted
+        """
+        self._write(WORK_ITEM_DELETE, (work_item_id,))
+        return True
+
     # --- Event operations ---
 
     def save_event(
@@ -560,17 +663,10 @@ class DatabaseRepository:
         bool
             True if saved
         """
-        conn = self.get_connection()
-        sql = """
-            INSERT INTO yawl_events
-            (event_type, case_id, work_item_id, task_id, participant_id, data_json)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """
-        conn.execute(
-            sql, (event_type, case_id, work_item_id, task_id, participant_id, json.dumps(data) if data else None)
+        self._write(
+            EVENT_INSERT,
+            (event_type, case_id, work_item_id, task_id, participant_id, json.dumps(data) if data else None),
         )
-        if self.auto_commit:
-            conn.commit()
         return True
 
     def find_events_by_case(self, case_id: str, limit: int = 100) -> list[dict[str, Any]]:
@@ -605,8 +701,47 @@ class DatabaseRepository:
             for row in rows
         ]
 
+    # --- Transaction operations ---
+
+    def begin(self) -> None:
+        """Start a transaction.
+
+        Writes issued before it are made durable first, so a later
+        ``rollback`` only discards writes made inside the transaction.
+        """
+        self.flush()
+
+    def flush(self) -> None:
+        """Make all writes issued so far durable.
+
+        Commits the open connection, if any. Subclasses that buffer
+        writes send them to the database first.
+        """
+        if self._connection is not None:
+            self._connection.commit()
+
+    def rollback(self) -> None:
+        """Discard writes not yet made durable."""
+        if self._connection is not None:
+            self._connection.rollback()
+
     # --- Helper methods ---
 
+    def _write(self, statement: WriteStatement, params: tuple[Any, ...]) -> None:
+        """Execute a write statement.
+
+        Parameters
+        ----------
+        statement : WriteStatement
+            Statement to execute
+        params : tuple[Any, ...]
+            Statement parameters
+        """
+        conn = self.get_connection()
+        conn.execute(statement.sql, params)
+        if self.auto_commit:
+            conn.commit()
+
     def _row_to_dict(self, row: tuple[Any, ...], columns: list[str]) -> dict[str, Any]:
         """Convert row tuple to dictionary.
 
@@ -216,6 +216,18 @@ class DatabaseSchema:
         """
         return SCHEMA_SQL
 
+    def get_sqlite_schema_sql(self) -> str:
+        """Get SQL to create schema in SQLite.
+
+        SQLite has no SERIAL type; surrogate keys use rowid aliases.
+
+        Returns
+        -------
+        str
+            CREATE TABLE statements
+        """
+        return SCHEMA_SQL.replace("SERIAL PRIMARY KEY", "INTEGER PRIMARY KEY AUTOINCREMENT")
+
     def get_drop_schema_sql(self) -> str:
         """Get SQL to drop schema.
 
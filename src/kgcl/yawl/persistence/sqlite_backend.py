@@ -0,0 +1,161 @@
+"""SQLite backend for the YAWL database repository.
+
+Adapts :mod:`sqlite3` to the ``DatabaseConnection`` protocol so the
+repository can run without a database server, e.g. for embedded
+deployments and tests.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from kgcl.yawl.persistence.db_schema import DatabaseSchema
+
+
+def _to_sqlite(params: tuple[Any, ...] | None) -> tuple[Any, ...]:
+    """Convert parameters to types SQLite stores natively.
+
+    Parameters
+    ----------
+    params : tuple[Any, ...] | None
+        Statement parameters
+
+    Returns
+    -------
+    tuple[Any, ...]
+        Converted parameters
+    """
+    if not params:
+        return ()
+    return tuple(value.isoformat(sep=" ") if isinstance(value, datetime) else value for value in params)
+
+
+@dataclass
+class SQLiteConnection:
+    """Database connection backed by SQLite.
+
+    Translates the repository's ``%s`` placeholders to SQLite's ``?``
+    and enables foreign key enforcement.
+
+    Parameters
+    ----------
+    database : str | Path
+        Database file path, or ``":memory:"``
+    timeout : float
+        Seconds to wait for a locked database
+    """
+
+    database: str | Path = ":memory:"
+    timeout: float = 5.0
+    _connection: sqlite3.Connection = field(init=False, repr=False)
+    _cursor: sqlite3.Cursor = field(init=False, repr=False)
+    _statements: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Open the database."""
+        self._connection = sqlite3.connect(str(self.database), timeout=self.timeout, check_same_thread=False)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._cursor = self._connection.cursor()
+
+    def create_schema(self, schema: DatabaseSchema | None = None) -> None:
+        """Create the YAWL tables if they do not exist.
+
+        Parameters
+        ----------
+        schema : DatabaseSchema | None
+            Schema definition (default schema if None)
+        """
+        self._connection.executescript((schema or DatabaseSchema()).get_sqlite_schema_sql())
+        self._connection.commit()
+
+    def execute(self, sql: str, params: tuple[Any, ...] | None = None) -> sqlite3.Cursor:
+        """Execute SQL statement.
+
+        Parameters
+        ----------
+        sql : str
+            Statement with ``%s`` placeholders
+        params : tuple[Any, ...] | None
+            Statement parameters
+
+        Returns
+        -------
+        sqlite3.Cursor
+            Cursor holding any result rows
+        """
+        return self._cursor.execute(self._translate(sql), _to_sqlite(params))
+
+    def executemany(self, sql: str, params_seq: Iterable[tuple[Any, ...]]) -> sqlite3.Cursor:
+        """Execute SQL statement once per parameter tuple.
+
+        Parameters
+        ----------
+        sql : str
+            Statement with ``%s`` placeholders
+        params_seq : Iterable[tuple[Any, ...]]
+            Parameters for each execution
+
+        Returns
+        -------
+        sqlite3.Cursor
+            Cursor used for the batch
+        """
+        return self._cursor.executemany(self._translate(sql), (_to_sqlite(params) for params in params_seq))
+
+    def fetchone(self) -> tuple[Any, ...] | None:
+        """Fetch one row."""
+        return self._cursor.fetchone()
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        """Fetch all rows."""
+        return self._cursor.fetchall()
+
+    def commit(self) -> None:
+        """Commit transaction."""
+        self._connection.commit()
+
+    def rollback(self) -> None:
+        """Rollback transaction."""
+        self._connection.rollback()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def _translate(self, sql: str) -> str:
+        """Rewrite ``%s`` placeholders as ``?``, caching the result."""
+        translated = self._statements.get(sql)
+        if translated is None:
+            translated = sql.replace("%s", "?")
+            self._statements[sql] = translated
+        return translated
+
+
+def sqlite_connection_factory(database: str | Path, create_schema: bool = True) -> Callable[[], SQLiteConnection]:
+    """Build a repository connection factory for a SQLite database.
+
+    Parameters
+    ----------
+    database : str | Path
+        Database file path, or ``":memory:"``
+    create_schema : bool
+        Whether to create the YAWL tables on connect
+
+    Returns
+    -------
+    Callable[[], SQLiteConnection]
+        Connection factory for ``DatabaseRepository``
+    """
+
+    def factory() -> SQLiteConnection:
+        connection = SQLiteConnection(database)
+        if create_schema:
+            connection.create_schema()
+        return connection
+
+    return factory
@@ -0,0 +1,457 @@
+"""Write-behind persistence for YAWL runtime state.
+
+Buffers repository writes and sends them to the database in batches.
+Repeated saves of the same entity within a flush window are coalesced
+into one row, and each flush issues one ``executemany`` per statement
+inside a single transaction. A background flusher thread closes the
+flush window when no further write arrives. Flushing on engine transaction
+commits and on checkpoints keeps the database consistent with the last
+durable point.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from kgcl.yawl.elements.y_specification import YSpecification
+from kgcl.yawl.engine.engine_types import YPersistenceManager
+from kgcl.yawl.engine.y_case import YCase
+from kgcl.yawl.engine.y_work_item import YWorkItem
+from kgcl.yawl.persistence.db_repository import DatabaseConnection, DatabaseRepository, WriteStatement
+
+logger = logging.getLogger(__name__)
+
+_IDLE_WAIT = 1.0
+"""Seconds an idle flusher sleeps before checking whether its repository is still alive."""
+
+
+def _run_flusher(ref: weakref.ref[WriteBehindRepository]) -> None:
+    """Close flush windows until the repository is closed or collected.
+
+    Only a weak reference is held between waits, so a repository that is
+    dropped without ``close`` does not keep its flusher thread alive.
+
+    Parameters
+    ----------
+    ref : weakref.ref[WriteBehindRepository]
+        Repository served by the calling thread
+    """
+    while (repository := ref()) is not None and repository._flush_when_due():
+        del repository
+
+
+@dataclass
+class WriteBehindRepository(DatabaseRepository):
+    """Database repository that batches writes.
+
+    Saves are buffered and coalesced per entity until the flush window
+    closes, the buffer reaches ``max_pending`` rows, or ``flush`` is
+    called. The window is closed by the next write after
+    ``flush_interval`` seconds or by a background flusher thread,
+    whichever comes first. Deletes send the buffer and run immediately.
+    Reads send the buffer first, so callers always see their own writes.
+    ``auto_commit`` is ignored.
+
+    The flusher shares the repository's connection, so every use of the
+    connection — reads, writes and background flushes — runs under one
+    lock. Callers using ``get_connection`` directly must hold
+    ``lock`` until they have fetched their results. ``close`` stops the
+    flusher and closes the connection.
+
+    Between ``begin`` and ``flush``/``rollback`` buffered rows are still
+    sent to the database, but not committed: ``rollback`` discards
+    every write made since ``begin`` and nothing before it. If sending
+    fails inside a transaction, the database rolls the whole
+    transaction back and the buffer is discarded with it.
+
+    Parameters
+    ----------
+    connection_factory : Callable[[], DatabaseConnection] | None
+        Factory for database connections
+    auto_commit : bool
+        Unused; flushes always commit
+    flush_interval : float
+        Seconds a write may stay buffered before it is sent
+    max_pending : int
+        Buffered rows that trigger a flush
+    clock : Callable[[], float]
+        Monotonic clock for the flush window
+    flush_count : int
+        Number of batches sent to the database
+    coalesced_count : int
+        Number of writes merged into an already buffered row
+    """
+
+    flush_interval: float = 0.05
+    max_pending: int = 1000
+    clock: Callable[[], float] = time.monotonic
+    flush_count: int = field(default=0, init=False)
+    coalesced_count: int = field(default=0, init=False)
+    _pending: dict[tuple[str, Any], tuple[WriteStatement, tuple[Any, ...]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _appends: list[tuple[WriteStatement, tuple[Any, ...]]] = field(default_factory=list, init=False, repr=False)
+    _window_start: float | None = field(default=None, init=False, repr=False)
+    _deadline: float | None = field(default=None, init=False, repr=False)
+    _flusher: threading.Thread | None = field(default=None, init=False, repr=False)
+    _in_transaction: bool = field(default=False, init=False, repr=False)
+    _uncommitted: bool = field(default=False, init=False, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
+    _wakeup: threading.Condition = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Create the flusher's wakeup condition on the repository lock."""
+        self._wakeup = threading.Condition(self._lock)
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock serializing use of the shared connection."""
+        return self._lock
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered rows."""
+        return len(self._pending) + len(self._appends)
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction started by ``begin`` is open."""
+        return self._in_transaction
+
+    def get_connection(self) -> DatabaseConnection:
+        """Get database connection after sending buffered writes.
+
+        Hold ``lock`` while using the connection, since the background
+        flusher shares it.
+
+        Returns
+        -------
+        DatabaseConnection
+            Active connection
+        """
+        with self._lock:
+            self._send(commit=not self._in_transaction)
+        return super().get_connection()
+
+    def begin(self) -> None:
+        """Flush buffered writes and start a transaction."""
+        with self._lock:
+            self.flush()
+            self._in_transaction = True
+
+    def flush(self) -> None:
+        """Write all buffered rows and commit, ending any open transaction.
+
+        Rows are grouped per statement and sent with ``executemany`` in
+        parent-before-child table order. Outside a transaction a failed
+        flush is rolled back and the buffer is kept, so the flush can be
+        retried.
+        """
+        with self._lock:
+            self._send(commit=True)
+            self._in_transaction = False
+
+    def rollback(self) -> None:
+        """Discard buffered and uncommitted writes."""
+        with self._lock:
+            self._discard()
+            self._in_transaction = False
+            self._uncommitted = False
+            super().rollback()
+
+    def close(self) -> None:
+        """Flush buffered writes, stop the flusher and close the connection."""
+        with self._lock:
+            try:
+                self.flush()
+            finally:
+                flusher, self._flusher = self._flusher, None
+                self._wakeup.notify_all()
+                close = getattr(self._connection, "close", None)
+                if close is not None:
+                    close()
+                self._connection = None
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join()
+
+    # --- Reads hold the lock until their rows are fetched ---
+
+    def get_specification(self, spec_id: str) -> dict[str, Any] | None:
+        """Get specification by ID."""
+        with self._lock:
+            return super().get_specification(spec_id)
+
+    def get_case(self, case_id: str) -> dict[str, Any] | None:
+        """Get case by ID."""
+        with self._lock:
+            return super().get_case(case_id)
+
+    def find_cases_by_status(self, status: str) -> list[dict[str, Any]]:
+        """Find cases by status."""
+        with self._lock:
+            return super().find_cases_by_status(status)
+
+    def get_work_item(self, work_item_id: str) -> dict[str, Any] | None:
+        """Get work item by ID."""
+        with self._lock:
+            return super().get_work_item(work_item_id)
+
+    def find_work_items_by_case(self, case_id: str) -> list[dict[str, Any]]:
+        """Find work items by case."""
+        with self._lock:
+            return super().find_work_items_by_case(case_id)
+
+    def find_events_by_case(self, case_id: str, limit: int = 100) -> list[dict[str, Any]]:
+        """Find events by case."""
+        with self._lock:
+            return super().find_events_by_case(case_id, limit)
+
+    def _write(self, statement: WriteStatement, params: tuple[Any, ...]) -> None:
+        """Buffer a write statement.
+
+        Parameters
+        ----------
+        statement : WriteStatement
+            Statement to buffer
+        params : tuple[Any, ...]
+            Statement parameters
+        """
+        with self._lock:
+            commit = not self._in_transaction
+            if statement.is_delete:
+                self._send(commit=commit)
+                conn = super().get_connection()
+                conn.execute(statement.sql, params)
+                if commit:
+                    conn.commit()
+                else:
+                    self._uncommitted = True
+                return
+
+            if statement.keyed:
+                key = (statement.table, params[0])
+                buffered = self._pending.get(key)
+                if buffered is None:
+                    self._pending[key] = (statement, params)
+                else:
+                    self._pending[key] = (statement, statement.merge(buffered[1], params))
+                    self.coalesced_count += 1
+            else:
+                self._appends.append((statement, params))
+
+            now = self.clock()
+            if self._window_start is None:
+                self._window_start = now
+                self._schedule_flush()
+            if self.pending_count >= self.max_pending or now - self._window_start >= self.flush_interval:
+                self._send(commit=commit)
+
+    def _send(self, commit: bool) -> None:
+        """Send buffered rows in one batch.
+
+        Parameters
+        ----------
+        commit : bool
+            Whether to commit the batch and any earlier uncommitted writes
+        """
+        if not self._pending and not self._appends:
+            if commit and self._uncommitted and self._connection is not None:
+                self._connection.commit()
+                self._uncommitted = False
+            return
+        conn = super().get_connection()
+        try:
+            for statement, rows in self._batches():
+                executemany = getattr(conn, "executemany", None)
+                if executemany is not None:
+                    executemany(statement.sql, rows)
+                else:
+                    for params in rows:
+                        conn.execute(statement.sql, params)
+            if commit:
+                conn.commit()
+        except BaseException:
+            conn.rollback()
+            if self._in_transaction:
+                self._discard()
+                self._in_transaction = False
+                self._uncommitted = False
+            raise
+        self._uncommitted = not commit
+        self._discard()
+        self.flush_count += 1
+
+    def _discard(self) -> None:
+        """Drop buffered rows and close the flush window."""
+        self._pending.clear()
+        self._appends.clear()
+        self._window_start = None
+        self._deadline = None
+
+    def _schedule_flush(self) -> None:
+        """Have the flusher close the current window after ``flush_interval`` seconds."""
+        self._deadline = time.monotonic() + self.flush_interval
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=_run_flusher, args=(weakref.ref(self),), name="write-behind-flusher", daemon=True
+            )
+            self._flusher.start()
+        self._wakeup.notify()
+
+    def _flush_when_due(self) -> bool:
+        """Wait for the flush deadline and send the buffer once it passes.
+
+        A failed background flush is logged and left to the next write
+        or ``flush`` to retry.
+
+        Returns
+        -------
+        bool
+            Whether the calling flusher should keep running
+        """
+        with self._wakeup:
+            if self._flusher is not threading.current_thread():
+                return False
+            if self._deadline is None:
+                self._wakeup.wait(_IDLE_WAIT)
+                return True
+            remaining = self._deadline - time.monotonic()
+            if remaining > 0:
+                self._wakeup.wait(min(remaining, _IDLE_WAIT))
+                return True
+            self._deadline = None
+            try:
+                self._send(commit=not self._in_transaction)
+            except Exception:
+                logger.exception("Background write-behind flush failed")
+            return True
+
+    def _batches(self) -> list[tuple[WriteStatement, list[tuple[Any, ...]]]]:
+        """Group buffered rows per statement in flush order.
+
+        Returns
+        -------
+        list[tuple[WriteStatement, list[tuple[Any, ...]]]]
+            Statements with their rows
+        """
+        grouped: dict[WriteStatement, list[tuple[Any, ...]]] = {}
+        for statement, params in self._pending.values():
+            grouped.setdefault(statement, []).append(params)
+        for statement, params in self._appends:
+            grouped.setdefault(statement, []).append(params)
+        return sorted(grouped.items(), key=lambda item: item[0].order)
+
+
+@dataclass
+class RepositoryPersistenceManager(YPersistenceManager):
+    """Engine persistence manager that stores objects in a repository.
+
+    Maps the engine's ``storeObject``/``updateObject``/``deleteObject``
+    hooks onto repository saves, and engine transactions onto repository
+    ``begin``/``flush``/``rollback``. Pair it with a
+    ``WriteBehindRepository`` to batch the engine's writes.
+
+    Parameters
+    ----------
+    transaction_active : bool
+        Is transaction active
+    repository : DatabaseRepository | None
+        Repository receiving engine objects
+
+    Examples
+    --------
+    >>> repository = WriteBehindRepository(connection_factory=factory)
+    >>> engine.initialise(RepositoryPersistenceManager(repository=repository), True, False, False)
+    """
+
+    repository: DatabaseRepository | None = None
+
+    def start_transaction(self) -> bool:
+        """Start transaction, making earlier writes durable first."""
+        started = super().start_transaction()
+        if started and self.repository is not None:
+            self.repository.begin()
+        return started
+
+    def commit_transaction(self) -> None:
+        """Commit transaction, flushing buffered writes."""
+        super().commit_transaction()
+        if self.repository is not None:
+            self.repository.flush()
+
+    def rollback_transaction(self) -> None:
+        """Rollback transaction, discarding buffered writes."""
+        super().rollback_transaction()
+        if self.repository is not None:
+            self.repository.rollback()
+
+    def store_object(self, obj: object) -> None:
+        """Store object."""
+        self._save(obj)
+
+    def update_object(self, obj: object) -> None:
+        """Update object."""
+        self._save(obj)
+
+    def delete_object(self, obj: object) -> None:
+        """Delete object."""
+        if self.repository is None:
+            return
+        if isinstance(obj, YWorkItem):
+            self.repository.delete_work_item(obj.id)
+        elif isinstance(obj, YCase):
+            self.repository.delete_case(obj.id)
+        elif isinstance(obj, YSpecification):
+            self.repository.delete_specification(obj.id)
+
+    def _save(self, obj: object) -> None:
+        """Save a specification, case or work item.
+
+        Parameters
+        ----------
+        obj : object
+            Engine object; other types are ignored
+        """
+        repository = self.repository
+        if repository is None:
+            return
+        if isinstance(obj, YWorkItem):
+            repository.save_work_item(
+                obj.id,
+                obj.case_id,
+                obj.task_id,
+                obj.net_id,
+                obj.status.name,
+                allocated_to=obj.resource_id,
+                started_by=obj.resource_id if obj.started_time else None,
+                data_in=obj.data_input or None,
+                data_out=obj.data_output or None,
+                fired_at=obj.fired_time,
+                started_at=obj.started_time,
+                completed_at=obj.completed_time,
+            )
+        elif isinstance(obj, YCase):
+            repository.save_case(
+                obj.id,
+                obj.specification_id,
+                obj.status.name,
+                root_net_id=obj.root_net_id,
+                parent_case_id=obj.parent_case_id,
+                started_at=obj.started,
+                completed_at=obj.completed,
+            )
+        elif isinstance(obj, YSpecification):
+            repository.save_specification(
+                obj.id,
+                obj.id,
+                obj.name or obj.id,
+                str(obj.metadata.version),
+                obj.status.name,
+                documentation=obj.documentation or None,
+            )
@@ -8,7 +8,10 @@ from kgcl.yawl.resources.y_distribution import (
     DistributionContext,
     DistributionStrategy,
     Distributor,
+    IndexedPriorityQueue,
     ParticipantMetrics,
+    ParticipantMetricsMap,
+    ParticipantRanking,
     create_distributor,
 )
 from kgcl.yawl.resources.y_filters import (
@@ -47,5 +50,8 @@ __all__ = [
     "DistributionContext",
     "Distributor",
     "ParticipantMetrics",
+    "ParticipantMetricsMap",
+    "ParticipantRanking",
+    "IndexedPriorityQueue",
     "create_distributor",
 ]
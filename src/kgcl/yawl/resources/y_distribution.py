@@ -2,15 +2,35 @@
 
 Implements YAWL's distribution strategies for allocating
 work items among qualified participants.
+
+Queue-length and throughput rankings are maintained incrementally:
+``ParticipantMetrics`` notify their listeners whenever a ranked field
+changes, and ``ParticipantRanking`` keeps one indexed priority queue
+per candidate pool, so selecting the shortest queue or the fastest
+participant costs O(log n) per metric update instead of a full sort
+per allocation.
 """
 
 from __future__ import annotations
 
+import inspect
 import random
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Any
+from operator import attrgetter, is_
+from typing import TYPE_CHECKING, Any, Self, overload
+
+if TYPE_CHECKING:
+    from _typeshed import SupportsKeysAndGetItem
+
+# Metric fields that affect participant ranking
+_RANKED_FIELDS = frozenset({"active_work_items", "average_completion_time_ms"})
+
+_participant_id = attrgetter("id")
 
 
 class DistributionStrategy(Enum):
@@ -66,6 +86,90 @@ class ParticipantMetrics:
     completed_count: int = 0
     average_completion_time_ms: float = 0.0
     last_assigned: datetime | None = None
+    _listeners: list[Callable[[], Callable[[ParticipantMetrics], None] | None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute and notify listeners when a ranked field changes.
+
+        Parameters
+        ----------
+        name : str
+            Attribute name
+        value : Any
+            New value
+        """
+        object.__setattr__(self, name, value)
+        if name in _RANKED_FIELDS:
+            refs = self.__dict__.get("_listeners")
+            if not refs:
+                return
+            dead = False
+            for ref in tuple(refs):
+                listener = ref()
+                if listener is None:
+                    dead = True
+                else:
+                    listener(self)
+            if dead:
+                refs[:] = [ref for ref in refs if ref() is not None]
+
+    def add_listener(self, listener: Callable[[ParticipantMetrics], None]) -> None:
+        """Register a callback invoked when ranked metrics change.
+
+        Bound methods are held weakly, so a ranking that is no longer
+        referenced elsewhere stops receiving updates and can be
+        garbage collected.
+
+        Parameters
+        ----------
+        listener : Callable[[ParticipantMetrics], None]
+            Callback receiving the updated metrics
+        """
+        if inspect.ismethod(listener):
+            self._listeners.append(weakref.WeakMethod(listener))
+        else:
+            self._listeners.append(lambda: listener)
+
+    def remove_listener(self, listener: Callable[[ParticipantMetrics], None]) -> None:
+        """Unregister a metrics listener.
+
+        Parameters
+        ----------
+        listener : Callable[[ParticipantMetrics], None]
+            Previously registered callback
+        """
+        self._listeners[:] = [ref for ref in self._listeners if ref() not in (None, listener)]
+
+    @property
+    def listener_count(self) -> int:
+        """Number of live listeners."""
+        return sum(1 for ref in self._listeners if ref() is not None)
+
+    @property
+    def queue_priority(self) -> int:
+        """Get ranking key for the shortest-queue strategy.
+
+        Returns
+        -------
+        int
+            Number of active work items
+        """
+        return self.active_work_items
+
+    @property
+    def speed_priority(self) -> float:
+        """Get ranking key for the fastest strategy.
+
+        Returns
+        -------
+        float
+            Average completion time, or infinity if unknown
+        """
+        if self.average_completion_time_ms > 0:
+            return self.average_completion_time_ms
+        return float("inf")
 
     def update_completion(self, duration_ms: float) -> None:
         """Update metrics after completion.
@@ -85,6 +189,431 @@ class ParticipantMetrics:
             ) / self.completed_count
 
 
+class ParticipantMetricsMap(dict[str, ParticipantMetrics]):
+    """Participant metrics by ID that counts structural changes.
+
+    ``version`` increases whenever an entry is added, replaced or
+    removed, letting rankings skip re-checking every entry when the
+    map is unchanged. Plain dicts are also accepted everywhere a
+    metrics map is expected.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: str, value: ParticipantMetrics) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    # Same overloads as dict.__ior__; mypy still reports the in-place form
+    # as incompatible with dict.__or__, which typeshed ignores for dict too
+    @overload  # type: ignore[override]
+    def __ior__(self, other: SupportsKeysAndGetItem[str, ParticipantMetrics], /) -> Self: ...
+    @overload
+    def __ior__(self, other: Iterable[tuple[str, ParticipantMetrics]], /) -> Self: ...
+    def __ior__(self, other: Any, /) -> Self:
+        super().__ior__(other)
+        self.version += 1
+        return self
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """Remove an entry and return its metrics."""
+        self.version += 1
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, ParticipantMetrics]:
+        """Remove and return the last inserted entry."""
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key: str, default: ParticipantMetrics | None = None) -> Any:  # type: ignore[override]
+        """Insert metrics for a missing ID and return the entry."""
+        self.version += 1
+        return super().setdefault(key, default)  # type: ignore[arg-type]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Add or replace entries."""
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        super().clear()
+        self.version += 1
+
+
+class IndexedPriorityQueue:
+    """Binary min-heap with a position index.
+
+    Each item ID appears at most once; its priority can be changed or
+    the item removed in O(log n). Entries are ordered by
+    ``(priority, item_id)`` so ties are broken deterministically.
+
+    Examples
+    --------
+    >>> queue = IndexedPriorityQueue()
+    >>> queue.push("b", 1)
+    >>> queue.push("a", 1)
+    >>> queue.peek()
+    'a'
+    """
+
+    __slots__ = ("_heap", "_positions")
+
+    def __init__(self) -> None:
+        """Create an empty queue."""
+        self._heap: list[tuple[Any, str]] = []
+        self._positions: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Get number of queued items.
+
+        Returns
+        -------
+        int
+            Item count
+        """
+        return len(self._heap)
+
+    def __contains__(self, item_id: object) -> bool:
+        """Check whether an item is queued.
+
+        Parameters
+        ----------
+        item_id : object
+            Item ID
+
+        Returns
+        -------
+        bool
+            True if queued
+        """
+        return item_id in self._positions
+
+    def push(self, item_id: str, priority: Any) -> None:
+        """Insert an item or change its priority.
+
+        Parameters
+        ----------
+        item_id : str
+            Item ID
+        priority : Any
+            Comparable priority (lower is served first)
+        """
+        entry = (priority, item_id)
+        index = self._positions.get(item_id)
+        if index is None:
+            self._heap.append(entry)
+            index = len(self._heap) - 1
+            self._positions[item_id] = index
+            self._sift_up(index)
+            return
+
+        old = self._heap[index]
+        self._heap[index] = entry
+        if entry < old:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def remove(self, item_id: str) -> None:
+        """Remove an item if present.
+
+        Parameters
+        ----------
+        item_id : str
+            Item ID
+        """
+        index = self._positions.pop(item_id, None)
+        if index is None:
+            return
+        last = self._heap.pop()
+        if index < len(self._heap):
+            self._heap[index] = last
+            self._positions[last[1]] = index
+            self._sift_up(index)
+            self._sift_down(self._positions[last[1]])
+
+    def peek(self) -> str | None:
+        """Get the item with the lowest priority.
+
+        Returns
+        -------
+        str | None
+            Item ID or None if empty
+        """
+        return self._heap[0][1] if self._heap else None
+
+    def priority_of(self, item_id: str) -> Any:
+        """Get current priority of an item.
+
+        Parameters
+        ----------
+        item_id : str
+            Item ID
+
+        Returns
+        -------
+        Any
+            Priority or None if not queued
+        """
+        index = self._positions.get(item_id)
+        return self._heap[index][0] if index is not None else None
+
+    def _sift_up(self, index: int) -> None:
+        heap = self._heap
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if heap[parent] <= entry:
+                break
+            heap[index] = heap[parent]
+            self._positions[heap[index][1]] = index
+            index = parent
+        heap[index] = entry
+        self._positions[entry[1]] = index
+
+    def _sift_down(self, index: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and heap[right] < heap[child]:
+                child = right
+            if entry <= heap[child]:
+                break
+            heap[index] = heap[child]
+            self._positions[heap[index][1]] = index
+            index = child
+        heap[index] = entry
+        self._positions[entry[1]] = index
+
+
+class _CandidatePool:
+    """Queue-length and speed rankings for one candidate sequence.
+
+    Parameters
+    ----------
+    participant_ids : tuple[str, ...]
+        Candidate participant IDs in distributor input order
+    """
+
+    __slots__ = (
+        "by_queue",
+        "by_speed",
+        "member_ids",
+        "participant_ids",
+        "positions",
+        "synced_map",
+        "synced_version",
+        "tracked",
+        "tracked_list",
+    )
+
+    def __init__(self, participant_ids: tuple[str, ...]) -> None:
+        self.participant_ids = participant_ids
+        self.by_queue = IndexedPriorityQueue()
+        self.by_speed = IndexedPriorityQueue()
+        # First position of each ID in the candidate sequence
+        self.positions: dict[str, int] = {}
+        for index, participant_id in enumerate(participant_ids):
+            self.positions.setdefault(participant_id, index)
+        self.member_ids = tuple(self.positions)
+        # Participant ID -> metrics object the priorities were read from
+        self.tracked: dict[str, ParticipantMetrics | None] = {}
+        # Tracked metrics objects in member_ids order
+        self.tracked_list: list[ParticipantMetrics | None] = []
+        # Versioned metrics map and version at last synchronisation
+        self.synced_map: ParticipantMetricsMap | None = None
+        self.synced_version = -1
+
+    def rank(self, participant_id: str, metrics: ParticipantMetrics | None) -> None:
+        """Insert or refresh a participant's priorities.
+
+        Parameters
+        ----------
+        participant_id : str
+            Participant ID
+        metrics : ParticipantMetrics | None
+            Current metrics (None ranks as idle with unknown speed)
+        """
+        self.tracked[participant_id] = metrics
+        if metrics is None:
+            self.by_queue.push(participant_id, 0)
+            self.by_speed.push(participant_id, float("inf"))
+        else:
+            self.by_queue.push(participant_id, metrics.queue_priority)
+            self.by_speed.push(participant_id, metrics.speed_priority)
+
+
+class ParticipantRanking:
+    """Incrementally maintained participant rankings.
+
+    Keeps an indexed priority queue per candidate sequence (the
+    participant IDs offered to the distributor) for both queue length
+    and average completion time. Metric changes are pushed into every
+    pool containing the participant, so each update costs O(log n) per
+    pool and selection is a heap peek.
+
+    Metrics objects are watched for in-place changes through weakly held
+    listeners. Entries added, removed or replaced in the metrics dict (or
+    a different dict) are detected on the next use of the pool, by the
+    version of a ``ParticipantMetricsMap`` or else by object identity,
+    and only the changed participants are re-ranked.
+
+    Parameters
+    ----------
+    max_pools : int
+        Maximum number of candidate pools retained (least recently used
+        pools are evicted)
+    """
+
+    def __init__(self, max_pools: int = 64) -> None:
+        """Create an empty ranking.
+
+        Parameters
+        ----------
+        max_pools : int
+            Maximum number of candidate pools retained
+        """
+        self.max_pools = max_pools
+        # Pools keyed by hash of the candidate sequence (hashed once per call)
+        self._pools: OrderedDict[int, _CandidatePool] = OrderedDict()
+        self._members: dict[str, set[int]] = {}
+        self._watched: dict[str, ParticipantMetrics] = {}
+
+    def select_shortest_queue(
+        self, participant_ids: tuple[str, ...], metrics: dict[str, ParticipantMetrics]
+    ) -> int | None:
+        """Get the candidate with the fewest active work items.
+
+        Parameters
+        ----------
+        participant_ids : tuple[str, ...]
+            Candidate participant IDs
+        metrics : dict[str, ParticipantMetrics]
+            Participant metrics by ID
+
+        Returns
+        -------
+        int | None
+            Position of the selected candidate in ``participant_ids``
+            (ties broken by ID), or None if there are no candidates
+        """
+        pool = self._pool_for(participant_ids, metrics)
+        selected = pool.by_queue.peek()
+        return pool.positions[selected] if selected is not None else None
+
+    def select_fastest(self, participant_ids: tuple[str, ...], metrics: dict[str, ParticipantMetrics]) -> int | None:
+        """Get the candidate with the lowest average completion time.
+
+        Parameters
+        ----------
+        participant_ids : tuple[str, ...]
+            Candidate participant IDs
+        metrics : dict[str, ParticipantMetrics]
+            Participant metrics by ID
+
+        Returns
+        -------
+        int | None
+            Position of the selected candidate in ``participant_ids``
+            (ties broken by ID), or None if there are no candidates
+        """
+        pool = self._pool_for(participant_ids, metrics)
+        selected = pool.by_speed.peek()
+        return pool.positions[selected] if selected is not None else None
+
+    def clear(self) -> None:
+        """Drop all pools and detach from metrics objects."""
+        for metrics in self._watched.values():
+            metrics.remove_listener(self._on_metrics_changed)
+        self._pools.clear()
+        self._members.clear()
+        self._watched.clear()
+
+    def _pool_for(self, participant_ids: tuple[str, ...], metrics: dict[str, ParticipantMetrics]) -> _CandidatePool:
+        key = hash(participant_ids)
+        pool = self._pools.get(key)
+        if pool is None or pool.participant_ids != participant_ids:
+            pool = self._create_pool(key, participant_ids)
+        else:
+            self._pools.move_to_end(key)
+
+        # In-place value changes arrive through listeners. A versioned map
+        # that has not changed since the last sync needs no further check;
+        # otherwise entries added, removed or replaced show up as a
+        # different object in the candidate's slot.
+        version = getattr(metrics, "version", None)
+        if version is not None and pool.synced_map is metrics and pool.synced_version == version:
+            return pool
+        current = list(map(metrics.get, pool.member_ids))
+        if len(current) != len(pool.tracked_list) or not all(map(is_, current, pool.tracked_list)):
+            tracked = pool.tracked
+            for participant_id, entry in zip(pool.member_ids, current):
+                if participant_id not in tracked or tracked[participant_id] is not entry:
+                    self._watch(participant_id, entry)
+                    pool.rank(participant_id, entry)
+            pool.tracked_list = current
+        if version is not None:
+            pool.synced_map = metrics  # type: ignore[assignment]
+            pool.synced_version = version
+        return pool
+
+    def _create_pool(self, key: int, participant_ids: tuple[str, ...]) -> _CandidatePool:
+        replaced = self._pools.pop(key, None)
+        if replaced is not None:
+            self._forget_pool(key, replaced)
+
+        pool = _CandidatePool(participant_ids)
+        for participant_id in pool.positions:
+            self._members.setdefault(participant_id, set()).add(key)
+        self._pools[key] = pool
+
+        while len(self._pools) > self.max_pools:
+            evicted_key, evicted = self._pools.popitem(last=False)
+            self._forget_pool(evicted_key, evicted)
+        return pool
+
+    def _forget_pool(self, key: int, pool: _CandidatePool) -> None:
+        for participant_id in pool.positions:
+            pools = self._members.get(participant_id)
+            if pools is not None:
+                pools.discard(key)
+                if not pools:
+                    del self._members[participant_id]
+                    self._watch(participant_id, None)
+
+    def _watch(self, participant_id: str, metrics: ParticipantMetrics | None) -> None:
+        previous = self._watched.get(participant_id)
+        if previous is metrics:
+            return
+        if previous is not None:
+            previous.remove_listener(self._on_metrics_changed)
+            del self._watched[participant_id]
+        if metrics is not None:
+            metrics.add_listener(self._on_metrics_changed)
+            self._watched[participant_id] = metrics
+
+    def _on_metrics_changed(self, metrics: ParticipantMetrics) -> None:
+        participant_id = metrics.participant_id
+        for key in self._members.get(participant_id, ()):
+            pool = self._pools[key]
+            if pool.tracked.get(participant_id) is metrics:
+                pool.rank(participant_id, metrics)
+
+
 @dataclass
 class DistributionContext:
     """Context for distribution decisions.
@@ -96,15 +625,19 @@ class DistributionContext:
     case_id : str
         Case ID
     metrics : dict[str, ParticipantMetrics]
-        Participant metrics by ID
+        Participant metrics by ID (a ParticipantMetricsMap lets rankings
+        skip per-call change detection)
     round_robin_index : dict[str, int]
         Round robin indices by task ID
+    ranking : ParticipantRanking
+        Incremental queue-length and throughput rankings
     """
 
     task_id: str
     case_id: str
-    metrics: dict[str, ParticipantMetrics] = field(default_factory=dict)
+    metrics: dict[str, ParticipantMetrics] = field(default_factory=ParticipantMetricsMap)
     round_robin_index: dict[str, int] = field(default_factory=dict)
+    ranking: ParticipantRanking = field(default_factory=ParticipantRanking, repr=False, compare=False)
 
     def get_next_round_robin_index(self, participant_count: int) -> int:
         """Get next index for round robin.
@@ -203,6 +736,8 @@ class Distributor:
     def _shortest_queue(self, participants: list[Any]) -> list[Any]:
         """Select participant with shortest queue.
 
+        Ties are broken by participant ID.
+
         Parameters
         ----------
         participants : list[Any]
@@ -216,16 +751,16 @@ class Distributor:
         if not self.context or not self.context.metrics:
             return [random.choice(participants)]
 
-        def get_queue_length(p: Any) -> int:
-            metrics = self.context.metrics.get(p.id) if self.context else None
-            return metrics.active_work_items if metrics else 0
-
-        sorted_participants = sorted(participants, key=get_queue_length)
-        return [sorted_participants[0]]
+        participant_ids = tuple(map(_participant_id, participants))
+        index = self.context.ranking.select_shortest_queue(participant_ids, self.context.metrics)
+        return [participants[index]]
 
     def _fastest(self, participants: list[Any]) -> list[Any]:
         """Select fastest participant.
 
+        Participants without completion history rank last; ties are
+        broken by participant ID.
+
         Parameters
         ----------
         participants : list[Any]
@@ -239,14 +774,9 @@ class Distributor:
         if not self.context or not self.context.metrics:
             return [random.choice(participants)]
 
-        def get_avg_time(p: Any) -> float:
-            metrics = self.context.metrics.get(p.id) if self.context else None
-            if metrics and metrics.average_completion_time_ms > 0:
-                return metrics.average_completion_time_ms
-            return float("inf")
-
-        sorted_participants = sorted(participants, key=get_avg_time)
-        return [sorted_participants[0]]
+        participant_ids = tuple(map(_participant_id, participants))
+        index = self.context.ranking.select_fastest(participant_ids, self.context.metrics)
+        return [participants[index]]
 
 
 def create_distributor(strategy: DistributionStrategy | str, context: DistributionContext | None = None) -> Distributor:
@@ -24,7 +24,7 @@ from kgcl.yawl.worklets.protocols import (
     WorkletRepositoryProtocol,
 )
 from kgcl.yawl.worklets.repository import WorkletQueryBuilder, WorkletRepository
-from kgcl.yawl.worklets.rules import RDREngine, RuleContext
+from kgcl.yawl.worklets.rules import RDREngine, RuleContext, compile_condition
 
 # Configure module-level logger
 _logger: Logger = logging.getLogger(__name__)
@@ -46,6 +46,7 @@ __all__ = [
     # Rules
     "RDREngine",
     "RuleContext",
+    "compile_condition",
     # Repository
     "WorkletRepository",
     "WorkletQueryBuilder",
@@ -6,6 +6,7 @@ for the YAWL worklet exception handling service.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
@@ -400,6 +401,9 @@ class RDRNode:
         Rule description
     created : datetime
         Creation timestamp
+    compiled : tuple[str, Callable[[Any], bool]] | None
+        Condition text and its compiled predicate, set by the engine
+        that owns the tree
 
     Examples
     --------
@@ -417,6 +421,7 @@ class RDRNode:
     cornerstone_case: dict[str, Any] | None = None
     description: str = ""
     created: datetime = field(default_factory=datetime.now)
+    compiled: tuple[str, Callable[[Any], bool]] | None = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate RDR node data."""
@@ -7,9 +7,11 @@ and selecting appropriate worklets for exceptions.
 from __future__ import annotations
 
 import logging
+import threading
+import uuid
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from kgcl.yawl.worklets.exceptions import RDRTreeError, RuleEvaluationError
@@ -111,6 +113,102 @@ class RuleContext:
         return self.attributes.get(name, default)
 
 
+ConditionPredicate = Callable[[RuleContext], bool]
+
+
+def compile_condition(condition: str) -> ConditionPredicate:
+    """Compile a condition expression into a predicate.
+
+    The expression is tokenized once; the returned closure only looks
+    up context values and compares them. Operators are recognised in
+    the same order as the interpreter always used: ``>=``, ``<=``,
+    ``==``, ``!=``, ``>``, ``<``, `` in ``, otherwise a truthy
+    variable check.
+
+    Parameters
+    ----------
+    condition : str
+        Condition expression
+
+    Returns
+    -------
+    ConditionPredicate
+        Predicate evaluating the condition against a RuleContext
+
+    Examples
+    --------
+    >>> predicate = compile_condition("priority == high")
+    >>> predicate(RuleContext(case_id="case-001", case_data={"priority": "HIGH"}))
+    True
+    """
+    condition = condition.strip()
+
+    # Boolean literals (case-insensitive)
+    condition_lower = condition.lower()
+    if condition_lower in ("true", "1", "yes"):
+        return lambda context: True
+    if condition_lower in ("false", "0", "no"):
+        return lambda context: False
+
+    def failing(error: Exception) -> ConditionPredicate:
+        def predicate(context: RuleContext) -> bool:
+            raise RuleEvaluationError(condition=condition, message=f"Failed to evaluate condition: {error}") from error
+
+        return predicate
+
+    def numeric(operator: str, compare: Callable[[float, float], bool]) -> ConditionPredicate:
+        parts = condition.split(operator, 1)
+        var_name = parts[0].strip()
+        try:
+            threshold = float(parts[1].strip())
+        except ValueError as e:
+            return failing(e)
+
+        def predicate(context: RuleContext) -> bool:
+            try:
+                actual = float(context.get(var_name, 0))
+            except (ValueError, TypeError) as e:
+                raise RuleEvaluationError(condition=condition, message=f"Failed to evaluate condition: {e}") from e
+            return compare(actual, threshold)
+
+        return predicate
+
+    def textual(operator: str, equal: bool) -> ConditionPredicate:
+        parts = condition.split(operator, 1)
+        var_name = parts[0].strip()
+        expected = parts[1].strip().strip("'\"").lower()
+        if equal:
+            return lambda context: str(context.get(var_name, "")).lower() == expected
+        return lambda context: str(context.get(var_name, "")).lower() != expected
+
+    # Check for operators (order matters - check longer first)
+    if ">=" in condition:
+        return numeric(">=", lambda actual, threshold: actual >= threshold)
+    if "<=" in condition:
+        return numeric("<=", lambda actual, threshold: actual <= threshold)
+    if "==" in condition:
+        return textual("==", equal=True)
+    if "!=" in condition:
+        return textual("!=", equal=False)
+    if ">" in condition:
+        return numeric(">", lambda actual, threshold: actual > threshold)
+    if "<" in condition:
+        return numeric("<", lambda actual, threshold: actual < threshold)
+
+    if " in " in condition:
+        parts = condition.split(" in ", 1)
+        var_name = parts[0].strip()
+        values_str = parts[1].strip()
+        # Parse list
+        if values_str.startswith("[") and values_str.endswith("]"):
+            values_str = values_str[1:-1]
+        values = frozenset(v.strip().strip("'\"").lower() for v in values_str.split(",") if v.strip())
+        return lambda context: str(context.get(var_name, "")).lower() in values
+
+    # Condition is just a variable name (truthy check)
+    return lambda context: bool(context.get(condition))
+
+
 @dataclass
 class RDREngine:
     """Engine for traversing RDR trees and selecting worklets.
@@ -125,9 +223,9 @@ class RDREngine:
     evaluator : RDREvaluatorProtocol | None
         Custom condition evaluator (Protocol-based)
     enable_caching : bool
-        Enable condition evaluation caching
+        Compile node conditions into predicates ahead of traversal
     cache_size : int
-        Maximum cache size for LRU cache
+        Maximum number of ad-hoc compiled conditions kept (LRU)
 
     Examples
     --------
@@ -140,10 +238,17 @@ class RDREngine:
     evaluator: RDREvaluatorProtocol | None = None
     enable_caching: bool = True
     cache_size: int = 128
+    _compiled: OrderedDict[str, ConditionPredicate] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _compiled_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
     def add_tree(self, tree: RDRTree) -> None:
         """Add an RDR tree.
 
+        Conditions of all nodes are compiled on insertion and attached
+        to the nodes.
+
         Parameters
         ----------
         tree : RDRTree
@@ -151,6 +256,7 @@ class RDREngine:
         """
         key = self._make_key(tree.task_id, tree.exception_type)
         self.trees[key] = tree
+        self._precompile(tree.root)
 
     def get_tree(self, task_id: str | None = None, exception_type: str = "default") -> RDRTree | None:
         """Get RDR tree for task and exception type.
@@ -232,7 +338,7 @@ class RDREngine:
         str | None
             Worklet ID or None
         """
-        if self._evaluate_condition(node.condition, context):
+        if self._evaluate_node(node, context):
             # Condition is true
             if node.true_child:
                 # Try refinement
@@ -247,6 +353,38 @@ class RDREngine:
                 return self._traverse(node.false_child, context)
             return None
 
+    def _evaluate_node(self, node: RDRNode, context: RuleContext) -> bool:
+        """Evaluate a node's condition with its compiled predicate.
+
+        Nodes linked into a tree after it was added, or whose condition
+        was edited in place, are compiled on their next visit.
+
+        Parameters
+        ----------
+        node : RDRNode
+            Node to evaluate
+        context : RuleContext
+            Evaluation context
+
+        Returns
+        -------
+        bool
+            Evaluation result
+
+        Raises
+        ------
+        RuleEvaluationError
+            If condition evaluation fails
+        """
+        if self.evaluator or not self.enable_caching:
+            return self._evaluate_condition(node.condition, context)
+        compiled = node.compiled
+        if compiled is None or compiled[0] != node.condition:
+            if not node.condition.strip():
+                raise RuleEvaluationError(condition=node.condition, message="Condition cannot be empty")
+            compiled = node.compiled = (node.condition, compile_condition(node.condition))
+        return compiled[1](context)
+
     def _evaluate_condition(self, condition: str, context: RuleContext) -> bool:
         """Evaluate a condition expression.
 
@@ -278,8 +416,6 @@ class RDREngine:
             except Exception as e:
                 raise RuleEvaluationError(condition=condition, message=f"Custom evaluator failed: {e}") from e
 
-        # Built-in evaluation (caching disabled for now due to context complexity)
-        # In production, implement proper caching with context serialization
         return self._default_evaluate(condition, context)
 
     def _default_evaluate(self, condition: str, context: RuleContext) -> bool:
@@ -293,6 +429,10 @@ class RDREngine:
         - "var in [a, b, c]"
         - Safe Python expressions (if enabled)
 
+        Used for conditions outside the engine's trees: the condition is
+        compiled into a predicate on first use (see ``compile_condition``)
+        and served from the engine's LRU condition cache afterwards.
+
         Parameters
         ----------
         condition : str
@@ -310,77 +450,75 @@ class RDREngine:
         RuleEvaluationError
             If condition evaluation fails
         """
-        condition = condition.strip()
+        return self.get_compiled_condition(condition)(context)
 
-        # Boolean literals (case-insensitive)
-        condition_lower = condition.lower()
-        if condition_lower in ("true", "1", "yes"):
-            return True
-        if condition_lower in ("false", "0", "no"):
-            return False
+    def get_compiled_condition(self, condition: str) -> ConditionPredicate:
+        """Get the compiled predicate for a condition.
 
-        # Try to parse as comparison
-        try:
-            # Check for operators (order matters - check longer first)
-            if ">=" in condition:
-                parts = condition.split(">=", 1)
-                var_name = parts[0].strip()
-                threshold = float(parts[1].strip())
-                actual = float(context.get(var_name, 0))
-                return actual >= threshold
+        Predicates are cached by condition text (LRU, bounded by
+        ``cache_size``). Tree traversal does not use this cache: nodes
+        carry their own predicates.
 
-            if "<=" in condition:
-                parts = condition.split("<=", 1)
-                var_name = parts[0].strip()
-                threshold = float(parts[1].strip())
-                actual = float(context.get(var_name, 0))
-                return actual <= threshold
-
-            if "==" in condition:
-                parts = condition.split("==", 1)
-                var_name = parts[0].strip()
-                expected = parts[1].strip().strip("'\"")
-                actual = str(context.get(var_name, "")).lower()
-                return actual == expected.lower()
-
-            if "!=" in condition:
-                parts = condition.split("!=", 1)
-                var_name = parts[0].strip()
-                expected = parts[1].strip().strip("'\"")
-                actual = str(context.get(var_name, "")).lower()
-                return actual != expected.lower()
-
-            if ">" in condition and ">=" not in condition:
-                parts = condition.split(">", 1)
-                var_name = parts[0].strip()
-                threshold = float(parts[1].strip())
-                actual = float(context.get(var_name, 0))
-                return actual > threshold
+        Parameters
+        ----------
+        condition : str
+            Condition expression
 
-            if "<" in condition and "<=" not in condition:
-                parts = condition.split("<", 1)
-                var_name = parts[0].strip()
-                threshold = float(parts[1].strip())
-                actual = float(context.get(var_name, 0))
-                return actual < threshold
-
-            if " in " in condition:
-                parts = condition.split(" in ", 1)
-                var_name = parts[0].strip()
-                values_str = parts[1].strip()
-                # Parse list
-                if values_str.startswith("[") and values_str.endswith("]"):
-                    values_str = values_str[1:-1]
-                values = [v.strip().strip("'\"") for v in values_str.split(",") if v.strip()]
-                actual = str(context.get(var_name, "")).lower()
-                return actual in [v.lower() for v in values]
-
-            # Check if condition is just a variable name (truthy check)
-            value = context.get(condition)
-            return bool(value)
-
-        except (ValueError, TypeError) as e:
-            raise RuleEvaluationError(condition=condition, message=f"Failed to evaluate condition: {e}") from e
+        Returns
+        -------
+        ConditionPredicate
+            Compiled predicate
+        """
+        if not self.enable_caching:
+            return compile_condition(condition)
+
+        with self._compiled_lock:
+            predicate = self._compiled.get(condition)
+            if predicate is not None:
+                self._compiled.move_to_end(condition)
+                return predicate
+
+            predicate = compile_condition(condition)
+            self._compiled[condition] = predicate
+            if len(self._compiled) > self.cache_size:
+                self._compiled.popitem(last=False)
+            return predicate
+
+    def invalidate_condition(self, condition: str) -> None:
+        """Drop a condition's compiled predicate from the cache.
+
+        Parameters
+        ----------
+        condition : str
+            Condition expression
+        """
+        with self._compiled_lock:
+            self._compiled.pop(condition, None)
+
+    def clear_condition_cache(self) -> None:
+        """Drop all compiled predicates."""
+        with self._compiled_lock:
+            self._compiled.clear()
+
+    def _precompile(self, node: RDRNode | None) -> None:
+        """Compile conditions of a subtree and attach them to its nodes.
+
+        Parameters
+        ----------
+        node : RDRNode | None
+            Subtree root
+        """
+        if self.evaluator or not self.enable_caching:
+            return
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current is None:
+                continue
+            if current.condition and current.condition.strip():
+                current.compiled = (current.condition, compile_condition(current.condition))
+            stack.append(current.true_child)
+            stack.append(current.false_child)
 
     def add_rule(
         self,
@@ -443,14 +581,13 @@ class RDREngine:
             )
 
         # Create new node
-        import uuid
-
         new_node = RDRNode(
             id=str(uuid.uuid4()), condition=condition, conclusion=conclusion, cornerstone_case=cornerstone_case
         )
 
         # Add to tree
         tree.add_node(new_node)
+        self._precompile(new_node)
 
         # Link to parent
         if is_true_branch:
@@ -464,6 +601,59 @@ class RDREngine:
 
         return new_node
 
+    def update_rule(
+        self, tree_id: str, node_id: str, condition: str | None = None, conclusion: str | None = None
+    ) -> RDRNode:
+        """Edit an existing rule's condition and/or conclusion.
+
+        The node's compiled predicate is replaced with one for the new
+        condition.
+
+        Parameters
+        ----------
+        tree_id : str
+            Tree ID
+        node_id : str
+            Node ID
+        condition : str | None
+            New condition expression (unchanged if None)
+        conclusion : str | None
+            New worklet ID for conclusion (unchanged if None)
+
+        Returns
+        -------
+        RDRNode
+            Updated node
+
+        Raises
+        ------
+        RDRTreeError
+            If tree or node not found
+        RuleEvaluationError
+            If condition is invalid
+        """
+        if condition is not None and not condition.strip():
+            raise RuleEvaluationError(condition=condition, message="Condition cannot be empty")
+
+        tree = next((t for t in self.trees.values() if t.id == tree_id), None)
+        if not tree:
+            raise RDRTreeError(tree_id=tree_id, message=f"RDR tree not found: {tree_id}")
+
+        node = tree.get_node(node_id)
+        if not node:
+            raise RDRTreeError(tree_id=tree_id, node_id=node_id, message=f"Node not found: {node_id}")
+
+        if condition is not None and condition != node.condition:
+            node.condition = condition
+            node.compiled = None
+            if not self.evaluator and self.enable_caching:
+                node.compiled = (condition, compile_condition(condition))
+        if conclusion is not None:
+            node.conclusion = conclusion
+
+        logger.info("Updated RDR rule", extra={"tree_id": tree_id, "node_id": node_id})
+        return node
+
     def _make_key(self, task_id: str | None, exception_type: str) -> str:
         """Make tree lookup key.
 
@@ -0,0 +1,106 @@
+"""Tests for lazy CLI and package imports.
+
+Verifies that importing the CLI application loads none of its noun groups
+or their heavy dependencies, that lazily registered groups still show up
+in help and run, and that the import cost stays within a budget.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+import kgcl.codegen
+import kgcl.hybrid
+from kgcl.cli.app import SUBCOMMANDS, app
+
+HEAVY_MODULES = [module.split(":")[0] for module, _help in SUBCOMMANDS.values()] + [
+    "dspy",
+    "pyshacl",
+    "kgcl.hybrid.hybrid_engine",
+    "kgcl.codegen.transpiler",
+]
+
+
+def _loaded_after(statement: str) -> set[str]:
+    """Run ``statement`` in a fresh interpreter and return the modules it loaded."""
+    code = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+class TestLazyCli:
+    """Tests for lazily registered noun groups."""
+
+    def test_import_loads_no_noun_group(self) -> None:
+        """Importing the app pulls in neither sub-CLIs nor their dependencies."""
+        assert _loaded_after("import kgcl.cli.app").isdisjoint(HEAVY_MODULES)
+
+    def test_help_lists_groups_without_importing_them(self) -> None:
+        """Top-level help shows every noun and its help text from the registry alone."""
+        loaded = _loaded_after(
+            "from typer.testing import CliRunner\n"
+            "from kgcl.cli.app import app\n"
+            "print(CliRunner().invoke(app, ['--help']).stdout, file=sys.stderr)"
+        )
+
+        assert loaded.isdisjoint(HEAVY_MODULES)
+        result = CliRunner().invoke(app, ["--help"])
+        for name, (_target, help_text) in SUBCOMMANDS.items():
+            assert re.search(rf"{name}\s+{re.escape(help_text)}", result.stdout)
+
+    def test_invoking_a_group_loads_only_that_group(self) -> None:
+        """Running one noun imports its module and leaves the others alone."""
+        loaded = _loaded_after(
+            "from typer.testing import CliRunner\n"
+            "from kgcl.cli.app import app\n"
+            "assert CliRunner().invoke(app, ['system', '--help']).exit_code == 0"
+        )
+
+        assert "kgcl.cli.system" in loaded
+        assert loaded.isdisjoint(set(HEAVY_MODULES) - {"kgcl.cli.system"})
+
+
+class TestLazyPackageExports:
+    """Tests for module-level ``__getattr__`` exports."""
+
+    @pytest.mark.parametrize("package", [kgcl.hybrid, kgcl.codegen])
+    def test_every_export_resolves(self, package: object) -> None:
+        """Each name in ``__all__`` is importable and listed by ``dir``."""
+        for name in package.__all__:  # type: ignore[attr-defined]
+            assert hasattr(package, name), name
+        assert set(package.__all__) <= set(dir(package))  # type: ignore[attr-defined]
+
+    def test_aliases_and_unknown_names(self) -> None:
+        """Renamed exports point at their source; unknown names raise AttributeError."""
+        from kgcl.hybrid.domain import PhysicsResult
+        from kgcl.hybrid.tick_controller import TickResult
+
+        assert kgcl.hybrid.DomainPhysicsResult is PhysicsResult
+        assert kgcl.hybrid.NewTickResult is TickResult
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            kgcl.hybrid.missing  # noqa: B018
+
+    def test_package_import_loads_no_submodule(self) -> None:
+        """Importing the packages defers their components."""
+        assert _loaded_after("import kgcl.hybrid, kgcl.codegen").isdisjoint(HEAVY_MODULES)
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+@pytest.mark.parametrize("module", ["kgcl.cli.app", "kgcl.hybrid", "kgcl.codegen"])
+def test_import_time_budget(module: str) -> None:
+    """``python -X importtime`` reports the module's cumulative import under 250 ms."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    ).stderr
+    cumulative_us = next(
+        int(line.split("|")[1]) for line in stderr.splitlines() if line.split("|")[-1].strip() == module
+    )
+
+    assert cumulative_us < 250_000, f"{module} took {cumulative_us / 1000:.0f} ms to import"
@@ -0,0 +1,21 @@
+"""Test configuration for codegen tests.
+
+Points the default graph cache directory at a per-test temporary
+directory, so tests never write cache files into the working tree.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from kgcl.codegen import cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Default ``GraphCache`` directory for the test."""
+    cache_dir = tmp_path / ".ttl2dspy_cache"
+    monkeypatch.setattr(cache, "DEFAULT_CACHE_DIR", cache_dir)
+    return cache_dir
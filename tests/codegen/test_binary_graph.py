@@ -0,0 +1,144 @@
+"""Tests for kgcl.codegen.binary_graph and the GraphCache disk tier.
+
+Verifies that binary images answer every triple pattern like the source
+graph, keep namespaces, reject foreign or outdated images, and that the
+GraphCache serves disk hits from them without re-reading unchanged sources.
+"""
+
+from __future__ import annotations
+
+import itertools
+import struct
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from rdflib import XSD, BNode, Graph, Literal, Namespace
+from rdflib.graph import ModificationException
+
+from kgcl.codegen.binary_graph import BinaryGraphStore, dumps_graph, load_graph, loads_graph, write_graph
+from kgcl.codegen.cache import GraphCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+EX = Namespace("http://example.org/")
+
+
+@pytest.fixture
+def graph() -> Graph:
+    """Graph mixing IRIs, blank nodes and typed, tagged and odd literals."""
+    graph = Graph()
+    graph.bind("ex", EX)
+    for n in range(300):
+        obj = EX[f"o{n % 11}"] if n % 3 == 0 else Literal(n)
+        graph.add((EX[f"s{n % 17}"], EX[f"p{n % 5}"], obj))
+    graph.add((BNode("b1"), EX.label, Literal("tab\tand\0nul", lang="en")))
+    graph.add((EX.s1, EX.value, Literal("1.50", datatype=XSD.decimal)))
+    return graph
+
+
+class TestBinaryImage:
+    """Tests for encoding and lazily querying binary images."""
+
+    def test_every_pattern_matches_rdflib(self, graph: Graph) -> None:
+        """All bound/unbound combinations, including absent terms, agree with the source."""
+        loaded = loads_graph(dumps_graph(graph))
+        terms = [None, EX.s1, EX.p2, EX.o0, Literal(4), BNode("b1"), EX.absent]
+
+        for pattern in itertools.product(terms, repeat=3):
+            assert set(loaded.triples(pattern)) == set(graph.triples(pattern)), pattern
+        assert len(loaded) == len(graph)
+
+    def test_file_round_trip_keeps_namespaces(self, graph: Graph, tmp_path: Path) -> None:
+        """A mapped file yields the same triples and prefix bindings."""
+        path = tmp_path / "graph.kgraph"
+        write_graph(graph, path)
+
+        loaded = load_graph(path)
+
+        assert set(loaded) == set(graph)
+        assert loaded.namespace_manager.compute_qname(EX.thing)[0] == "ex"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_loaded_graph_is_read_only(self, graph: Graph) -> None:
+        """Adding to an image-backed graph raises."""
+        loaded = loads_graph(dumps_graph(graph))
+
+        with pytest.raises(ModificationException):
+            loaded.add((EX.a, EX.b, EX.c))
+
+    @pytest.mark.parametrize(
+        ("mutate", "message"),
+        [
+            (lambda data: b"NOTGRAPH" + data[8:], "not a graph image"),
+            (lambda data: data[:8] + struct.pack("<I", 99) + data[12:], "version 99"),
+            (lambda data: data[:-3], "truncated"),
+        ],
+    )
+    def test_invalid_images_are_rejected(self, graph: Graph, mutate: object, message: str) -> None:
+        """Foreign, outdated and truncated images raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            BinaryGraphStore(mutate(dumps_graph(graph)))  # type: ignore[operator]
+
+
+class TestGraphCacheDiskTier:
+    """Tests for GraphCache persistence through binary images."""
+
+    def test_disk_hit_is_image_backed(self, graph: Graph, tmp_path: Path) -> None:
+        """A fresh cache loads the persisted image instead of a pickle."""
+        source = tmp_path / "onto.ttl"
+        source.write_text("@prefix ex: <http://example.org/> .\nex:a ex:b ex:c .")
+        writer = GraphCache(cache_dir=tmp_path)
+        writer.put(source, graph)
+
+        reader = GraphCache(cache_dir=tmp_path)
+        cached = reader.get(source)
+
+        assert cached is not None and isinstance(cached.store, BinaryGraphStore)
+        assert set(cached) == set(graph)
+        assert reader.stats()["disk_entries"] == 1
+
+    def test_outdated_image_is_a_miss(self, graph: Graph, tmp_path: Path) -> None:
+        """An image of another format version is discarded."""
+        source = tmp_path / "onto.ttl"
+        source.write_text("ex")
+        cache = GraphCache(cache_dir=tmp_path)
+        image = tmp_path / f"{cache._get_cache_key(source)}.kgraph"
+        data = dumps_graph(graph)
+        image.write_bytes(data[:8] + struct.pack("<I", 0) + data[12:])
+
+        assert cache.get(source) is None
+        assert not image.exists()
+
+    def test_unchanged_source_is_not_rehashed(self, tmp_path: Path) -> None:
+        """The content hash is reused until the file's stat changes."""
+        source = tmp_path / "onto.ttl"
+        source.write_text("first")
+        cache = GraphCache(enable_disk_cache=False)
+        key = cache._get_cache_key(source)
+        path, (signature, digest) = next(iter(cache._key_memo.items()))
+        cache._key_memo[path] = (signature, "memoized")
+
+        assert cache._get_cache_key(source) == "memoized"
+        source.write_text("second, longer")
+        assert cache._get_cache_key(source) not in {key, "memoized"}
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_warm_disk_hit_on_large_graph_takes_milliseconds(tmp_path: Path) -> None:
+    """Opening a 200k-triple image and running a lookup stays far below a parse."""
+    graph = Graph()
+    for n in range(200_000):
+        graph.add((EX[f"s{n // 10}"], EX[f"p{n % 10}"], Literal(n)))
+    path = tmp_path / "large.kgraph"
+    write_graph(graph, path)
+
+    start = time.perf_counter()
+    loaded = load_graph(path)
+    value = loaded.value(EX.s1234, EX.p5)
+    elapsed = time.perf_counter() - start
+
+    assert value == Literal(12345)
+    assert elapsed < 0.05
@@ -0,0 +1,132 @@
+"""Tests for incremental signature generation.
+
+Chicago School TDD tests verifying that after an ontology edit only the
+signatures derived from touched shapes and classes are rebuilt, in one
+transpiler and across transpiler instances through the on-disk state.
+"""
+
+from pathlib import Path
+
+import pytest
+from rdflib import Literal, URIRef
+
+from kgcl.codegen.incremental import DependencyMap, GenerationState, OntologyDelta
+from kgcl.codegen.transpiler import UltraOptimizedTTL2DSPyTranspiler
+
+PREFIXES = """
+@prefix ex: <http://example.org/> .
+@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+"""
+
+
+def _shape(name: str, comment: str = "Name") -> str:
+    return f"""
+ex:{name}Shape a sh:NodeShape ; sh:targetClass ex:{name} ; sh:property ex:{name}NameShape .
+ex:{name}NameShape sh:path ex:{name.lower()}Name ; sh:datatype xsd:string ; rdfs:comment "{comment}" .
+"""
+
+
+def _transpiler(cache_dir: Path) -> UltraOptimizedTTL2DSPyTranspiler:
+    return UltraOptimizedTTL2DSPyTranspiler(enable_parallel=False, cache_dir=cache_dir)
+
+
+@pytest.fixture
+def ontology(tmp_path: Path) -> Path:
+    """Ontology with three independent classes."""
+    path = tmp_path / "onto.ttl"
+    path.write_text(PREFIXES + _shape("Person") + _shape("Order") + _shape("Invoice"))
+    return path
+
+
+class TestIncrementalTranspiler:
+    """Tests for rebuilding only affected signatures."""
+
+    def test_edit_rebuilds_only_the_touched_signature(self, ontology: Path, tmp_path: Path) -> None:
+        """Changing one property shape keeps the other signatures verbatim."""
+        transpiler = _transpiler(tmp_path / "cache")
+        first = transpiler.ultra_build_signatures([ontology])
+
+        ontology.write_text(PREFIXES + _shape("Person", "Full name") + _shape("Order") + _shape("Invoice"))
+        second = transpiler.ultra_build_signatures([ontology])
+
+        assert transpiler.metrics.signatures_reused == 2
+        assert '"Full name"' in second["PersonSignature"]
+        assert second["OrderSignature"] == first["OrderSignature"]
+        assert second["InvoiceSignature"] == first["InvoiceSignature"]
+
+    def test_added_and_removed_classes(self, ontology: Path, tmp_path: Path) -> None:
+        """A new class is built, a removed one disappears, the rest are reused."""
+        transpiler = _transpiler(tmp_path / "cache")
+        transpiler.ultra_build_signatures([ontology])
+
+        ontology.write_text(PREFIXES + _shape("Person") + _shape("Order") + _shape("Refund"))
+        signatures = transpiler.ultra_build_signatures([ontology])
+
+        assert sorted(signatures) == ["OrderSignature", "PersonSignature", "RefundSignature"]
+        assert transpiler.metrics.signatures_reused == 2
+
+    def test_state_survives_a_new_transpiler(self, ontology: Path, tmp_path: Path) -> None:
+        """A fresh transpiler picks up the saved dependency map and cached graph."""
+        first = _transpiler(tmp_path / "cache").ultra_build_signatures([ontology])
+
+        ontology.write_text(PREFIXES + _shape("Person") + _shape("Order", "Reference") + _shape("Invoice"))
+        transpiler = _transpiler(tmp_path / "cache")
+        second = transpiler.ultra_build_signatures([ontology])
+
+        assert transpiler.metrics.signatures_reused == 2
+        assert second["PersonSignature"] == first["PersonSignature"]
+        assert '"Reference"' in second["OrderSignature"]
+
+    def test_changed_options_rebuild_everything(self, ontology: Path, tmp_path: Path) -> None:
+        """Options that affect every signature invalidate the whole state."""
+        transpiler = _transpiler(tmp_path / "cache")
+        transpiler.ultra_build_signatures([ontology])
+
+        transpiler.ultra_build_signatures([ontology], allow_multi_output=True)
+
+        assert transpiler.metrics.signatures_reused == 0
+
+    def test_non_incremental_mode_matches(self, ontology: Path, tmp_path: Path) -> None:
+        """Disabling incremental generation yields the same signature names."""
+        transpiler = _transpiler(tmp_path / "cache")
+        transpiler.incremental = False
+
+        assert sorted(transpiler.ultra_build_signatures([ontology])) == sorted(
+            _transpiler(tmp_path / "cache2").ultra_build_signatures([ontology])
+        )
+
+
+class TestDependencyMap:
+    """Tests for delta-driven staleness."""
+
+    def test_object_side_changes_touch_dependents(self) -> None:
+        """A new triple pointing at a class marks the class's artifact stale."""
+        shape, cls = URIRef("urn:NewShape"), URIRef("urn:Person")
+        delta = OntologyDelta.between(set(), {(shape, URIRef("urn:targetClass"), cls)})
+        dependencies = DependencyMap()
+        dependencies.record("urn:Person", "PersonSignature", "...", {"urn:PersonShape"})
+        dependencies.record("urn:Order", "OrderSignature", "...", {"urn:OrderShape"})
+
+        assert dependencies.stale(delta) == {"urn:Person"}
+
+    def test_literal_objects_are_not_dependencies(self) -> None:
+        """Literals equal to a node name do not count as touching it."""
+        delta = OntologyDelta.between({(URIRef("urn:a"), URIRef("urn:p"), Literal("urn:b"))}, set())
+
+        assert delta.touched == frozenset({"urn:a"})
+
+    def test_state_round_trip(self, tmp_path: Path) -> None:
+        """Saved state loads back with its reverse index rebuilt."""
+        dependencies = DependencyMap()
+        dependencies.record("urn:a", "A", "code", {"urn:shape"})
+        GenerationState("key", {"flag": True}, dependencies).save(tmp_path / "state.json")
+
+        loaded = GenerationState.load(tmp_path / "state.json")
+
+        assert loaded is not None and loaded.options == {"flag": True}
+        assert loaded.dependencies.stale(OntologyDelta(removed=frozenset({(URIRef("urn:shape"), None, None)}))) == {
+            "urn:a"
+        }
+        assert GenerationState.load(tmp_path / "missing.json") is None
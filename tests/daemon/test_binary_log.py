@@ -0,0 +1,273 @@
+"""Tests for the binary append-only event log.
+
+Verifies that events round-trip through the binary encoding, that the
+log survives reopening, torn writes and a lost index, that checksums
+catch corruption, and that RDFEventStore behaves the same on top of it
+with the RDF view available on demand.
+"""
+
+from __future__ import annotations
+
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from kgcl.daemon import (
+    BinaryEventLog,
+    DaemonConfig,
+    DomainEvent,
+    EventLogCorruptionError,
+    EventType,
+    KGCLDaemon,
+    RDFEventStore,
+    compute_state_hash,
+)
+from kgcl.daemon.binary_log import _TAIL_LIMIT
+from kgcl.daemon.event_store import EVENTS_GRAPH_URI, STATE_GRAPH
+
+
+def _event(index: int, event_type: EventType = EventType.TRIPLE_ADDED, **payload: object) -> DomainEvent:
+    return DomainEvent(
+        event_id=f"evt-{index}",
+        event_type=event_type,
+        timestamp=1_700_000_000.0 + index,
+        sequence=0,
+        payload=payload or {"s": f"urn:task:{index % 3}", "p": "urn:status", "o": f"Status {index % 2}"},
+    )
+
+
+def _history() -> list[DomainEvent]:
+    return [
+        _event(1),
+        _event(2),
+        _event(
+            3,
+            EventType.CHANGESET_APPLIED,
+            additions=[("urn:task:9", "urn:label", 'quoted "text"')],
+            removals=[("urn:task:1", "urn:status", "Status 1")],
+        ),
+        _event(4, EventType.TICK_COMPLETED, tick=4),
+        _event(5, EventType.HOOK_FIRED, score=0.5, flags={"dry_run": True}, enabled=False),
+        _event(6, EventType.TRIPLE_REMOVED, s="urn:task:0", p="urn:status", o="Status 0"),
+    ]
+
+
+def _write(directory: Path, events: list[DomainEvent]) -> None:
+    with BinaryEventLog(directory) as log:
+        for event in events:
+            log.append(event)
+
+
+def _with_sequence(event: DomainEvent, sequence: int) -> DomainEvent:
+    return DomainEvent(event.event_id, event.event_type, event.timestamp, sequence, event.payload, event.state_hash)
+
+
+class TestBinaryEventLog:
+    """Tests for BinaryEventLog on its own."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Every payload type decodes to the appended value."""
+        history = _history()
+        expected = [_with_sequence(event, seq) for seq, event in enumerate(history, 1)]
+        with BinaryEventLog(tmp_path) as log:
+            assert [log.append(event) for event in history] == [1, 2, 3, 4, 5, 6]
+
+            assert list(log.replay()) == expected
+            assert log.get(3) == expected[2]
+            assert log.find("evt-5") == expected[4]
+            assert log.get(0) is None
+            assert log.get(7) is None
+            assert log.find("missing") is None
+
+    def test_replay_filters(self, tmp_path: Path) -> None:
+        """Replay honours sequence bounds and event types."""
+        _write(tmp_path, _history())
+        with BinaryEventLog(tmp_path) as log:
+            assert [e.sequence for e in log.replay(from_seq=2, to_seq=4)] == [3, 4]
+            assert [e.event_id for e in log.replay(event_types=[EventType.TICK_COMPLETED])] == ["evt-4"]
+            assert list(log.replay(event_types=[EventType.GRAPH_LOADED])) == []
+            assert log.count(event_type=EventType.TRIPLE_ADDED) == 2
+            assert log.count(from_seq=1, to_seq=3) == 2
+            assert log.sequence_at_time(1_700_000_003.5) == 3
+            assert log.sequence_at_time(0.0) == 0
+
+    def test_terms_are_shared(self, tmp_path: Path) -> None:
+        """Repeated IRIs and literals are stored once in the dictionary."""
+        with BinaryEventLog(tmp_path) as log:
+            for index in range(200):
+                log.append(_event(index))
+
+            # event type, s/p/o keys, 3 subjects, 1 predicate, 2 objects
+            assert log.term_count == 10
+
+    def test_reopen(self, tmp_path: Path) -> None:
+        """A reopened log continues the sequence with the same terms."""
+        _write(tmp_path, _history())
+        with BinaryEventLog(tmp_path) as log:
+            assert log.sequence == 6
+            assert log.append(_event(7)) == 7
+            assert log.get(2) == _with_sequence(_history()[1], 2)
+            assert log.verify() == 7
+
+    def test_torn_write_truncated(self, tmp_path: Path) -> None:
+        """An incomplete last record is dropped when the log is opened."""
+        _write(tmp_path, _history())
+        log_file = tmp_path / "events.log"
+        intact_size = log_file.stat().st_size
+        with log_file.open("ab") as handle:
+            handle.write(b"\x40\x00\x00\x00\x01\x02")
+
+        with BinaryEventLog(tmp_path) as log:
+            assert log.sequence == 6
+            assert log_file.stat().st_size == intact_size
+            assert log.append(_event(7)) == 7
+            assert log.get(7).event_id == "evt-7"
+
+    def test_index_rebuilt(self, tmp_path: Path) -> None:
+        """A missing or stale index is rebuilt from the log."""
+        _write(tmp_path, _history())
+        (tmp_path / "events.idx").unlink()
+
+        with BinaryEventLog(tmp_path) as log:
+            assert log.get(6).event_type == EventType.TRIPLE_REMOVED
+
+    def test_corruption_detected(self, tmp_path: Path) -> None:
+        """A flipped byte in a complete record fails its checksum."""
+        _write(tmp_path, _history())
+        log_file = tmp_path / "events.log"
+        data = bytearray(log_file.read_bytes())
+        data[len(data) // 2] ^= 0xFF
+        log_file.write_bytes(bytes(data))
+
+        with pytest.raises(EventLogCorruptionError):
+            BinaryEventLog(tmp_path)
+
+    def test_verify_detects_corruption_while_open(self, tmp_path: Path) -> None:
+        """verify() re-checks records already indexed."""
+        with BinaryEventLog(tmp_path) as log:
+            for event in _history():
+                log.append(event)
+            with (tmp_path / "events.log").open("r+b") as handle:
+                handle.seek(-3, 2)
+                last = handle.read(1)
+                handle.seek(-3, 2)
+                handle.write(bytes((last[0] ^ 0xFF,)))
+
+            with pytest.raises(EventLogCorruptionError):
+                log.verify()
+
+    def test_reads_between_appends_keep_maps(self, tmp_path: Path) -> None:
+        """Reading each event after appending it maps the files again only once the tail is full."""
+        events = [_event(index) for index in range(1, _TAIL_LIMIT + 10)]
+        with BinaryEventLog(tmp_path) as log:
+            log.append(events[0])
+            assert log.get(1).event_id == "evt-1"
+            first_map = log._log_map
+            for sequence, event in enumerate(events[1:_TAIL_LIMIT], 2):
+                log.append(event)
+                assert log.get(sequence).event_id == event.event_id
+            assert log._log_map is first_map
+
+            for event in events[_TAIL_LIMIT:]:
+                log.append(event)
+            assert [e.event_id for e in log.replay()] == [e.event_id for e in events]
+            assert log._log_map is not first_map
+            assert log.sequence_at_time(events[-1].timestamp) == len(events)
+
+    def test_sequence_at_time_with_unordered_timestamps(self, tmp_path: Path) -> None:
+        """An event stamped earlier than its predecessor still yields the highest matching sequence."""
+        with BinaryEventLog(tmp_path) as log:
+            for index in (1, 2, 5, 3, 6):
+                log.append(_event(index))
+
+            assert log.sequence_at_time(1_700_000_003.5) == 4
+            assert log.sequence_at_time(1_700_000_004.5) == 4
+            assert log.sequence_at_time(1_700_000_000.5) == 0
+
+        with BinaryEventLog(tmp_path) as reopened:
+            assert reopened.sequence_at_time(1_700_000_003.5) == 4
+
+    def test_unencodable_payload_leaves_log_usable(self, tmp_path: Path) -> None:
+        """A failed append does not leave dangling dictionary terms."""
+        with BinaryEventLog(tmp_path) as log:
+            with pytest.raises(TypeError):
+                log.append(_event(1, EventType.HOOK_FIRED, name="new-term", handle=object()))
+            log.append(_event(2, EventType.HOOK_FIRED, name="new-term"))
+
+        with BinaryEventLog(tmp_path) as log:
+            assert log.get(1).payload == {"name": "new-term"}
+
+
+class TestRDFEventStoreOnBinaryLog:
+    """Tests for RDFEventStore using a binary log."""
+
+    def test_same_views_as_rdf_log(self, tmp_path: Path) -> None:
+        """State, replay and time travel match the RDF-encoded log."""
+        rdf = RDFEventStore()
+        with closing(RDFEventStore(event_log=BinaryEventLog(tmp_path))) as binary:
+            for event in _history():
+                binary.append(event)
+                rdf.append(event)
+
+            assert compute_state_hash(binary.store, STATE_GRAPH) == compute_state_hash(rdf.store, STATE_GRAPH)
+            triples = [EventType.TRIPLE_ADDED, EventType.TRIPLE_REMOVED, EventType.CHANGESET_APPLIED]
+            assert list(binary.replay(event_types=triples)) == list(rdf.replay(event_types=triples))
+            assert binary.count_events() == rdf.count_events() == 6
+            assert binary.sequence_at_time(1_700_000_002.0) == rdf.sequence_at_time(1_700_000_002.0) == 2
+            for sequence in range(7):
+                assert compute_state_hash(binary.reconstruct_at(sequence)) == compute_state_hash(
+                    rdf.reconstruct_at(sequence)
+                )
+
+    def test_events_graph_only_on_demand(self, tmp_path: Path) -> None:
+        """The store holds only state; the RDF event view is built when asked."""
+        with closing(RDFEventStore(event_log=BinaryEventLog(tmp_path))) as store:
+            for event in _history():
+                store.append(event)
+
+            assert len(store.store) == len(list(store.store.quads_for_pattern(None, None, None, STATE_GRAPH)))
+            view = store.materialize_events(from_seq=3)
+        rows = view.query(
+            f"SELECT ?id WHERE {{ GRAPH <{EVENTS_GRAPH_URI}> {{ ?e <urn:kgcl:vocab#eventId> ?id }} }} ORDER BY ?id"
+        )
+        assert [row["id"].value for row in rows] == ["evt-4", "evt-5", "evt-6"]
+
+    def test_state_restored_on_reopen(self, tmp_path: Path) -> None:
+        """A fresh store over an existing log replays it into the state graph."""
+        with closing(RDFEventStore(event_log=BinaryEventLog(tmp_path))) as original:
+            for event in _history():
+                original.append(event)
+
+        with closing(RDFEventStore(event_log=BinaryEventLog(tmp_path))) as reopened:
+            assert reopened.sequence == 6
+            assert compute_state_hash(reopened.store, STATE_GRAPH) == compute_state_hash(original.store, STATE_GRAPH)
+
+    def test_close_closes_log(self, tmp_path: Path) -> None:
+        """Closing the store closes its binary log."""
+        store = RDFEventStore(event_log=BinaryEventLog(tmp_path))
+        store.append(_event(1))
+        store.close()
+
+        with pytest.raises(ValueError, match="closed"):
+            store.get_event_at_sequence(1)
+        RDFEventStore().close()
+
+    def test_fifo_limit_rejected(self, tmp_path: Path) -> None:
+        """FIFO purging cannot be combined with an append-only log."""
+        with BinaryEventLog(tmp_path) as log, pytest.raises(ValueError, match="append-only"):
+            RDFEventStore(max_event_log_size=10, event_log=log)
+
+    async def test_daemon_persists_events(self, tmp_path: Path) -> None:
+        """A daemon configured with a log directory resumes from it."""
+        config = DaemonConfig(tick_interval=3600.0, event_log_dir=tmp_path)
+        async with KGCLDaemon(config) as daemon:
+            await daemon.add("urn:task:1", "urn:status", "Pending")
+            await daemon.add_many([("urn:task:2", "urn:status", "Done"), ("urn:task:3", "urn:status", "Done")])
+
+        with pytest.raises(ValueError, match="closed"):
+            list(daemon.store.replay())
+        async with KGCLDaemon(config) as resumed:
+            assert resumed.sequence == daemon.sequence
+            assert resumed.event_count() == daemon.sequence
+            assert resumed.triple_count() == 3
@@ -0,0 +1,122 @@
+"""Tests for batched daemon mutations.
+
+Verifies that add_many and apply_changeset record one event, produce
+one receipt and one notification per batch, and that replay and
+time-travel reconstruct the same states as per-triple mutations.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+from pyoxigraph import Store
+
+from kgcl.daemon import DaemonConfig, DomainEvent, EventType, KGCLDaemon
+from kgcl.daemon.event_store import STATE_GRAPH, STATE_GRAPH_URI, compute_state_hash
+
+
+@pytest.fixture
+async def daemon() -> AsyncIterator[KGCLDaemon]:
+    """Running daemon with a tick interval long enough to never fire."""
+    async with KGCLDaemon(DaemonConfig(tick_interval=3600.0)) as running:
+        yield running
+
+
+def _triples(count: int) -> list[tuple[str, str, str]]:
+    return [(f"urn:task:{i}", "urn:status", f"Status {i}") for i in range(count)]
+
+
+def _contents(store: Store) -> set[str]:
+    return {f"{q.subject} {q.predicate} {q.object}" for q in store.quads_for_pattern(None, None, None, None)}
+
+
+class TestAddMany:
+    """Tests for KGCLDaemon.add_many."""
+
+    async def test_one_event_and_receipt_per_batch(self, daemon: KGCLDaemon) -> None:
+        """A batch is one event, one receipt and one notification."""
+        notified: list[DomainEvent] = []
+        daemon.subscribe(notified.append)
+
+        receipt = await daemon.add_many(_triples(50))
+        await daemon.flush_subscribers()
+
+        assert receipt.triples_added == 50
+        assert receipt.sequence == daemon.sequence == 1
+        assert daemon.event_count() == 1
+        assert daemon.triple_count() == 50
+        assert [e.event_type for e in notified] == [EventType.CHANGESET_APPLIED]
+        assert receipt.state_hash == compute_state_hash(daemon.store.store, STATE_GRAPH)
+
+    async def test_same_state_as_single_adds(self, daemon: KGCLDaemon) -> None:
+        """Batched and per-triple adds yield the same state hash."""
+        receipt = await daemon.add_many(_triples(10))
+
+        async with KGCLDaemon(DaemonConfig(tick_interval=3600.0)) as single:
+            for s, p, o in _triples(10):
+                last = await single.add(s, p, o)
+
+        assert receipt.state_hash == last.state_hash
+
+    async def test_empty_batch_rejected(self, daemon: KGCLDaemon) -> None:
+        """An empty batch records nothing."""
+        with pytest.raises(ValueError, match="no additions or removals"):
+            await daemon.add_many([])
+        assert daemon.event_count() == 0
+
+    async def test_requires_running_daemon(self) -> None:
+        """Batches are refused before start."""
+        with pytest.raises(RuntimeError, match="Cannot apply changeset"):
+            await KGCLDaemon(DaemonConfig()).add_many(_triples(1))
+
+
+class TestApplyChangeset:
+    """Tests for KGCLDaemon.apply_changeset."""
+
+    async def test_removals_applied_before_additions(self, daemon: KGCLDaemon) -> None:
+        """A changeset can replace values and counts both sides."""
+        await daemon.add_many(_triples(3))
+
+        receipt = await daemon.apply_changeset(
+            additions=[("urn:task:0", "urn:status", "Done")], removals=[("urn:task:0", "urn:status", "Status 0")]
+        )
+
+        assert (receipt.triples_added, receipt.triples_removed) == (1, 1)
+        result = await daemon.query(
+            f"SELECT ?o WHERE {{ GRAPH <{STATE_GRAPH_URI}> {{ <urn:task:0> <urn:status> ?o }} }}"
+        )
+        assert result.bindings == [{"o": "Done"}]
+
+    async def test_replay_returns_changeset_payload(self, daemon: KGCLDaemon) -> None:
+        """Replayed changeset events carry the exact triples."""
+        additions = [*_triples(2), ("urn:task:9", "urn:label", 'quoted "text", with comma')]
+        await daemon.apply_changeset(additions=additions, removals=[("urn:task:0", "urn:status", "Status 0")])
+
+        events = [event async for event in daemon.replay_events()]
+
+        assert len(events) == 1
+        assert events[0].payload["additions"] == additions
+        assert events[0].payload["removals"] == [("urn:task:0", "urn:status", "Status 0")]
+        assert daemon.store.get_event(events[0].event_id) == events[0]
+
+    async def test_time_travel_matches_single_mutations(self, daemon: KGCLDaemon) -> None:
+        """Reconstructed states at every sequence equal the per-triple history."""
+        await daemon.add_many(_triples(4))
+        await daemon.add("urn:task:9", "urn:status", "Extra")
+        await daemon.apply_changeset(
+            additions=[("urn:task:1", "urn:status", "Done")], removals=[("urn:task:1", "urn:status", "Status 1")]
+        )
+
+        async with KGCLDaemon(DaemonConfig(tick_interval=3600.0)) as single:
+            for s, p, o in _triples(4):
+                await single.add(s, p, o)
+            await single.add("urn:task:9", "urn:status", "Extra")
+            await single.remove("urn:task:1", "urn:status", "Status 1")
+            await single.add("urn:task:1", "urn:status", "Done")
+
+            checkpoints = [(1, 4), (2, 5), (3, 7)]
+            for batched_seq, single_seq in checkpoints:
+                batched_state = await daemon.get_state_at(batched_seq)
+                single_state = await single.get_state_at(single_seq)
+                assert _contents(batched_state) == _contents(single_state)
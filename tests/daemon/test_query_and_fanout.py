@@ -0,0 +1,236 @@
+"""Tests for off-loop queries and bounded subscriber fan-out.
+
+Verifies that queries run on the query pool under the configured
+timeout, and that each subscriber's queue applies its back-pressure
+policy, preserves order and reports lag metrics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+
+import pytest
+
+from kgcl.daemon import BackpressurePolicy, DaemonConfig, DomainEvent, KGCLDaemon
+from kgcl.daemon.event_store import STATE_GRAPH_URI
+from kgcl.daemon.kgcld import DaemonLimits
+
+COUNT_QUERY = f"SELECT (COUNT(*) AS ?n) WHERE {{ GRAPH <{STATE_GRAPH_URI}> {{ ?s ?p ?o }} }}"
+
+
+@pytest.fixture
+async def daemon() -> AsyncIterator[KGCLDaemon]:
+    """Running daemon with a tick interval long enough to never fire."""
+    async with KGCLDaemon(DaemonConfig(tick_interval=3600.0)) as running:
+        yield running
+
+
+class _Gate:
+    """Async subscriber that records events but waits for release."""
+
+    def __init__(self) -> None:
+        self.events: list[DomainEvent] = []
+        self.open = asyncio.Event()
+
+    async def __call__(self, event: DomainEvent) -> None:
+        await self.open.wait()
+        self.events.append(event)
+
+
+async def _add(daemon: KGCLDaemon, index: int) -> None:
+    await daemon.add(f"urn:task:{index}", "urn:status", "Pending")
+
+
+def _indices(events: list[DomainEvent]) -> list[int]:
+    return [int(event.payload["s"].rsplit(":", 1)[1]) for event in events]
+
+
+class TestQueryPool:
+    """Tests for query execution on worker threads."""
+
+    async def test_query_runs_on_worker_thread(self, daemon: KGCLDaemon) -> None:
+        """Queries are evaluated off the event loop thread."""
+        await _add(daemon, 1)
+
+        result = await daemon.query(COUNT_QUERY)
+
+        assert result.bindings == [{"n": "1"}]
+        assert result.at_sequence == 1
+        assert any(thread.name.startswith("kgcld-query") for thread in threading.enumerate())
+
+    async def test_concurrent_queries(self, daemon: KGCLDaemon) -> None:
+        """Many concurrent queries all return consistent results."""
+        await daemon.add_many([(f"urn:task:{i}", "urn:status", "Pending") for i in range(20)])
+
+        results = await asyncio.gather(*(daemon.query(COUNT_QUERY) for _ in range(16)))
+
+        assert {r.bindings[0]["n"] for r in results} == {"20"}
+
+    async def test_raw_queries_use_pool(self, daemon: KGCLDaemon) -> None:
+        """Raw queries also go through the pool."""
+        await _add(daemon, 1)
+        await _add(daemon, 2)
+
+        assert await daemon.query_raw(COUNT_QUERY) == [{"n": "2"}]
+
+    async def test_query_timeout(self) -> None:
+        """Queries exceeding the configured timeout raise TimeoutError."""
+        limits = DaemonLimits(query_timeout_seconds=0.001)
+        async with KGCLDaemon(DaemonConfig(tick_interval=3600.0, limits=limits)) as daemon:
+            await daemon.add_many([(f"urn:n:{i}", "urn:p", str(i)) for i in range(100)])
+            cross_join = f"""
+                SELECT (COUNT(*) AS ?n) WHERE {{
+                    GRAPH <{STATE_GRAPH_URI}> {{ ?a ?p ?x . ?b ?p ?y . ?c ?p ?z }}
+                }}
+            """
+            with pytest.raises(TimeoutError):
+                await daemon.query(cross_join)
+
+
+class TestSubscriberFanout:
+    """Tests for per-subscriber queues and back-pressure."""
+
+    async def test_delivery_in_order(self, daemon: KGCLDaemon) -> None:
+        """Sync and async subscribers see every event in sequence order."""
+        seen: list[DomainEvent] = []
+        gate = _Gate()
+        gate.open.set()
+        daemon.subscribe(seen.append)
+        daemon.subscribe(gate)
+
+        for index in range(10):
+            await _add(daemon, index)
+        await daemon.flush_subscribers()
+
+        assert _indices(seen) == list(range(10))
+        assert gate.events == seen
+
+    async def test_block_holds_mutation_until_room(self, daemon: KGCLDaemon) -> None:
+        """A full BLOCK queue delays the mutation, not other work."""
+        gate = _Gate()
+        subscription = daemon.subscribe(gate, policy=BackpressurePolicy.BLOCK, queue_size=1)
+        await _add(daemon, 1)
+        await asyncio.sleep(0)
+        await _add(daemon, 2)
+
+        blocked = asyncio.create_task(_add(daemon, 3))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert subscription.stats().lag == 1
+        assert (await daemon.query(COUNT_QUERY)).bindings == [{"n": "3"}]
+
+        gate.open.set()
+        await blocked
+        await daemon.flush_subscribers()
+        assert _indices(gate.events) == [1, 2, 3]
+
+    async def test_reentrant_mutation_under_block(self, daemon: KGCLDaemon) -> None:
+        """A BLOCK subscriber may mutate the daemon from its callback while a mutation waits on it."""
+        seen: list[DomainEvent] = []
+        gate = asyncio.Event()
+
+        async def reenter(event: DomainEvent) -> None:
+            seen.append(event)
+            if _indices([event]) == [1]:
+                await gate.wait()
+                await _add(daemon, 10)
+
+        daemon.subscribe(reenter, policy=BackpressurePolicy.BLOCK, queue_size=1)
+        await _add(daemon, 1)
+        await asyncio.sleep(0)
+        await _add(daemon, 2)
+        blocked = asyncio.create_task(_add(daemon, 3))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        gate.set()
+        await asyncio.wait_for(blocked, timeout=5.0)
+        await asyncio.wait_for(daemon.flush_subscribers(), timeout=5.0)
+        assert _indices(seen) == [1, 2, 3, 10]
+
+    async def test_queue_size_must_be_positive(self, daemon: KGCLDaemon) -> None:
+        """An explicit queue size of zero is rejected rather than replaced by the default."""
+        with pytest.raises(ValueError, match="at least 1, got 0"):
+            daemon.subscribe(print, queue_size=0)
+        with pytest.raises(ValueError, match="at least 1, got -1"):
+            daemon.subscribe(print, queue_size=-1)
+        assert daemon.subscriber_stats() == []
+
+    async def test_drop_oldest(self, daemon: KGCLDaemon) -> None:
+        """DROP_OLDEST discards the oldest queued events and counts them."""
+        gate = _Gate()
+        subscription = daemon.subscribe(gate, policy=BackpressurePolicy.DROP_OLDEST, queue_size=2)
+        await _add(daemon, 1)
+        await asyncio.sleep(0)
+        for index in range(2, 6):
+            await _add(daemon, index)
+
+        stats = subscription.stats()
+        assert (stats.lag, stats.max_lag, stats.dropped) == (2, 2, 2)
+
+        gate.open.set()
+        await daemon.flush_subscribers()
+        assert _indices(gate.events) == [1, 4, 5]
+        assert subscription.stats().delivered == 3
+
+    async def test_disconnect(self, daemon: KGCLDaemon) -> None:
+        """DISCONNECT unsubscribes a lagging subscriber and cancels its delivery."""
+        gate = _Gate()
+        subscription = daemon.subscribe(gate, policy=BackpressurePolicy.DISCONNECT, queue_size=1)
+        await _add(daemon, 1)
+        await asyncio.sleep(0)
+        await _add(daemon, 2)
+        await _add(daemon, 3)
+
+        assert not subscription.connected
+        assert daemon.subscriber_stats() == []
+
+        gate.open.set()
+        await _add(daemon, 4)
+        await daemon.flush_subscribers()
+        assert gate.events == []
+
+    async def test_failing_subscriber_isolated(self, daemon: KGCLDaemon) -> None:
+        """A raising callback is counted and does not affect others."""
+        seen: list[DomainEvent] = []
+
+        def fail(event: DomainEvent) -> None:
+            raise ValueError(event.event_id)
+
+        failing = daemon.subscribe(fail)
+        daemon.subscribe(seen.append)
+
+        await _add(daemon, 1)
+        await _add(daemon, 2)
+        await daemon.flush_subscribers()
+
+        assert failing.stats().errors == 2
+        assert failing.stats().delivered == 0
+        assert _indices(seen) == [1, 2]
+
+    async def test_unsubscribe_and_early_subscription(self) -> None:
+        """Subscribing before start works and calling the handle unsubscribes."""
+        seen: list[DomainEvent] = []
+        daemon = KGCLDaemon(DaemonConfig(tick_interval=3600.0))
+        unsubscribe = daemon.subscribe(seen.append)
+
+        async with daemon:
+            await _add(daemon, 1)
+            await daemon.flush_subscribers()
+            unsubscribe()
+            await _add(daemon, 2)
+            await daemon.flush_subscribers()
+
+        assert _indices(seen) == [1]
+
+    async def test_stop_delivers_queued_events(self) -> None:
+        """Stopping the daemon flushes pending deliveries first."""
+        seen: list[DomainEvent] = []
+        async with KGCLDaemon(DaemonConfig(tick_interval=3600.0)) as daemon:
+            daemon.subscribe(seen.append)
+            for index in range(5):
+                await _add(daemon, index)
+
+        assert _indices(seen) == [0, 1, 2, 3, 4]
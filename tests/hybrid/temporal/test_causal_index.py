@@ -0,0 +1,137 @@
+"""Tests for the causal reachability index.
+
+Verifies that chain-decomposition labels agree with graph traversal on
+random DAGs, stay correct for histories deeper than the traversal
+limit, and are rebuilt when causes are recorded out of order.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime
+
+from kgcl.hybrid.temporal.adapters.causal_tracker_adapter import DefaultCausalityAnalyzer, InMemoryCausalTracker
+from kgcl.hybrid.temporal.adapters.in_memory_event_store import InMemoryEventStore
+from kgcl.hybrid.temporal.domain.causal_index import CausalReachabilityIndex
+from kgcl.hybrid.temporal.domain.event import EventType, WorkflowEvent
+
+
+def _random_dag(rng: random.Random, size: int) -> dict[str, tuple[str, ...]]:
+    causes: dict[str, tuple[str, ...]] = {}
+    for index in range(size):
+        candidates = [f"e{j}" for j in range(index)]
+        count = min(len(candidates), rng.choice([0, 1, 1, 1, 2, 3]))
+        causes[f"e{index}"] = tuple(rng.sample(candidates, count))
+    return causes
+
+
+def _ancestors(causes: dict[str, tuple[str, ...]], event_id: str) -> set[str]:
+    seen: set[str] = set()
+    stack = list(causes.get(event_id, ()))
+    while stack:
+        current = stack.pop()
+        if current not in seen:
+            seen.add(current)
+            stack.extend(causes.get(current, ()))
+    return seen
+
+
+def _event(event_id: str) -> WorkflowEvent:
+    return WorkflowEvent(
+        event_id=event_id,
+        event_type=EventType.STATUS_CHANGE,
+        workflow_id="wf-1",
+        timestamp=datetime(2025, 1, 1, tzinfo=UTC),
+        tick_number=0,
+        payload={},
+    )
+
+
+class TestCausalReachabilityIndex:
+    """Tests for the index on its own."""
+
+    def test_matches_traversal_on_random_dags(self) -> None:
+        """Every ancestor query agrees with a graph search."""
+        rng = random.Random(11)
+        for _ in range(20):
+            causes = _random_dag(rng, 40)
+            index = CausalReachabilityIndex()
+            for event_id, cause_ids in causes.items():
+                index.add(event_id, cause_ids)
+
+            for descendant in causes:
+                expected = _ancestors(causes, descendant)
+                actual = {candidate for candidate in causes if index.is_ancestor(candidate, descendant)}
+                assert actual == expected
+
+    def test_linear_history_uses_one_chain(self) -> None:
+        """A deep linear history is one chain and stays fully reachable."""
+        index = CausalReachabilityIndex()
+        for position in range(1, 5000):
+            index.add(f"e{position}", (f"e{position - 1}",))
+
+        assert index.chain_count == 1
+        assert index.is_ancestor("e0", "e4999")
+        assert not index.is_ancestor("e4999", "e0")
+
+    def test_unknown_events_are_unrelated(self) -> None:
+        """Events never added are neither ancestors nor descendants."""
+        index = CausalReachabilityIndex()
+        index.add("b", ("a",))
+
+        assert not index.is_ancestor("a", "missing")
+        assert not index.is_ancestor("missing", "b")
+        assert not index.is_ancestor("b", "b")
+
+    def test_rebuild_matches_traversal(self) -> None:
+        """Rebuilding from a cause mapping in any order gives correct labels."""
+        rng = random.Random(5)
+        causes = _random_dag(rng, 60)
+        shuffled = dict(rng.sample(list(causes.items()), len(causes)))
+        index = CausalReachabilityIndex()
+
+        index.rebuild(shuffled)
+
+        for descendant in causes:
+            expected = _ancestors(causes, descendant)
+            assert {c for c in causes if index.is_ancestor(c, descendant)} == expected
+
+
+class TestTrackerReachability:
+    """Tests for InMemoryCausalTracker and the analyzer using the index."""
+
+    def test_ancestry_beyond_default_depth(self) -> None:
+        """Deep histories are neither truncated nor traversed for ancestor checks."""
+        tracker = InMemoryCausalTracker(event_store=InMemoryEventStore())
+        for position in range(1, 300):
+            tracker.track_causation(f"e{position}", (f"e{position - 1}",))
+
+        assert tracker.is_ancestor("e0", "e299")
+        assert len(tracker.get_transitive_causes("e299")) == 299
+        assert tracker.get_root_causes("e299") == ("e0",)
+
+    def test_out_of_order_tracking_rebuilds(self) -> None:
+        """Recording a cause's own causes later is reflected in queries."""
+        tracker = InMemoryCausalTracker(event_store=InMemoryEventStore())
+        tracker.track_causation("c", ("b",))
+        assert not tracker.is_ancestor("a", "c")
+
+        tracker.track_causation("b", ("a",))
+
+        assert tracker.is_ancestor("a", "c")
+        assert not tracker._index.stale
+
+    def test_analyzer_uses_tracked_causation(self) -> None:
+        """Events without vector clocks are related through tracked causes."""
+        store = InMemoryEventStore()
+        for event_id in ("a", "b", "c", "d"):
+            store.append(_event(event_id))
+        tracker = InMemoryCausalTracker(event_store=store)
+        tracker.track_causation("b", ("a",))
+        tracker.track_causation("c", ("b",))
+        tracker.track_causation("d", ("a",))
+        analyzer = DefaultCausalityAnalyzer(tracker=tracker, event_store=store)
+
+        assert analyzer.check_causally_related("c", "a")
+        assert analyzer.check_concurrent("c", "d")
+        assert analyzer.find_common_causes(("c", "d")) == ("a",)
@@ -0,0 +1,159 @@
+"""Tests for checkpointed and segmented hash-chain verification.
+
+Verifies that repeated store verification only checks events appended
+after the last verified prefix, and that parallel segment verification
+reports the same first failure as a sequential walk.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from kgcl.hybrid.temporal.adapters.in_memory_event_store import InMemoryEventStore
+from kgcl.hybrid.temporal.domain.chain_verification import verify_chain_parallel, verify_segment
+from kgcl.hybrid.temporal.domain.event import EventType, WorkflowEvent
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _chain(count: int, workflow_id: str = "wf-1") -> list[WorkflowEvent]:
+    events: list[WorkflowEvent] = []
+    previous_hash = ""
+    for index in range(count):
+        event = WorkflowEvent(
+            event_id=f"{workflow_id}-{index}",
+            event_type=EventType.STATUS_CHANGE,
+            timestamp=BASE_TIME + timedelta(seconds=index),
+            tick_number=index,
+            workflow_id=workflow_id,
+            payload={"index": index},
+            previous_hash=previous_hash,
+        )
+        events.append(event)
+        previous_hash = event.event_hash
+    return events
+
+
+class TestVerifySegment:
+    """Tests for sequential verification."""
+
+    def test_valid_chain(self) -> None:
+        """An untouched chain verifies."""
+        assert verify_segment(_chain(5), "") == (True, "")
+
+    def test_detects_modified_payload(self) -> None:
+        """Content changed after hashing no longer matches the stored hash."""
+        events = _chain(5)
+        events[2].payload["index"] = 99
+
+        valid, error = verify_segment(events, "")
+
+        assert not valid
+        assert "wf-1-2 hash mismatch" in error
+
+
+class TestVerifyChainParallel:
+    """Tests for segmented verification."""
+
+    @pytest.mark.parametrize("segment_size", [1, 3, 4, 10, 50])
+    def test_matches_sequential(self, segment_size: int) -> None:
+        """Segmented verification agrees with a sequential walk."""
+        events = _chain(20)
+        events[9].payload["index"] = -1
+        events[15].payload["index"] = -1
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            result = verify_chain_parallel(events, segment_size=segment_size, executor=pool)
+
+        assert result == verify_segment(events, "")
+        assert "wf-1-9" in result[1]
+
+    def test_broken_link_at_segment_boundary(self) -> None:
+        """A link broken exactly at a segment start is detected."""
+        events = _chain(8)
+        events[4] = WorkflowEvent(
+            event_id="forged",
+            event_type=EventType.STATUS_CHANGE,
+            timestamp=BASE_TIME,
+            tick_number=4,
+            workflow_id="wf-1",
+            payload={},
+            previous_hash="0" * 64,
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            valid, error = verify_chain_parallel(events, segment_size=4, executor=pool)
+
+        assert not valid
+        assert "Hash chain broken at event forged" in error
+
+    def test_process_pool(self) -> None:
+        """Segments verify on the default process pool."""
+        assert verify_chain_parallel(_chain(12), segment_size=4, max_workers=2) == (True, "")
+
+    def test_rejects_empty_segments(self) -> None:
+        """Segment size must be positive."""
+        with pytest.raises(ValueError, match="segment_size"):
+            verify_chain_parallel(_chain(2), segment_size=0)
+
+
+class TestStoreCheckpoints:
+    """Tests for checkpointed store verification."""
+
+    def test_checkpoint_advances_with_new_events(self) -> None:
+        """Successful verification records the verified prefix."""
+        store = InMemoryEventStore()
+        events = _chain(6)
+        store.append_batch(events[:4])
+        assert store.verify_chain_integrity("wf-1") == (True, "")
+        assert store.get_chain_checkpoint("wf-1").verified_events == 4
+
+        store.append_batch(events[4:])
+        assert store.verify_chain_integrity("wf-1") == (True, "")
+
+        checkpoint = store.get_chain_checkpoint("wf-1")
+        assert checkpoint.verified_events == 6
+        assert checkpoint.last_sequence == 6
+        assert checkpoint.last_hash == events[-1].event_hash
+
+    def test_verified_prefix_not_rechecked(self) -> None:
+        """Only events after the checkpoint are verified; a full audit re-checks everything."""
+        store = InMemoryEventStore()
+        events = _chain(6)
+        store.append_batch(events)
+        store.verify_chain_integrity("wf-1")
+        events[1].payload["index"] = 42
+
+        assert store.verify_chain_integrity("wf-1") == (True, "")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            valid, error = store.audit_chain_integrity("wf-1", segment_size=2, executor=pool)
+        assert not valid
+        assert "wf-1-1 hash mismatch" in error
+
+    def test_failure_keeps_checkpoint(self) -> None:
+        """A broken link does not advance the checkpoint."""
+        store = InMemoryEventStore()
+        events = _chain(3)
+        store.append_batch(events)
+        store.verify_chain_integrity("wf-1")
+        store.append(_chain(1, workflow_id="wf-1")[0])
+
+        valid, error = store.verify_chain_integrity("wf-1")
+
+        assert not valid
+        assert "wf-1-0" in error
+        assert store.get_chain_checkpoint("wf-1").verified_events == 3
+
+    def test_workflows_checkpointed_independently(self) -> None:
+        """Interleaved workflows keep separate checkpoints."""
+        store = InMemoryEventStore()
+        first, second = _chain(3, "wf-a"), _chain(3, "wf-b")
+        for a, b in zip(first, second, strict=True):
+            store.append_batch([a, b])
+
+        assert store.verify_chain_integrity("wf-a") == (True, "")
+        assert store.get_chain_checkpoint("wf-a").last_sequence == 5
+        assert store.get_chain_checkpoint("wf-b") is None
@@ -0,0 +1,136 @@
+"""Tests for Karp–Miller coverability analysis.
+
+Verifies that the pruned coverability tree names exactly the unbounded
+places, that its witness is a real pumping sequence of the net, and that
+bounds and the minimal coverability set match exhaustive exploration on
+bounded nets.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+from kgcl.hybrid.temporal.analysis import OMEGA, CoverabilityAnalyzer
+from kgcl.hybrid.temporal.domain.petri_net import (
+    Marking,
+    WorkflowNet,
+    create_arc,
+    create_place,
+    create_transition,
+    create_workflow_net,
+)
+
+
+def _net(places: list[str], arcs: list[tuple[str, str] | tuple[str, str, int]]) -> WorkflowNet:
+    place_set = set(places)
+    transitions = sorted({node for arc in arcs for node in arc[:2] if node not in place_set})
+    return create_workflow_net(
+        [create_place(p, is_source=p == "i", is_sink=p == "o") for p in places],
+        [create_transition(t) for t in transitions],
+        [create_arc(*arc) for arc in arcs],
+    )
+
+
+def _generator_net() -> WorkflowNet:
+    """A loop that emits one token into ``q`` per iteration."""
+    return _net(
+        ["i", "loop", "q", "o"],
+        [("i", "start"), ("start", "loop"), ("loop", "emit"), ("emit", "loop"), ("emit", "q"), ("loop", "end"),
+         ("end", "o")],
+    )  # fmt: skip
+
+
+def _reachable(net: WorkflowNet) -> set[Marking]:
+    seen = {net.initial_marking()}
+    queue = deque(seen)
+    while queue:
+        marking = queue.popleft()
+        for t_id in net.enabled_transitions(marking):
+            following = net.fire(t_id, marking)
+            if following not in seen:
+                seen.add(following)
+                queue.append(following)
+    return seen
+
+
+class TestUnboundedNets:
+    """Tests for detection of unbounded places."""
+
+    def test_generator_place_is_unbounded(self) -> None:
+        """Only the accumulating place gets ω."""
+        result = CoverabilityAnalyzer().analyze(_generator_net())
+
+        assert not result.is_bounded
+        assert result.complete
+        assert result.unbounded_places == ("q",)
+        assert dict(result.place_bounds) == {"i": 1, "loop": 1, "o": 1}
+        assert (("loop", 1), ("q", OMEGA)) in result.minimal_coverability_set
+
+    def test_witness_pumps_in_the_real_net(self) -> None:
+        """Repeating the pumping suffix keeps adding tokens."""
+        net = _generator_net()
+
+        result = CoverabilityAnalyzer().analyze(net)
+
+        assert result.witness is not None and result.pumping_sequence is not None
+        prefix = result.witness.transitions[: len(result.witness) - len(result.pumping_sequence)]
+        marking = net.initial_marking()
+        for t_id in prefix:
+            marking = net.fire(t_id, marking)
+        counts = []
+        for _ in range(3):
+            for t_id in result.pumping_sequence.transitions:
+                marking = net.fire(t_id, marking)
+            counts.append(marking.get("q"))
+        assert counts == sorted(set(counts))
+
+    def test_unbounded_places_behind_concurrency(self) -> None:
+        """Two independent generators are both reported without exhausting nodes."""
+        net = _net(
+            ["i", "a", "b", "qa", "qb", "done_a", "done_b", "o"],
+            [("i", "split"), ("split", "a"), ("split", "b"), ("a", "emit_a"), ("emit_a", "a"), ("emit_a", "qa"),
+             ("b", "emit_b"), ("emit_b", "b"), ("emit_b", "qb", 2), ("a", "stop_a"), ("stop_a", "done_a"),
+             ("b", "stop_b"), ("stop_b", "done_b"), ("done_a", "join"), ("done_b", "join"), ("join", "o")],
+        )  # fmt: skip
+
+        result = CoverabilityAnalyzer(max_nodes=100).analyze(net)
+
+        assert result.complete
+        assert result.unbounded_places == ("qa", "qb")
+        assert result.nodes < 100
+
+    def test_node_limit_reports_incomplete(self) -> None:
+        """Stopping at max_nodes never claims boundedness."""
+        result = CoverabilityAnalyzer(max_nodes=2).analyze(_generator_net())
+
+        assert not result.complete
+        assert not result.is_bounded
+        assert CoverabilityAnalyzer(max_nodes=2).is_bounded(_generator_net())[0] is False
+
+
+class TestBoundedNets:
+    """Coverability results on bounded nets match explicit reachability."""
+
+    def test_bounds_match_reachable_markings(self) -> None:
+        """Place bounds and maximal markings equal those of the reachability set."""
+        net = _net(
+            ["i", "a", "b", "c", "o"],
+            [("i", "split"), ("split", "a"), ("split", "b"), ("a", "ta"), ("b", "tb"), ("ta", "c"), ("tb", "c"),
+             ("c", "join", 2), ("join", "o")],
+        )  # fmt: skip
+        reachable = _reachable(net)
+
+        result = CoverabilityAnalyzer().analyze(net)
+
+        expected_bounds = {p: max(m.get(p) for m in reachable) for m in reachable for p, _ in m.tokens}
+        maximal = {
+            m.tokens
+            for m in reachable
+            if not any(m != o and all(m.get(p) <= o.get(p) for p, _ in m.tokens) for o in reachable)
+        }
+        assert result.is_bounded
+        assert result.unbounded_places == ()
+        assert result.witness is None
+        assert dict(result.place_bounds) == expected_bounds
+        assert set(result.minimal_coverability_set) == maximal
+        assert CoverabilityAnalyzer().is_bounded(net) == (True, 2)
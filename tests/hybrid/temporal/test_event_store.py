@@ -439,3 +439,69 @@ def test_append_empty_batch(store: EventStore) -> None:
     assert result.event_ids == ()
     assert result.sequence_numbers == ()
     assert store.count() == 0
+
+
+def _scan_query(
+    events: list[WorkflowEvent],
+    start: datetime | None,
+    end: datetime | None,
+    workflow_id: str | None,
+    event_types: list[EventType] | None,
+) -> list[str]:
+    """Reference implementation: filter every event in sequence order."""
+    return [
+        e.event_id
+        for e in events
+        if (workflow_id is None or e.workflow_id == workflow_id)
+        and (start is None or e.timestamp >= start)
+        and (end is None or e.timestamp <= end)
+        and (event_types is None or e.event_type in event_types)
+    ]
+
+
+@pytest.mark.parametrize("shuffled", [False, True], ids=["ordered", "out-of-order"])
+@pytest.mark.parametrize(
+    ("workflow_id", "event_types"),
+    [
+        (None, None),
+        (None, [EventType.STATUS_CHANGE]),
+        (None, [EventType.STATUS_CHANGE, EventType.TICK_END]),
+        ("wf1", None),
+        ("wf1", [EventType.TICK_START]),
+        ("wf2", [EventType.STATUS_CHANGE, EventType.TICK_END]),
+    ],
+)
+def test_indexed_query_matches_scan(
+    base_time: datetime, shuffled: bool, workflow_id: str | None, event_types: list[EventType] | None
+) -> None:
+    """Indexed windows, counts and pages match a full scan."""
+    types = [EventType.TICK_START, EventType.STATUS_CHANGE, EventType.TICK_END]
+    offsets = [(i * 37) % 200 for i in range(200)] if shuffled else list(range(200))
+    events = [
+        create_event(f"e{i}", f"wf{i % 3}", types[i % 3 if i % 7 else 1], base_time + timedelta(seconds=offsets[i]))
+        for i in range(200)
+    ]
+    store = InMemoryEventStore()
+    store.append_batch(events)
+    start, end = base_time + timedelta(seconds=40), base_time + timedelta(seconds=150)
+
+    expected = _scan_query(events, start, end, workflow_id, event_types)
+    for offset in (0, 7, len(expected) - 3, len(expected) + 5):
+        result = store.query_range(
+            start=start, end=end, workflow_id=workflow_id, event_types=event_types, limit=10, offset=max(offset, 0)
+        )
+        assert [e.event_id for e in result.events] == expected[max(offset, 0) : max(offset, 0) + 10]
+        assert result.total_count == len(expected)
+        assert result.has_more == (max(offset, 0) + 10 < len(expected))
+
+    unbounded = store.query_range(workflow_id=workflow_id, event_types=event_types, limit=1000)
+    assert [e.event_id for e in unbounded.events] == _scan_query(events, None, None, workflow_id, event_types)
+
+
+def test_query_unknown_filters_return_empty(store: EventStore, base_time: datetime) -> None:
+    """Unknown workflows and empty type lists match nothing."""
+    store.append(create_event("e1", "wf1", EventType.TICK_START, base_time))
+
+    assert store.query_range(workflow_id="missing").total_count == 0
+    assert store.query_range(event_types=[]).total_count == 0
+    assert store.query_range(event_types=[EventType.SPLIT]).events == ()
@@ -0,0 +1,214 @@
+"""Tests for incremental projection maintenance.
+
+Verifies that CachingProjector applies only newly appended events,
+publishes read-only snapshots that later events never change, and
+serves historical projections from checkpoints with the same results
+as a full replay.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from kgcl.hybrid.temporal.adapters.caching_projector import CachingProjector
+from kgcl.hybrid.temporal.adapters.in_memory_event_store import InMemoryEventStore
+from kgcl.hybrid.temporal.domain.event import EventType, WorkflowEvent
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def _status(index: int, entity: str, offset_seconds: int | None = None) -> WorkflowEvent:
+    seconds = index if offset_seconds is None else offset_seconds
+    return WorkflowEvent(
+        event_id=f"evt-{index}",
+        event_type=EventType.STATUS_CHANGE,
+        workflow_id="wf-1",
+        timestamp=BASE_TIME + timedelta(seconds=seconds),
+        tick_number=index,
+        payload={"entity_id": entity, "new_status": f"status{index}"},
+    )
+
+
+def _token(index: int) -> WorkflowEvent:
+    return WorkflowEvent(
+        event_id=f"tok-{index}",
+        event_type=EventType.TOKEN_MOVE,
+        workflow_id="wf-1",
+        timestamp=BASE_TIME + timedelta(seconds=index),
+        tick_number=index,
+        payload={"token_id": f"t{index % 3}", "from_place": "p1", "to_place": f"p{index}"},
+    )
+
+
+def _mixed_store(count: int) -> InMemoryEventStore:
+    store = InMemoryEventStore()
+    for index in range(count):
+        store.append(_token(index) if index % 4 == 0 else _status(index, f"task{index % 5}"))
+    return store
+
+
+def _plain(state: object) -> object:
+    """Convert read-only views into plain dicts for comparison."""
+    if hasattr(state, "items"):
+        return {key: _plain(value) for key, value in state.items()}
+    return state
+
+
+class TestIncrementalProjection:
+    """Tests for project_current."""
+
+    def test_only_new_events_applied(self) -> None:
+        """A read after appends applies just the appended events."""
+        store = _mixed_store(10)
+        projector = CachingProjector(event_store=store)
+        assert projector.project_current().events_applied == 10
+
+        store.append(_status(10, "task9"))
+        store.append(_status(11, "task0"))
+        result = projector.project_current()
+
+        assert result.events_applied == 2
+        assert not result.cache_hit
+        assert result.sequence_number == 12
+        assert result.state["task9"]["status"] == "status10"
+        assert result.state["task1"]["status"] == "status6"
+
+    def test_new_events_detected_without_invalidate(self) -> None:
+        """Appends are picked up even if invalidate() is never called."""
+        store = _mixed_store(3)
+        projector = CachingProjector(event_store=store)
+        projector.project_current()
+        assert projector.project_current().cache_hit
+
+        store.append(_status(3, "task3"))
+
+        assert not projector.project_current().cache_hit
+
+    def test_snapshots_are_read_only(self) -> None:
+        """Projected states and their entities cannot be modified."""
+        projector = CachingProjector(event_store=_mixed_store(5))
+        state = projector.project_current().state
+
+        with pytest.raises(TypeError):
+            state["task1"] = {}  # type: ignore[index]
+        with pytest.raises(TypeError):
+            state["task1"]["status"] = "hacked"
+
+    def test_nested_values_are_read_only(self) -> None:
+        """Nested token entries cannot be changed through a snapshot."""
+        store = _mixed_store(5)
+        projector = CachingProjector(event_store=store)
+        state = projector.project_current().state
+
+        with pytest.raises(TypeError):
+            state["_tokens"]["t1"]["to"] = "hacked"  # type: ignore[index]
+        store.append(_status(5, "task0"))
+
+        assert projector.project_current().state["_tokens"]["t1"]["to"] == "p4"
+        assert _plain(projector.project_current().state) == _plain(
+            CachingProjector(event_store=store).project_current().state
+        )
+
+    def test_snapshots_unaffected_by_later_events(self) -> None:
+        """Earlier snapshots keep their values while unchanged entities are shared."""
+        store = _mixed_store(8)
+        projector = CachingProjector(event_store=store)
+        before = projector.project_current().state
+        expected = _plain(before)
+
+        store.append(_status(8, "task1"))
+        store.append(_token(9))
+        after = projector.project_current().state
+
+        assert _plain(before) == expected
+        assert after["task1"]["status"] == "status8"
+        assert after["task2"] is before["task2"]
+        assert after["_tokens"] is not before["_tokens"]
+
+    def test_matches_full_replay(self) -> None:
+        """Interleaved reads and appends end in the same state as one replay."""
+        store = InMemoryEventStore()
+        projector = CachingProjector(event_store=store, checkpoint_interval=7)
+        for index in range(60):
+            store.append(_token(index) if index % 4 == 0 else _status(index, f"task{index % 5}"))
+            if index % 9 == 0:
+                projector.project_current()
+
+        incremental = projector.project_current()
+        replayed = CachingProjector(event_store=store).project_current()
+
+        assert _plain(incremental.state) == _plain(replayed.state)
+        assert incremental.sequence_number == replayed.sequence_number == 60
+
+    def test_invalid_checkpoint_interval(self) -> None:
+        """A non-positive checkpoint interval is rejected."""
+        with pytest.raises(ValueError, match="checkpoint_interval"):
+            CachingProjector(event_store=InMemoryEventStore(), checkpoint_interval=0)
+        with pytest.raises(ValueError, match="max_checkpoints"):
+            CachingProjector(event_store=InMemoryEventStore(), max_checkpoints=0)
+
+
+class TestCheckpointedHistory:
+    """Tests for historical projections served from checkpoints."""
+
+    def test_checkpoints_recorded(self) -> None:
+        """A checkpoint is kept every checkpoint_interval events."""
+        projector = CachingProjector(event_store=_mixed_store(35), checkpoint_interval=10)
+        projector.project_current()
+
+        assert [c.sequence_number for c in projector._checkpoints] == [10, 20, 30]
+
+    def test_checkpoint_count_is_capped(self) -> None:
+        """Past max_checkpoints every other checkpoint is dropped and the spacing doubles."""
+        store = _mixed_store(95)
+        projector = CachingProjector(event_store=store, checkpoint_interval=10, max_checkpoints=4)
+        projector.project_current()
+
+        assert [c.sequence_number for c in projector._checkpoints] == [20, 40, 60, 80]
+        assert _plain(projector.project_at_sequence(60).state) == _plain(
+            CachingProjector(event_store=store).project_at_sequence(60).state
+        )
+
+    def test_at_sequence_matches_full_replay(self) -> None:
+        """Every sequence projects the same state with and without checkpoints."""
+        store = _mixed_store(35)
+        checkpointed = CachingProjector(event_store=store, checkpoint_interval=10)
+        replayed = CachingProjector(event_store=store, checkpoint_interval=10_000)
+
+        for sequence in range(-1, 38):
+            expected = replayed.project_at_sequence(sequence)
+            actual = checkpointed.project_at_sequence(sequence)
+            assert _plain(actual.state) == _plain(expected.state), sequence
+            assert actual.sequence_number == expected.sequence_number
+            assert actual.events_applied == expected.events_applied
+            assert actual.as_of == expected.as_of
+
+    def test_at_time_matches_full_replay(self) -> None:
+        """Time projections stop at the first later event, as a replay does."""
+        store = InMemoryEventStore()
+        offsets = [0, 1, 2, 9, 3, 4, 5, 6, 7, 8, 10, 11, 12, 13, 14]
+        for index, offset in enumerate(offsets):
+            store.append(_status(index, f"task{index % 4}", offset_seconds=offset))
+        checkpointed = CachingProjector(event_store=store, checkpoint_interval=2)
+        replayed = CachingProjector(event_store=store, checkpoint_interval=10_000)
+
+        for second in range(-1, 16):
+            timestamp = BASE_TIME + timedelta(seconds=second, milliseconds=500)
+            expected = replayed.project_at_time(timestamp)
+            actual = checkpointed.project_at_time(timestamp)
+            assert _plain(actual.state) == _plain(expected.state), second
+            assert actual.events_applied == expected.events_applied
+            assert actual.sequence_number == expected.sequence_number
+
+    def test_historical_snapshots_leave_checkpoints_intact(self) -> None:
+        """Replaying on top of a checkpoint does not modify it."""
+        store = _mixed_store(25)
+        projector = CachingProjector(event_store=store, checkpoint_interval=10)
+        projector.project_current()
+        checkpoint_state = _plain(projector._checkpoints[0].state)
+
+        projector.project_at_sequence(14)
+
+        assert _plain(projector._checkpoints[0].state) == checkpoint_state
@@ -0,0 +1,310 @@
+"""Tests for streaming LTL monitors.
+
+Verifies that compiled monitors reach the same results as scanning the
+whole trace, that the evaluator only advances monitors over new events,
+and that watched properties report violations as events are appended.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from kgcl.hybrid.temporal.adapters.in_memory_event_store import InMemoryEventStore
+from kgcl.hybrid.temporal.adapters.ltl_evaluator import LTLEvaluator
+from kgcl.hybrid.temporal.adapters.ltl_monitor import LTLMonitor, MonitorVerdict
+from kgcl.hybrid.temporal.domain.event import EventType, WorkflowEvent
+from kgcl.hybrid.temporal.domain.ltl_formula import LTLFormula, LTLOperator, LTLResult
+from kgcl.hybrid.temporal.ports.temporal_reasoner_port import TemporalProperty
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+def _event(index: int, workflow_id: str = "wf-1", value: int = 0) -> WorkflowEvent:
+    return WorkflowEvent(
+        event_id=f"evt-{index}",
+        event_type=EventType.STATUS_CHANGE,
+        workflow_id=workflow_id,
+        timestamp=BASE_TIME + timedelta(seconds=index),
+        tick_number=index,
+        payload={"value": value},
+    )
+
+
+def _value_at_least(threshold: int) -> Callable[[WorkflowEvent], bool]:
+    def predicate(event: WorkflowEvent) -> bool:
+        return event.payload["value"] >= threshold
+
+    return predicate
+
+
+def _scan(formula: LTLFormula, events: list[WorkflowEvent]) -> LTLResult:
+    """Reference finite-trace semantics: scan the whole trace."""
+    inner = formula.inner
+    assert callable(inner)
+    if formula.operator is LTLOperator.ALWAYS:
+        failing = next((e for e in events if not inner(e)), None)
+        return LTLResult(holds=failing is None, violating_event_id=failing.event_id if failing else None)
+    if formula.operator is LTLOperator.EVENTUALLY:
+        return LTLResult(holds=any(inner(e) for e in events))
+    right = formula.right
+    assert callable(right)
+    for event in events:
+        if right(event):
+            return LTLResult(holds=True)
+        if not inner(event):
+            return LTLResult(holds=False, violating_event_id=event.event_id)
+    return LTLResult(holds=False)
+
+
+class TestLTLMonitor:
+    """Tests for compiled monitors."""
+
+    @pytest.mark.parametrize(
+        "formula",
+        [
+            LTLFormula(LTLOperator.ALWAYS, _value_at_least(1)),
+            LTLFormula(LTLOperator.EVENTUALLY, _value_at_least(9)),
+            LTLFormula(LTLOperator.UNTIL, _value_at_least(2), _value_at_least(8)),
+        ],
+        ids=["always", "eventually", "until"],
+    )
+    def test_matches_full_scan_on_every_prefix(self, formula: LTLFormula) -> None:
+        """After each event the monitor agrees with a scan of the prefix."""
+        rng = random.Random(7)
+        for _ in range(50):
+            events = [_event(i, value=rng.randint(0, 9)) for i in range(rng.randint(0, 12))]
+            monitor = LTLMonitor.from_formula(formula)
+            for index, event in enumerate(events):
+                monitor.observe(event)
+                expected = _scan(formula, events[: index + 1])
+                assert monitor.result.holds is expected.holds
+                assert monitor.verdict.holds is expected.holds
+                assert monitor.result.violating_event_id == expected.violating_event_id
+
+    def test_final_verdict_stops_evaluating(self) -> None:
+        """Once violated, later events do not call the predicate."""
+        calls: list[str] = []
+
+        def positive(event: WorkflowEvent) -> bool:
+            calls.append(event.event_id)
+            return event.payload["value"] > 0
+
+        monitor = LTLMonitor.from_formula(LTLFormula(LTLOperator.ALWAYS, positive))
+        for index, value in enumerate([1, 0, 1, 1]):
+            monitor.observe(_event(index, value=value))
+
+        assert monitor.verdict is MonitorVerdict.VIOLATED
+        assert calls == ["evt-0", "evt-1"]
+
+    def test_verdicts_are_four_valued(self) -> None:
+        """Open obligations are presumable until decided."""
+        monitor = LTLMonitor.from_formula(LTLFormula(LTLOperator.UNTIL, _value_at_least(1), _value_at_least(5)))
+        assert monitor.verdict is MonitorVerdict.PRESUMABLY_VIOLATED
+
+        monitor.observe(_event(0, value=3))
+        assert monitor.verdict is MonitorVerdict.PRESUMABLY_VIOLATED
+
+        monitor.observe(_event(1, value=6))
+        assert monitor.verdict is MonitorVerdict.SATISFIED
+        assert monitor.verdict.is_final
+
+    def test_other_workflows_ignored(self) -> None:
+        """A workflow-bound monitor skips events of other workflows."""
+        monitor = LTLMonitor.from_formula(LTLFormula(LTLOperator.ALWAYS, _value_at_least(1)), workflow_id="wf-1")
+
+        monitor.observe(_event(0, workflow_id="wf-2", value=0))
+
+        assert monitor.verdict is MonitorVerdict.PRESUMABLY_SATISFIED
+        assert monitor.events_seen == 0
+
+    def test_next_formula_has_fixed_failure(self) -> None:
+        """Formulas the evaluator rejects compile to a fixed failing result."""
+        monitor = LTLMonitor.from_formula(LTLFormula(LTLOperator.NEXT, _value_at_least(1)))
+
+        assert monitor.verdict is MonitorVerdict.VIOLATED
+        assert "check_next" in monitor.result.explanation
+
+
+class TestLTLEvaluatorMonitoring:
+    """Tests for incremental evaluation and watched properties."""
+
+    def test_repeated_checks_only_visit_new_events(self) -> None:
+        """A second check advances the cached monitor over appended events only."""
+        store = InMemoryEventStore()
+        evaluator = LTLEvaluator(event_store=store)
+        seen: list[str] = []
+
+        def positive(event: WorkflowEvent) -> bool:
+            seen.append(event.event_id)
+            return event.payload["value"] > 0
+
+        formula = LTLFormula(LTLOperator.ALWAYS, positive)
+        for index in range(3):
+            store.append(_event(index, value=1))
+        assert evaluator.evaluate(formula, "wf-1").holds is True
+
+        store.append(_event(3, value=1))
+        assert evaluator.evaluate(formula, "wf-1").holds is True
+        assert seen == ["evt-0", "evt-1", "evt-2", "evt-3"]
+
+    def test_check_precedes_incremental(self) -> None:
+        """Precedence checks keep their verdict across appends."""
+        store = InMemoryEventStore()
+        evaluator = LTLEvaluator(event_store=store)
+        store.append(_event(0))
+        assert evaluator.check_precedes("TICK_START", "TICK_END", "wf-1").holds is True
+
+        end = WorkflowEvent(
+            event_id="end",
+            event_type=EventType.TICK_END,
+            workflow_id="wf-1",
+            timestamp=BASE_TIME,
+            tick_number=1,
+            payload={},
+        )
+        store.append(end)
+        result = evaluator.check_precedes("TICK_START", "TICK_END", "wf-1")
+
+        assert result.holds is False
+        assert result.violating_event_id == "end"
+
+    def test_monitor_cache_is_bounded(self) -> None:
+        """Ad-hoc conditions do not grow the monitor cache without bound."""
+        evaluator = LTLEvaluator(event_store=InMemoryEventStore(), max_monitors=4)
+        for threshold in range(10):
+            evaluator.check_always(_value_at_least(threshold))
+
+        assert len(evaluator._monitors) == 4
+
+    def test_watch_reports_violation_on_append(self) -> None:
+        """Watched properties report a violation while the event is appended."""
+        store = InMemoryEventStore()
+        evaluator = LTLEvaluator(event_store=store)
+        store.append(_event(0, value=1))
+        violations: list[LTLResult] = []
+        prop = TemporalProperty(
+            property_id="positive",
+            name="Positive",
+            description="Values stay positive",
+            formula=LTLFormula(LTLOperator.ALWAYS, _value_at_least(1)),
+            workflow_id="wf-1",
+        )
+
+        monitor = evaluator.watch(prop, on_violation=violations.append)
+        store.append(_event(1, workflow_id="wf-2", value=0))
+        assert violations == []
+
+        store.append(_event(2, value=0))
+        assert [v.violating_event_id for v in violations] == ["evt-2"]
+        assert monitor.verdict is MonitorVerdict.VIOLATED
+        assert monitor.position == 3
+
+    def test_watch_catches_up_after_gap(self) -> None:
+        """Events delivered out of order are replayed from the store."""
+        store = InMemoryEventStore()
+        evaluator = LTLEvaluator(event_store=store)
+        prop = TemporalProperty(
+            property_id="eventually-nine",
+            name="Eventually nine",
+            description="A value of nine appears",
+            formula=LTLFormula(LTLOperator.EVENTUALLY, _value_at_least(9)),
+        )
+        monitor = evaluator.watch(prop)
+        evaluator.unwatch(monitor)
+        store.append_batch([_event(0, value=9), _event(1, value=0)])
+        evaluator._watched.append(monitor)
+
+        evaluator.observe(2, _event(1, value=0))
+
+        assert monitor.verdict is MonitorVerdict.SATISFIED
+        assert monitor.position == 2
+
+    def test_unwatch_unsubscribes(self) -> None:
+        """Removing the last watched monitor detaches from the store."""
+        store = InMemoryEventStore()
+        evaluator = LTLEvaluator(event_store=store)
+        prop = TemporalProperty(
+            property_id="positive",
+            name="Positive",
+            description="Values stay positive",
+            formula=LTLFormula(LTLOperator.ALWAYS, _value_at_least(1)),
+        )
+        monitor = evaluator.watch(prop)
+
+        evaluator.unwatch(monitor)
+        store.append(_event(0, value=0))
+
+        assert store._subscribers == []
+        assert monitor.position == 0
+
+    def test_verify_property_reuses_monitor_for_fresh_callables(self) -> None:
+        """Properties rebuilt with new lambdas advance the monitor cached under their id."""
+        store = InMemoryEventStore()
+        evaluator = LTLEvaluator(event_store=store)
+        seen: list[str] = []
+
+        def prop() -> TemporalProperty:
+            return TemporalProperty(
+                property_id="positive",
+                name="Positive",
+                description="Values stay positive",
+                formula=LTLFormula(LTLOperator.ALWAYS, lambda e: seen.append(e.event_id) is None),
+            )
+
+        store.append_batch([_event(0), _event(1)])
+        evaluator.verify_property(prop())
+        store.append(_event(2))
+        evaluator.verify_property(prop())
+
+        assert seen == ["evt-0", "evt-1", "evt-2"]
+
+    def test_failing_callbacks_do_not_fail_the_append(self) -> None:
+        """Errors from listeners and on_violation are logged; the append still succeeds."""
+        store = InMemoryEventStore()
+        evaluator = LTLEvaluator(event_store=store)
+        received: list[int] = []
+
+        def broken_listener(sequence: int, event: WorkflowEvent) -> None:
+            raise RuntimeError("listener")
+
+        def broken_callback(result: LTLResult) -> None:
+            raise RuntimeError("callback")
+
+        store.subscribe(broken_listener)
+        prop = TemporalProperty("positive", "Positive", "", LTLFormula(LTLOperator.ALWAYS, _value_at_least(1)))
+        monitor = evaluator.watch(prop, on_violation=broken_callback)
+        store.subscribe(lambda sequence, event: received.append(sequence))
+
+        result = store.append(_event(0, value=0))
+
+        assert result.success and store.get_latest_sequence() == 1
+        assert received == [1]
+        assert monitor.verdict is MonitorVerdict.VIOLATED
+
+    def test_unwatch_during_appends_does_not_deadlock(self) -> None:
+        """Watching and unwatching while another thread appends always completes."""
+        store = InMemoryEventStore()
+        evaluator = LTLEvaluator(event_store=store)
+        prop = TemporalProperty("positive", "Positive", "", LTLFormula(LTLOperator.ALWAYS, _value_at_least(0)))
+
+        def append() -> None:
+            for index in range(2000):
+                store.append(_event(index))
+
+        def churn() -> None:
+            for _ in range(500):
+                evaluator.unwatch(evaluator.watch(prop))
+
+        threads = [threading.Thread(target=append, daemon=True), threading.Thread(target=churn, daemon=True)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert store.get_latest_sequence() == 2000
@@ -0,0 +1,209 @@
+"""Tests for packed markings and partial-order reduction in soundness checks.
+
+Verifies that the stubborn-set search reaches the same verdicts, deadlocks
+and dead transitions as the full search, that unsafe nets widen their
+marking encoding, and that the visited set respects its memory budget.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from kgcl.hybrid.temporal.analysis.soundness_verifier import SoundnessVerifier, SoundnessViolation
+from kgcl.hybrid.temporal.domain.petri_net import (
+    Marking,
+    WorkflowNet,
+    create_arc,
+    create_place,
+    create_transition,
+    create_workflow_net,
+)
+
+
+def _parallel_net(branches: int, length: int, *, stuck_branch: int | None = None) -> WorkflowNet:
+    """AND-split into sequential branches joined before the sink.
+
+    ``stuck_branch`` drops the last step of one branch, so the join never fires.
+    """
+    places = [create_place("i", is_source=True), create_place("o", is_sink=True)]
+    transitions = [create_transition("split"), create_transition("join")]
+    arcs = [create_arc("i", "split"), create_arc("join", "o")]
+    for b in range(branches):
+        places.extend(create_place(f"b{b}_{k}") for k in range(length + 1))
+        arcs.extend([create_arc("split", f"b{b}_0"), create_arc(f"b{b}_{length}", "join")])
+        steps = length - 1 if b == stuck_branch else length
+        for k in range(steps):
+            transitions.append(create_transition(f"t{b}_{k}"))
+            arcs.extend([create_arc(f"b{b}_{k}", f"t{b}_{k}"), create_arc(f"t{b}_{k}", f"b{b}_{k + 1}")])
+    return create_workflow_net(places, transitions, arcs)
+
+
+def _nets() -> dict[str, WorkflowNet]:
+    def net(places: list[str], arcs: list[tuple[str, str] | tuple[str, str, int]]) -> WorkflowNet:
+        place_set = set(places)
+        transitions = sorted({node for arc in arcs for node in arc[:2] if node not in place_set})
+        return create_workflow_net(
+            [create_place(p, is_source=p == "i", is_sink=p == "o") for p in places],
+            [create_transition(t) for t in transitions],
+            [create_arc(*arc) for arc in arcs],
+        )
+
+    return {
+        "parallel": _parallel_net(4, 2),
+        "stuck_branch": _parallel_net(3, 2, stuck_branch=1),
+        # Concurrent branch racing the completion leaves a token behind
+        "improper": net(
+            ["i", "a", "b", "o"],
+            [("i", "split"), ("split", "a"), ("split", "b"), ("a", "finish"), ("finish", "o"), ("b", "idle")],
+        ),
+        # A choice in one branch leads to a transition needing both branches' tokens
+        "dead_behind_concurrency": net(
+            ["i", "a", "b", "a2", "b2", "x", "o"],
+            [
+                ("i", "split"),
+                ("split", "a"),
+                ("split", "b"),
+                ("a", "ta"),
+                ("ta", "a2"),
+                ("b", "tb"),
+                ("tb", "b2"),
+                ("a2", "join"),
+                ("b2", "join"),
+                ("join", "o"),
+                ("x", "never"),
+                ("a2", "never"),
+                ("never", "o"),
+            ],
+        ),
+        # Two branches produce into the same place: not safe
+        "unsafe": net(
+            ["i", "a", "b", "c", "o"],
+            [("i", "split"), ("split", "a"), ("split", "b"), ("a", "ta"), ("b", "tb"), ("ta", "c"), ("tb", "c"),
+             ("c", "join", 2), ("join", "o")],
+        ),
+        "loop": net(
+            ["i", "p1", "p2", "o"],
+            [("i", "t1"), ("t1", "p1"), ("p1", "t2"), ("t2", "p2"), ("p2", "back"), ("back", "p1"), ("p2", "t3"),
+             ("t3", "o")],
+        ),
+    }  # fmt: skip
+
+
+class TestReducedSearchAgreesWithFullSearch:
+    """Stubborn sets keep every verdict of the full state space."""
+
+    @pytest.mark.parametrize("name", list(_nets()))
+    def test_same_verdict(self, name: str) -> None:
+        """Soundness, violations, deadlocks and dead transitions match."""
+        net = _nets()[name]
+
+        full = SoundnessVerifier(partial_order_reduction=False).verify(net)
+        reduced = SoundnessVerifier().verify(net)
+
+        assert reduced.is_sound == full.is_sound
+        assert set(reduced.violations) == set(full.violations)
+        assert set(reduced.deadlock_markings) == set(full.deadlock_markings)
+        assert reduced.dead_transitions == full.dead_transitions
+        assert reduced.reachable_markings <= full.reachable_markings
+        assert reduced.exhaustive and full.exhaustive
+
+    def test_expected_violations(self) -> None:
+        """The unsound examples are reported for the right reason."""
+        nets = _nets()
+        verifier = SoundnessVerifier()
+
+        stuck = verifier.verify(nets["stuck_branch"])
+        improper = verifier.verify(nets["improper"])
+        dead = verifier.verify(nets["dead_behind_concurrency"])
+
+        assert SoundnessViolation.DEADLOCK in stuck.violations
+        assert SoundnessViolation.IMPROPER_COMPLETION in improper.violations
+        assert dead.dead_transitions == ("never",)
+        assert verifier.verify(nets["parallel"]).is_sound
+
+    def test_concurrency_is_not_interleaved(self) -> None:
+        """Independent branches are explored in one order only."""
+        net = _parallel_net(8, 3)
+
+        full = SoundnessVerifier(max_markings=100_000, partial_order_reduction=False).verify(net)
+        reduced = SoundnessVerifier().verify(net)
+
+        assert full.reachable_markings == 4**8 + 2
+        assert reduced.is_sound and full.is_sound
+        assert reduced.reachable_markings == 8 * 3 + 3
+
+
+class TestMarkingEncoding:
+    """Tests for packed markings on safe and unsafe nets."""
+
+    def test_unsafe_net_widens_fields(self) -> None:
+        """A place collecting two tokens is counted, not overflowed."""
+        result = SoundnessVerifier().verify(_nets()["unsafe"])
+
+        assert result.is_sound
+        assert result.exhaustive
+
+    def test_deadlock_markings_keep_token_counts(self) -> None:
+        """Deadlocks decode back to token counts per place."""
+        places = [create_place("i", is_source=True), create_place("p"), create_place("o", is_sink=True)]
+        transitions = [create_transition("t1"), create_transition("t2")]
+        arcs = [create_arc("i", "t1"), create_arc("t1", "p", weight=5), create_arc("p", "t2", weight=6)]
+        arcs.append(create_arc("t2", "o"))
+        net = create_workflow_net(places, transitions, arcs)
+
+        result = SoundnessVerifier().verify(net)
+
+        assert result.deadlock_markings == (Marking.from_dict({"p": 5}),)
+        assert result.dead_transitions == ("t2",)
+
+
+class TestVisitedSetBudget:
+    """Tests for max_markings and the memory-bounded visited set."""
+
+    def test_budget_switches_to_bitstate(self) -> None:
+        """Past the budget the search continues but is not exhaustive."""
+        net = _parallel_net(6, 2)
+
+        result = SoundnessVerifier(partial_order_reduction=False, visited_memory=2_000).verify(net)
+
+        assert not result.exhaustive
+        assert result.reachable_markings > 2_000 // 64
+        assert not result.deadlock_markings
+
+    def test_marking_limit_is_reported(self) -> None:
+        """Hitting max_markings marks the result as partial."""
+        net = _parallel_net(6, 2)
+
+        result = SoundnessVerifier(max_markings=50, partial_order_reduction=False).verify(net)
+
+        assert result.reachable_markings == 50
+        assert not result.exhaustive
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+class TestLargeStateSpaces:
+    """Timing checks on nets with millions of interleavings."""
+
+    def test_reduction_handles_wide_concurrency(self) -> None:
+        """Twenty branches of five steps (6**20 markings) verify in seconds."""
+        net = _parallel_net(20, 5)
+
+        started = time.perf_counter()
+        result = SoundnessVerifier().verify(net)
+        elapsed = time.perf_counter() - started
+
+        assert result.is_sound
+        assert result.exhaustive
+        assert elapsed < 5.0
+
+    def test_full_search_of_a_million_markings(self) -> None:
+        """Bitset markings keep an unreduced million-marking search tractable."""
+        net = _parallel_net(20, 1)
+
+        result = SoundnessVerifier(max_markings=2_000_000, partial_order_reduction=False).verify(net)
+
+        assert result.is_sound
+        assert result.reachable_markings == 2**20 + 2
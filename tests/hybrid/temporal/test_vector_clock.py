@@ -0,0 +1,134 @@
+"""Tests for interned vector clocks and clock delta encoding.
+
+Verifies that the interned, tuple-backed VectorClock keeps the semantics of the
+dict-based definition, and that snapshots delta-encode clocks without
+changing decoded events or their hashes.
+"""
+
+from __future__ import annotations
+
+import pickle
+from dataclasses import FrozenInstanceError
+from datetime import UTC, datetime
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from kgcl.hybrid.temporal.adapters.tiered_event_store import Snapshot
+from kgcl.hybrid.temporal.domain.event import EventType, WorkflowEvent
+from kgcl.hybrid.temporal.domain.vector_clock import NodeInterner, VectorClock, apply_clock_delta, clock_delta
+
+entries = st.lists(
+    st.tuples(st.sampled_from([f"node-{i}" for i in range(8)]), st.integers(min_value=0, max_value=2**70)), max_size=8
+)
+
+
+def _reference(clocks: list[tuple[str, int]]) -> dict[str, int]:
+    times: dict[str, int] = {}
+    for node_id, time in clocks:
+        times[node_id] = max(times.get(node_id, 0), time)
+    return times
+
+
+def _reference_before(a: dict[str, int], b: dict[str, int]) -> bool:
+    nodes = a.keys() | b.keys()
+    return all(a.get(n, 0) <= b.get(n, 0) for n in nodes) and any(a.get(n, 0) < b.get(n, 0) for n in nodes)
+
+
+class TestInternedVectorClock:
+    """VectorClock against the dict-based definition."""
+
+    @given(entries, entries)
+    def test_matches_reference(self, clocks_a: list[tuple[str, int]], clocks_b: list[tuple[str, int]]) -> None:
+        """Normalization, merge and ordering agree with per-node dicts."""
+        a, b = VectorClock(clocks=tuple(clocks_a)), VectorClock(clocks=tuple(clocks_b))
+        ref_a, ref_b = _reference(clocks_a), _reference(clocks_b)
+
+        assert a.clocks == tuple(sorted(ref_a.items()))
+        merged = {n: max(ref_a.get(n, 0), ref_b.get(n, 0)) for n in ref_a.keys() | ref_b.keys()}
+        assert a.merge(b).clocks == tuple(sorted(merged.items()))
+        assert a.happens_before(b) == _reference_before(ref_a, ref_b)
+        assert a.concurrent_with(b) == (not _reference_before(ref_a, ref_b) and not _reference_before(ref_b, ref_a))
+        assert (a == b) == (a.clocks == b.clocks)
+        if a == b:
+            assert hash(a) == hash(b)
+
+    def test_listed_zero_differs_from_absent(self) -> None:
+        """A node listed at 0 changes equality but not ordering."""
+        listed = VectorClock.zero("node-z")
+        empty = VectorClock(clocks=())
+
+        assert listed != empty
+        assert not listed.happens_before(empty)
+        assert not empty.happens_before(listed)
+        assert listed.increment("node-z").clocks == (("node-z", 1),)
+        assert listed.merge(VectorClock(clocks=(("node-y", 2),))).clocks == (("node-y", 2), ("node-z", 0))
+
+    def test_immutable_and_picklable(self) -> None:
+        """Clocks reject mutation and pickle by node id."""
+        clock = VectorClock(clocks=(("node-a", 3),)).increment("node-b")
+
+        restored = pickle.loads(pickle.dumps(clock))
+
+        assert restored == clock
+        assert restored.clocks == (("node-a", 3), ("node-b", 1))
+        assert clock.time("node-a") == 3
+        assert clock.time("never-seen") == 0
+        with pytest.raises(FrozenInstanceError):
+            clock.clocks = ()  # type: ignore[misc]
+
+    def test_interner_is_stable(self) -> None:
+        """Node ids keep their first index."""
+        interner = NodeInterner()
+
+        assert [interner.intern(n) for n in ("x", "y", "x", "z")] == [0, 1, 0, 2]
+        assert interner.index_of("y") == 1
+        assert interner.index_of("w") is None
+        assert len(interner) == 3
+
+
+class TestClockDelta:
+    """Tests for delta encoding of clocks."""
+
+    @given(entries, entries)
+    def test_round_trip(self, clocks: list[tuple[str, int]], base: list[tuple[str, int]]) -> None:
+        """Applying the delta to the base restores the canonical clock."""
+        clock = VectorClock(clocks=tuple(clocks)).clocks
+        base_clock = VectorClock(clocks=tuple(base)).clocks
+
+        assert apply_clock_delta(base_clock, clock_delta(clock, base_clock)) == clock
+
+    def test_delta_is_small_for_successors(self) -> None:
+        """A successor's clock differs from its predecessor in one entry."""
+        base = VectorClock(clocks=tuple((f"node-{i}", i + 1) for i in range(300)))
+
+        successor = base.increment("node-7")
+
+        assert clock_delta(successor.clocks, base.clocks) == (("node-7", 9),)
+
+    def test_snapshot_round_trip_preserves_hashes(self) -> None:
+        """Delta-encoded snapshot clocks decode to the original events."""
+        clock = VectorClock(clocks=tuple((f"node-{i}", 1) for i in range(200)))
+        events: list[tuple[WorkflowEvent, int]] = []
+        previous: WorkflowEvent | None = None
+        for index in range(30):
+            clock = clock.increment(f"node-{index % 5}")
+            vector_clock = clock.clocks if index != 10 else (("z", 1), ("a", 2))  # non-canonical
+            previous = WorkflowEvent(
+                event_id=f"evt-{index}",
+                event_type=EventType.STATUS_CHANGE,
+                timestamp=datetime(2025, 1, 1, tzinfo=UTC),
+                tick_number=index,
+                workflow_id="wf-1",
+                payload={"index": index},
+                caused_by=(previous.event_id,) if previous else (),
+                vector_clock=vector_clock,
+            )
+            events.append((previous, index + 1))
+
+        restored = Snapshot.create(events=events, workflow_id="wf-1").decompress()
+
+        assert [(e.vector_clock, e.event_hash, seq) for e, seq in restored] == [
+            (e.vector_clock, e.event_hash, seq) for e, seq in events
+        ]
@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
+import gzip
+import io
 import tempfile
 import xml.etree.ElementTree as ET
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
 
+from kgcl.hybrid.temporal.adapters.in_memory_event_store import InMemoryEventStore
 from kgcl.hybrid.temporal.adapters.xes_exporter import (
     LifecycleTransition,
     XESAttribute,
     XESEvent,
     XESExporter,
     XESLog,
+    XESStreamWriter,
     XESTrace,
     create_xes_exporter,
 )
@@ -618,6 +622,109 @@ class TestFileExport:
             Path(filepath).unlink(missing_ok=True)
 
 
+def _interleaved_store(workflows: int, per_workflow: int) -> InMemoryEventStore:
+    """Store whose workflows' events are interleaved round-robin."""
+    store = InMemoryEventStore()
+    base = datetime(2025, 1, 1, tzinfo=UTC)
+    for index in range(per_workflow):
+        for wf in range(workflows):
+            store.append(
+                WorkflowEvent(
+                    event_id=f"wf{wf}-{index}",
+                    event_type=EventType.STATUS_CHANGE,
+                    workflow_id=f"wf{wf}",
+                    timestamp=base + timedelta(seconds=index),
+                    tick_number=index,
+                    payload={"activity": f"Task{index % 3}", "attempt": index},
+                )
+            )
+    return store
+
+
+def _traces(root: ET.Element) -> list[tuple[str, list[str]]]:
+    """(case_id, event ids) for each trace of a parsed log."""
+    ns = "{http://www.xes-standard.org/}"
+    result = []
+    for trace in root.iter(f"{ns}trace"):
+        name = next(a.get("value") for a in trace.findall(f"{ns}string") if a.get("key") == "concept:name")
+        event_ids = [
+            a.get("value") for event in trace.findall(f"{ns}event") for a in event if a.get("key") == "event:id"
+        ]
+        result.append((str(name), [str(e) for e in event_ids]))
+    return result
+
+
+class TestStreamingExport:
+    """Test incremental XES export."""
+
+    def test_export_store_matches_in_memory_export(self, tmp_path: Path) -> None:
+        """Streaming a store produces the same document as to_xml."""
+        store = _interleaved_store(workflows=3, per_workflow=4)
+        exporter = XESExporter()
+        path = tmp_path / "log.xes"
+
+        written = exporter.export_store(store, path)
+
+        grouped = [(wf, list(store.replay(workflow_id=wf))) for wf in ("wf0", "wf1", "wf2")]
+        expected = ET.fromstring(exporter.to_xml(exporter.convert_log(grouped), pretty=False))
+        actual = ET.parse(path).getroot()
+        assert written == 12
+        assert ET.canonicalize(ET.tostring(actual), strip_text=True) == ET.canonicalize(
+            ET.tostring(expected), strip_text=True
+        )
+
+    def test_gzip_output_inferred_from_suffix(self, tmp_path: Path) -> None:
+        """A .gz path is written gzip-compressed."""
+        store = _interleaved_store(workflows=2, per_workflow=3)
+        path = tmp_path / "log.xes.gz"
+
+        XESExporter().export_store(store, path)
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            root = ET.fromstring(f.read())
+        assert [name for name, _ in _traces(root)] == ["wf0", "wf1"]
+
+    def test_export_events_groups_by_workflow(self, tmp_path: Path) -> None:
+        """Events from a replay iterator are grouped into one trace per workflow."""
+        store = _interleaved_store(workflows=3, per_workflow=5)
+        path = tmp_path / "log.xes"
+
+        XESExporter().export_events(store.replay(), path)
+
+        traces = _traces(ET.parse(path).getroot())
+        assert traces == [(f"wf{wf}", [f"wf{wf}-{i}" for i in range(5)]) for wf in range(3)]
+
+    def test_export_events_bounds_buffer(self, tmp_path: Path) -> None:
+        """A small buffer splits traces into ordered segments, losing no events."""
+        store = _interleaved_store(workflows=3, per_workflow=10)
+        path = tmp_path / "log.xes"
+
+        written = XESExporter().export_events(store.replay(), path, max_buffered_events=4)
+
+        traces = _traces(ET.parse(path).getroot())
+        assert written == 30
+        assert all(len(event_ids) <= 4 for _, event_ids in traces)
+        for wf in range(3):
+            joined = [e for name, event_ids in traces if name == f"wf{wf}" for e in event_ids]
+            assert joined == [f"wf{wf}-{i}" for i in range(10)]
+
+    def test_export_events_rejects_empty_buffer(self, tmp_path: Path) -> None:
+        """The buffer must hold at least one event."""
+        with pytest.raises(ValueError, match="max_buffered_events"):
+            XESExporter().export_events([], tmp_path / "log.xes", max_buffered_events=0)
+
+    def test_writer_closes_once_and_rejects_late_traces(self) -> None:
+        """Closing writes the footer once; writing afterwards fails."""
+        stream = io.StringIO()
+        writer = XESStreamWriter(XESExporter(), stream)
+        writer.close()
+        writer.close()
+
+        assert stream.getvalue().count("</log>") == 1
+        with pytest.raises(ValueError, match="closed"):
+            writer.write_trace("wf", [])
+
+
 class TestFactory:
     """Test factory function."""
 
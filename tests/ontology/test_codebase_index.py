@@ -12,6 +12,7 @@ import pytest
 from rdflib import Graph
 from scripts.build_codebase_index import CodebaseIndexBuilder
 
+from kgcl.ontology import codebase_index
 from kgcl.ontology.codebase_index import CodebaseIndex
 
 
@@ -321,3 +322,73 @@ def test_stats(sample_codebase: Path, tmp_path: Path) -> None:
     assert stats["classes"] > 0
     assert stats["packages"] > 0
     assert stats["triples"] > 0
+
+
+def test_reopen_uses_persisted_tables(sample_codebase: Path, tmp_path: Path) -> None:
+    """Test a second index is served from the cache file without parsing.
+
+    Parameters
+    ----------
+    sample_codebase : Path
+        Sample codebase directory
+    tmp_path : Path
+        Temporary directory
+    """
+    output_file = tmp_path / "index.ttl"
+    CodebaseIndexBuilder(sample_codebase, output_file).build_index()
+    cache_file = tmp_path / "tables.json"
+    first = CodebaseIndex(output_file, cache_file=cache_file)
+
+    codebase_index._LOADED.clear()
+    reopened = CodebaseIndex(output_file, cache_file=cache_file)
+
+    assert cache_file.exists()
+    assert reopened._graph is None
+    assert reopened.find_class("TestClass") == first.find_class("TestClass")
+    assert reopened.find_classes_with_method("toString") == first.find_classes_with_method("toString")
+    assert reopened.stats() == first.stats()
+
+
+def test_changed_index_file_rebuilds_tables(sample_codebase: Path, tmp_path: Path) -> None:
+    """Test tables built for an older index file are not reused.
+
+    Parameters
+    ----------
+    sample_codebase : Path
+        Sample codebase directory
+    tmp_path : Path
+        Temporary directory
+    """
+    output_file = tmp_path / "index.ttl"
+    CodebaseIndexBuilder(sample_codebase, output_file).build_index()
+    cache_file = tmp_path / "tables.json"
+    CodebaseIndex(output_file, cache_file=cache_file)
+
+    (sample_codebase / "org" / "yawlfoundation" / "yawl" / "test" / "AnotherClass.ttl").unlink()
+    CodebaseIndexBuilder(sample_codebase, output_file).build_index()
+    index = CodebaseIndex(output_file, cache_file=cache_file)
+
+    assert index.find_class("AnotherClass") is None
+    assert index.find_class("TestClass") is not None
+
+
+def test_search_matches_substrings_across_words(sample_codebase: Path, tmp_path: Path) -> None:
+    """Test the n-gram index keeps substring semantics, including short queries.
+
+    Parameters
+    ----------
+    sample_codebase : Path
+        Sample codebase directory
+    tmp_path : Path
+        Temporary directory
+    """
+    output_file = tmp_path / "index.ttl"
+    CodebaseIndexBuilder(sample_codebase, output_file).build_index()
+    index = CodebaseIndex(output_file, use_cache=False)
+
+    names = {result["class_name"] for result in index.search("ANOTHERCLASS ORG.YAWL")}
+
+    assert names == {"AnotherClass"}
+    assert len(index.search("an")) >= 1
+    assert index.search("no such text") == []
+    assert not list(tmp_path.glob(".*.cache.json"))
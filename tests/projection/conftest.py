@@ -0,0 +1,92 @@
+"""Shared fixtures for projection tests."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from kgcl.projection.domain.descriptors import OntologyConfig, QueryDescriptor, TemplateDescriptor, TemplateMetadata
+
+
+class DictRegistry:
+    """Template registry backed by a dict of descriptors."""
+
+    def __init__(self) -> None:
+        self.templates: dict[str, TemplateDescriptor] = {}
+
+    def get(self, template_name: str) -> TemplateDescriptor | None:
+        """Return the descriptor registered under a name."""
+        return self.templates.get(template_name)
+
+
+class RecordingClient:
+    """Graph client answering SELECT queries from a table and recording them."""
+
+    def __init__(self, results: dict[str, list[dict[str, Any]]] | None = None, delay: float = 0.0) -> None:
+        self.results = results or {}
+        self.delay = delay
+        self.queries: list[str] = []
+
+    @property
+    def graph_id(self) -> str:
+        """Graph identifier."""
+        return "main"
+
+    def query(self, sparql: str) -> list[dict[str, Any]]:
+        """Record the query and return its canned bindings."""
+        self.queries.append(sparql)
+        if self.delay:
+            time.sleep(self.delay)
+        return self.results.get(sparql, [])
+
+    def ask(self, sparql: str) -> bool:
+        """ASK queries are always false."""
+        return False
+
+    def construct(self, sparql: str) -> str:
+        """CONSTRUCT queries return no triples."""
+        return ""
+
+
+def _make_descriptor(name: str, content: str, queries: tuple[QueryDescriptor, ...] = ()) -> TemplateDescriptor:
+    """Build a descriptor for a template bound to the ``main`` graph."""
+    return TemplateDescriptor(
+        id=f"http://example.org/templates/{name}",
+        engine="jinja2",
+        language="python",
+        framework="",
+        version="1.0",
+        ontology=OntologyConfig("main"),
+        queries=queries,
+        n3_rules=(),
+        metadata=TemplateMetadata(),
+        template_path=f"{name}.j2",
+        raw_content=content,
+    )
+
+
+@pytest.fixture
+def registry() -> DictRegistry:
+    """Empty template registry."""
+    return DictRegistry()
+
+
+@pytest.fixture
+def make_template() -> Callable[..., TemplateDescriptor]:
+    """Factory for template descriptors: ``make_template(name, content, queries=())``."""
+    return _make_descriptor
+
+
+@pytest.fixture
+def client() -> RecordingClient:
+    """Graph client with no canned results."""
+    return RecordingClient()
+
+
+@pytest.fixture
+def client_factory() -> type[RecordingClient]:
+    """The recording client class, for clients with canned results or delays."""
+    return RecordingClient
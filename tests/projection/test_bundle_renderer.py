@@ -0,0 +1,151 @@
+"""Tests for parallel, incremental bundle rendering.
+
+Verifies that parallel rendering keeps bundle order, that a re-render
+skips outputs whose inputs are unchanged, and that only files whose content
+changed are written, atomically.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kgcl.projection.domain.bundle import BundleDescriptor, BundleTemplateEntry, ConflictMode, IterationSpec
+from kgcl.projection.domain.descriptors import QueryDescriptor, QuerySource
+from kgcl.projection.engine.bundle_manifest import MANIFEST_NAME
+from kgcl.projection.engine.bundle_renderer import BundleRenderer
+from kgcl.projection.engine.projection_engine import ProjectionConfig, ProjectionEngine
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from kgcl.projection.domain.descriptors import TemplateDescriptor
+
+    from .conftest import DictRegistry, RecordingClient
+
+ROWS = "SELECT ?id ?label WHERE {}"
+TITLE = "SELECT ?title WHERE {}"
+
+
+@pytest.fixture
+def engine(
+    registry: DictRegistry, make_template: Callable[..., TemplateDescriptor], client: RecordingClient
+) -> ProjectionEngine:
+    """Engine with an index template and a per-row item template."""
+    client.results[ROWS] = [{"id": f"e{n}", "label": f"Entity {n}"} for n in range(20)]
+    client.results[TITLE] = [{"title": "Catalog"}]
+    title = QueryDescriptor("title", "Title", QuerySource.INLINE, TITLE)
+    registry.templates["index"] = make_template("index", "{{ sparql.title[0].title }}", (title,))
+    registry.templates["item"] = make_template("item", "{{ params.row.label }}")
+    return ProjectionEngine(registry, {"main": client}, config=ProjectionConfig(n3_enabled=False))
+
+
+@pytest.fixture
+def bundle() -> BundleDescriptor:
+    """Index file plus one file per row."""
+    return BundleDescriptor(
+        id="catalog",
+        templates=(
+            BundleTemplateEntry("index", "index.txt"),
+            BundleTemplateEntry("item", "items/{{ params.row.id }}.txt", IterationSpec(ROWS, "row")),
+        ),
+    )
+
+
+class TestParallelRendering:
+    """Tests for rendering entries and iterations concurrently."""
+
+    def test_parallel_matches_sequential(self, engine: ProjectionEngine, bundle: BundleDescriptor) -> None:
+        """Files come back in bundle order with the same content."""
+        parallel = BundleRenderer(engine, max_workers=4).render_bundle(bundle, dry_run=True)
+        sequential = BundleRenderer(engine, max_workers=1).render_bundle(bundle, dry_run=True)
+
+        assert parallel.output_paths == sequential.output_paths
+        assert parallel.output_paths[:3] == ("index.txt", "items/e0.txt", "items/e1.txt")
+        assert [f.result.content for f in parallel.files] == [f.result.content for f in sequential.files]
+
+    def test_dry_run_writes_nothing(self, engine: ProjectionEngine, bundle: BundleDescriptor, tmp_path: Path) -> None:
+        """A dry run leaves the output directory untouched."""
+        result = BundleRenderer(engine).render_bundle(bundle, output_dir=tmp_path, dry_run=True)
+
+        assert result.written_paths == ()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestIncrementalRendering:
+    """Tests for the manifest of input fingerprints."""
+
+    def test_rerender_skips_unchanged_outputs(
+        self, engine: ProjectionEngine, bundle: BundleDescriptor, tmp_path: Path
+    ) -> None:
+        """A second run with the same inputs renders and writes nothing."""
+        renderer = BundleRenderer(engine)
+        first = renderer.render_bundle(bundle, output_dir=tmp_path)
+        mtimes = {p: (tmp_path / p).stat().st_mtime_ns for p in first.output_paths}
+
+        second = renderer.render_bundle(bundle, output_dir=tmp_path)
+
+        assert len(first.written_paths) == 21
+        assert second.written_paths == ()
+        assert all(f.unchanged for f in second.files)
+        assert second.get_file("items/e3.txt").result.content == "Entity 3"  # type: ignore[union-attr]
+        assert {p: (tmp_path / p).stat().st_mtime_ns for p in second.output_paths} == mtimes
+        assert (tmp_path / MANIFEST_NAME).exists()
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_changed_row_touches_only_its_file(
+        self, engine: ProjectionEngine, bundle: BundleDescriptor, client: RecordingClient, tmp_path: Path
+    ) -> None:
+        """Editing one iteration row re-renders and rewrites one file."""
+        renderer = BundleRenderer(engine)
+        renderer.render_bundle(bundle, output_dir=tmp_path)
+        client.results[ROWS][7] = {"id": "e7", "label": "Renamed"}
+
+        result = renderer.render_bundle(bundle, output_dir=tmp_path)
+
+        assert [f.output_path for f in result.files if not f.unchanged] == ["items/e7.txt"]
+        assert result.written_paths == ("items/e7.txt",)
+        assert (tmp_path / "items/e7.txt").read_text() == "Renamed"
+
+    def test_new_query_results_rerender_but_write_only_changes(
+        self, engine: ProjectionEngine, bundle: BundleDescriptor, client: RecordingClient, tmp_path: Path
+    ) -> None:
+        """A template whose query results change is re-rendered; same content is not rewritten."""
+        renderer = BundleRenderer(engine)
+        renderer.render_bundle(bundle, output_dir=tmp_path)
+        client.results[TITLE] = [{"title": "Catalog", "unused": 1}]
+
+        result = renderer.render_bundle(bundle, output_dir=tmp_path)
+
+        assert not result.get_file("index.txt").unchanged  # type: ignore[union-attr]
+        assert result.written_paths == ()
+
+    def test_edited_output_is_not_silently_overwritten(
+        self, engine: ProjectionEngine, bundle: BundleDescriptor, tmp_path: Path
+    ) -> None:
+        """A file changed by hand is no longer owned and falls under the conflict mode."""
+        renderer = BundleRenderer(engine)
+        renderer.render_bundle(bundle, output_dir=tmp_path)
+        (tmp_path / "items/e1.txt").write_text("hand edited, and longer")
+
+        with pytest.raises(ValueError, match="already exists"):
+            renderer.render_bundle(bundle, output_dir=tmp_path)
+        result = renderer.render_bundle(bundle, output_dir=tmp_path, conflict_mode=ConflictMode.OVERWRITE)
+
+        assert result.written_paths == ("items/e1.txt",)
+        assert (tmp_path / "items/e1.txt").read_text() == "Entity 1"
+
+    def test_non_incremental_renders_everything(
+        self, engine: ProjectionEngine, bundle: BundleDescriptor, tmp_path: Path
+    ) -> None:
+        """With incremental rendering off, existing files follow the conflict mode."""
+        renderer = BundleRenderer(engine, incremental=False)
+        renderer.render_bundle(bundle, output_dir=tmp_path)
+
+        result = renderer.render_bundle(bundle, output_dir=tmp_path, conflict_mode=ConflictMode.OVERWRITE)
+
+        assert not any(f.unchanged for f in result.files)
+        assert result.written_paths == ()
+        assert not (tmp_path / MANIFEST_NAME).exists()
@@ -0,0 +1,168 @@
+"""Tests for hot reloading in FilesystemTemplateRegistry.
+
+Verifies that edited templates and query files are reparsed on the next
+lookup, that unrelated descriptors stay cached, that the directory index
+follows created and deleted files, and that compiled templates are evicted.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from kgcl.projection.adapters.file_watcher import InotifyWatcher, PollingWatcher
+from kgcl.projection.adapters.filesystem_registry import FilesystemTemplateRegistry
+from kgcl.projection.engine.projection_engine import ProjectionConfig, ProjectionEngine
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from .conftest import RecordingClient
+
+
+def _write(template_dir: Path, name: str, body: str, *, query_file: str | None = None) -> None:
+    queries = f"queries:\n  - name: q\n    file: {query_file}\n" if query_file else ""
+    path = template_dir / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\nid: urn:{name}\n{queries}---\n{body}", encoding="utf-8")
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> Iterator[FilesystemTemplateRegistry]:
+    """Registry over a directory with two templates, one loading an external query."""
+    (tmp_path / "queries").mkdir()
+    (tmp_path / "queries" / "items.rq").write_text("SELECT ?item WHERE {}")
+    _write(tmp_path, "a.j2", "A")
+    _write(tmp_path, "b.j2", "B", query_file="items.rq")
+    registry = FilesystemTemplateRegistry(tmp_path)
+    yield registry
+    registry.close()
+
+
+class TestHotReload:
+    """Tests for change detection through the watcher."""
+
+    def test_edited_template_is_reparsed_alone(self, registry: FilesystemTemplateRegistry, tmp_path: Path) -> None:
+        """Only the changed template gets a new descriptor."""
+        a, b = registry.get("a"), registry.get("b")
+
+        _write(tmp_path, "a.j2", "A, edited")
+
+        assert registry.get("a").raw_content == "A, edited"  # type: ignore[union-attr]
+        assert registry.get("b") is b
+        assert registry.get("a") is not a
+
+    def test_query_file_change_invalidates_dependents(
+        self, registry: FilesystemTemplateRegistry, tmp_path: Path
+    ) -> None:
+        """Editing a query file reparses the templates that load it."""
+        a = registry.get("a")
+        registry.get("b")
+
+        (tmp_path / "queries" / "items.rq").write_text("SELECT ?item ?label WHERE {}")
+
+        assert registry.get("b").queries[0].content == "SELECT ?item ?label WHERE {}"  # type: ignore[union-attr]
+        assert registry.get("a") is a
+
+    def test_index_follows_created_and_deleted_files(
+        self, registry: FilesystemTemplateRegistry, tmp_path: Path
+    ) -> None:
+        """New templates, including in new directories, appear; deleted ones vanish."""
+        assert registry.list_templates() == ["a.j2", "b.j2"]
+
+        _write(tmp_path, "nested/c.j2", "C")
+        (tmp_path / "a.j2").unlink()
+
+        assert registry.list_templates() == ["b.j2", "nested/c.j2"]
+        assert registry.get("a") is None
+        assert registry.get("nested/c").raw_content == "C"  # type: ignore[union-attr]
+
+    def test_listeners_receive_invalidated_names(self, registry: FilesystemTemplateRegistry, tmp_path: Path) -> None:
+        """Subscribers hear about changed templates only."""
+        seen: list[str] = []
+        registry.subscribe(seen.append)
+        registry.get("a")
+        registry.get("b")
+
+        _write(tmp_path, "b.j2", "B, edited")
+        registry.get("a")
+
+        assert seen == ["b.j2"]
+
+    def test_engine_renders_the_new_version(
+        self, registry: FilesystemTemplateRegistry, tmp_path: Path, client: RecordingClient
+    ) -> None:
+        """The engine evicts the stale compiled template and keeps the others."""
+        engine = ProjectionEngine(registry, {"main": client}, config=ProjectionConfig(n3_enabled=False))
+        engine.render("a")
+        engine.render("b")
+
+        _write(tmp_path, "a.j2", "A v2")
+
+        assert engine.render("a").content == "A v2"
+        assert len(engine.template_cache) == 2
+        assert engine.template_cache.misses == 3
+
+
+class TestWithoutAutoReload:
+    """Tests for explicit refreshes."""
+
+    def test_refresh_picks_up_changes(self, tmp_path: Path) -> None:
+        """Descriptors stay cached until refresh() re-validates them."""
+        _write(tmp_path, "a.j2", "A")
+        registry = FilesystemTemplateRegistry(tmp_path, auto_reload=False)
+        registry.get("a")
+
+        _write(tmp_path, "a.j2", "A, edited")
+        stale = registry.get("a")
+        registry.refresh()
+
+        assert stale.raw_content == "A"  # type: ignore[union-attr]
+        assert registry.get("a").raw_content == "A, edited"  # type: ignore[union-attr]
+
+
+class TestWatchers:
+    """Tests for the inotify and polling watchers."""
+
+    def test_polling_watcher_reports_changes(self, tmp_path: Path) -> None:
+        """Created, modified and deleted files are reported once."""
+        (tmp_path / "keep.j2").write_text("1")
+        (tmp_path / "gone.j2").write_text("1")
+        watcher = PollingWatcher([tmp_path], interval=0.0)
+
+        (tmp_path / "keep.j2").write_text("22")
+        (tmp_path / "gone.j2").unlink()
+        (tmp_path / "new.j2").write_text("1")
+
+        assert watcher.poll() == {tmp_path / "keep.j2", tmp_path / "gone.j2", tmp_path / "new.j2"}
+        assert watcher.poll() == set()
+
+    def test_polling_interval_limits_rescans(self, tmp_path: Path) -> None:
+        """Within the interval a poll reports nothing."""
+        watcher = PollingWatcher([tmp_path], interval=3600.0)
+
+        (tmp_path / "new.j2").write_text("1")
+
+        assert watcher.poll() == set()
+
+    def test_inotify_watcher_reports_changes(self, tmp_path: Path) -> None:
+        """Kernel events arrive for files in existing and new directories."""
+        try:
+            watcher = InotifyWatcher([tmp_path])
+        except OSError:
+            pytest.skip("inotify unavailable")
+        try:
+            (tmp_path / "a.j2").write_text("1")
+            (tmp_path / "sub").mkdir()
+            (tmp_path / "sub" / "b.j2").write_text("1")
+
+            changed = watcher.poll()
+            (tmp_path / "sub" / "c.j2").write_text("1")
+            later = watcher.poll()
+        finally:
+            watcher.close()
+
+        assert changed is not None and tmp_path / "a.j2" in changed
+        assert later == {tmp_path / "sub" / "c.j2"}
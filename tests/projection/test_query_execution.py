@@ -0,0 +1,300 @@
+"""Tests for concurrent and memoized query execution.
+
+Verifies that a render's queries run in parallel, that results are reused
+while a versioned store's generation is unchanged, and that a bundle runs
+each distinct query once across its templates.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from rdflib import Graph, Literal, URIRef
+
+from kgcl.daemon.event_store import RDFEventStore
+from kgcl.projection.adapters.event_store_adapter import EventStoreAdapter
+from kgcl.projection.adapters.rdflib_adapter import RDFLibAdapter
+from kgcl.projection.domain.bundle import BundleDescriptor, BundleTemplateEntry, IterationSpec
+from kgcl.projection.domain.descriptors import QueryDescriptor, QuerySource
+from kgcl.projection.domain.exceptions import QueryExecutionError, QueryTimeoutError
+from kgcl.projection.engine.bundle_renderer import BundleRenderer
+from kgcl.projection.engine.context_builder import ContextBuilder
+from kgcl.projection.engine.projection_engine import ProjectionConfig, ProjectionEngine
+from kgcl.projection.engine.query_cache import QueryCache
+from kgcl.projection.ports.graph_client import VersionedGraphClient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kgcl.projection.domain.descriptors import TemplateDescriptor
+
+    from .conftest import DictRegistry, RecordingClient
+
+
+def _query(name: str) -> QueryDescriptor:
+    return QueryDescriptor(name, name, QuerySource.INLINE, f"SELECT ?{name} WHERE {{}}")
+
+
+class BarrierClient:
+    """Client whose queries only complete once ``parties`` of them run at the same time."""
+
+    graph_id = "main"
+
+    def __init__(self, parties: int) -> None:
+        self._barrier = threading.Barrier(parties, timeout=5.0)
+
+    def query(self, sparql: str) -> list[dict[str, Any]]:
+        """Wait for the other queries, then answer with the query text."""
+        self._barrier.wait()
+        return [{"q": sparql}]
+
+    def ask(self, sparql: str) -> bool:
+        """ASK queries are always false."""
+        return False
+
+    def construct(self, sparql: str) -> str:
+        """CONSTRUCT queries return no triples."""
+        return ""
+
+
+class VersionedClient:
+    """Recording client with a settable store generation."""
+
+    graph_id = "main"
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self.queries: list[str] = []
+
+    def query(self, sparql: str) -> list[dict[str, Any]]:
+        """Record the query and answer with the current generation."""
+        self.queries.append(sparql)
+        return [{"generation": self.generation}]
+
+    def ask(self, sparql: str) -> bool:
+        """ASK queries are always false."""
+        return False
+
+    def construct(self, sparql: str) -> str:
+        """CONSTRUCT queries return no triples."""
+        return ""
+
+
+class TestConcurrentExecution:
+    """Tests for running a batch of queries in parallel."""
+
+    def test_queries_run_at_the_same_time(self) -> None:
+        """Four queries that each wait for the others all complete."""
+        queries = tuple(_query(name) for name in "abcd")
+
+        results = ContextBuilder(BarrierClient(len(queries)), concurrent=True).execute_queries(queries)
+
+        assert list(results) == ["a", "b", "c", "d"]
+        assert results["c"] == [{"q": "SELECT ?c WHERE {}"}]
+
+    def test_first_failure_in_declaration_order_is_raised(self) -> None:
+        """A failing query surfaces as QueryExecutionError naming it."""
+
+        class FailingClient(VersionedClient):
+            def query(self, sparql: str) -> list[dict[str, Any]]:
+                if "?b" in sparql or "?c" in sparql:
+                    raise RuntimeError(sparql)
+                return []
+
+        with pytest.raises(QueryExecutionError) as excinfo:
+            ContextBuilder(FailingClient(), concurrent=True).execute_queries(tuple(_query(name) for name in "abc"))
+
+        assert excinfo.value.query_name == "b"
+
+    def test_timeout_applies_to_the_batch(self, client_factory: type[RecordingClient]) -> None:
+        """A slow query still raises QueryTimeoutError when run concurrently."""
+        builder = ContextBuilder(client_factory(delay=0.5), query_timeout_seconds=0.05, concurrent=True)
+
+        with pytest.raises(QueryTimeoutError):
+            builder.execute_queries((_query("a"), _query("b")))
+
+    def test_sequential_mode_matches(self, client_factory: type[RecordingClient]) -> None:
+        """Disabling concurrency yields the same mapping."""
+        client = client_factory({"SELECT ?a WHERE {}": [{"x": 1}]})
+        queries = (_query("a"), _query("b"))
+
+        concurrent = ContextBuilder(client, concurrent=True).execute_queries(queries)
+        sequential = ContextBuilder(client).execute_queries(queries)
+
+        assert concurrent == sequential == {"a": [{"x": 1}], "b": []}
+
+
+class TestRDFLibAdapter:
+    """Tests for rendering against rdflib, whose SPARQL engine is not thread-safe."""
+
+    @pytest.fixture
+    def adapter(self) -> RDFLibAdapter:
+        """Adapter over a graph with ten numbered items."""
+        graph = Graph()
+        for n in range(10):
+            graph.add((URIRef(f"urn:item{n}"), URIRef("urn:rank"), Literal(n)))
+        return RDFLibAdapter(graph, graph_id="main")
+
+    def test_default_config_renders_several_queries(
+        self, registry: DictRegistry, make_template: Callable[..., TemplateDescriptor], adapter: RDFLibAdapter
+    ) -> None:
+        """A template with several queries renders through the real adapter."""
+        queries = tuple(
+            QueryDescriptor(f"q{n}", "", QuerySource.INLINE, f"SELECT ?s WHERE {{ ?s <urn:rank> ?r FILTER(?r > {n}) }}")
+            for n in range(4)
+        )
+        registry.templates["page"] = make_template("page", "{{ sparql.q0 | length }} {{ sparql.q3 | length }}", queries)
+        engine = ProjectionEngine(registry, {"main": adapter})
+
+        assert [engine.render("page").content for _ in range(5)] == ["9 6"] * 5
+
+    def test_concurrent_batches_are_serialized(self, adapter: RDFLibAdapter) -> None:
+        """Opting into concurrency stays correct: the adapter serializes rdflib calls."""
+        queries = tuple(
+            QueryDescriptor(f"q{n}", "", QuerySource.INLINE, f"SELECT ?s WHERE {{ ?s <urn:rank> {n} }}")
+            for n in range(8)
+        )
+        builder = ContextBuilder(adapter, concurrent=True)
+
+        for _ in range(10):
+            results = builder.execute_queries(queries)
+            assert results["q7"] == [{"s": "urn:item7"}]
+
+
+class TestQueryCache:
+    """Tests for memoization keyed on store generation."""
+
+    def test_versioned_results_reused_until_generation_changes(self) -> None:
+        """A repeated query hits the cache; a new generation re-executes it."""
+        client = VersionedClient()
+        cache = QueryCache()
+        builder = ContextBuilder(client, query_cache=cache)
+
+        builder.execute_queries((_query("a"),))
+        again = builder.execute_queries((_query("a"),))
+        client.generation = 1
+        fresh = builder.execute_queries((_query("a"),))
+
+        assert len(client.queries) == 2
+        assert again["a"] == [{"generation": 0}]
+        assert fresh["a"] == [{"generation": 1}]
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_unversioned_clients_bypass_the_root_cache(self, client: RecordingClient) -> None:
+        """Without a generation there is no safe way to reuse results across renders."""
+        cache = QueryCache()
+
+        cache.execute(client, "SELECT ?a", client.query)
+        cache.execute(client, "SELECT ?a", client.query)
+        scope = cache.scope()
+        scope.execute(client, "SELECT ?a", client.query)
+        scope.execute(client, "SELECT ?a", client.query)
+
+        assert len(client.queries) == 3
+        assert len(cache) == 0
+
+    def test_ttl_expires_entries(self) -> None:
+        """A zero TTL never serves cached results."""
+        client = VersionedClient()
+        cache = QueryCache(ttl_seconds=0)
+
+        cache.execute(client, "SELECT ?a", client.query)
+        cache.execute(client, "SELECT ?a", client.query)
+
+        assert len(client.queries) == 2
+
+    def test_concurrent_misses_execute_once(self) -> None:
+        """Callers asking for an in-flight query wait for its result."""
+        client = VersionedClient()
+        release = threading.Event()
+        calls: list[str] = []
+
+        def run(sparql: str) -> list[dict[str, Any]]:
+            calls.append(sparql)
+            release.wait(5.0)
+            return client.query(sparql)
+
+        cache = QueryCache()
+        results: list[list[dict[str, Any]]] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.execute(client, "SELECT ?a", run))) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        while cache.misses + cache.hits < len(threads):
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["SELECT ?a"]
+        assert len(results) == 4 and all(result is results[0] for result in results)
+
+    def test_failures_are_not_cached(self) -> None:
+        """An exception reaches the caller and the next call retries."""
+        client = VersionedClient()
+        attempts: list[int] = []
+
+        def flaky(sparql: str) -> list[dict[str, Any]]:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("store unavailable")
+            return client.query(sparql)
+
+        cache = QueryCache()
+        with pytest.raises(RuntimeError):
+            cache.execute(client, "SELECT ?a", flaky)
+
+        assert cache.execute(client, "SELECT ?a", flaky) == [{"generation": 0}]
+
+    def test_event_store_adapter_is_versioned(self) -> None:
+        """The daemon's event sequence serves as the generation."""
+        adapter = EventStoreAdapter(RDFEventStore(), graph_id="main")
+
+        assert isinstance(adapter, VersionedGraphClient)
+        assert adapter.generation == 0
+
+
+class TestEngineAndBundles:
+    """Tests for query sharing through the engine and bundle renderer."""
+
+    def test_engine_memoizes_versioned_renders(
+        self, registry: DictRegistry, make_template: Callable[..., TemplateDescriptor]
+    ) -> None:
+        """Rendering twice against an unchanged store queries once."""
+        client = VersionedClient()
+        registry.templates["page"] = make_template("page", "{{ sparql.a[0].generation }}", (_query("a"),))
+        engine = ProjectionEngine(registry, {"main": client}, config=ProjectionConfig(n3_enabled=False))
+
+        first = engine.render("page")
+        second = engine.render("page")
+        client.generation = 3
+        third = engine.render("page")
+
+        assert (first.content, second.content, third.content) == ("0", "0", "3")
+        assert len(client.queries) == 2
+
+    def test_bundle_shares_queries_across_templates(
+        self, registry: DictRegistry, make_template: Callable[..., TemplateDescriptor], client: RecordingClient
+    ) -> None:
+        """Templates declaring the same query, and per-row renders, execute it once."""
+        client.results["SELECT ?item WHERE {}"] = [{"id": "x"}, {"id": "y"}]
+        shared = _query("a")
+        registry.templates["index"] = make_template("index", "index", (shared, _query("item")))
+        registry.templates["item"] = make_template("item", "{{ params.row.id }}", (shared,))
+        engine = ProjectionEngine(registry, {"main": client}, config=ProjectionConfig(n3_enabled=False))
+        bundle = BundleDescriptor(
+            id="site",
+            templates=(
+                BundleTemplateEntry("index", "index.txt"),
+                BundleTemplateEntry("item", "{{ params.row.id }}.txt", IterationSpec("SELECT ?item WHERE {}", "row")),
+            ),
+        )
+
+        result = BundleRenderer(engine).render_bundle(bundle)
+
+        assert [f.result.content for f in result.files] == ["index", "x", "y"]
+        assert sorted(client.queries) == ["SELECT ?a WHERE {}", "SELECT ?item WHERE {}"]
@@ -0,0 +1,150 @@
+"""Tests for compiled template caching and the shared timeout executor.
+
+Verifies that ProjectionEngine compiles each template once per content,
+recompiles on edits, keeps the sandbox when loading persisted bytecode,
+and that timed queries share one executor and fail fast.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from jinja2 import FileSystemBytecodeCache
+
+from kgcl.projection.domain.exceptions import QueryTimeoutError, TemplateRenderError
+from kgcl.projection.engine import ProjectionConfig, ProjectionEngine, TemplateCache
+from kgcl.projection.engine.timeout_executor import execute_with_timeout, get_timeout_executor
+from kgcl.projection.sandbox import create_projection_environment
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from kgcl.projection.domain.descriptors import TemplateDescriptor
+
+    from .conftest import DictRegistry, RecordingClient
+
+    MakeTemplate = Callable[..., TemplateDescriptor]
+
+
+class TestEngineTemplateCache:
+    """Tests for template caching in ProjectionEngine.render."""
+
+    def test_compiles_once_per_content(
+        self, registry: DictRegistry, client: RecordingClient, make_template: MakeTemplate
+    ) -> None:
+        """Repeated renders reuse the compiled template; edits recompile."""
+        registry.templates["api"] = make_template("api", "v{{ params.version }}")
+        engine = ProjectionEngine(registry, {"main": client})
+
+        outputs = [engine.render("api", {"version": n}).content for n in range(3)]
+        registry.templates["api"] = make_template("api", "version {{ params.version }}")
+        edited = engine.render("api", {"version": 4}).content
+
+        assert outputs == ["v0", "v1", "v2"]
+        assert edited == "version 4"
+        assert (engine.template_cache.misses, engine.template_cache.hits) == (2, 2)
+        assert len(engine.template_cache) == 1
+
+    def test_syntax_error_is_not_cached(
+        self, registry: DictRegistry, client: RecordingClient, make_template: MakeTemplate
+    ) -> None:
+        """A template that fails to compile raises every time."""
+        registry.templates["bad"] = make_template("bad", "{% if %}")
+        engine = ProjectionEngine(registry, {"main": client})
+
+        for _ in range(2):
+            with pytest.raises(TemplateRenderError, match="Failed to parse"):
+                engine.render("bad")
+        assert len(engine.template_cache) == 0
+
+    def test_bytecode_cache_persists_and_stays_sandboxed(
+        self, tmp_path: Path, registry: DictRegistry, client: RecordingClient, make_template: MakeTemplate
+    ) -> None:
+        """A second engine loads persisted bytecode, still under the sandbox."""
+        registry.templates["ok"] = make_template("ok", "{{ params.name | upper }}")
+        registry.templates["escape"] = make_template("escape", "{{ params.name.__class__.__mro__ }}")
+        config = ProjectionConfig(bytecode_cache_dir=tmp_path / "bytecode")
+
+        ProjectionEngine(registry, {"main": client}, config=config).render("ok", {"name": "ada"})
+        with pytest.raises(TemplateRenderError):
+            ProjectionEngine(registry, {"main": client}, config=config).render("escape", {"name": "ada"})
+        cached_files = sorted((tmp_path / "bytecode").iterdir())
+        reloaded = ProjectionEngine(registry, {"main": client}, config=config)
+
+        assert len(cached_files) == 2
+        assert reloaded.render("ok", {"name": "grace"}).content == "GRACE"
+        with pytest.raises(TemplateRenderError):
+            reloaded.render("escape", {"name": "ada"})
+
+
+class TestTemplateCache:
+    """Tests for TemplateCache on its own."""
+
+    def test_lru_eviction(self) -> None:
+        """The least recently used template is evicted first."""
+        cache = TemplateCache(create_projection_environment(), max_size=2)
+        cache.get("a", "A")
+        cache.get("b", "B")
+        cache.get("a", "A")
+        cache.get("c", "C")
+
+        cache.get("a", "A")
+        cache.get("b", "B")
+
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_bytecode_shared_between_caches(self, tmp_path: Path) -> None:
+        """Compiled code written by one cache is read back by another."""
+        bytecode = FileSystemBytecodeCache(str(tmp_path))
+        env = create_projection_environment()
+        TemplateCache(env, bytecode_cache=bytecode).get("t", "{{ 6 * 7 }}")
+
+        key = f"{type(env).__module__}.{type(env).__qualname__}:t"
+        bucket = bytecode.get_bucket(env, key, None, "{{ 6 * 7 }}")
+
+        assert bucket.code is not None
+        assert TemplateCache(env, bytecode_cache=bytecode).get("t", "{{ 6 * 7 }}").render() == "42"
+
+    def test_concurrent_renders(self) -> None:
+        """Concurrent lookups of one template all get a working template."""
+        cache = TemplateCache(create_projection_environment())
+        results: list[str] = []
+
+        def render(index: int) -> None:
+            results.append(cache.get("t", "{{ n * 2 }}").render(n=index))
+
+        threads = [threading.Thread(target=render, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(results, key=int) == [str(i * 2) for i in range(16)]
+        assert len(cache) == 1
+
+
+class TestSharedTimeoutExecutor:
+    """Tests for the shared executor behind execute_with_timeout."""
+
+    def test_queries_share_one_pool(self) -> None:
+        """Timed calls run on the long-lived pool's threads."""
+        names = {execute_with_timeout(lambda: threading.current_thread().name, 1.0) for _ in range(20)}
+
+        assert all(name.startswith("kgcl-query-timeout") for name in names)
+        assert len(names) <= get_timeout_executor()._max_workers
+
+    def test_timeout_returns_without_waiting_for_query(self) -> None:
+        """The caller is released at the timeout, not when the query ends."""
+        release = threading.Event()
+        started = time.perf_counter()
+
+        with pytest.raises(QueryTimeoutError):
+            execute_with_timeout(lambda: release.wait(5.0), 0.05, "stuck")
+        elapsed = time.perf_counter() - started
+        release.set()
+
+        assert elapsed < 1.0
@@ -0,0 +1,175 @@
+"""Tests for CodeletExecutor.
+
+Verifies the shared worker pool, per-codelet concurrency limits,
+timeout cancellation and shutdown behaviour.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from kgcl.yawl.codelets.base import AbstractCodelet, CodeletContext, CodeletResult, CodeletStatus
+from kgcl.yawl.codelets.executor import CodeletExecutor
+
+
+class EchoCodelet(AbstractCodelet):
+    """Codelet returning its inputs and the executing thread name."""
+
+    def do_execute(self, context: CodeletContext) -> CodeletResult:
+        """Echo input data."""
+        return CodeletResult.success_result({**context.input_data, "thread": threading.current_thread().name})
+
+
+class SquareCodelet(AbstractCodelet):
+    """CPU-bound codelet (picklable for the process pool)."""
+
+    def do_execute(self, context: CodeletContext) -> CodeletResult:
+        """Square the input value."""
+        value = int(context.get_input("value", 0))
+        return CodeletResult.success_result({"square": value * value})
+
+
+class GateCodelet(AbstractCodelet):
+    """Codelet that blocks until its gate is opened."""
+
+    def __init__(self) -> None:
+        super().__init__(name="gate")
+        self.gate = threading.Event()
+        self.started = threading.Semaphore(0)
+        self.runs = 0
+
+    def do_execute(self, context: CodeletContext) -> CodeletResult:
+        """Wait for the gate and count the run."""
+        self.runs += 1
+        self.started.release()
+        self.gate.wait(timeout=5)
+        return CodeletResult.success_result({"run": self.runs})
+
+
+def _context() -> CodeletContext:
+    return CodeletContext(work_item_id="wi-1", case_id="case-1", task_id="task-1", input_data={"x": 1})
+
+
+@pytest.fixture
+def executor() -> Iterator[CodeletExecutor]:
+    """Executor shut down after each test."""
+    codelet_executor = CodeletExecutor(max_workers=2, default_timeout=5.0)
+    yield codelet_executor
+    codelet_executor.shutdown(wait=False)
+
+
+def test_execute_runs_on_shared_pool(executor: CodeletExecutor) -> None:
+    """Executions reuse the long-lived worker pool."""
+    executor.register("echo", EchoCodelet())
+
+    results = [executor.execute("echo", _context()) for _ in range(5)]
+
+    assert all(r.success for r in results)
+    assert all(r.output_data["thread"].startswith("codelet") for r in results)
+    assert len({r.output_data["thread"] for r in results}) <= executor.max_workers
+
+
+def test_unknown_codelet_fails(executor: CodeletExecutor) -> None:
+    """Unknown codelet names produce a failure result."""
+    assert executor.execute("missing", _context()).status == CodeletStatus.FAILURE
+    assert executor.execute_async("missing", _context()).result().status == CodeletStatus.FAILURE
+
+
+def test_timeout_returns_without_waiting_for_codelet(executor: CodeletExecutor) -> None:
+    """A timed-out execution returns at the deadline."""
+    gate = GateCodelet()
+    executor.register("gate", gate)
+
+    start = time.perf_counter()
+    result = executor.execute("gate", _context(), timeout=0.05)
+    elapsed = time.perf_counter() - start
+    gate.gate.set()
+
+    assert result.status == CodeletStatus.TIMEOUT
+    assert elapsed < 1.0
+
+
+def test_per_codelet_limit_queues_excess(executor: CodeletExecutor) -> None:
+    """Executions over the per-codelet limit wait in the queue."""
+    executor.max_concurrent_per_codelet = 1
+    gate = GateCodelet()
+    executor.register("gate", gate)
+
+    first = executor.execute_async("gate", _context())
+    assert gate.started.acquire(timeout=2)
+    second = executor.execute_async("gate", _context())
+
+    assert executor.active_count == 1
+    assert executor.queue_depth == 1
+
+    gate.gate.set()
+    assert first.result(timeout=2).success
+    assert second.result(timeout=2).success
+    assert gate.runs == 2
+    assert executor.queue_depth == 0
+
+
+def test_timed_out_queued_job_is_cancelled(executor: CodeletExecutor) -> None:
+    """A job that times out while queued never runs."""
+    executor.max_concurrent_per_codelet = 1
+    gate = GateCodelet()
+    executor.register("gate", gate)
+
+    running = executor.execute_async("gate", _context())
+    assert gate.started.acquire(timeout=2)
+
+    result = executor.execute("gate", _context(), timeout=0.05)
+    assert result.status == CodeletStatus.TIMEOUT
+    assert executor.queue_depth == 0
+
+    gate.gate.set()
+    assert running.result(timeout=2).success
+    assert gate.runs == 1
+
+
+def test_async_callback_and_timeout(executor: CodeletExecutor) -> None:
+    """Async executions invoke callbacks and honour the default timeout."""
+    executor.default_timeout = 0.05
+    gate = GateCodelet()
+    executor.register("gate", gate)
+    received: list[CodeletResult] = []
+
+    future = executor.execute_async("gate", _context(), callback=received.append)
+
+    assert future.result(timeout=2).status == CodeletStatus.TIMEOUT
+    assert received[0].status == CodeletStatus.TIMEOUT
+    gate.gate.set()
+
+
+def test_shutdown_fails_waiting_and_new_jobs() -> None:
+    """Shutdown resolves queued jobs and rejects new ones."""
+    executor = CodeletExecutor(max_workers=1, max_concurrent_per_codelet=1)
+    gate = GateCodelet()
+    executor.register("gate", gate)
+
+    executor.execute_async("gate", _context())
+    assert gate.started.acquire(timeout=2)
+    waiting = executor.execute_async("gate", _context())
+
+    gate.gate.set()
+    executor.shutdown()
+
+    assert waiting.result(timeout=2).status == CodeletStatus.FAILURE
+    assert executor.execute("gate", _context()).status == CodeletStatus.FAILURE
+
+
+@pytest.mark.slow
+def test_process_codelets_run_on_process_pool() -> None:
+    """Codelets listed as CPU-bound run in worker processes."""
+    with CodeletExecutor(max_workers=1, process_codelets={"square"}, default_timeout=60.0) as executor:
+        executor.register("square", SquareCodelet())
+        context = CodeletContext(work_item_id="wi-1", case_id="case-1", task_id="task-1", input_data={"value": 7})
+
+        result = executor.execute("square", context)
+
+    assert result.success
+    assert result.output_data == {"square": 49}
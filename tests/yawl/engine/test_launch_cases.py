@@ -0,0 +1,218 @@
+"""Tests for bulk case launch.
+
+Verifies that YEngine.launch_cases produces the same cases, markings
+and work items as launching one case at a time, delivers events after
+the batch, and persists the batch in one transaction.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from kgcl.yawl.elements.y_atomic_task import YAtomicTask
+from kgcl.yawl.elements.y_condition import ConditionType, YCondition
+from kgcl.yawl.elements.y_flow import YFlow
+from kgcl.yawl.elements.y_net import YNet
+from kgcl.yawl.elements.y_specification import YSpecification
+from kgcl.yawl.elements.y_task import SplitType
+from kgcl.yawl.engine.y_case import CaseStatus
+from kgcl.yawl.engine.y_engine import EngineEvent, YEngine
+from kgcl.yawl.engine.y_net_runner import YNetRunner
+from kgcl.yawl.persistence.sqlite_backend import SQLiteConnection, sqlite_connection_factory
+from kgcl.yawl.persistence.write_behind import RepositoryPersistenceManager, WriteBehindRepository
+
+
+def _parallel_spec() -> YSpecification:
+    """Specification whose start task AND-splits into two branches."""
+    spec = YSpecification(id="bulk-spec", name="Bulk")
+    net = YNet(id="main")
+    net.add_condition(YCondition(id="start", condition_type=ConditionType.INPUT))
+    net.add_condition(YCondition(id="end", condition_type=ConditionType.OUTPUT))
+    net.add_condition(YCondition(id="c1"))
+    net.add_condition(YCondition(id="c2"))
+    net.add_task(YAtomicTask(id="Split", split_type=SplitType.AND))
+    net.add_task(YAtomicTask(id="B"))
+    net.add_task(YAtomicTask(id="C"))
+    net.add_flow(YFlow(id="f1", source_id="start", target_id="Split"))
+    net.add_flow(YFlow(id="f2", source_id="Split", target_id="c1"))
+    net.add_flow(YFlow(id="f3", source_id="Split", target_id="c2"))
+    net.add_flow(YFlow(id="f4", source_id="c1", target_id="B"))
+    net.add_flow(YFlow(id="f5", source_id="c2", target_id="C"))
+    net.add_flow(YFlow(id="f6", source_id="B", target_id="end"))
+    net.add_flow(YFlow(id="f7", source_id="C", target_id="end"))
+    spec.set_root_net(net)
+    return spec
+
+
+def _engine() -> YEngine:
+    engine = YEngine()
+    engine.start()
+    spec = engine.load_specification(_parallel_spec())
+    engine.activate_specification(spec.id)
+    return engine
+
+
+class TestLaunchCases:
+    """Tests for YEngine.launch_cases."""
+
+    def test_matches_single_launches(self) -> None:
+        """Bulk launched cases have the same state as individually started ones."""
+        single = _engine()
+        single_ids = []
+        for amount in (1, 2, 3):
+            case = single.create_case("bulk-spec", input_data={"amount": amount})
+            single.start_case(case.id)
+            single_ids.append(case.id)
+
+        bulk = _engine()
+        bulk_ids = bulk.launch_cases("bulk-spec", [{"amount": 1}, {"amount": 2}, {"amount": 3}])
+
+        assert bulk_ids == single_ids
+        for case_id in bulk_ids:
+            expected = single.cases[case_id]
+            actual = bulk.cases[case_id]
+            assert actual.status == CaseStatus.RUNNING
+            assert actual.data.input_data == expected.data.input_data
+            assert actual.net_runners["main"].get_marking_snapshot() == (
+                expected.net_runners["main"].get_marking_snapshot()
+            )
+            assert actual.net_runners["main"].enabled_tasks == expected.net_runners["main"].enabled_tasks
+            assert sorted(wi.task_id for wi in actual.work_items.values()) == ["Split"]
+
+    def test_runners_continue_independently(self) -> None:
+        """Runners started from the shared prototype fire normally."""
+        engine = _engine()
+        first, second = engine.launch_cases("bulk-spec", [None, None])
+
+        engine.net_runners[f"{first}:main"].fire_task("Split")
+
+        assert sorted(engine.net_runners[f"{first}:main"].get_enabled_tasks()) == ["B", "C"]
+        assert engine.net_runners[f"{second}:main"].get_enabled_tasks() == ["Split"]
+
+    def test_events_delivered_after_batch(self) -> None:
+        """Listeners receive the batch's events in emission order once it completes."""
+        engine = _engine()
+        received: list[EngineEvent] = []
+        cases_seen: list[int] = []
+
+        def listener(event: EngineEvent) -> None:
+            received.append(event)
+            cases_seen.append(len(engine.cases))
+
+        engine.add_event_listener(listener)
+        case_ids = engine.launch_cases("bulk-spec", [{}, {}])
+
+        assert [e.event_type for e in received if e.case_id == case_ids[0]][:3] == [
+            "CASE_CREATED",
+            "CASE_STARTED",
+            "WORK_ITEM_CREATED",
+        ]
+        assert set(cases_seen) == {2}
+
+    def test_inactive_specification_rejected(self) -> None:
+        """The specification is validated before any case is created."""
+        engine = YEngine()
+        engine.load_specification(_parallel_spec())
+
+        with pytest.raises(ValueError, match="not active"):
+            engine.launch_cases("bulk-spec", [{}])
+        assert engine.cases == {}
+
+    def test_start_like_rejects_advanced_prototype(self) -> None:
+        """A prototype that has fired cannot seed new runners."""
+        net = _parallel_spec().get_root_net()
+        prototype = YNetRunner(net=net, case_id="proto")
+        prototype.start()
+        prototype.fire_task("Split")
+
+        with pytest.raises(ValueError, match="freshly started"):
+            YNetRunner(net=net, case_id="other").start_like(prototype)
+
+    def test_batch_persisted_in_one_flush(self, tmp_path: Path) -> None:
+        """Cases and work items of a batch are written in one transaction."""
+        database = tmp_path / "yawl.db"
+        repository = WriteBehindRepository(connection_factory=sqlite_connection_factory(database), flush_interval=60.0)
+        repository.save_specification("bulk-spec", "bulk-spec", "Bulk", "0.1", "ACTIVE")
+        repository.flush()
+        engine = _engine()
+        engine.initialise(RepositoryPersistenceManager(repository=repository), True, False, False)
+
+        engine.launch_cases("bulk-spec", [{} for _ in range(20)])
+
+        assert repository.flush_count == 2
+        reader = SQLiteConnection(database)
+        reader.execute("SELECT COUNT(*) FROM yawl_cases")
+        assert reader.fetchone() == (20,)
+        reader.execute("SELECT COUNT(*) FROM yawl_work_items")
+        assert reader.fetchone() == (20,)
+        reader.close()
+
+    def test_failed_batch_keeps_launched_cases(self, tmp_path: Path) -> None:
+        """Cases launched before a failure are kept, announced and persisted."""
+        database = tmp_path / "yawl.db"
+        repository = WriteBehindRepository(connection_factory=sqlite_connection_factory(database), flush_interval=60.0)
+        repository.save_specification("bulk-spec", "bulk-spec", "Bulk", "0.1", "ACTIVE")
+        repository.flush()
+        engine = _engine()
+        engine.initialise(RepositoryPersistenceManager(repository=repository), True, False, False)
+        received: list[EngineEvent] = []
+        engine.add_event_listener(received.append)
+
+        def inputs() -> Iterator[dict[str, int]]:
+            yield {"amount": 1}
+            yield {"amount": 2}
+            raise RuntimeError("input source failed")
+
+        with pytest.raises(RuntimeError, match="input source failed"):
+            engine.launch_cases("bulk-spec", inputs())
+
+        assert len(engine.cases) == 2
+        assert {e.case_id for e in received if e.event_type == "CASE_STARTED"} == set(engine.cases)
+        reader = SQLiteConnection(database)
+        reader.execute("SELECT COUNT(*) FROM yawl_cases")
+        assert reader.fetchone() == (2,)
+        reader.close()
+
+    def test_events_delivered_event_by_event(self) -> None:
+        """Every listener sees an event before the next event is delivered."""
+        engine = _engine()
+        calls: list[tuple[str, str]] = []
+        engine.add_event_listener(lambda event: calls.append(("first", event.event_type)))
+        engine.add_event_listener(lambda event: calls.append(("second", event.event_type)))
+
+        engine.launch_cases("bulk-spec", [{}])
+
+        assert calls[:4] == [
+            ("first", "CASE_CREATED"),
+            ("second", "CASE_CREATED"),
+            ("first", "CASE_STARTED"),
+            ("second", "CASE_STARTED"),
+        ]
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_bulk_launch_faster_than_single_launches() -> None:
+    """Benchmark launch_cases against create_case/start_case loops."""
+    count = 2000
+
+    single = _engine()
+    start = time.perf_counter()
+    for _ in range(count):
+        case = single.create_case("bulk-spec")
+        single.start_case(case.id)
+    single_seconds = time.perf_counter() - start
+
+    bulk = _engine()
+    start = time.perf_counter()
+    bulk.launch_cases("bulk-spec", [None] * count)
+    bulk_seconds = time.perf_counter() - start
+
+    assert len(bulk.cases) == len(single.cases) == count
+    assert bulk_seconds < single_seconds, (
+        f"Bulk launch took {bulk_seconds * 1000:.1f}ms vs single launches {single_seconds * 1000:.1f}ms"
+    )
@@ -0,0 +1,370 @@
+"""Tests for write-behind persistence and the SQLite backend.
+
+Verifies that buffered writes are coalesced per entity, flushed in
+batches inside one transaction, made durable on checkpoints and
+engine commits, and visible to reads before they are flushed.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from kgcl.yawl.elements.y_specification import YSpecification
+from kgcl.yawl.engine.y_case import CaseStatus, YCase
+from kgcl.yawl.engine.y_engine import YEngine
+from kgcl.yawl.engine.y_work_item import WorkItemStatus, YWorkItem
+from kgcl.yawl.persistence.checkpoint import CheckpointManager
+from kgcl.yawl.persistence.db_repository import DatabaseRepository
+from kgcl.yawl.persistence.sqlite_backend import SQLiteConnection, sqlite_connection_factory
+from kgcl.yawl.persistence.write_behind import RepositoryPersistenceManager, WriteBehindRepository
+
+WriteBehindFactory = Callable[..., WriteBehindRepository]
+
+
+class CountingConnection(SQLiteConnection):
+    """SQLite connection that counts statements and commits."""
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.statements = 0
+        self.batches = 0
+        self.commits = 0
+
+    def execute(self, sql: str, params: tuple[Any, ...] | None = None) -> Any:
+        self.statements += 1
+        return super().execute(sql, params)
+
+    def executemany(self, sql: str, params_seq: Any) -> Any:
+        self.batches += 1
+        return super().executemany(sql, params_seq)
+
+    def commit(self) -> None:
+        self.commits += 1
+        super().commit()
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> Path:
+    """SQLite database file with the YAWL schema."""
+    path = tmp_path / "yawl.db"
+    connection = SQLiteConnection(path)
+    connection.create_schema()
+    connection.close()
+    return path
+
+
+@pytest.fixture
+def write_behind(database: Path) -> Iterator[WriteBehindFactory]:
+    """Factory for write-behind repositories on ``database``, closed after the test."""
+    repositories: list[WriteBehindRepository] = []
+
+    def make(**kwargs: Any) -> WriteBehindRepository:
+        kwargs.setdefault("connection_factory", lambda: SQLiteConnection(database))
+        kwargs.setdefault("flush_interval", 60.0)
+        repository = WriteBehindRepository(**kwargs)
+        repositories.append(repository)
+        return repository
+
+    yield make
+    for repository in repositories:
+        repository.close()
+
+
+def _read_rows(database: Path, sql: str) -> list[tuple[Any, ...]]:
+    connection = SQLiteConnection(database)
+    connection.execute(sql)
+    rows = connection.fetchall()
+    connection.close()
+    return rows
+
+
+def _seed(repository: DatabaseRepository) -> None:
+    repository.save_specification("spec-1", "urn:spec-1", "Spec", "1.0", "ACTIVE")
+    repository.save_case("case-1", "spec-1", "RUNNING", root_net_id="net")
+
+
+class TestSQLiteBackend:
+    """Tests for the SQLite connection adapter."""
+
+    def test_repository_round_trip(self, database: Path) -> None:
+        """The plain repository runs unchanged on SQLite."""
+        repository = DatabaseRepository(connection_factory=lambda: SQLiteConnection(database))
+        _seed(repository)
+        repository.save_work_item("wi-1", "case-1", "task", "net", "FIRED", data_in={"amount": 3})
+
+        assert repository.get_case("case-1")["status"] == "RUNNING"
+        assert repository.get_work_item("wi-1")["data_in"] == {"amount": 3}
+
+        repository.delete_case("case-1")
+        assert repository.find_work_items_by_case("case-1") == []
+        repository.get_connection().close()
+
+
+class TestWriteBehindRepository:
+    """Tests for write-behind batching."""
+
+    def test_updates_coalesced_into_one_row(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """Repeated saves of one entity are written once."""
+        connection = CountingConnection(database)
+        repository = write_behind(connection_factory=lambda: connection)
+        _seed(repository)
+        fired = datetime(2025, 1, 1, 9, 0)
+        repository.save_work_item("wi-1", "case-1", "task", "net", "FIRED", fired_at=fired)
+        for status in ("ALLOCATED", "STARTED", "COMPLETED"):
+            repository.save_work_item("wi-1", "case-1", "task", "net", status, allocated_to="alice")
+
+        assert repository.pending_count == 3
+        assert repository.coalesced_count == 3
+        repository.flush()
+
+        assert connection.batches == 3
+        assert connection.commits == 1
+        rows = _read_rows(database, "SELECT status, allocated_to, fired_at FROM yawl_work_items")
+        assert rows == [("COMPLETED", "alice", "2025-01-01 09:00:00")]
+
+    def test_merge_matches_sequential_upserts(self, write_behind: WriteBehindFactory) -> None:
+        """Coalesced rows keep insert-only columns and non-null timestamps."""
+        repository = write_behind()
+        _seed(repository)
+        started = datetime(2025, 1, 1, 10, 0)
+        repository.save_case("case-2", "spec-1", "RUNNING", root_net_id="net", started_at=started)
+        repository.save_case("case-2", "spec-1", "COMPLETED", root_net_id="other")
+
+        case = repository.get_case("case-2")
+
+        assert case["status"] == "COMPLETED"
+        assert case["root_net_id"] == "net"
+        assert case["started_at"] == "2025-01-01 10:00:00"
+
+    def test_events_appended_in_order(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """Unkeyed event inserts are never coalesced."""
+        repository = write_behind()
+        _seed(repository)
+        for name in ("fired", "started", "completed"):
+            repository.save_event(name, case_id="case-1")
+        repository.flush()
+
+        rows = _read_rows(database, "SELECT event_type FROM yawl_events ORDER BY id")
+        assert rows == [("fired",), ("started",), ("completed",)]
+
+    def test_reads_see_buffered_writes(self, write_behind: WriteBehindFactory) -> None:
+        """Reads flush the buffer first."""
+        repository = write_behind()
+        _seed(repository)
+
+        assert repository.pending_count == 2
+        assert repository.get_specification("spec-1")["name"] == "Spec"
+        assert repository.pending_count == 0
+
+    def test_buffered_writes_not_visible_until_flush(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """Other connections only see flushed state."""
+        repository = write_behind()
+        _seed(repository)
+
+        assert _read_rows(database, "SELECT id FROM yawl_cases") == []
+        repository.flush()
+        assert _read_rows(database, "SELECT id FROM yawl_cases") == [("case-1",)]
+
+    def test_size_and_window_trigger_flush(self, write_behind: WriteBehindFactory) -> None:
+        """The buffer flushes when full or when the window elapses."""
+        now = [0.0]
+        repository = write_behind(flush_interval=1.0, max_pending=3, clock=lambda: now[0])
+        _seed(repository)
+        assert repository.flush_count == 0
+        repository.save_event("e1", case_id="case-1")
+        assert repository.flush_count == 1
+
+        repository.save_event("e2", case_id="case-1")
+        now[0] = 1.5
+        repository.save_event("e3", case_id="case-1")
+        assert repository.flush_count == 2
+        assert repository.pending_count == 0
+
+    def test_failed_flush_keeps_buffer(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """A failing batch rolls back the whole flush."""
+        repository = write_behind()
+        repository.save_specification("spec-1", "urn:spec-1", "Spec", "1.0", "ACTIVE")
+        repository.save_case("case-1", "missing-spec", "RUNNING")
+
+        with pytest.raises(sqlite3.IntegrityError, match="FOREIGN KEY"):
+            repository.flush()
+
+        assert repository.pending_count == 2
+        assert _read_rows(database, "SELECT id FROM yawl_specifications") == []
+        repository.rollback()
+
+    def test_checkpoint_flushes_buffer(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """Creating a checkpoint makes buffered writes durable."""
+        repository = write_behind()
+        manager = CheckpointManager(flush_hooks=[repository.flush])
+        _seed(repository)
+
+        manager.create_engine_checkpoint(YEngine())
+
+        assert _read_rows(database, "SELECT id, status FROM yawl_cases") == [("case-1", "RUNNING")]
+
+    def test_timer_flushes_idle_buffer(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """Buffered writes are sent once the window elapses, without another write."""
+        repository = write_behind(flush_interval=0.02)
+        _seed(repository)
+
+        deadline = time.monotonic() + 5.0
+        while repository.pending_count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert _read_rows(database, "SELECT id FROM yawl_cases") == [("case-1",)]
+        assert repository.flush_count == 1
+
+    def test_rollback_cancels_timer(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """Rolled back rows are never sent by the flusher."""
+        repository = write_behind(flush_interval=0.02)
+        repository.save_specification("spec-1", "urn:spec-1", "Spec", "1.0", "ACTIVE")
+        repository.rollback()
+        time.sleep(0.1)
+
+        assert repository.flush_count == 0
+        assert _read_rows(database, "SELECT id FROM yawl_specifications") == []
+
+    def test_transaction_rows_sent_but_not_committed(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """Reads inside a transaction see its rows; rollback still removes them."""
+        repository = write_behind()
+        repository.begin()
+        repository.save_specification("spec-1", "urn:spec-1", "Spec", "1.0", "ACTIVE")
+
+        assert repository.get_specification("spec-1")["name"] == "Spec"
+        assert _read_rows(database, "SELECT id FROM yawl_specifications") == []
+
+        repository.rollback()
+        assert repository.get_specification("spec-1") is None
+
+    def test_one_flusher_thread_serves_every_window(self, write_behind: WriteBehindFactory) -> None:
+        """Successive windows reuse one flusher thread, and close stops it."""
+        repository = write_behind(flush_interval=0.01)
+
+        def flushed_threads() -> set[str]:
+            deadline = time.monotonic() + 5.0
+            while repository.pending_count and time.monotonic() < deadline:
+                time.sleep(0.005)
+            return {thread.name for thread in threading.enumerate() if thread.name == "write-behind-flusher"}
+
+        repository.save_specification("spec-1", "urn:spec-1", "Spec", "1.0", "ACTIVE")
+        first = flushed_threads()
+        repository.save_case("case-1", "spec-1", "RUNNING")
+        second = flushed_threads()
+        flusher = repository._flusher
+        repository.close()
+
+        assert repository.flush_count == 2
+        assert len(first) == len(second) == 1
+        assert flusher is not None and not flusher.is_alive()
+
+    def test_reads_do_not_interleave_with_background_flushes(
+        self, database: Path, write_behind: WriteBehindFactory
+    ) -> None:
+        """A background flush waits until a read has fetched its rows."""
+        fetching = threading.Event()
+
+        class SlowFetchConnection(SQLiteConnection):
+            def fetchone(self) -> tuple[Any, ...] | None:
+                fetching.set()
+                time.sleep(0.1)
+                return super().fetchone()
+
+        repository = write_behind(connection_factory=lambda: SlowFetchConnection(database), flush_interval=0.005)
+        _seed(repository)
+        repository.flush()
+        cases: list[dict[str, Any] | None] = []
+        reader = threading.Thread(target=lambda: cases.append(repository.get_case("case-1")))
+        reader.start()
+        fetching.wait(5.0)
+        repository.save_event("started", case_id="case-1")
+        reader.join()
+
+        assert cases[0] is not None and cases[0]["id"] == "case-1"
+
+    @pytest.mark.slow
+    @pytest.mark.performance
+    def test_batched_writes_faster_than_row_commits(self, tmp_path: Path, write_behind: WriteBehindFactory) -> None:
+        """Benchmark write-behind against commit-per-row persistence."""
+        transitions = ("FIRED", "ALLOCATED", "STARTED", "COMPLETED")
+
+        def run(repository: DatabaseRepository) -> float:
+            _seed(repository)
+            start = time.perf_counter()
+            for i in range(150):
+                for status in transitions:
+                    repository.save_work_item(f"wi-{i}", "case-1", "task", "net", status)
+            repository.flush()
+            return time.perf_counter() - start
+
+        direct = DatabaseRepository(connection_factory=sqlite_connection_factory(tmp_path / "direct.db"))
+        direct_seconds = run(direct)
+        direct.get_connection().close()
+        batched_seconds = run(write_behind(connection_factory=sqlite_connection_factory(tmp_path / "batched.db")))
+
+        assert _read_rows(tmp_path / "batched.db", "SELECT COUNT(*) FROM yawl_work_items") == [(150,)]
+        assert batched_seconds < direct_seconds, (
+            f"Write-behind took {batched_seconds * 1000:.1f}ms vs row commits {direct_seconds * 1000:.1f}ms"
+        )
+
+
+class TestRepositoryPersistenceManager:
+    """Tests for feeding engine persistence hooks into the repository."""
+
+    def test_engine_hooks_flush_on_commit(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """Objects stored by the engine are written when the transaction commits."""
+        repository = write_behind()
+        engine = YEngine()
+        engine.initialise(RepositoryPersistenceManager(repository=repository), True, False, False)
+        case = YCase(id="case-1", specification_id="spec-1", root_net_id="net", status=CaseStatus.RUNNING)
+        item = YWorkItem(id="wi-1", case_id="case-1", task_id="task", net_id="net", status=WorkItemStatus.FIRED)
+
+        engine.startTransaction()
+        engine.storeObject(YSpecification(id="spec-1", name="Spec"))
+        engine.storeObject(case)
+        engine.storeObject(item)
+        item.status = WorkItemStatus.STARTED
+        item.resource_id = "alice"
+        engine.updateObject(item)
+        engine.commitTransaction()
+
+        assert _read_rows(database, "SELECT status, allocated_to FROM yawl_work_items") == [("STARTED", "alice")]
+
+        engine.deleteObject(item)
+        assert _read_rows(database, "SELECT id FROM yawl_work_items") == []
+
+    def test_rollback_discards_buffer(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """Rolled back engine transactions leave the database untouched."""
+        repository = write_behind()
+        engine = YEngine()
+        engine.initialise(RepositoryPersistenceManager(repository=repository), True, False, False)
+
+        engine.startTransaction()
+        engine.storeObject(YSpecification(id="spec-1", name="Spec"))
+        engine.rollbackTransaction()
+        repository.flush()
+
+        assert repository.pending_count == 0
+        assert _read_rows(database, "SELECT id FROM yawl_specifications") == []
+
+    def test_rollback_keeps_writes_before_transaction(self, database: Path, write_behind: WriteBehindFactory) -> None:
+        """Rollback discards only the writes made inside the transaction."""
+        repository = write_behind()
+        engine = YEngine()
+        engine.initialise(RepositoryPersistenceManager(repository=repository), True, False, False)
+
+        engine.storeObject(YSpecification(id="s1", name="First"))
+        engine.startTransaction()
+        engine.storeObject(YSpecification(id="s2", name="Second"))
+        engine.rollbackTransaction()
+        repository.flush()
+
+        assert _read_rows(database, "SELECT id FROM yawl_specifications") == [("s1",)]
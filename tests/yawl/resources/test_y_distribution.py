@@ -0,0 +1,245 @@
+"""Tests for YAWL work item distribution strategies.
+
+Verifies the incrementally maintained queue-length and throughput
+rankings used by the SHORTEST_QUEUE and FASTEST strategies.
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+import weakref
+
+import pytest
+
+from kgcl.yawl.resources.y_distribution import (
+    DistributionContext,
+    DistributionStrategy,
+    Distributor,
+    IndexedPriorityQueue,
+    ParticipantMetrics,
+    ParticipantMetricsMap,
+)
+from kgcl.yawl.resources.y_resource import YParticipant, YResourceManager
+
+
+def _participants(count: int) -> list[YParticipant]:
+    return [YParticipant(id=f"P{i:05d}") for i in range(count)]
+
+
+class TestIndexedPriorityQueue:
+    """Tests for the indexed binary heap."""
+
+    def test_peek_returns_lowest_priority(self) -> None:
+        """Lowest priority item is at the top."""
+        queue = IndexedPriorityQueue()
+        queue.push("a", 3)
+        queue.push("b", 1)
+        queue.push("c", 2)
+
+        assert queue.peek() == "b"
+        assert len(queue) == 3
+
+    def test_ties_broken_by_item_id(self) -> None:
+        """Equal priorities resolve to the smallest ID."""
+        queue = IndexedPriorityQueue()
+        for item_id in ("z", "m", "a"):
+            queue.push(item_id, 5)
+
+        assert queue.peek() == "a"
+
+    def test_update_and_remove(self) -> None:
+        """Priority changes and removals reorder the heap."""
+        queue = IndexedPriorityQueue()
+        for i in range(10):
+            queue.push(f"i{i}", i)
+
+        queue.push("i0", 100)
+        assert queue.peek() == "i1"
+        assert queue.priority_of("i0") == 100
+
+        queue.remove("i1")
+        assert "i1" not in queue
+        assert queue.peek() == "i2"
+
+
+class TestShortestQueue:
+    """Tests for SHORTEST_QUEUE distribution."""
+
+    def test_selects_fewest_active_items(self) -> None:
+        """Participant with fewest active items is selected."""
+        participants = _participants(3)
+        metrics = {
+            "P00000": ParticipantMetrics(participant_id="P00000", active_work_items=4),
+            "P00001": ParticipantMetrics(participant_id="P00001", active_work_items=1),
+            "P00002": ParticipantMetrics(participant_id="P00002", active_work_items=2),
+        }
+        context = DistributionContext(task_id="t1", case_id="c1", metrics=metrics)
+        distributor = Distributor(strategy=DistributionStrategy.SHORTEST_QUEUE, context=context)
+
+        assert distributor.distribute(participants)[0].id == "P00001"
+
+    def test_tracks_metric_updates(self) -> None:
+        """Mutating metrics updates the ranking without rebuilding it."""
+        participants = _participants(3)
+        metrics = {p.id: ParticipantMetrics(participant_id=p.id) for p in participants}
+        context = DistributionContext(task_id="t1", case_id="c1", metrics=metrics)
+        distributor = Distributor(strategy=DistributionStrategy.SHORTEST_QUEUE, context=context)
+
+        selected = []
+        for _ in range(6):
+            chosen = distributor.distribute(participants)[0]
+            metrics[chosen.id].active_work_items += 1
+            selected.append(chosen.id)
+
+        assert selected == ["P00000", "P00001", "P00002"] * 2
+
+        metrics["P00002"].active_work_items -= 2
+        assert distributor.distribute(participants)[0].id == "P00002"
+
+    def test_picks_up_metrics_added_after_first_call(self) -> None:
+        """Metrics registered after the pool is built are honoured."""
+        participants = _participants(2)
+        metrics = {"P00000": ParticipantMetrics(participant_id="P00000", active_work_items=1)}
+        context = DistributionContext(task_id="t1", case_id="c1", metrics=metrics)
+        distributor = Distributor(strategy=DistributionStrategy.SHORTEST_QUEUE, context=context)
+
+        assert distributor.distribute(participants)[0].id == "P00001"
+
+        metrics["P00001"] = ParticipantMetrics(participant_id="P00001", active_work_items=5)
+        assert distributor.distribute(participants)[0].id == "P00000"
+
+    def test_candidate_subsets_ranked_independently(self) -> None:
+        """Each candidate set selects only among its own members."""
+        participants = _participants(4)
+        metrics = {
+            p.id: ParticipantMetrics(participant_id=p.id, active_work_items=i) for i, p in enumerate(participants)
+        }
+        context = DistributionContext(task_id="t1", case_id="c1", metrics=metrics)
+        distributor = Distributor(strategy=DistributionStrategy.SHORTEST_QUEUE, context=context)
+
+        assert distributor.distribute(participants)[0].id == "P00000"
+        assert distributor.distribute(participants[2:])[0].id == "P00002"
+
+        metrics["P00003"].active_work_items = 0
+        assert distributor.distribute(participants[2:])[0].id == "P00003"
+        assert distributor.distribute(participants)[0].id == "P00000"
+
+    @pytest.mark.parametrize("map_type", [dict, ParticipantMetricsMap])
+    def test_replaced_metrics_entry_is_ranked(self, map_type: type[dict[str, ParticipantMetrics]]) -> None:
+        """Replacing a metrics object in the dict re-ranks that participant."""
+        participants = _participants(2)
+        metrics = map_type(
+            (p.id, ParticipantMetrics(participant_id=p.id, active_work_items=i)) for i, p in enumerate(participants)
+        )
+        context = DistributionContext(task_id="t1", case_id="c1", metrics=metrics)
+        distributor = Distributor(strategy=DistributionStrategy.SHORTEST_QUEUE, context=context)
+        assert distributor.distribute(participants)[0].id == "P00000"
+
+        metrics["P00000"] = ParticipantMetrics(participant_id="P00000", active_work_items=10)
+        assert distributor.distribute(participants)[0].id == "P00001"
+
+        metrics["P00000"].active_work_items = 0
+        assert distributor.distribute(participants)[0].id == "P00000"
+
+    @pytest.mark.parametrize("map_type", [dict, ParticipantMetricsMap])
+    def test_removed_and_added_keys_are_ranked(self, map_type: type[dict[str, ParticipantMetrics]]) -> None:
+        """Deleting one entry and adding another keeps the ranking in sync."""
+        participants = _participants(3)
+        metrics = map_type(
+            (p.id, ParticipantMetrics(participant_id=p.id, active_work_items=i + 1)) for i, p in enumerate(participants)
+        )
+        context = DistributionContext(task_id="t1", case_id="c1", metrics=metrics)
+        distributor = Distributor(strategy=DistributionStrategy.SHORTEST_QUEUE, context=context)
+        assert distributor.distribute(participants)[0].id == "P00000"
+
+        del metrics["P00002"]
+        metrics["P00000"] = ParticipantMetrics(participant_id="P00000", active_work_items=5)
+        assert distributor.distribute(participants)[0].id == "P00002"
+
+    def test_discarded_contexts_release_listeners(self) -> None:
+        """Short-lived distribution contexts do not accumulate listeners."""
+        participants = _participants(3)
+        metrics = {p.id: ParticipantMetrics(participant_id=p.id) for p in participants}
+        contexts = [DistributionContext(task_id="t1", case_id="", metrics=metrics) for _ in range(100)]
+        for context in contexts:
+            Distributor(strategy=DistributionStrategy.SHORTEST_QUEUE, context=context).distribute(participants)
+        assert metrics["P00000"].listener_count == 100
+
+        rankings = [weakref.ref(context.ranking) for context in contexts]
+        del contexts, context
+        gc.collect()
+        assert all(ranking() is None for ranking in rankings)
+        metrics["P00000"].active_work_items += 1
+
+        assert metrics["P00000"].listener_count == 0
+        assert len(metrics["P00000"]._listeners) == 0
+
+    def test_clearing_ranking_removes_listeners(self) -> None:
+        """ParticipantRanking.clear detaches from every watched metrics object."""
+        participants = _participants(3)
+        metrics = {p.id: ParticipantMetrics(participant_id=p.id) for p in participants}
+        context = DistributionContext(task_id="t1", case_id="", metrics=metrics)
+        Distributor(strategy=DistributionStrategy.SHORTEST_QUEUE, context=context).distribute(participants)
+        assert [m.listener_count for m in metrics.values()] == [1, 1, 1]
+
+        context.ranking.clear()
+
+        assert [len(m._listeners) for m in metrics.values()] == [0, 0, 0]
+
+
+class TestFastest:
+    """Tests for FASTEST distribution."""
+
+    def test_selects_lowest_average_time(self) -> None:
+        """Participant with lowest average completion time is selected."""
+        participants = _participants(3)
+        metrics = {p.id: ParticipantMetrics(participant_id=p.id) for p in participants}
+        metrics["P00000"].update_completion(300.0)
+        metrics["P00001"].update_completion(100.0)
+        context = DistributionContext(task_id="t1", case_id="c1", metrics=metrics)
+        distributor = Distributor(strategy=DistributionStrategy.FASTEST, context=context)
+
+        assert distributor.distribute(participants)[0].id == "P00001"
+
+        # Slow completions push the average above P00000
+        for _ in range(3):
+            metrics["P00001"].update_completion(1000.0)
+        assert distributor.distribute(participants)[0].id == "P00000"
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_indexed_allocation_faster_than_sort_based() -> None:
+    """Benchmark indexed selection against the sort-based strategy."""
+    participants = _participants(2000)
+    allocations = 300
+
+    def sort_based_allocate(metrics: dict[str, ParticipantMetrics]) -> float:
+        start = time.perf_counter()
+        for _ in range(allocations):
+            chosen = sorted(participants, key=lambda p: metrics[p.id].active_work_items)[0]
+            metrics[chosen.id].active_work_items += 1
+        return time.perf_counter() - start
+
+    def indexed_allocate(metrics: dict[str, ParticipantMetrics]) -> float:
+        context = DistributionContext(task_id="t1", case_id="c1", metrics=metrics)
+        distributor = Distributor(strategy=DistributionStrategy.SHORTEST_QUEUE, context=context)
+        start = time.perf_counter()
+        for _ in range(allocations):
+            chosen = distributor.distribute(participants)[0]
+            metrics[chosen.id].active_work_items += 1
+        return time.perf_counter() - start
+
+    sort_metrics = {p.id: ParticipantMetrics(participant_id=p.id) for p in participants}
+    indexed_metrics = ParticipantMetricsMap((p.id, ParticipantMetrics(participant_id=p.id)) for p in participants)
+
+    sort_seconds = sort_based_allocate(sort_metrics)
+    indexed_seconds = indexed_allocate(indexed_metrics)
+
+    assert {pid: m.active_work_items for pid, m in indexed_metrics.items()} == {
+        pid: m.active_work_items for pid, m in sort_metrics.items()
+    }
+    assert indexed_seconds < sort_seconds, (
+        f"Indexed allocation took {indexed_seconds * 1000:.1f}ms vs sort-based {sort_seconds * 1000:.1f}ms"
+    )
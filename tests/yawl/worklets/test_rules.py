@@ -0,0 +1,184 @@
+"""Tests for compiled RDR rule conditions.
+
+Verifies that rule conditions are compiled once into predicates,
+evaluate identically to the interpreted rules, and are invalidated
+when a rule is edited.
+"""
+
+from __future__ import annotations
+
+from itertools import pairwise
+
+import pytest
+
+from kgcl.yawl.worklets.exceptions import RuleEvaluationError
+from kgcl.yawl.worklets.models import RDRNode, RDRTree
+from kgcl.yawl.worklets.rules import RDREngine, RuleContext, compile_condition
+
+
+@pytest.fixture
+def context() -> RuleContext:
+    """Rule context with numeric and text case data."""
+    return RuleContext(
+        case_id="case-001",
+        exception_type="TIMEOUT",
+        case_data={"amount": "150", "priority": "High", "region": "EU"},
+        work_item_data={"retries": 2},
+    )
+
+
+class TestCompileCondition:
+    """Tests for compile_condition."""
+
+    @pytest.mark.parametrize(
+        ("condition", "expected"),
+        [
+            ("true", True),
+            ("NO", False),
+            ("amount >= 150", True),
+            ("amount <= 100", False),
+            ("priority == 'high'", True),
+            ("priority != high", False),
+            ("retries > 1", True),
+            ("retries < 1", False),
+            ("region in [us, eu]", True),
+            ("region in [us, apac]", False),
+            ("priority", True),
+            ("missing_var", False),
+        ],
+    )
+    def test_operators(self, context: RuleContext, condition: str, expected: bool) -> None:
+        """Compiled predicates match the rule condition semantics."""
+        assert compile_condition(condition)(context) is expected
+
+    def test_invalid_threshold_raises_on_evaluation(self, context: RuleContext) -> None:
+        """Non-numeric thresholds compile but fail when evaluated."""
+        predicate = compile_condition("amount > lots")
+
+        with pytest.raises(RuleEvaluationError):
+            predicate(context)
+
+    def test_non_numeric_value_raises(self, context: RuleContext) -> None:
+        """Non-numeric context values fail numeric comparisons."""
+        with pytest.raises(RuleEvaluationError):
+            compile_condition("priority > 3")(context)
+
+
+class TestRDREngineConditionCache:
+    """Tests for the RDREngine compiled condition cache."""
+
+    def _tree(self) -> RDRTree:
+        tree = RDRTree(id="tree-1", name="Timeouts", task_id="task-a", exception_type="TIMEOUT")
+        high = RDRNode(id="high", condition="amount > 100", conclusion="wl-high")
+        tree.add_node(high)
+        tree.root.add_true_child(high)
+        return tree
+
+    def test_add_tree_compiles_conditions(self) -> None:
+        """All node conditions are compiled onto the nodes when the tree is added."""
+        engine = RDREngine()
+        tree = self._tree()
+        engine.add_tree(tree)
+
+        assert tree.get_node("high").compiled is not None
+        assert not engine._compiled
+
+    def test_traversal_reuses_node_predicates(self, context: RuleContext) -> None:
+        """Repeated traversals reuse the predicates attached to the nodes."""
+        engine = RDREngine()
+        tree = self._tree()
+        engine.add_tree(tree)
+        compiled = tree.get_node("high").compiled
+
+        for _ in range(3):
+            assert engine.find_worklet(context, task_id="task-a") == "wl-high"
+
+        assert tree.get_node("high").compiled is compiled
+
+    def test_traversal_independent_of_cache_size(self, context: RuleContext) -> None:
+        """Trees with more conditions than the LRU holds are not recompiled on traversal."""
+        engine = RDREngine(cache_size=1)
+        tree = self._tree()
+        refinements = [RDRNode(id=f"n{i}", condition=f"retries > {i + 5}", conclusion=f"wl-{i}") for i in range(5)]
+        for node in refinements:
+            tree.add_node(node)
+        tree.get_node("high").add_true_child(refinements[0])
+        for parent, child in pairwise(refinements):
+            parent.add_false_child(child)
+        engine.add_tree(tree)
+        compiled = {node.id: node.compiled for node in tree.nodes.values()}
+
+        assert engine.find_worklet(context, task_id="task-a") == "wl-high"
+        assert {node.id: node.compiled for node in tree.nodes.values()} == compiled
+        assert not engine._compiled
+
+    def test_update_rule_replaces_node_predicate(self, context: RuleContext) -> None:
+        """Editing a rule replaces its compiled predicate."""
+        engine = RDREngine()
+        tree = self._tree()
+        engine.add_tree(tree)
+        old = tree.get_node("high").compiled
+
+        engine.update_rule("tree-1", "high", condition="amount > 500")
+
+        assert tree.get_node("high").compiled is not old
+        assert engine.find_worklet(context, task_id="task-a") is None
+
+    def test_add_rule_compiles_new_condition(self, context: RuleContext) -> None:
+        """Rules added incrementally are compiled immediately."""
+        engine = RDREngine()
+        engine.add_tree(self._tree())
+
+        node = engine.add_rule("tree-1", "high", is_true_branch=True, condition="region == eu", conclusion="wl-eu")
+
+        assert node.compiled is not None
+        assert engine.find_worklet(context, task_id="task-a") == "wl-eu"
+
+    def test_nodes_linked_after_add_tree_compiled_on_visit(self, context: RuleContext) -> None:
+        """Nodes attached directly to a registered tree are compiled when first visited."""
+        engine = RDREngine()
+        tree = self._tree()
+        engine.add_tree(tree)
+        eu = RDRNode(id="eu", condition="region == eu", conclusion="wl-eu")
+        tree.add_node(eu)
+        tree.get_node("high").add_true_child(eu)
+
+        assert engine.find_worklet(context, task_id="task-a") == "wl-eu"
+        assert eu.compiled is not None
+
+    def test_condition_edited_in_place_recompiled(self, context: RuleContext) -> None:
+        """A node whose condition is reassigned directly is recompiled on its next visit."""
+        engine = RDREngine()
+        tree = self._tree()
+        engine.add_tree(tree)
+
+        tree.get_node("high").condition = "amount > 500"
+
+        assert engine.find_worklet(context, task_id="task-a") is None
+        assert tree.get_node("high").compiled[0] == "amount > 500"
+
+    def test_cache_is_bounded(self) -> None:
+        """The ad-hoc cache evicts least recently used conditions."""
+        engine = RDREngine(cache_size=2)
+        for threshold in range(5):
+            engine.get_compiled_condition(f"amount > {threshold}")
+
+        assert list(engine._compiled) == ["amount > 3", "amount > 4"]
+
+    def test_caching_disabled(self, context: RuleContext) -> None:
+        """Conditions still evaluate when caching is disabled."""
+        engine = RDREngine(enable_caching=False)
+        tree = self._tree()
+        engine.add_tree(tree)
+
+        assert engine.find_worklet(context, task_id="task-a") == "wl-high"
+        assert tree.get_node("high").compiled is None
+        assert not engine._compiled
+
+    def test_engine_equality_ignores_compiled_state(self) -> None:
+        """Compiled predicates and the cache lock do not affect equality."""
+        first = RDREngine()
+        second = RDREngine()
+        first.get_compiled_condition("amount > 1")
+
+        assert first == second